@@ -0,0 +1,25 @@
+"""Add stored problem embeddings to solutions
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add problem_embedding column (backfilled lazily by SolutionStore)."""
+    op.add_column('solutions', sa.Column('problem_embedding', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop problem_embedding column."""
+    op.drop_column('solutions', 'problem_embedding')
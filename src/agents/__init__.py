@@ -20,6 +20,7 @@ from .testing_agent import TestingAgent
 from .review_agent import ReviewAgent
 from .pr_agent import PRAgent
 from .orchestrator import AgentOrchestrator
+from .scheduler import TaskScheduler, ScheduleOutcome
 
 __all__ = [
     "ExecutionPlan",
@@ -36,4 +37,6 @@ __all__ = [
     "ReviewAgent",
     "PRAgent",
     "AgentOrchestrator",
+    "TaskScheduler",
+    "ScheduleOutcome",
 ]
@@ -85,6 +85,42 @@ class ExecutionPlan:
 
         return ready
 
+    def get_dependents(self) -> Dict[str, List[str]]:
+        """Map each task ID to the IDs of tasks that depend on it"""
+        dependents = {task.id: [] for task in self.tasks}
+        for task in self.tasks:
+            for dep_id in task.dependencies:
+                if dep_id in dependents:
+                    dependents[dep_id].append(task.id)
+        return dependents
+
+    def critical_path_lengths(self) -> Dict[str, int]:
+        """
+        Longest chain of estimated effort from each task to the end of the plan
+
+        Includes the task's own effort. Dependency cycles are cut at the
+        back edge instead of recursing forever.
+        """
+        dependents = self.get_dependents()
+        effort = {task.id: task.estimated_effort for task in self.tasks}
+        lengths: Dict[str, int] = {}
+        visiting = set()
+
+        def visit(task_id: str) -> int:
+            if task_id in lengths:
+                return lengths[task_id]
+            if task_id in visiting:
+                return 0
+            visiting.add(task_id)
+            downstream = max((visit(dep) for dep in dependents[task_id]), default=0)
+            visiting.discard(task_id)
+            lengths[task_id] = effort[task_id] + downstream
+            return lengths[task_id]
+
+        for task in self.tasks:
+            visit(task.id)
+        return lengths
+
 
 @dataclass
 class FileChange:
@@ -26,6 +26,7 @@ from .coding_agent import CodingAgent
 from .testing_agent import TestingAgent
 from .review_agent import ReviewAgent
 from .pr_agent import PRAgent
+from .scheduler import TaskScheduler
 
 
 class AgentOrchestrator(BaseAgent):
@@ -42,6 +43,9 @@ class AgentOrchestrator(BaseAgent):
     Modes:
     - Supervised: Requires approval after each stage
     - Autonomous: Runs all stages automatically
+
+    Tasks are scheduled by dependency readiness (see TaskScheduler); in
+    autonomous mode each task is tested as soon as its coding completes.
     """
 
     MAX_RETRIES = 3
@@ -50,7 +54,8 @@ class AgentOrchestrator(BaseAgent):
         self,
         context: AgentContext,
         mode: str = "supervised",
-        approval_callback=None
+        approval_callback=None,
+        max_concurrency: Optional[int] = None
     ):
         """
         Initialize the orchestrator.
@@ -59,6 +64,7 @@ class AgentOrchestrator(BaseAgent):
             context: Agent execution context
             mode: "supervised" or "autonomous"
             approval_callback: Function to call for approval in supervised mode
+            max_concurrency: Maximum coding/testing jobs running at once
         """
         super().__init__(context)
         self.mode = mode
@@ -71,6 +77,8 @@ class AgentOrchestrator(BaseAgent):
         self.review_agent = ReviewAgent(context)
         self.pr_agent = PRAgent(context)
 
+        self.scheduler = TaskScheduler(max_concurrency)
+
     async def run(self, request: str) -> AgentResult:
         """
         Execute the full agent workflow for a request.
@@ -103,18 +111,25 @@ class AgentOrchestrator(BaseAgent):
 
             # Stage 2: Coding (for each task)
             result.state = AgentState.CODING
-            code_changes_list = await self._execute_coding(result.plan)
-            result.code_changes = code_changes_list
-
             if self.mode == "supervised":
+                code_changes_list = await self._execute_coding(result.plan)
+                result.code_changes = code_changes_list
+
                 if not await self._request_approval("Coding", code_changes_list):
                     result.state = AgentState.FAILED
                     result.error = "Code changes rejected by user"
                     return result
 
-            # Stage 3: Testing
-            result.state = AgentState.TESTING
-            test_results_list = await self._execute_testing(code_changes_list)
+                # Stage 3: Testing
+                result.state = AgentState.TESTING
+                test_results_list = await self._execute_testing(code_changes_list)
+            else:
+                # No approval gate between coding and testing: pipeline them per task
+                code_changes_list, test_results_list = await self._execute_coding_and_testing(
+                    result.plan
+                )
+                result.code_changes = code_changes_list
+                result.state = AgentState.TESTING
             result.test_results = test_results_list
 
             if self.mode == "supervised":
@@ -214,39 +229,65 @@ class AgentOrchestrator(BaseAgent):
         """
         self.log_info("=== Stage 2: Coding ===")
 
-        code_changes_list = []
+        code_changes_list, _ = await self._schedule_tasks(plan, run_tests=False)
+        return code_changes_list
 
-        # Execute tasks in dependency order
-        while True:
-            ready_tasks = plan.get_ready_tasks()
-            if not ready_tasks:
-                break
-
-            # Execute ready tasks in parallel
-            tasks_to_execute = []
-            for task in ready_tasks:
-                tasks_to_execute.append(self._execute_task_coding(task))
-
-            # Wait for all tasks to complete
-            results = await asyncio.gather(*tasks_to_execute, return_exceptions=True)
-
-            # Update task statuses
-            for task, result in zip(ready_tasks, results):
-                if isinstance(result, Exception):
-                    task.status = TaskStatus.FAILED
-                    task.error = str(result)
-                    self.log_error(f"Task {task.id} failed: {result}")
-                else:
-                    task.status = TaskStatus.COMPLETED
-                    task.result = result
-                    code_changes_list.append(result)
-                    self.log_info(f"Task {task.id} completed: {len(result.changes)} files changed")
-
-            # Check for failed tasks
-            if any(task.status == TaskStatus.FAILED for task in ready_tasks):
-                raise RuntimeError("Some tasks failed during coding")
+    async def _execute_coding_and_testing(
+        self,
+        plan: ExecutionPlan
+    ) -> tuple[list[CodeChanges], list[TestResults]]:
+        """
+        Execute coding with each task's tests started as soon as its code is ready.
 
-        return code_changes_list
+        Args:
+            plan: Execution plan
+
+        Returns:
+            (List of CodeChanges, List of TestResults) in plan order
+        """
+        self.log_info("=== Stage 2-3: Coding + Testing ===")
+
+        return await self._schedule_tasks(plan, run_tests=True)
+
+    async def _schedule_tasks(
+        self,
+        plan: ExecutionPlan,
+        run_tests: bool
+    ) -> tuple[list[CodeChanges], list[TestResults]]:
+        """
+        Run plan tasks as their dependencies complete (critical path first).
+
+        Args:
+            plan: Execution plan
+            run_tests: Test each task's changes as soon as its coding finishes
+
+        Returns:
+            (List of CodeChanges, List of TestResults) in plan order
+        """
+        outcome = await self.scheduler.run(
+            plan,
+            self._execute_task_coding,
+            followup=self._execute_task_testing_after_coding if run_tests else None,
+        )
+
+        if outcome.failed:
+            raise RuntimeError("Some tasks failed during coding")
+
+        code_changes_list = []
+        test_results_list = []
+        for task in plan.tasks:
+            if task.id not in outcome.results:
+                continue
+            changes = outcome.results[task.id]
+            code_changes_list.append(changes)
+            self.log_info(f"Task {task.id} completed: {len(changes.changes)} files changed")
+            if run_tests:
+                test_results_list.append(outcome.followup_results.get(
+                    task.id,
+                    TestResults(task_id=changes.task_id, test_cases=[]),
+                ))
+
+        return code_changes_list, test_results_list
 
     async def _execute_task_coding(self, task: Task) -> CodeChanges:
         """
@@ -284,6 +325,8 @@ class AgentOrchestrator(BaseAgent):
         """
         Execute testing stage with retry.
 
+        Tasks are tested concurrently, up to the scheduler's concurrency limit.
+
         Args:
             code_changes_list: List of code changes to test
 
@@ -292,33 +335,49 @@ class AgentOrchestrator(BaseAgent):
         """
         self.log_info("=== Stage 3: Testing ===")
 
-        test_results_list = []
+        semaphore = asyncio.Semaphore(self.scheduler.max_concurrency)
 
-        for changes in code_changes_list:
-            for attempt in range(self.MAX_RETRIES):
-                try:
-                    test_results = await self.testing_agent.test(changes)
-                    test_results_list.append(test_results)
+        async def test_one(changes: CodeChanges) -> TestResults:
+            async with semaphore:
+                return await self._execute_task_testing(changes)
 
-                    self.log_info(
-                        f"Tests for task {changes.task_id}: "
-                        f"{test_results.passed}/{test_results.total_tests} passed, "
-                        f"{test_results.coverage:.1f}% coverage"
-                    )
+        return list(await asyncio.gather(*(test_one(changes) for changes in code_changes_list)))
 
-                    break
+    async def _execute_task_testing_after_coding(self, task: Task, changes: CodeChanges) -> TestResults:
+        """Scheduler follow-up: test a task's changes once its coding completes"""
+        return await self._execute_task_testing(changes)
 
-                except Exception as e:
-                    self.log_error(f"Testing attempt {attempt + 1} failed: {e}")
-                    if attempt == self.MAX_RETRIES - 1:
-                        # Don't fail the whole workflow if testing fails
-                        # Create empty test results
-                        test_results_list.append(TestResults(
-                            task_id=changes.task_id,
-                            test_cases=[],
-                        ))
-
-        return test_results_list
+    async def _execute_task_testing(self, changes: CodeChanges) -> TestResults:
+        """
+        Execute testing for a single task's changes with retry.
+
+        Args:
+            changes: Code changes to test
+
+        Returns:
+            TestResults (empty if every attempt failed)
+        """
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                test_results = await self.testing_agent.test(changes)
+
+                self.log_info(
+                    f"Tests for task {changes.task_id}: "
+                    f"{test_results.passed}/{test_results.total_tests} passed, "
+                    f"{test_results.coverage:.1f}% coverage"
+                )
+
+                return test_results
+
+            except Exception as e:
+                self.log_error(f"Testing attempt {attempt + 1} failed: {e}")
+
+        # Don't fail the whole workflow if testing fails
+        # Create empty test results
+        return TestResults(
+            task_id=changes.task_id,
+            test_cases=[],
+        )
 
     async def _execute_review(
         self,
@@ -0,0 +1,159 @@
+"""
+Task Scheduler
+
+Dependency-driven execution of an ExecutionPlan.
+
+Each task starts as soon as its own dependencies complete instead of waiting
+for every task in its "wave". Ready work is started critical-path first under
+a global concurrency limit, and an optional follow-up (e.g. testing) runs for
+each task as soon as that task finishes.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .models import ExecutionPlan, Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduleOutcome:
+    """Results of running a plan through the scheduler"""
+    results: Dict[str, Any] = field(default_factory=dict)  # task ID -> result
+    followup_results: Dict[str, Any] = field(default_factory=dict)  # task ID -> follow-up result
+    failed: List[str] = field(default_factory=list)  # IDs of tasks that raised
+    skipped: List[str] = field(default_factory=list)  # IDs never started
+
+    @property
+    def success(self) -> bool:
+        return not self.failed and not self.skipped
+
+
+class TaskScheduler:
+    """
+    Runs plan tasks as their dependencies complete.
+
+    Priority is the task's critical-path length (its own estimated effort plus
+    the longest chain of effort that depends on it), so work that gates the
+    most downstream effort starts first. Follow-ups are prioritized by the
+    downstream effort still waiting on their task.
+
+    On the first failure no new work is started; running work is allowed to
+    finish and every task that never ran is marked SKIPPED.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 4
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrency: Maximum number of tasks and follow-ups running at once
+        """
+        self.max_concurrency = max(1, max_concurrency or self.DEFAULT_MAX_CONCURRENCY)
+
+    async def run(
+        self,
+        plan: ExecutionPlan,
+        run_task: Callable[[Task], Awaitable[Any]],
+        followup: Optional[Callable[[Task, Any], Awaitable[Any]]] = None,
+    ) -> ScheduleOutcome:
+        """
+        Execute every task in the plan.
+
+        Args:
+            plan: Execution plan (task statuses and results are updated in place)
+            run_task: Coroutine function executing one task
+            followup: Optional coroutine function run with (task, result) after
+                each task completes
+
+        Returns:
+            ScheduleOutcome
+        """
+        tasks = {task.id: task for task in plan.tasks}
+        dependents = plan.get_dependents()
+        critical_path = plan.critical_path_lengths()
+        completed = {task_id for task_id, task in tasks.items() if task.status == TaskStatus.COMPLETED}
+        waiting = {
+            task.id: sum(1 for dep in task.dependencies if dep not in completed)
+            for task in plan.tasks
+            if task.status == TaskStatus.PENDING
+        }
+
+        outcome = ScheduleOutcome()
+        ready: list = []
+        sequence = itertools.count()
+
+        def push(priority: int, kind: str, task: Task, payload: Any = None):
+            heapq.heappush(ready, (-priority, next(sequence), kind, task, payload))
+
+        for task in plan.tasks:
+            if waiting.get(task.id) == 0:
+                push(critical_path[task.id], "task", task)
+
+        running: Dict[asyncio.Task, tuple] = {}
+        failed = False
+
+        try:
+            while ready or running:
+                while ready and not failed and len(running) < self.max_concurrency:
+                    _, _, kind, task, payload = heapq.heappop(ready)
+                    if kind == "task":
+                        task.status = TaskStatus.IN_PROGRESS
+                        job = asyncio.create_task(run_task(task))
+                    else:
+                        job = asyncio.create_task(followup(task, payload))
+                    running[job] = (kind, task)
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for job in done:
+                    kind, task = running.pop(job)
+                    error = job.exception()
+
+                    if kind == "followup":
+                        if error is not None:
+                            logger.error(f"Follow-up for task {task.id} failed: {error}")
+                        else:
+                            outcome.followup_results[task.id] = job.result()
+                        continue
+
+                    if error is not None:
+                        task.status = TaskStatus.FAILED
+                        task.error = str(error)
+                        outcome.failed.append(task.id)
+                        failed = True
+                        logger.error(f"Task {task.id} failed: {error}")
+                        continue
+
+                    task.status = TaskStatus.COMPLETED
+                    task.result = job.result()
+                    outcome.results[task.id] = task.result
+                    if followup is not None:
+                        push(critical_path[task.id] - task.estimated_effort, "followup", task, task.result)
+                    for dependent_id in dependents.get(task.id, ()):
+                        if dependent_id not in waiting:
+                            continue
+                        waiting[dependent_id] -= 1
+                        if waiting[dependent_id] == 0:
+                            push(critical_path[dependent_id], "task", tasks[dependent_id])
+        finally:
+            for job in running:
+                job.cancel()
+
+        for task in plan.tasks:
+            if task.status == TaskStatus.PENDING:
+                task.status = TaskStatus.SKIPPED
+                outcome.skipped.append(task.id)
+        if outcome.skipped and not failed:
+            logger.warning(f"Tasks with unmet dependencies were not run: {outcome.skipped}")
+
+        return outcome
@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
+from src.analysis.symbol_index import SymbolIndex
 from src.parsing.models import ParseResult, ClassInfo, ImportInfo, Language
 
 logger = logging.getLogger(__name__)
@@ -140,6 +141,9 @@ class CrossLanguageAnalyzer:
             PatternType.DEPENDENCY_INJECTION: self._detect_dependency_injection_pattern,
         }
 
+        # Module/symbol lookups, kept in sync with the analyzed result set
+        self.symbol_index = SymbolIndex()
+
         self.stats = {
             "files_analyzed": 0,
             "patterns_detected": 0,
@@ -211,26 +215,8 @@ class CrossLanguageAnalyzer:
         """Build dependency graph from parse results."""
         dependencies = []
 
-        # Create lookup maps for efficient searching
-        symbol_map = {}  # symbol_name -> (file_path, symbol_info)
-        class_map = {}  # class_name -> (file_path, class_info)
-
-        # Build lookup maps
-        for result in parse_results:
-            file_path = str(result.file_path)
-
-            # Map symbols
-            for symbol in result.symbols:
-                key = f"{symbol.name}:{symbol.type}"
-                if key not in symbol_map:
-                    symbol_map[key] = []
-                symbol_map[key].append((file_path, symbol))
-
-            # Map classes
-            for class_info in result.classes:
-                if class_info.name not in class_map:
-                    class_map[class_info.name] = []
-                class_map[class_info.name].append((file_path, class_info))
+        # Re-index only files whose parse results changed since the last run
+        self.symbol_index.sync(parse_results)
 
         # Analyze dependencies
         for result in parse_results:
@@ -249,13 +235,13 @@ class CrossLanguageAnalyzer:
             for class_info in result.classes:
                 dependencies.extend(
                     self._analyze_inheritance_dependencies(
-                        file_path, class_info, language, class_map
+                        file_path, class_info, language
                     )
                 )
 
             # Function call dependencies (basic analysis)
             dependencies.extend(
-                self._analyze_call_dependencies(file_path, result, language, symbol_map)
+                self._analyze_call_dependencies(file_path, result, language)
             )
 
         return dependencies
@@ -270,90 +256,84 @@ class CrossLanguageAnalyzer:
         """Analyze import-based dependencies."""
         dependencies = []
 
-        # Find target files that match the import
-        for result in parse_results:
-            target_file = str(result.file_path)
-
-            # Check if this file could be the import target
-            if self._matches_import(import_info, result):
-                # Create dependency for each imported item
-                if import_info.items:
-                    for item in import_info.items:
-                        dependencies.append(
-                            DependencyRelation(
-                                source_file=file_path,
-                                source_symbol=f"import:{item}",
-                                target_file=target_file,
-                                target_symbol=item,
-                                relation_type="import",
-                                language=language,
-                                confidence=0.8,
-                                line_number=import_info.line,
-                            )
-                        )
-                else:
-                    # Module-level import
+        # Files whose path has a module component as a directory part or file stem
+        for target_file in self.symbol_index.files_matching_module(import_info.module):
+            # Create dependency for each imported item
+            if import_info.items:
+                for item in import_info.items:
                     dependencies.append(
                         DependencyRelation(
                             source_file=file_path,
-                            source_symbol=f"import:{import_info.module}",
+                            source_symbol=f"import:{item}",
                             target_file=target_file,
-                            target_symbol=import_info.module,
+                            target_symbol=item,
                             relation_type="import",
                             language=language,
-                            confidence=0.7,
+                            confidence=0.8,
                             line_number=import_info.line,
                         )
                     )
+            else:
+                # Module-level import
+                dependencies.append(
+                    DependencyRelation(
+                        source_file=file_path,
+                        source_symbol=f"import:{import_info.module}",
+                        target_file=target_file,
+                        target_symbol=import_info.module,
+                        relation_type="import",
+                        language=language,
+                        confidence=0.7,
+                        line_number=import_info.line,
+                    )
+                )
 
         return dependencies
 
     def _analyze_inheritance_dependencies(
-        self, file_path: str, class_info: ClassInfo, language: str, class_map: Dict
+        self, file_path: str, class_info: ClassInfo, language: str
     ) -> List[DependencyRelation]:
         """Analyze inheritance-based dependencies."""
         dependencies = []
 
         # Base class dependencies
         for base_class in class_info.base_classes:
-            if base_class in class_map:
-                for target_file, target_class in class_map[base_class]:
-                    if target_file != file_path:  # Don't create self-dependencies
-                        dependencies.append(
-                            DependencyRelation(
-                                source_file=file_path,
-                                source_symbol=class_info.name,
-                                target_file=target_file,
-                                target_symbol=base_class,
-                                relation_type="inheritance",
-                                language=language,
-                                confidence=0.9,
-                                line_number=class_info.line_start,
-                            )
+            for target_file, target_class in self.symbol_index.class_definitions(base_class):
+                if target_file != file_path:  # Don't create self-dependencies
+                    dependencies.append(
+                        DependencyRelation(
+                            source_file=file_path,
+                            source_symbol=class_info.name,
+                            target_file=target_file,
+                            target_symbol=base_class,
+                            relation_type="inheritance",
+                            language=language,
+                            confidence=0.9,
+                            line_number=class_info.line_start,
                         )
+                    )
 
         # Interface implementation dependencies
         for interface in class_info.interfaces:
-            if interface in class_map:
-                for target_file, target_class in class_map[interface]:
-                    if target_file != file_path:
-                        dependencies.append(
-                            DependencyRelation(
-                                source_file=file_path,
-                                source_symbol=class_info.name,
-                                target_file=target_file,
-                                target_symbol=interface,
-                                relation_type="implements",
-                                language=language,
-                                confidence=0.9,
-                                line_number=class_info.line_start,
-                            )
+            for target_file, target_class in self.symbol_index.class_definitions(interface):
+                if target_file != file_path:
+                    dependencies.append(
+                        DependencyRelation(
+                            source_file=file_path,
+                            source_symbol=class_info.name,
+                            target_file=target_file,
+                            target_symbol=interface,
+                            relation_type="implements",
+                            language=language,
+                            confidence=0.9,
+                            line_number=class_info.line_start,
                         )
+                    )
 
         return dependencies
 
     def _analyze_call_dependencies(
-        self, file_path: str, result: ParseResult, language: str, symbol_map: Dict
+        self, file_path: str, result: ParseResult, language: str
     ) -> List[DependencyRelation]:
         """Analyze function call dependencies (basic implementation)."""
         dependencies = []
@@ -365,53 +345,33 @@ class CrossLanguageAnalyzer:
         for symbol in result.symbols:
             if symbol.parent_class:
                 # This is a method - it depends on its class
-                class_key = f"{symbol.parent_class}:class"
-                if class_key in symbol_map:
-                    for target_file, target_symbol in symbol_map[class_key]:
-                        if target_file != file_path:
-                            dependencies.append(
-                                DependencyRelation(
-                                    source_file=file_path,
-                                    source_symbol=symbol.name,
-                                    target_file=target_file,
-                                    target_symbol=symbol.parent_class,
-                                    relation_type="composition",
-                                    language=language,
-                                    confidence=0.8,
-                                    line_number=symbol.line_start,
-                                )
+                for target_file, target_symbol in self.symbol_index.symbol_definitions(
+                    symbol.parent_class, "class"
+                ):
+                    if target_file != file_path:
+                        dependencies.append(
+                            DependencyRelation(
+                                source_file=file_path,
+                                source_symbol=symbol.name,
+                                target_file=target_file,
+                                target_symbol=symbol.parent_class,
+                                relation_type="composition",
+                                language=language,
+                                confidence=0.8,
+                                line_number=symbol.line_start,
                             )
+                        )
 
         return dependencies
 
-    def _matches_import(self, import_info: ImportInfo, result: ParseResult) -> bool:
-        """Check if a parse result matches an import statement."""
-        file_path = result.file_path
-
-        # Simple heuristic: check if module name matches file/directory structure
-        module_parts = import_info.module.split(".")
-        path_parts = file_path.parts
-
-        # Check if any part of the module matches the file path
-        for module_part in module_parts:
-            if module_part in path_parts or module_part == file_path.stem:
-                return True
-
-        return False
-
     def _is_cross_language_dependency(
         self, dependency: DependencyRelation, parse_results: List[ParseResult]
     ) -> bool:
         """Check if a dependency crosses language boundaries."""
-        source_lang = None
-        target_lang = None
-
-        for result in parse_results:
-            file_path = str(result.file_path)
-            if file_path == dependency.source_file:
-                source_lang = result.language.value
-            elif file_path == dependency.target_file:
-                target_lang = result.language.value
+        if len(self.symbol_index) != len(parse_results):
+            self.symbol_index.sync(parse_results)
+        source_lang = self.symbol_index.language_of(dependency.source_file)
+        target_lang = self.symbol_index.language_of(dependency.target_file)
 
         return source_lang and target_lang and source_lang != target_lang
 
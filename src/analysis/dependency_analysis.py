@@ -15,6 +15,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List, Set, Tuple, Optional
 
+from src.analysis.symbol_index import SymbolIndex
 from src.parsing.models import ParseResult, ImportInfo
 
 
@@ -30,12 +31,22 @@ class DependencyEdge:
 class DependencyAnalyzer:
     """Builds dependency graphs and provides analysis helpers."""
 
-    def __init__(self, parse_results: List[ParseResult]):
+    def __init__(
+        self,
+        parse_results: List[ParseResult],
+        symbol_index: Optional[SymbolIndex] = None,
+    ):
         self.parse_results = parse_results
         # index by file for quick lookup
         self._by_file: Dict[str, ParseResult] = {
             str(p.file_path): p for p in parse_results
         }
+        # module/class/symbol lookups (may be shared with other analyzers)
+        if symbol_index is None:
+            symbol_index = SymbolIndex(parse_results)
+        else:
+            symbol_index.sync(parse_results)
+        self.symbol_index = symbol_index
         # build edges lazily
         self._edges: Optional[List[DependencyEdge]] = None
 
@@ -140,31 +151,12 @@ class DependencyAnalyzer:
     # ---------------- Helpers -----------------
     def _resolve_import_to_path(self, imp: ImportInfo) -> Optional[str]:
         # naive: map module name to file ending with it; prefer exact module match
-        mod = (imp.module or "").replace(".", "/")
-        # try exact module.py
-        candidate = f"{mod}.py" if mod else None
-        if candidate and candidate in self._by_file:
-            return candidate
-        # search by basename
-        for path in self._by_file.keys():
-            if (
-                path.endswith(f"/{mod}.py")
-                or path.endswith(f"\\{mod}.py")
-                or path.endswith(f"{mod}.py")
-            ):
-                return path
-        return None
+        return self.symbol_index.resolve_module_path(imp.module or "")
 
     def _find_file_defining_class(self, class_name: str) -> Optional[str]:
-        for p in self.parse_results:
-            for cls in p.classes or []:
-                if cls.name == class_name:
-                    return str(p.file_path)
-        return None
+        files = self.symbol_index.files_defining_class(class_name)
+        return files[0] if files else None
 
     def _find_file_defining_symbol(self, symbol_name: str) -> Optional[str]:
-        for p in self.parse_results:
-            for s in p.symbols or []:
-                if s.name == symbol_name:
-                    return str(p.file_path)
-        return None
+        files = self.symbol_index.files_defining_symbol(symbol_name)
+        return files[0] if files else None
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, asdict
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
+
+from src.security.scan_engine import PatternScanEngine, ScanRule, get_scan_engine
 
 
 SUSPICIOUS = [
@@ -24,22 +26,32 @@ class SecurityIssue:
 
 
 class SecurityScanner:
-    """Heuristic security scanner (regex-free for speed and safety)."""
+    """Heuristic security scanner (literal patterns only, matched in one pass)."""
+
+    @staticmethod
+    def engine() -> PatternScanEngine:
+        rules = [ScanRule(code, needle, message=msg) for code, msg, needle in SUSPICIOUS]
+        return get_scan_engine(rules, ignore_case=True)
 
-    def scan_file(self, path: str) -> Dict[str, object]:
-        issues: List[SecurityIssue] = []
+    def scan_file(self, path: str, content: Optional[Union[str, bytes]] = None) -> Dict[str, object]:
+        """
+        Scan one file.
+
+        Args:
+            path: File path
+            content: File content if the caller already has it (skips reading)
+        """
         try:
-            if not os.path.exists(path):
+            if content is not None:
+                matches = self.engine().scan_content(content)
+            elif not os.path.exists(path):
                 return {"success": False, "error": "file_not_found", "issues": []}
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                for i, line in enumerate(f, start=1):
-                    low = line.lower()
-                    for code, msg, needle in SUSPICIOUS:
-                        idx = low.find(needle.lower())
-                        if idx != -1:
-                            issues.append(SecurityIssue(i, idx + 1, code, msg))
+            else:
+                matches = self.engine().scan_path(path)
         except Exception as e:
             return {"success": False, "error": str(e), "issues": []}
 
+        issues: List[SecurityIssue] = [
+            SecurityIssue(m.line, m.col, m.rule.rule, m.rule.message) for m in matches
+        ]
         return {"success": True, "issues": [x.to_dict() for x in issues]}
-
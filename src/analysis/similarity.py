@@ -2,17 +2,43 @@
 Code Similarity Detection
 
 Detects similar code patterns and structures across different programming languages.
+
+Pipeline:
+- Candidate generation: all pairs for small inputs, MinHash LSH over name
+  n-grams and structural tokens for large ones
+- Vectorized upper-bound scoring of candidates (NumPy) to discard pairs that
+  cannot reach the threshold
+- Exact scoring of the survivors, streamed via iter_similarities()
 """
 
 import logging
-from typing import List, Dict, Tuple, Optional, Set, Any
+import re
+import zlib
+from typing import Iterator, List, Dict, Tuple, Optional, Set, Any
 from dataclasses import dataclass
 import hashlib
 
+import numpy as np
+
 from src.parsing.models import ParseResult, SymbolInfo, Language
 
 logger = logging.getLogger(__name__)
 
+# Above this many signatures, candidates come from LSH instead of all pairs
+EXHAUSTIVE_LIMIT = 2000
+
+# MinHash LSH banding (bands * rows permutations); ~0.5 Jaccard threshold
+LSH_BANDS = 16
+LSH_ROWS = 4
+
+# Buckets larger than this are skipped (shared boilerplate, not clones)
+MAX_BUCKET_SIZE = 256
+
+_MERSENNE_31 = (1 << 31) - 1
+_NAME_SPLIT = re.compile(r"[_\-]+|(?<=[a-z0-9])(?=[A-Z])")
+
+SignatureEntry = Tuple["CodeSignature", ParseResult, SymbolInfo]
+
 
 @dataclass
 class SimilarityMatch:
@@ -68,8 +94,33 @@ class SimilarityDetector:
     using structural, semantic, and functional analysis.
     """
 
-    def __init__(self):
-        """Initialize similarity detector."""
+    def __init__(
+        self,
+        exhaustive_limit: int = EXHAUSTIVE_LIMIT,
+        lsh_bands: int = LSH_BANDS,
+        lsh_rows: int = LSH_ROWS,
+        max_bucket_size: int = MAX_BUCKET_SIZE,
+    ):
+        """
+        Initialize similarity detector.
+
+        Args:
+            exhaustive_limit: Max signatures compared all-pairs before switching to LSH
+            lsh_bands: Number of LSH bands
+            lsh_rows: MinHash rows per band
+            max_bucket_size: LSH buckets larger than this are ignored
+        """
+        self.exhaustive_limit = exhaustive_limit
+        self.lsh_bands = lsh_bands
+        self.lsh_rows = lsh_rows
+        self.max_bucket_size = max_bucket_size
+
+        rng = np.random.default_rng(0x5EED)
+        num_perm = lsh_bands * lsh_rows
+        self._perm_a = rng.integers(1, _MERSENNE_31, size=(num_perm, 1), dtype=np.uint64)
+        self._perm_b = rng.integers(0, _MERSENNE_31, size=(num_perm, 1), dtype=np.uint64)
+        self._token_hashes: Dict[str, int] = {}
+
         self.language_normalizers = {
             Language.PYTHON: self._normalize_python_symbol,
             Language.JAVASCRIPT: self._normalize_javascript_symbol,
@@ -82,6 +133,8 @@ class SimilarityDetector:
 
         self.stats = {
             "comparisons_performed": 0,
+            "candidate_pairs": 0,
+            "pairs_pruned": 0,
             "similarities_found": 0,
             "cross_language_matches": 0,
         }
@@ -101,29 +154,40 @@ class SimilarityDetector:
         Returns:
             List of similarity matches
         """
+        matches = list(self.iter_similarities(parse_results, min_similarity))
+        logger.info(f"Found {len(matches)} similarity matches")
+        return matches
+
+    def iter_similarities(
+        self, parse_results: List[ParseResult], min_similarity: float = 0.7
+    ) -> Iterator[SimilarityMatch]:
+        """
+        Stream similarity matches as they are scored.
+
+        Args:
+            parse_results: List of parse results to analyze
+            min_similarity: Minimum similarity score to report
+
+        Yields:
+            Similarity matches in (source, target) signature order
+        """
         logger.info(f"Finding similarities across {len(parse_results)} files")
 
         # Generate signatures for all symbols
         signatures = self._generate_signatures(parse_results)
 
-        # Find matches
-        matches = self._find_matches(signatures, min_similarity)
+        self.stats["similarities_found"] = 0
+        self.stats["cross_language_matches"] = 0
 
-        # Update statistics
-        self.stats["comparisons_performed"] += (
-            len(signatures) * (len(signatures) - 1) // 2
-        )
-        self.stats["similarities_found"] = len(matches)
-        self.stats["cross_language_matches"] = len(
-            [m for m in matches if m.source_language != m.target_language]
-        )
-
-        logger.info(f"Found {len(matches)} similarity matches")
-        return matches
+        for match in self._iter_matches(signatures, min_similarity):
+            self.stats["similarities_found"] += 1
+            if match.source_language != match.target_language:
+                self.stats["cross_language_matches"] += 1
+            yield match
 
     def _generate_signatures(
         self, parse_results: List[ParseResult]
-    ) -> List[Tuple[CodeSignature, ParseResult, SymbolInfo]]:
+    ) -> List[SignatureEntry]:
         """Generate normalized signatures for all symbols."""
         signatures = []
 
@@ -144,42 +208,247 @@ class SimilarityDetector:
 
     def _find_matches(
         self,
-        signatures: List[Tuple[CodeSignature, ParseResult, SymbolInfo]],
+        signatures: List[SignatureEntry],
         min_similarity: float,
     ) -> List[SimilarityMatch]:
         """Find similarity matches between signatures."""
-        matches = []
-
-        for i, (sig1, result1, symbol1) in enumerate(signatures):
-            for j, (sig2, result2, symbol2) in enumerate(signatures[i + 1 :], i + 1):
-                # Skip self-comparisons
-                if (
-                    result1.file_path == result2.file_path
-                    and symbol1.name == symbol2.name
-                ):
-                    continue
+        return list(self._iter_matches(signatures, min_similarity))
+
+    def _iter_matches(
+        self,
+        signatures: List[SignatureEntry],
+        min_similarity: float,
+    ) -> Iterator[SimilarityMatch]:
+        """Generate candidates, prune by upper bound, then score exactly."""
+        if len(signatures) < 2:
+            return
+
+        features = self._build_features(signatures)
+
+        if len(signatures) <= self.exhaustive_limit:
+            candidate_blocks = self._all_pair_blocks(len(signatures))
+        else:
+            candidate_blocks = [self._lsh_candidates(signatures)]
+
+        for left, right in candidate_blocks:
+            self.stats["candidate_pairs"] += len(left)
+            keep = self._upper_bound_mask(features, left, right, min_similarity)
+            self.stats["pairs_pruned"] += int(len(left) - keep.sum())
+
+            for i, j in zip(left[keep].tolist(), right[keep].tolist()):
+                sig1, result1, symbol1 = signatures[i]
+                sig2, result2, symbol2 = signatures[j]
 
                 # Calculate similarity
+                self.stats["comparisons_performed"] += 1
                 similarity_score, similarity_type, evidence = (
                     self._calculate_similarity(sig1, sig2, symbol1, symbol2)
                 )
 
                 if similarity_score >= min_similarity:
-                    matches.append(
-                        SimilarityMatch(
-                            source_file=str(result1.file_path),
-                            source_symbol=symbol1.name,
-                            source_language=result1.language.value,
-                            target_file=str(result2.file_path),
-                            target_symbol=symbol2.name,
-                            target_language=result2.language.value,
-                            similarity_score=similarity_score,
-                            similarity_type=similarity_type,
-                            evidence=evidence,
-                        )
+                    yield SimilarityMatch(
+                        source_file=str(result1.file_path),
+                        source_symbol=symbol1.name,
+                        source_language=result1.language.value,
+                        target_file=str(result2.file_path),
+                        target_symbol=symbol2.name,
+                        target_language=result2.language.value,
+                        similarity_score=similarity_score,
+                        similarity_type=similarity_type,
+                        evidence=evidence,
                     )
 
-        return matches
+    # ==================== Candidate Generation ====================
+
+    def _build_features(self, signatures: List[SignatureEntry]) -> Dict[str, np.ndarray]:
+        """Encode the per-signature fields used by the vectorized bound."""
+        vocab: Dict[Tuple[str, Any], int] = {}
+
+        def intern(kind: str, value: Any) -> int:
+            return vocab.setdefault((kind, value), len(vocab))
+
+        rows = []
+        for sig, result, symbol in signatures:
+            rows.append(
+                (
+                    intern("type", sig.type),
+                    sig.parameter_count,
+                    bool(sig.parameter_types),
+                    intern("ret", self._normalize_type(sig.return_type))
+                    if sig.return_type
+                    else -1,
+                    bool(sig.modifiers),
+                    sig.complexity_score,
+                    intern("hash", sig.to_hash()),
+                    intern("name", symbol.name),
+                    intern("norm", symbol.name.lower().replace("_", "").replace("-", "")),
+                    intern("file", str(result.file_path)),
+                    bool(symbol.docstring),
+                    bool(symbol.parent_class),
+                )
+            )
+
+        columns = list(zip(*rows))
+        names = (
+            "type", "params", "has_param_types", "ret", "has_modifiers", "complexity",
+            "hash", "name", "norm_name", "file", "has_doc", "has_parent",
+        )
+        features = {name: np.asarray(col) for name, col in zip(names, columns)}
+        features["complexity"] = features["complexity"].astype(np.float64)
+        return features
+
+    def _all_pair_blocks(self, n: int, max_pairs: int = 1 << 22):
+        """Yield (left, right) index arrays covering every i < j pair in order."""
+        start = 0
+        while start < n - 1:
+            # Rows start..stop pair with everything after them
+            stop = start + 1
+            pairs = n - start - 1
+            while stop < n - 1 and pairs + (n - stop - 1) <= max_pairs:
+                pairs += n - stop - 1
+                stop += 1
+            left = np.repeat(np.arange(start, stop), n - 1 - np.arange(start, stop))
+            right = np.concatenate([np.arange(i + 1, n) for i in range(start, stop)])
+            yield left, right
+            start = stop
+
+    def _signature_tokens(self, sig: CodeSignature) -> Set[str]:
+        """Normalized name n-grams plus coarse structural tokens for MinHash."""
+        name = sig.name or ""
+        tokens = {f"w:{t.lower()}" for t in _NAME_SPLIT.split(name) if t}
+        norm = f"^{name.lower().replace('_', '').replace('-', '')}$"
+        tokens.update(f"g:{norm[k:k + 3]}" for k in range(max(len(norm) - 2, 1)))
+        tokens.add(f"t:{sig.type}")
+        tokens.add(f"n:{sig.parameter_count}")
+        return tokens
+
+    def _hash_token(self, token: str) -> int:
+        value = self._token_hashes.get(token)
+        if value is None:
+            value = zlib.crc32(token.encode("utf-8")) & _MERSENNE_31
+            self._token_hashes[token] = value
+        return value
+
+    def _minhash(self, signatures: List[SignatureEntry], chunk: int = 2048) -> np.ndarray:
+        """MinHash matrix of shape (n, bands * rows)."""
+        n = len(signatures)
+        out = np.empty((n, self._perm_a.shape[0]), dtype=np.uint64)
+
+        for begin in range(0, n, chunk):
+            token_lists = [
+                [self._hash_token(t) for t in self._signature_tokens(sig)]
+                for sig, _, _ in signatures[begin : begin + chunk]
+            ]
+            lengths = np.fromiter((len(t) for t in token_lists), dtype=np.int64)
+            flat = np.fromiter(
+                (h for tokens in token_lists for h in tokens), dtype=np.uint64, count=int(lengths.sum())
+            )
+            starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            # (perm, token) universal hashes; a, h < 2^31 so a*h+b fits in uint64
+            hashed = (self._perm_a * flat + self._perm_b) % np.uint64(_MERSENNE_31)
+            out[begin : begin + len(token_lists)] = np.minimum.reduceat(hashed, starts, axis=1).T
+
+        return out
+
+    def _lsh_candidates(self, signatures: List[SignatureEntry]) -> Tuple[np.ndarray, np.ndarray]:
+        """Pairs sharing at least one LSH band bucket, sorted by (i, j)."""
+        n = len(signatures)
+        minhash = self._minhash(signatures)
+        mixers = np.asarray(
+            [0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5],
+            dtype=np.uint64,
+        )
+        encoded = []
+        skipped = 0
+        triu_cache: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+        for band in range(self.lsh_bands):
+            cols = minhash[:, band * self.lsh_rows : (band + 1) * self.lsh_rows]
+            keys = np.zeros(n, dtype=np.uint64)
+            for r in range(cols.shape[1]):
+                keys = keys * mixers[r % len(mixers)] + cols[:, r]
+
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            boundaries = np.flatnonzero(np.diff(sorted_keys)) + 1
+            for bucket in np.split(order, boundaries):
+                size = len(bucket)
+                if size < 2:
+                    continue
+                if size > self.max_bucket_size:
+                    skipped += 1
+                    continue
+                members = np.sort(bucket)
+                if size not in triu_cache:
+                    triu_cache[size] = np.triu_indices(size, k=1)
+                left, right = triu_cache[size]
+                encoded.append(members[left] * n + members[right])
+
+        if skipped:
+            logger.debug(f"Skipped {skipped} oversized LSH buckets")
+        if not encoded:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        pairs = np.sort(np.concatenate(encoded))
+        pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))]
+        return pairs // n, pairs % n
+
+    def _upper_bound_mask(
+        self,
+        f: Dict[str, np.ndarray],
+        left: np.ndarray,
+        right: np.ndarray,
+        min_similarity: float,
+    ) -> np.ndarray:
+        """
+        Vectorized upper bound of _calculate_similarity for candidate pairs.
+
+        Set overlaps (parameter types, modifiers, docstrings) and the fuzzy
+        name heuristics are bounded by their maximum contribution, so no pair
+        that could reach min_similarity is dropped.
+        """
+        # Structural (weight 0.4)
+        params_diff = np.abs(f["params"][left] - f["params"][right])
+        ret_left = f["ret"][left]
+        structural = (
+            0.3 * (f["type"][left] == f["type"][right])
+            + np.where(params_diff == 0, 0.2, np.where(params_diff <= 1, 0.1, 0.0))
+            + 0.2 * (f["has_param_types"][left] & f["has_param_types"][right])
+            + 0.15 * ((ret_left >= 0) & (ret_left == f["ret"][right]))
+            + 0.15 * (f["has_modifiers"][left] & f["has_modifiers"][right])
+        )
+
+        # Semantic (weight 0.4): exact name 1.0, normalized name 0.9, otherwise <= 0.7
+        name_bound = np.where(
+            f["name"][left] == f["name"][right],
+            1.0,
+            np.where(f["norm_name"][left] == f["norm_name"][right], 0.9, 0.7),
+        )
+        semantic = (
+            0.4 * name_bound
+            + 0.3 * (f["has_doc"][left] & f["has_doc"][right])
+            + 0.3 * (f["has_parent"][left] & f["has_parent"][right])
+        )
+
+        # Functional (weight 0.2) is cheap enough to compute exactly
+        c_left = f["complexity"][left]
+        c_right = f["complexity"][right]
+        functional = np.where(
+            (c_left > 0) & (c_right > 0),
+            0.5 * (1.0 - np.minimum(np.abs(c_left - c_right), 1.0)),
+            0.0,
+        ) + 0.5 * (f["hash"][left] == f["hash"][right])
+
+        bound = (
+            0.4 * np.minimum(structural, 1.0)
+            + 0.4 * np.minimum(semantic, 1.0)
+            + 0.2 * np.minimum(functional, 1.0)
+        )
+
+        # Skip self-comparisons (same symbol name in the same file)
+        self_pair = (f["file"][left] == f["file"][right]) & (f["name"][left] == f["name"][right])
+        return (bound >= min_similarity - 1e-9) & ~self_pair
 
     def _calculate_similarity(
         self,
@@ -321,8 +590,6 @@ class SimilarityDetector:
             return 0.9
 
         # Token-level heuristic to penalize re-ordered words
-        import re
-
         tokens1 = [t for t in re.split(r"[_-]+", name1.lower()) if t]
         tokens2 = [t for t in re.split(r"[_-]+", name2.lower()) if t]
         if tokens1 != tokens2 and sorted(tokens1) == sorted(tokens2):
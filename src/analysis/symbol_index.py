@@ -0,0 +1,186 @@
+"""
+Symbol & Module Index
+
+Incrementally maintained lookup tables over ParseResult collections, shared by
+the cross-language and dependency analyzers so that resolving an import,
+base class or symbol is a dictionary lookup instead of a scan of every file.
+
+Indexes:
+- path token (directory part or file stem) -> files
+- file-name suffix -> files (resolves "pkg/mod" to ".../pkg/mod.py")
+- class name -> defining files
+- symbol name (and "name:type") -> defining files
+
+All per-key file collections preserve insertion order, so "first match"
+queries return the same file a linear scan over the inputs would.
+"""
+
+from __future__ import annotations
+
+import re
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.parsing.models import ClassInfo, ParseResult, SymbolInfo
+
+_SEPARATORS = re.compile(r"[\\/]")
+
+
+def _add(index: Dict[str, Dict[str, None]], key: str, file_path: str):
+    index.setdefault(key, {})[file_path] = None
+
+
+def _discard(index: Dict[str, Dict[str, None]], key: str, file_path: str):
+    files = index.get(key)
+    if files is not None:
+        files.pop(file_path, None)
+        if not files:
+            del index[key]
+
+
+class SymbolIndex:
+    """Incremental symbol/module index over parse results."""
+
+    def __init__(self, parse_results: Optional[Iterable[ParseResult]] = None):
+        self._results: Dict[str, ParseResult] = {}
+        self._order: Dict[str, int] = {}
+        self._counter = count()
+
+        self._path_tokens: Dict[str, Dict[str, None]] = {}
+        self._name_suffixes: Dict[str, Dict[str, None]] = {}
+        self._classes: Dict[str, Dict[str, None]] = {}
+        self._symbols: Dict[str, Dict[str, None]] = {}
+        self._typed_symbols: Dict[str, Dict[str, None]] = {}
+
+        for result in parse_results or []:
+            self.add(result)
+
+    # ---------------- Maintenance -----------------
+    def add(self, result: ParseResult):
+        """Index a parse result, replacing any previous entry for its file."""
+        file_path = str(result.file_path)
+        if file_path in self._results:
+            self.remove(file_path)
+
+        self._results[file_path] = result
+        self._order[file_path] = next(self._counter)
+
+        for token in self._tokens_for(result):
+            _add(self._path_tokens, token, file_path)
+        for suffix in self._suffixes_for(file_path):
+            _add(self._name_suffixes, suffix, file_path)
+        for cls in result.classes or []:
+            _add(self._classes, cls.name, file_path)
+        for symbol in result.symbols or []:
+            _add(self._symbols, symbol.name, file_path)
+            _add(self._typed_symbols, f"{symbol.name}:{symbol.type}", file_path)
+
+    def remove(self, file_path: str):
+        """Drop a file from every index."""
+        file_path = str(file_path)
+        result = self._results.pop(file_path, None)
+        if result is None:
+            return
+        self._order.pop(file_path, None)
+
+        for token in self._tokens_for(result):
+            _discard(self._path_tokens, token, file_path)
+        for suffix in self._suffixes_for(file_path):
+            _discard(self._name_suffixes, suffix, file_path)
+        for cls in result.classes or []:
+            _discard(self._classes, cls.name, file_path)
+        for symbol in result.symbols or []:
+            _discard(self._symbols, symbol.name, file_path)
+            _discard(self._typed_symbols, f"{symbol.name}:{symbol.type}", file_path)
+
+    def sync(self, parse_results: Iterable[ParseResult]):
+        """
+        Bring the index in line with a result set.
+
+        Results already indexed (same object) are left untouched, changed ones
+        are re-indexed and files absent from the set are removed.
+        """
+        seen = set()
+        for result in parse_results:
+            file_path = str(result.file_path)
+            seen.add(file_path)
+            if self._results.get(file_path) is not result:
+                self.add(result)
+        for file_path in [fp for fp in self._results if fp not in seen]:
+            self.remove(file_path)
+
+    @staticmethod
+    def _tokens_for(result: ParseResult) -> set:
+        path = result.file_path
+        return set(path.parts) | {path.stem}
+
+    @staticmethod
+    def _suffixes_for(file_path: str) -> List[str]:
+        name = _SEPARATORS.split(file_path)[-1]
+        return [name[i:] for i in range(len(name))]
+
+    # ---------------- Queries -----------------
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __contains__(self, file_path: str) -> bool:
+        return file_path in self._results
+
+    def get(self, file_path: str) -> Optional[ParseResult]:
+        return self._results.get(file_path)
+
+    def language_of(self, file_path: str) -> Optional[str]:
+        result = self._results.get(file_path)
+        return result.language.value if result is not None else None
+
+    def files_matching_module(self, module: str) -> List[str]:
+        """
+        Files whose path contains any module component as a directory part
+        or file stem, in index order.
+        """
+        matched: Dict[str, None] = {}
+        for part in (module or "").split("."):
+            matched.update(self._path_tokens.get(part, {}))
+        return sorted(matched, key=self._order.__getitem__)
+
+    def resolve_module_path(self, module: str, extension: str = ".py") -> Optional[str]:
+        """Resolve a dotted module to the first file whose path ends with it."""
+        mod = (module or "").replace(".", "/")
+        if not mod:
+            return None
+        target = f"{mod}{extension}"
+        if target in self._results:
+            return target
+
+        # Candidates share the file-name suffix; check the full path suffix
+        name_suffix = target.rsplit("/", 1)[-1]
+        best: Optional[str] = None
+        for path in self._name_suffixes.get(name_suffix, {}):
+            if path.replace("\\", "/").endswith(target) or path.endswith(target):
+                if best is None or self._order[path] < self._order[best]:
+                    best = path
+        return best
+
+    def files_defining_class(self, class_name: str) -> List[str]:
+        return list(self._classes.get(class_name, {}))
+
+    def files_defining_symbol(self, symbol_name: str) -> List[str]:
+        return list(self._symbols.get(symbol_name, {}))
+
+    def class_definitions(self, class_name: str) -> List[Tuple[str, ClassInfo]]:
+        """(file, ClassInfo) pairs for every definition of a class name."""
+        return [
+            (file_path, cls)
+            for file_path in self._classes.get(class_name, {})
+            for cls in self._results[file_path].classes
+            if cls.name == class_name
+        ]
+
+    def symbol_definitions(self, name: str, symbol_type: str) -> List[Tuple[str, SymbolInfo]]:
+        """(file, SymbolInfo) pairs for a symbol name and type."""
+        return [
+            (file_path, symbol)
+            for file_path in self._typed_symbols.get(f"{name}:{symbol_type}", {})
+            for symbol in self._results[file_path].symbols
+            if symbol.name == name and symbol.type == symbol_type
+        ]
@@ -39,6 +39,8 @@ from .alerting import (
     EmailChannel,
     WebhookChannel,
     AnomalyDetector,
+    RollingStats,
+    EWMAStats,
     get_alert_manager,
     get_default_alert_rules
 )
@@ -71,6 +73,8 @@ __all__ = [
     "EmailChannel",
     "WebhookChannel",
     "AnomalyDetector",
+    "RollingStats",
+    "EWMAStats",
     "get_alert_manager",
     "get_default_alert_rules",
 
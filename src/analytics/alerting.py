@@ -12,6 +12,8 @@ from enum import Enum
 import asyncio
 import logging
 import json
+import time
+from collections import deque
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
@@ -296,6 +298,8 @@ class AlertManager:
     def __init__(self):
         """Initialize alert manager."""
         self.rules: Dict[str, AlertRule] = {}
+        # metric -> {rule name: rule}, so evaluation only touches matching rules
+        self.rules_by_metric: Dict[str, Dict[str, AlertRule]] = {}
         self.active_alerts: Dict[str, Alert] = {}
         self.alert_history: List[Alert] = []
         self.channels: List[NotificationChannel] = []
@@ -308,18 +312,28 @@ class AlertManager:
         Args:
             rule: Alert rule to add
         """
+        self.remove_rule(rule.name, log=False)
         self.rules[rule.name] = rule
+        self.rules_by_metric.setdefault(rule.metric, {})[rule.name] = rule
         logger.info(f"Added alert rule: {rule.name}")
 
-    def remove_rule(self, rule_name: str):
+    def remove_rule(self, rule_name: str, log: bool = True):
         """
         Remove an alert rule.
 
         Args:
             rule_name: Name of rule to remove
+            log: Log the removal
         """
-        if rule_name in self.rules:
-            del self.rules[rule_name]
+        rule = self.rules.pop(rule_name, None)
+        if rule is None:
+            return
+        same_metric = self.rules_by_metric.get(rule.metric)
+        if same_metric is not None:
+            same_metric.pop(rule_name, None)
+            if not same_metric:
+                del self.rules_by_metric[rule.metric]
+        if log:
             logger.info(f"Removed alert rule: {rule_name}")
 
     def add_channel(self, channel: NotificationChannel):
@@ -334,20 +348,30 @@ class AlertManager:
 
     async def evaluate(self, metrics: Dict[str, float]):
         """
-        Evaluate all rules against current metrics.
+        Evaluate the rules watching the given metrics.
+
+        Only rules whose metric is present are looked at, so cost follows the
+        number of reported metrics rather than the number of rules.
 
         Args:
             metrics: Dictionary of metric_name -> value
         """
-        for rule_name, rule in self.rules.items():
+        # Walk whichever side is smaller
+        if len(metrics) <= len(self.rules_by_metric):
+            watched = [metric for metric in metrics if metric in self.rules_by_metric]
+        else:
+            watched = [metric for metric in self.rules_by_metric if metric in metrics]
+
+        matching = [
+            (rule, metrics[metric])
+            for metric in watched
+            for rule in self.rules_by_metric[metric].values()
+        ]
+
+        for rule, current_value in matching:
             if not rule.enabled:
                 continue
-
-            # Check if metric exists
-            if rule.metric not in metrics:
-                continue
-
-            current_value = metrics[rule.metric]
+            rule_name = rule.name
 
             # Evaluate condition
             triggered = self._evaluate_condition(
@@ -489,59 +513,197 @@ class AlertManager:
 # ANOMALY DETECTION
 # ============================================================
 
+class RollingStats:
+    """
+    Mean and variance of the last ``window_size`` values, updated in O(1).
+
+    Welford's update is applied for each value entering the ring buffer and
+    reversed for the value it evicts. The sums are recomputed from the buffer
+    now and then to shed accumulated floating point error.
+    """
+
+    RECOMPUTE_EVERY = 10_000
+
+    def __init__(self, window_size: int):
+        self.window = deque(maxlen=window_size)
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return len(self.window)
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the window"""
+        return max(self._m2, 0.0) / len(self.window) if self.window else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        return self.variance ** 0.5
+
+    def push(self, value: float):
+        """Add a value, evicting the oldest once the window is full"""
+        if len(self.window) == self.window.maxlen:
+            old = self.window[0]
+            n = len(self.window) - 1
+            if n == 0:
+                self.mean, self._m2 = 0.0, 0.0
+            else:
+                delta = old - self.mean
+                self.mean -= delta / n
+                self._m2 -= delta * (old - self.mean)
+        self.window.append(value)
+
+        n = len(self.window)
+        delta = value - self.mean
+        self.mean += delta / n
+        self._m2 += delta * (value - self.mean)
+
+        self._updates += 1
+        if self._updates >= self.RECOMPUTE_EVERY:
+            self._recompute()
+
+    def _recompute(self):
+        n = len(self.window)
+        self.mean = sum(self.window) / n
+        self._m2 = sum((x - self.mean) ** 2 for x in self.window)
+        self._updates = 0
+
+
+class EWMAStats:
+    """
+    Exponentially weighted mean and variance, updated in O(1).
+
+    Recent values weigh more, so the baseline follows gradual drift instead of
+    keeping a fixed window.
+    """
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.mean = 0.0
+        self.variance = 0.0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def std_dev(self) -> float:
+        return self.variance ** 0.5
+
+    def push(self, value: float):
+        self.count += 1
+        if self.count == 1:
+            self.mean = value
+            return
+        delta = value - self.mean
+        increment = self.alpha * delta
+        self.mean += increment
+        self.variance = (1 - self.alpha) * (self.variance + delta * increment)
+
+
 class AnomalyDetector:
     """
     Simple anomaly detection using statistical methods.
 
-    Uses moving average and standard deviation to detect anomalies.
+    Flags values more than ``std_threshold`` standard deviations from the
+    baseline of earlier values. Baselines are maintained incrementally, so a
+    datapoint costs O(1):
+
+    - method="window": mean/std of the last ``window_size`` values
+    - method="ewma": exponentially weighted mean/std (alpha defaults to
+      2 / (window_size + 1))
+
+    With ``season_period`` set (seconds, e.g. 86400), each metric keeps one
+    baseline per ``season_buckets`` slice of the period, so a value is compared
+    to what is normal for that time of day/week.
     """
 
-    def __init__(self, window_size: int = 20, std_threshold: float = 3.0):
+    def __init__(
+        self,
+        window_size: int = 20,
+        std_threshold: float = 3.0,
+        method: str = "window",
+        alpha: Optional[float] = None,
+        season_period: Optional[float] = None,
+        season_buckets: int = 24,
+    ):
         """
         Initialize anomaly detector.
 
         Args:
-            window_size: Number of data points for moving window
+            window_size: Number of data points for moving window (and warm-up)
             std_threshold: Number of standard deviations for anomaly threshold
+            method: "window" or "ewma"
+            alpha: EWMA smoothing factor
+            season_period: Length of the seasonal cycle in seconds (None = off)
+            season_buckets: Number of baselines per seasonal cycle
         """
+        if method not in ("window", "ewma"):
+            raise ValueError(f"Unknown anomaly detection method: {method}")
         self.window_size = window_size
         self.std_threshold = std_threshold
-        self.data_windows: Dict[str, List[float]] = {}
-
-    def add_datapoint(self, metric: str, value: float) -> bool:
+        self.method = method
+        self.alpha = alpha if alpha is not None else 2.0 / (window_size + 1)
+        self.season_period = season_period
+        self.season_buckets = max(1, season_buckets)
+        self.baselines: Dict[Any, Any] = {}
+
+    @property
+    def data_windows(self) -> Dict[Any, List[float]]:
+        """Current window contents per metric (window method)"""
+        return {
+            key: list(stats.window)
+            for key, stats in self.baselines.items()
+            if isinstance(stats, RollingStats)
+        }
+
+    def _baseline_key(self, metric: str, timestamp: Optional[float]):
+        if not self.season_period:
+            return metric
+        ts = timestamp if timestamp is not None else time.time()
+        bucket = int((ts % self.season_period) / self.season_period * self.season_buckets)
+        return (metric, bucket)
+
+    def get_baseline(self, metric: str, timestamp: Optional[float] = None) -> Optional[Dict[str, float]]:
+        """Current mean/std used for a metric (None before any data)"""
+        stats = self.baselines.get(self._baseline_key(metric, timestamp))
+        if stats is None:
+            return None
+        return {"mean": stats.mean, "std": stats.std_dev, "count": len(stats)}
+
+    def add_datapoint(self, metric: str, value: float, timestamp: Optional[float] = None) -> bool:
         """
         Add a datapoint and check for anomaly.
 
         Args:
             metric: Metric name
             value: Metric value
+            timestamp: Unix time of the sample (seasonal baselines; default now)
 
         Returns:
             True if anomaly detected, False otherwise
         """
-        # Initialize window if needed
-        if metric not in self.data_windows:
-            self.data_windows[metric] = []
-
-        window = self.data_windows[metric]
+        key = self._baseline_key(metric, timestamp)
+        stats = self.baselines.get(key)
+        if stats is None:
+            stats = RollingStats(self.window_size) if self.method == "window" else EWMAStats(self.alpha)
+            self.baselines[key] = stats
 
         # Not enough data yet
-        if len(window) < self.window_size:
-            window.append(value)
+        if len(stats) < self.window_size:
+            stats.push(value)
             return False
 
-        # Calculate statistics
-        mean = sum(window) / len(window)
-        variance = sum((x - mean) ** 2 for x in window) / len(window)
-        std_dev = variance ** 0.5
+        mean = stats.mean
+        std_dev = stats.std_dev
 
         # Check if anomaly
         is_anomaly = abs(value - mean) > (self.std_threshold * std_dev)
 
-        # Update window
-        window.append(value)
-        if len(window) > self.window_size:
-            window.pop(0)
+        # Update baseline
+        stats.push(value)
 
         if is_anomaly:
             logger.warning(
@@ -8,6 +8,7 @@ Components:
 - QueryCache: Multi-layer query result cache (L1, L2, L3)
 - EmbeddingCache: Embedding caching with compression
 - CacheInvalidator: Smart invalidation based on file changes
+- InvalidationBus: Cross-process invalidation broadcast (Redis / SQLite)
 - PredictivePrefetcher: Pattern-based query prediction
 - CacheStats: Prometheus metrics and monitoring
 """
@@ -15,6 +16,7 @@ Components:
 from .query_cache import QueryCache, get_query_cache
 from .embedding_cache import EmbeddingCache, get_embedding_cache
 from .invalidation import CacheInvalidator, get_cache_invalidator
+from .invalidation_bus import InvalidationBus, create_invalidation_bus
 from .prefetcher import PredictivePrefetcher, get_prefetcher
 from .stats import CacheStats, get_cache_stats
 
@@ -25,6 +27,8 @@ __all__ = [
     "get_embedding_cache",
     "CacheInvalidator",
     "get_cache_invalidator",
+    "InvalidationBus",
+    "create_invalidation_bus",
     "PredictivePrefetcher",
     "get_prefetcher",
     "CacheStats",
@@ -7,6 +7,7 @@ Features:
 - Incremental invalidation (not full cache clear)
 - Batch invalidation (group file changes)
 - Debouncing to avoid invalidation storms
+- Optional cross-process broadcast via InvalidationBus (multi-worker deployments)
 """
 
 import asyncio
@@ -49,6 +50,7 @@ class CacheInvalidator:
         debounce_seconds: float = 2.0,
         batch_size: int = 50,
         stats=None,
+        bus=None,
     ):
         """
         Initialize cache invalidator
@@ -59,6 +61,7 @@ class CacheInvalidator:
             debounce_seconds: Debounce interval to batch changes
             batch_size: Maximum batch size for invalidation
             stats: CacheStats instance
+            bus: InvalidationBus for broadcasting to other worker processes
         """
         # Lazy import to avoid circular dependencies
         self.query_cache = query_cache
@@ -83,6 +86,11 @@ class CacheInvalidator:
         # Patterns for broad invalidation
         self._invalidation_patterns: Dict[str, Set[str]] = defaultdict(set)
 
+        # Cross-process bus (remote messages are applied without re-publishing)
+        self.bus = bus
+        if self.bus is not None:
+            self.bus.start(self._apply_remote)
+
         logger.info(
             f"Cache invalidator initialized (debounce: {debounce_seconds}s, "
             f"batch: {batch_size})"
@@ -159,6 +167,7 @@ class CacheInvalidator:
             pattern: File pattern (e.g., '*.py', 'src/**/*.ts')
         """
         logger.info(f"Invalidating by pattern: {pattern}")
+        self._publish("pattern", [pattern])
 
         # Get affected files from pattern
         affected_files = self._get_files_matching_pattern(pattern)
@@ -217,6 +226,8 @@ class CacheInvalidator:
         files_to_invalidate = modified_files + deleted_files
 
         if files_to_invalidate:
+            self._publish("files", files_to_invalidate)
+
             # Split into batches
             for i in range(0, len(files_to_invalidate), self.batch_size):
                 batch = files_to_invalidate[i : i + self.batch_size]
@@ -274,6 +285,7 @@ class CacheInvalidator:
             project_path: Project root path
         """
         logger.info(f"Invalidating project: {project_path}")
+        self._publish("project", [project_path])
 
         query_cache = self.get_query_cache()
 
@@ -298,12 +310,54 @@ class CacheInvalidator:
         Use sparingly - defeats the purpose of caching!
         """
         logger.warning("Invalidating ALL caches")
+        self._publish("all")
 
         query_cache = self.get_query_cache()
         query_cache.clear_all()
 
         logger.info("All caches cleared")
 
+    def _publish(self, kind: str, targets: Optional[List[str]] = None):
+        """Broadcast an invalidation to other workers (no-op without a bus)"""
+        if self.bus is not None:
+            self.bus.publish(kind, targets)
+
+    def _apply_remote(self, message):
+        """
+        Apply an invalidation broadcast by another worker
+
+        Runs on the bus listener thread, so it uses the synchronous
+        QueryCache path and resolves patterns against this process's index.
+        """
+        query_cache = self.get_query_cache()
+
+        if message.kind == "all":
+            query_cache.clear_local()
+            return
+
+        if message.kind == "files":
+            files = message.targets
+        elif message.kind == "pattern":
+            files = set()
+            for pattern in message.targets:
+                files |= self._get_files_matching_pattern(pattern)
+        elif message.kind == "project":
+            with query_cache._map_lock:
+                tracked = list(query_cache._file_query_map.keys())
+            files = [fp for fp in tracked if any(fp.startswith(p) for p in message.targets)]
+        else:
+            logger.warning(f"Unknown remote invalidation kind: {message.kind}")
+            return
+
+        invalidated = 0
+        for file_path in files:
+            invalidated += query_cache.invalidate_file_local(file_path)
+
+        logger.debug(
+            f"Applied remote {message.kind} invalidation from {message.origin}: "
+            f"{invalidated} queries"
+        )
+
     def get_pending_count(self) -> int:
         """Get number of pending invalidations"""
         with self._pending_lock:
@@ -320,6 +374,7 @@ class CacheInvalidator:
             "running": self._running,
             "tracked_files": len(query_cache._file_query_map),
             "tracked_queries": len(query_cache._query_file_map),
+            "bus": self.bus.get_statistics() if self.bus is not None else None,
         }
 
     def stop(self):
@@ -327,6 +382,8 @@ class CacheInvalidator:
         self._running = False
         if self._debounce_task:
             self._debounce_task.cancel()
+        if self.bus is not None:
+            self.bus.close()
         logger.info("Cache invalidator stopped")
 
 
@@ -341,5 +398,7 @@ def get_cache_invalidator() -> CacheInvalidator:
     if _cache_invalidator is None:
         with _invalidator_lock:
             if _cache_invalidator is None:
-                _cache_invalidator = CacheInvalidator()
+                from .invalidation_bus import create_invalidation_bus
+
+                _cache_invalidator = CacheInvalidator(bus=create_invalidation_bus())
     return _cache_invalidator
@@ -0,0 +1,311 @@
+"""
+Cross-Process Cache Invalidation Bus
+
+Broadcasts cache invalidations between worker processes so that a file change
+observed by one HTTP worker also drops stale L1 entries in every other worker.
+
+Backends:
+- RedisInvalidationBackend: Redis pub/sub (multi-host)
+- SQLiteInvalidationBackend: shared SQLite file polled by each worker (single host)
+- LocalInvalidationBackend: in-process loopback (tests, single worker)
+
+Messages carry an origin id; each worker ignores its own broadcasts.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+REDIS_CHANNEL = "qcache:invalidate"
+
+
+@dataclass
+class InvalidationMessage:
+    """A broadcast invalidation (files, pattern, project or all)"""
+
+    kind: str  # 'files', 'pattern', 'project', 'all'
+    targets: List[str] = field(default_factory=list)
+    origin: str = ""
+    timestamp: float = field(default_factory=time.time)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw) -> "InvalidationMessage":
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        data = json.loads(raw)
+        return cls(
+            kind=data["kind"],
+            targets=list(data.get("targets") or []),
+            origin=data.get("origin", ""),
+            timestamp=float(data.get("timestamp", 0.0)),
+        )
+
+
+MessageHandler = Callable[[InvalidationMessage], None]
+
+
+class InvalidationBackend:
+    """Transport for invalidation messages"""
+
+    name = "base"
+
+    def publish(self, message: InvalidationMessage):
+        raise NotImplementedError
+
+    def start(self, handler: MessageHandler):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class LocalInvalidationBackend(InvalidationBackend):
+    """
+    In-process loopback backend
+
+    Every bus attached to the same instance receives every message, which
+    mimics several workers sharing one transport.
+    """
+
+    name = "local"
+
+    def __init__(self):
+        self._handlers: List[MessageHandler] = []
+        self._lock = threading.Lock()
+
+    def publish(self, message: InvalidationMessage):
+        with self._lock:
+            handlers = list(self._handlers)
+        for handler in handlers:
+            handler(message)
+
+    def start(self, handler: MessageHandler):
+        with self._lock:
+            self._handlers.append(handler)
+
+    def close(self):
+        with self._lock:
+            self._handlers.clear()
+
+
+class RedisInvalidationBackend(InvalidationBackend):
+    """Redis pub/sub backend with a background listener thread"""
+
+    name = "redis"
+
+    def __init__(self, redis_client, channel: str = REDIS_CHANNEL):
+        self.redis_client = redis_client
+        self.channel = channel
+        self._pubsub = None
+        self._thread = None
+
+    def publish(self, message: InvalidationMessage):
+        self.redis_client.publish(self.channel, message.to_json())
+
+    def start(self, handler: MessageHandler):
+        def on_message(raw):
+            try:
+                handler(InvalidationMessage.from_json(raw["data"]))
+            except Exception as e:
+                logger.warning(f"Invalid invalidation message: {e}")
+
+        self._pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.channel: on_message})
+        self._thread = self._pubsub.run_in_thread(sleep_time=0.1, daemon=True)
+
+    def close(self):
+        if self._thread is not None:
+            self._thread.stop()
+            self._thread = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+
+class SQLiteInvalidationBackend(InvalidationBackend):
+    """
+    Single-host backend using a shared SQLite file
+
+    Publishers append rows; each worker polls for rows newer than the last one
+    it has seen. Rows older than ``retention_seconds`` are pruned on publish.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        poll_interval: float = 0.5,
+        retention_seconds: float = 300.0,
+    ):
+        self.db_path = db_path or os.path.join(tempfile.gettempdir(), "context_cache_invalidation.db")
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self._stop = threading.Event()
+        self._thread = None
+        # One autocommit connection shared by publishers and the poll thread
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            self.db_path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn_lock = threading.Lock()
+        with self._conn_lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS invalidations ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, created REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            row = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM invalidations").fetchone()
+        # Only deliver messages published after this worker attached
+        self._last_id = int(row[0])
+
+    def _execute(self, sql: str, params: tuple = ()) -> list:
+        with self._conn_lock:
+            if self._conn is None:
+                raise RuntimeError("SQLite invalidation backend is closed")
+            return self._conn.execute(sql, params).fetchall()
+
+    def publish(self, message: InvalidationMessage):
+        now = time.time()
+        self._execute(
+            "INSERT INTO invalidations (created, payload) VALUES (?, ?)",
+            (now, message.to_json()),
+        )
+        self._execute("DELETE FROM invalidations WHERE created < ?", (now - self.retention_seconds,))
+
+    def poll(self) -> List[InvalidationMessage]:
+        """Fetch messages published since the last poll"""
+        rows = self._execute(
+            "SELECT id, payload FROM invalidations WHERE id > ? ORDER BY id",
+            (self._last_id,),
+        )
+        messages = []
+        for row_id, payload in rows:
+            self._last_id = max(self._last_id, int(row_id))
+            try:
+                messages.append(InvalidationMessage.from_json(payload))
+            except Exception as e:
+                logger.warning(f"Invalid invalidation message: {e}")
+        return messages
+
+    def start(self, handler: MessageHandler):
+        def poll_loop():
+            while not self._stop.wait(self.poll_interval):
+                try:
+                    for message in self.poll():
+                        handler(message)
+                except Exception as e:
+                    logger.warning(f"Invalidation poll failed: {e}")
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=poll_loop, name="cache-invalidation-poll", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval * 2)
+            self._thread = None
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class InvalidationBus:
+    """
+    Publishes local invalidations and applies remote ones
+
+    The handler receives messages from other workers only; messages carrying
+    this bus's origin id are dropped.
+    """
+
+    def __init__(self, backend: InvalidationBackend, origin: Optional[str] = None):
+        self.backend = backend
+        self.origin = origin or f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.published = 0
+        self.received = 0
+        self._handler: Optional[MessageHandler] = None
+
+    def start(self, handler: MessageHandler):
+        """Begin delivering remote messages to handler"""
+        self._handler = handler
+        self.backend.start(self._dispatch)
+
+    def _dispatch(self, message: InvalidationMessage):
+        if message.origin == self.origin or self._handler is None:
+            return
+        self.received += 1
+        try:
+            self._handler(message)
+        except Exception as e:
+            logger.error(f"Failed to apply remote invalidation: {e}")
+
+    def publish(self, kind: str, targets: Optional[List[str]] = None):
+        """Broadcast an invalidation to other workers"""
+        message = InvalidationMessage(kind=kind, targets=list(targets or []), origin=self.origin)
+        try:
+            self.backend.publish(message)
+            self.published += 1
+        except Exception as e:
+            logger.warning(f"Failed to publish invalidation ({self.backend.name}): {e}")
+
+    def get_statistics(self) -> dict:
+        return {
+            "backend": self.backend.name,
+            "origin": self.origin,
+            "published": self.published,
+            "received": self.received,
+        }
+
+    def close(self):
+        self.backend.close()
+
+
+def create_invalidation_bus(backend: Optional[str] = None) -> Optional[InvalidationBus]:
+    """
+    Build the bus configured in settings
+
+    Args:
+        backend: Override for settings.cache_invalidation_bus ('none', 'redis', 'sqlite')
+
+    Returns:
+        InvalidationBus or None when disabled/unavailable
+    """
+    try:
+        from src.config.settings import settings
+    except Exception:
+        settings = None
+
+    kind = (backend or getattr(settings, "cache_invalidation_bus", "none") or "none").lower()
+    if kind == "none":
+        return None
+
+    try:
+        if kind == "redis":
+            import redis
+
+            client = redis.from_url(getattr(settings, "redis_url", None), socket_connect_timeout=5)
+            client.ping()
+            return InvalidationBus(RedisInvalidationBackend(client))
+        if kind == "sqlite":
+            return InvalidationBus(
+                SQLiteInvalidationBackend(
+                    db_path=getattr(settings, "cache_invalidation_bus_path", None) or None,
+                    poll_interval=getattr(settings, "cache_invalidation_poll_seconds", 0.5),
+                )
+            )
+        logger.warning(f"Unknown cache invalidation bus backend: {kind}")
+    except Exception as e:
+        logger.warning(f"Cache invalidation bus disabled: {e}")
+    return None
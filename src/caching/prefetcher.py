@@ -16,6 +16,7 @@ from typing import Dict, List, Optional, Tuple, Set, Any, Callable
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 import threading
+from array import array
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,49 @@ class MarkovState:
     transition_count: int = 0
 
 
+class _ProjectQueryIndex:
+    """
+    Bounded, incrementally maintained token -> query inverted index
+
+    Holds the last ``window`` queries recorded for one project. Similarity
+    lookups only touch posting lists of the incoming query's tokens, so cost
+    is proportional to the number of matches rather than the history size.
+    """
+
+    __slots__ = ("window", "recent", "occurrences", "postings")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.recent: deque = deque()  # query ids, oldest first
+        self.occurrences: Dict[int, int] = {}  # query id -> count within window
+        self.postings: Dict[str, Set[int]] = defaultdict(set)  # token -> query ids
+
+    def add(self, query_id: int, tokens: frozenset):
+        self.recent.append(query_id)
+        count = self.occurrences.get(query_id, 0)
+        self.occurrences[query_id] = count + 1
+        if count == 0:
+            for token in tokens:
+                self.postings[token].add(query_id)
+
+    def evict_oldest(self, tokens_of: Callable[[int], frozenset]):
+        query_id = self.recent.popleft()
+        count = self.occurrences[query_id] - 1
+        if count:
+            self.occurrences[query_id] = count
+            return
+        del self.occurrences[query_id]
+        for token in tokens_of(query_id):
+            posting = self.postings.get(token)
+            if posting is not None:
+                posting.discard(query_id)
+                if not posting:
+                    del self.postings[token]
+
+    def __len__(self) -> int:
+        return len(self.recent)
+
+
 class PatternAnalyzer:
     """
     Analyzes user query patterns using Markov chains and sequence mining
@@ -48,6 +92,11 @@ class PatternAnalyzer:
     - Temporal patterns (queries at specific times)
     - Context patterns (queries in specific contexts)
     - User-specific patterns
+
+    Queries are interned to integer ids. Markov transitions keep per-state
+    totals in a compact array, trigrams are indexed by their two-query
+    prefix and context similarity uses a per-project inverted index, so
+    prediction cost is O(matches) independent of history size.
     """
 
     def __init__(self, history_size: int = 1000, min_confidence: float = 0.1):
@@ -55,7 +104,8 @@ class PatternAnalyzer:
         Initialize pattern analyzer
 
         Args:
-            history_size: Maximum query history to maintain
+            history_size: Maximum query history to maintain (per project for
+                context patterns); scales to ~100k
             min_confidence: Minimum confidence for predictions
         """
         self.history_size = history_size
@@ -65,20 +115,35 @@ class PatternAnalyzer:
         self._query_history: deque = deque(maxlen=history_size)
         self._history_lock = threading.Lock()
 
-        # Markov chain: query -> next queries with counts
-        self._transitions: Dict[str, Dict[str, int]] = defaultdict(
-            lambda: defaultdict(int)
-        )
+        # Interned queries: text <-> id, plus cached token sets
+        self._query_ids: Dict[str, int] = {}
+        self._queries: List[str] = []
+        self._query_tokens: List[frozenset] = []
 
-        # Context-based patterns
-        self._context_patterns: Dict[str, List[str]] = defaultdict(list)
+        # Markov chain: state id -> {next id: count}; totals[state id] = row sum
+        self._transitions: Dict[int, Dict[int, int]] = defaultdict(dict)
+        self._transition_totals = array("L")
 
-        # Frequent sequences (2-gram, 3-gram)
-        self._bigrams: Dict[Tuple[str, str], int] = defaultdict(int)
-        self._trigrams: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        # Context-based patterns (project -> inverted index)
+        self._context_patterns: Dict[str, _ProjectQueryIndex] = {}
+
+        # Frequent sequences: bigrams by pair, trigrams by 2-query prefix
+        self._bigrams: Dict[Tuple[int, int], int] = defaultdict(int)
+        self._trigrams: Dict[Tuple[int, int], Dict[int, int]] = defaultdict(dict)
 
         logger.info("Pattern analyzer initialized")
 
+    def _intern(self, query: str) -> int:
+        """Return the id of a query, assigning one if new (lock held)"""
+        query_id = self._query_ids.get(query)
+        if query_id is None:
+            query_id = len(self._queries)
+            self._query_ids[query] = query_id
+            self._queries.append(query)
+            self._query_tokens.append(frozenset(query.lower().split()))
+            self._transition_totals.append(0)
+        return query_id
+
     def record_query(
         self, query: str, context: Optional[Dict[str, Any]] = None, user_id: str = None
     ):
@@ -91,6 +156,7 @@ class PatternAnalyzer:
             user_id: User ID
         """
         with self._history_lock:
+            query_id = self._intern(query)
             pattern = QueryPattern(
                 query=query, timestamp=time.time(), context=context
             )
@@ -100,22 +166,30 @@ class PatternAnalyzer:
 
             # Update Markov chain
             if len(self._query_history) >= 2:
-                prev_query = self._query_history[-2].query
-                self._transitions[prev_query][query] += 1
+                prev_id = self._query_ids[self._query_history[-2].query]
+                row = self._transitions[prev_id]
+                row[query_id] = row.get(query_id, 0) + 1
+                self._transition_totals[prev_id] += 1
 
                 # Update bigram
-                self._bigrams[(prev_query, query)] += 1
+                self._bigrams[(prev_id, query_id)] += 1
 
             # Update trigram
             if len(self._query_history) >= 3:
-                query1 = self._query_history[-3].query
-                query2 = self._query_history[-2].query
-                self._trigrams[(query1, query2, query)] += 1
+                id1 = self._query_ids[self._query_history[-3].query]
+                id2 = self._query_ids[self._query_history[-2].query]
+                followers = self._trigrams[(id1, id2)]
+                followers[query_id] = followers.get(query_id, 0) + 1
 
             # Update context patterns
             if context and "current_project" in context:
                 project = context["current_project"]
-                self._context_patterns[project].append(query)
+                index = self._context_patterns.get(project)
+                if index is None:
+                    index = self._context_patterns[project] = _ProjectQueryIndex(self.history_size)
+                index.add(query_id, self._query_tokens[query_id])
+                if len(index) > index.window:
+                    index.evict_oldest(self._query_tokens.__getitem__)
 
     def predict_next_queries(
         self,
@@ -134,46 +208,67 @@ class PatternAnalyzer:
         Returns:
             List of (query, probability) tuples
         """
-        predictions: Dict[str, float] = defaultdict(float)
-
-        # Markov chain predictions
-        if current_query in self._transitions:
-            next_queries = self._transitions[current_query]
-            total_count = sum(next_queries.values())
-
-            for next_query, count in next_queries.items():
-                probability = count / total_count
-                if probability >= self.min_confidence:
-                    predictions[next_query] += probability * 0.6  # 60% weight
-
-        # Context-based predictions
-        if context and "current_project" in context:
-            project = context["current_project"]
-            if project in self._context_patterns:
-                # Find similar patterns
-                similar = self._find_similar_queries(
-                    current_query, self._context_patterns[project]
-                )
-                for similar_query in similar[:3]:
-                    predictions[similar_query] += 0.2  # 20% weight
-
-        # Trigram predictions (if we have recent context)
+        predictions: Dict[int, float] = defaultdict(float)
+
         with self._history_lock:
-            if len(self._query_history) >= 1:
-                prev_query = self._query_history[-1].query
-                trigram_key = (prev_query, current_query)
-
-                # Find trigrams starting with these two queries
-                for (q1, q2, q3), count in self._trigrams.items():
-                    if (q1, q2) == trigram_key:
-                        predictions[q3] += 0.2  # 20% weight
-
-        # Sort by probability
-        sorted_predictions = sorted(
-            predictions.items(), key=lambda x: x[1], reverse=True
-        )
+            current_id = self._query_ids.get(current_query)
+
+            # Markov chain predictions
+            if current_id is not None and current_id in self._transitions:
+                total_count = self._transition_totals[current_id]
+                for next_id, count in self._transitions[current_id].items():
+                    probability = count / total_count
+                    if probability >= self.min_confidence:
+                        predictions[next_id] += probability * 0.6  # 60% weight
+
+            # Context-based predictions
+            if context and "current_project" in context:
+                index = self._context_patterns.get(context["current_project"])
+                if index is not None:
+                    # Find similar patterns
+                    for similar_id in self._find_similar_ids(current_query, index, top_k=3):
+                        predictions[similar_id] += 0.2  # 20% weight
+
+            # Trigram predictions (if we have recent context). The current
+            # query is usually already the last history entry.
+            if current_id is not None and self._query_history:
+                offset = 2 if self._query_history[-1].query == current_query else 1
+                if len(self._query_history) >= offset:
+                    prev_id = self._query_ids[self._query_history[-offset].query]
+                    for next_id in self._trigrams.get((prev_id, current_id), ()):
+                        predictions[next_id] += 0.2  # 20% weight
+
+            # Sort by probability
+            sorted_predictions = sorted(
+                predictions.items(), key=lambda x: x[1], reverse=True
+            )[:top_k]
+            return [(self._queries[qid], score) for qid, score in sorted_predictions]
+
+    def _find_similar_ids(
+        self, query: str, index: _ProjectQueryIndex, top_k: int = 5
+    ) -> List[int]:
+        """
+        Find ids of indexed queries similar to the given query (Jaccard)
+
+        Only queries sharing at least one token are visited.
+        """
+        query_words = frozenset(query.lower().split())
+        if not query_words:
+            return []
 
-        return sorted_predictions[:top_k]
+        intersections: Dict[int, int] = defaultdict(int)
+        for word in query_words:
+            for candidate_id in index.postings.get(word, ()):
+                intersections[candidate_id] += 1
+
+        similarities = []
+        for candidate_id, intersection in intersections.items():
+            union = len(query_words) + len(self._query_tokens[candidate_id]) - intersection
+            similarities.append((candidate_id, intersection / union))
+
+        # Sort by similarity
+        similarities.sort(key=lambda x: x[1], reverse=True)
+        return [qid for qid, _ in similarities[:top_k]]
 
     def _find_similar_queries(
         self, query: str, candidate_queries: List[str], top_k: int = 5
@@ -189,22 +284,12 @@ class PatternAnalyzer:
         Returns:
             List of similar queries
         """
-        # Simple word-based similarity
-        query_words = set(query.lower().split())
-
-        similarities = []
-        for candidate in candidate_queries:
-            candidate_words = set(candidate.lower().split())
-            # Jaccard similarity
-            intersection = len(query_words & candidate_words)
-            union = len(query_words | candidate_words)
-            similarity = intersection / union if union > 0 else 0.0
-            if similarity > 0:
-                similarities.append((candidate, similarity))
-
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return [q for q, _ in similarities[:top_k]]
+        index = _ProjectQueryIndex(window=len(candidate_queries))
+        with self._history_lock:
+            for candidate in candidate_queries:
+                candidate_id = self._intern(candidate)
+                index.add(candidate_id, self._query_tokens[candidate_id])
+            return [self._queries[qid] for qid in self._find_similar_ids(query, index, top_k)]
 
     def get_frequent_sequences(self, min_count: int = 3) -> List[Tuple[Tuple, int]]:
         """
@@ -217,16 +302,18 @@ class PatternAnalyzer:
             List of (sequence, count) tuples
         """
         frequent = []
+        queries = self._queries
 
         # Bigrams
-        for bigram, count in self._bigrams.items():
+        for (id1, id2), count in self._bigrams.items():
             if count >= min_count:
-                frequent.append((bigram, count))
+                frequent.append(((queries[id1], queries[id2]), count))
 
         # Trigrams
-        for trigram, count in self._trigrams.items():
-            if count >= min_count:
-                frequent.append((trigram, count))
+        for (id1, id2), followers in self._trigrams.items():
+            for id3, count in followers.items():
+                if count >= min_count:
+                    frequent.append(((queries[id1], queries[id2], queries[id3]), count))
 
         # Sort by count
         frequent.sort(key=lambda x: x[1], reverse=True)
@@ -236,9 +323,10 @@ class PatternAnalyzer:
         """Get pattern analysis statistics"""
         return {
             "query_history_size": len(self._query_history),
+            "distinct_queries": len(self._queries),
             "markov_states": len(self._transitions),
             "bigrams": len(self._bigrams),
-            "trigrams": len(self._trigrams),
+            "trigrams": sum(len(f) for f in self._trigrams.values()),
             "context_patterns": len(self._context_patterns),
         }
 
@@ -11,6 +11,7 @@ Features:
 - Cache invalidation on file changes
 - LRU eviction policy
 - Promotion from L2 -> L1 on hit
+- Optional semantic tier: near-duplicate queries reuse results by embedding similarity
 """
 
 import asyncio
@@ -21,111 +22,219 @@ import pickle
 import sys
 import time
 from collections import OrderedDict
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 import threading
 
 logger = logging.getLogger(__name__)
 
 
+# Containers larger than this are sized from a sample and extrapolated
+_SIZE_SAMPLE_ITEMS = 32
+_SIZE_MAX_DEPTH = 6
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    Cheap structural size estimate of a Python object graph
+
+    Walks containers recursively (bounded depth) summing ``sys.getsizeof``.
+    Large containers are sampled and extrapolated so the cost stays bounded
+    regardless of result-list length.
+
+    Args:
+        value: Object to size
+        _depth: Current recursion depth (internal)
+
+    Returns:
+        Approximate size in bytes
+    """
+    size = sys.getsizeof(value)
+    if _depth >= _SIZE_MAX_DEPTH or isinstance(value, (str, bytes, bytearray, int, float, bool)):
+        return size
+
+    if isinstance(value, dict):
+        items = value.items()
+        count = len(value)
+        if count > _SIZE_SAMPLE_ITEMS:
+            items = list(items)[:_SIZE_SAMPLE_ITEMS]
+        sampled = sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in items)
+        sample_len = min(count, _SIZE_SAMPLE_ITEMS)
+        return size + (sampled * count // sample_len if sample_len else 0)
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        count = len(value)
+        if isinstance(value, (list, tuple)):
+            sample = value[:_SIZE_SAMPLE_ITEMS]
+        else:
+            sample = [v for _, v in zip(range(_SIZE_SAMPLE_ITEMS), value)]
+        sampled = sum(estimate_size(v, _depth + 1) for v in sample)
+        return size + (sampled * count // len(sample) if sample else 0)
+
+    attrs = getattr(value, "__dict__", None)
+    if attrs is not None:
+        return size + estimate_size(attrs, _depth + 1)
+
+    return size
+
+
+class _LRUSegment:
+    """Single lock-protected shard of an LRUCache"""
+
+    __slots__ = ("lock", "entries", "size", "max_size", "evictions")
+
+    def __init__(self, max_size: int):
+        self.lock = threading.Lock()
+        # key -> (value, timestamp, size)
+        self.entries: OrderedDict = OrderedDict()
+        self.size = 0
+        self.max_size = max_size
+        self.evictions = 0
+
+
 class LRUCache:
     """
     Thread-safe LRU cache with size and TTL limits
 
-    Uses OrderedDict for O(1) access and LRU eviction
+    Keys are hashed across ``segments`` independent shards, each with its own
+    lock, OrderedDict and share of the byte budget, so concurrent HTTP workers
+    rarely contend. Entry sizes come from the caller (e.g. the length of bytes
+    already serialized for L2) or from a cheap structural estimate.
     """
 
-    def __init__(self, max_size_bytes: int = 100_000_000, ttl_seconds: int = 300):
+    def __init__(
+        self,
+        max_size_bytes: int = 100_000_000,
+        ttl_seconds: int = 300,
+        segments: int = 16,
+        on_evict: Optional[Callable[[str, int], None]] = None,
+    ):
         """
         Args:
             max_size_bytes: Maximum cache size (default 100MB)
             ttl_seconds: Time-to-live for entries (default 5min)
+            segments: Number of lock shards (default 16)
+            on_evict: Optional callback(key, size) invoked after an LRU eviction
         """
         self.max_size_bytes = max_size_bytes
         self.ttl_seconds = ttl_seconds
-        self._cache: OrderedDict = OrderedDict()
-        self._lock = threading.Lock()
-        self._current_size = 0
+        self.segment_count = max(1, int(segments))
+        self.on_evict = on_evict
+        per_segment = max(1, max_size_bytes // self.segment_count)
+        self._segments = [_LRUSegment(per_segment) for _ in range(self.segment_count)]
+
+    def _segment(self, key: str) -> _LRUSegment:
+        return self._segments[hash(key) % self.segment_count]
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache, moving to end (most recently used)"""
-        with self._lock:
-            if key not in self._cache:
+        seg = self._segment(key)
+        with seg.lock:
+            entry = seg.entries.get(key)
+            if entry is None:
                 return None
 
-            entry = self._cache[key]
-
             # Check TTL
-            if time.time() - entry["timestamp"] > self.ttl_seconds:
-                self._remove_entry(key)
+            if time.time() - entry[1] > self.ttl_seconds:
+                self._remove_entry(seg, key)
                 return None
 
             # Move to end (most recently used)
-            self._cache.move_to_end(key)
-            return entry["value"]
+            seg.entries.move_to_end(key)
+            return entry[0]
 
-    def set(self, key: str, value: Any) -> int:
+    def set(self, key: str, value: Any, size: Optional[int] = None) -> int:
         """
         Set value in cache with LRU eviction
 
+        Args:
+            key: Cache key
+            value: Value to cache
+            size: Known size in bytes (e.g. len of serialized payload);
+                estimated structurally when omitted
+
         Returns:
             Size in bytes of the cached value
         """
-        with self._lock:
-            # Calculate size
-            size = sys.getsizeof(pickle.dumps(value))
-
-            # Evict if needed
-            while (
-                self._current_size + size > self.max_size_bytes and len(self._cache) > 0
-            ):
-                self._evict_lru()
+        if size is None:
+            size = estimate_size(value)
 
+        seg = self._segment(key)
+        evicted: List[tuple] = []
+        with seg.lock:
             # Remove old entry if exists
-            if key in self._cache:
-                self._remove_entry(key)
+            if key in seg.entries:
+                self._remove_entry(seg, key)
+
+            # Evict if needed
+            while seg.size + size > seg.max_size and seg.entries:
+                evicted.append(self._evict_lru(seg))
 
             # Add new entry
-            self._cache[key] = {"value": value, "timestamp": time.time(), "size": size}
-            self._current_size += size
+            seg.entries[key] = (value, time.time(), size)
+            seg.size += size
 
-            return size
+        if self.on_evict is not None:
+            for evicted_key, evicted_size in evicted:
+                try:
+                    self.on_evict(evicted_key, evicted_size)
+                except Exception as e:
+                    logger.debug(f"Eviction callback failed: {e}")
+
+        return size
 
     def delete(self, key: str) -> bool:
         """Delete entry from cache"""
-        with self._lock:
-            if key in self._cache:
-                self._remove_entry(key)
+        seg = self._segment(key)
+        with seg.lock:
+            if key in seg.entries:
+                self._remove_entry(seg, key)
                 return True
             return False
 
     def clear(self):
         """Clear all entries"""
-        with self._lock:
-            self._cache.clear()
-            self._current_size = 0
+        for seg in self._segments:
+            with seg.lock:
+                seg.entries.clear()
+                seg.size = 0
 
     def size_bytes(self) -> int:
         """Get current cache size in bytes"""
-        with self._lock:
-            return self._current_size
+        total = 0
+        for seg in self._segments:
+            with seg.lock:
+                total += seg.size
+        return total
 
     def item_count(self) -> int:
         """Get number of items in cache"""
-        with self._lock:
-            return len(self._cache)
-
-    def _evict_lru(self):
-        """Evict least recently used entry"""
-        if not self._cache:
-            return
-
-        key, _ = self._cache.popitem(last=False)  # Remove first (LRU)
+        total = 0
+        for seg in self._segments:
+            with seg.lock:
+                total += len(seg.entries)
+        return total
+
+    def eviction_count(self) -> int:
+        """Get total number of LRU evictions since creation"""
+        total = 0
+        for seg in self._segments:
+            with seg.lock:
+                total += seg.evictions
+        return total
+
+    def _evict_lru(self, seg: _LRUSegment) -> tuple:
+        """Evict least recently used entry of a segment (lock held)"""
+        key, entry = seg.entries.popitem(last=False)  # Remove first (LRU)
+        seg.size -= entry[2]
+        seg.evictions += 1
         logger.debug(f"Evicted LRU entry: {key[:16]}...")
+        return key, entry[2]
 
-    def _remove_entry(self, key: str):
-        """Remove entry and update size"""
-        entry = self._cache.pop(key)
-        self._current_size -= entry["size"]
+    @staticmethod
+    def _remove_entry(seg: _LRUSegment, key: str):
+        """Remove entry and update size (lock held)"""
+        entry = seg.entries.pop(key)
+        seg.size -= entry[2]
 
 
 class QueryCache:
@@ -140,11 +249,18 @@ class QueryCache:
     - Cache key generation from query + context
     """
 
+    # Redis set per file holding the query keys that accessed it (shared by workers)
+    FILE_INDEX_PREFIX = "qcache:files:"
+    # JSON list of accessed files stored beside each L2 payload (same TTL)
+    DEPS_PREFIX = "qcache:deps:"
+
     def __init__(
         self,
         redis_url: Optional[str] = None,
         enable_redis: bool = True,
         stats=None,
+        enable_semantic: bool = False,
+        semantic_threshold: float = 0.92,
     ):
         """
         Initialize multi-layer cache
@@ -153,9 +269,20 @@ class QueryCache:
             redis_url: Redis connection URL
             enable_redis: Whether to enable Redis (L2) layer
             stats: CacheStats instance for metrics
+            enable_semantic: Whether to match near-duplicate queries by embedding
+            semantic_threshold: Minimum cosine similarity for a semantic hit
         """
+        # Stats
+        from .stats import get_cache_stats
+
+        self.stats = stats or get_cache_stats()
+
         # L1: In-memory cache
-        self.l1 = LRUCache(max_size_bytes=100_000_000, ttl_seconds=300)  # 100MB, 5min
+        self.l1 = LRUCache(
+            max_size_bytes=100_000_000,
+            ttl_seconds=300,
+            on_evict=lambda _key, size: self.stats.record_eviction("l1", size),
+        )  # 100MB, 5min
 
         # L2: Redis cache
         self.redis_client = None
@@ -178,10 +305,12 @@ class QueryCache:
         # L3: Pre-computed queries
         self.l3_queries: Set[str] = set()
 
-        # Stats
-        from .stats import get_cache_stats
+        # Semantic tier: query embedding -> exact cache key (opt-in)
+        self.semantic_cache = None
+        if enable_semantic:
+            from .semantic_cache import SemanticCache
 
-        self.stats = stats or get_cache_stats()
+            self.semantic_cache = SemanticCache(similarity_threshold=semantic_threshold)
 
         # File -> Query mapping for invalidation
         self._file_query_map: Dict[str, Set[str]] = {}
@@ -232,15 +361,27 @@ class QueryCache:
         key_string = "|".join(key_parts)
         return hashlib.sha256(key_string.encode()).hexdigest()
 
+    def _scope_key(self, context: Optional[Dict[str, Any]] = None) -> str:
+        """Scope for semantic matching: same project and filters only"""
+        if not context:
+            return ""
+        project = context.get("current_project", "")
+        filters = json.dumps(context.get("filters"), sort_keys=True) if "filters" in context else ""
+        return f"{project}|{filters}"
+
     async def get(
-        self, query: str, context: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        context: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> Optional[List[Any]]:
         """
-        Get cached query results (L1 -> L2 -> L3 -> Miss)
+        Get cached query results (L1 -> L2 -> L3 -> Semantic -> Miss)
 
         Args:
             query: Search query
             context: Search context
+            query_embedding: Query embedding for the semantic tier (optional)
 
         Returns:
             Cached results or None if not found
@@ -259,17 +400,16 @@ class QueryCache:
         # L2: Redis cache
         if self.redis_enabled:
             try:
-                cached_data = self.redis_client.get(f"qcache:{query_key}")
+                cached_data, deps = self.redis_client.mget(
+                    f"qcache:{query_key}", f"{self.DEPS_PREFIX}{query_key}"
+                )
                 if cached_data:
                     result = pickle.loads(cached_data)
                     latency = (time.time() - start_time) * 1000
                     self.stats.record_hit("l2", latency)
                     logger.debug(f"L2 cache hit: {query[:50]}... ({latency:.2f}ms)")
 
-                    # Promote to L1
-                    size = self.l1.set(query_key, result)
-                    self.stats.record_set("l1", size)
-
+                    self._promote_to_l1(query_key, result, cached_data, deps)
                     return result
             except Exception as e:
                 logger.warning(f"L2 cache error: {e}")
@@ -289,22 +429,78 @@ class QueryCache:
                         )
 
                         # Promote to L1 and L2
-                        size = self.l1.set(query_key, result)
+                        size = self.l1.set(query_key, result, size=len(cached_data))
                         self.stats.record_set("l1", size)
-                        if self.redis_enabled:
-                            self._set_redis(f"qcache:{query_key}", result, ttl=3600)
+                        self.redis_client.setex(f"qcache:{query_key}", 3600, cached_data)
 
                         return result
             except Exception as e:
                 logger.warning(f"L3 cache error: {e}")
                 self.stats.record_error("l3")
 
+        # Semantic: reuse results of a near-duplicate query in the same scope
+        if self.semantic_cache is not None and query_embedding is not None:
+            scope = self._scope_key(context)
+            similar_key, similarity = self.semantic_cache.lookup(scope, query_embedding)
+            result = self._get_exact(similar_key) if similar_key is not None else None
+            if result is not None:
+                latency = (time.time() - start_time) * 1000
+                self.stats.record_semantic_lookup(similarity, hit=True, latency_ms=latency)
+                logger.debug(
+                    f"Semantic cache hit: {query[:50]}... (sim={similarity:.3f}, {latency:.2f}ms)"
+                )
+                return result
+            if similar_key is not None:
+                # Underlying entry expired or was invalidated
+                self.semantic_cache.discard(scope, similar_key)
+            self.stats.record_semantic_lookup(similarity, hit=False)
+
         # Cache miss
         latency = (time.time() - start_time) * 1000
         self.stats.record_miss(latency)
         logger.debug(f"Cache miss: {query[:50]}... ({latency:.2f}ms)")
         return None
 
+    def _get_exact(self, query_key: str) -> Optional[Any]:
+        """Fetch a cache key from L1, falling back to L2 (promoting on hit)"""
+        result = self.l1.get(query_key)
+        if result is not None or not self.redis_enabled:
+            return result
+        try:
+            cached_data, deps = self.redis_client.mget(
+                f"qcache:{query_key}", f"{self.DEPS_PREFIX}{query_key}"
+            )
+            if cached_data:
+                result = pickle.loads(cached_data)
+                self._promote_to_l1(query_key, result, cached_data, deps)
+                return result
+        except Exception as e:
+            logger.warning(f"L2 cache error: {e}")
+            self.stats.record_error("l2")
+        return None
+
+    def _promote_to_l1(
+        self, query_key: str, result: Any, cached_data: bytes, deps: Optional[bytes]
+    ):
+        """
+        Copy an L2 hit into L1 and register its files in the local reverse index
+
+        The file list stored next to the L2 payload lets pattern/project
+        invalidations and shared-index misses still find promoted entries.
+        """
+        # Serialized length is a good size proxy
+        size = self.l1.set(query_key, result, size=len(cached_data))
+        self.stats.record_set("l1", size)
+
+        if deps:
+            try:
+                files = json.loads(deps)
+            except ValueError:
+                logger.warning(f"Corrupt dependency list for query key {query_key}")
+                return
+            if files:
+                self._track_file_access(query_key, files, share=False)
+
     async def set(
         self,
         query: str,
@@ -312,6 +508,7 @@ class QueryCache:
         context: Optional[Dict[str, Any]] = None,
         accessed_files: Optional[List[str]] = None,
         ttl: int = 3600,
+        query_embedding: Optional[List[float]] = None,
     ):
         """
         Cache query results in L1 and L2
@@ -322,32 +519,44 @@ class QueryCache:
             context: Search context
             accessed_files: Files accessed during search (for invalidation)
             ttl: Time-to-live in seconds (for L2)
+            query_embedding: Query embedding to register with the semantic tier
         """
         query_key = self.generate_cache_key(query, context)
 
+        # Serialize once when L2 is active and reuse the byte length for L1 sizing
+        payload: Optional[bytes] = None
+        if self.redis_enabled:
+            try:
+                payload = pickle.dumps(results)
+            except Exception as e:
+                logger.warning(f"Failed to serialize results for L2: {e}")
+                self.stats.record_error("l2")
+
         # Store in L1
-        size = self.l1.set(query_key, results)
+        size = self.l1.set(query_key, results, size=len(payload) if payload is not None else None)
         self.stats.record_set("l1", size)
 
         # Store in L2 (Redis)
-        if self.redis_enabled:
+        if payload is not None:
             try:
-                self._set_redis(f"qcache:{query_key}", results, ttl)
-                self.stats.record_set("l2", len(pickle.dumps(results)))
+                pipe = self.redis_client.pipeline()
+                pipe.setex(f"qcache:{query_key}", ttl, payload)
+                if accessed_files:
+                    pipe.setex(f"{self.DEPS_PREFIX}{query_key}", ttl, json.dumps(list(accessed_files)))
+                pipe.execute()
+                self.stats.record_set("l2", len(payload))
             except Exception as e:
                 logger.warning(f"Failed to cache in L2: {e}")
                 self.stats.record_error("l2")
 
         # Track file-query relationships for invalidation
         if accessed_files:
-            self._track_file_access(query_key, accessed_files)
+            self._track_file_access(query_key, accessed_files, ttl=ttl)
 
-        logger.debug(f"Cached query: {query[:50]}... ({len(results)} results)")
+        if self.semantic_cache is not None and query_embedding is not None:
+            self.semantic_cache.add(self._scope_key(context), query_key, query_embedding)
 
-    def _set_redis(self, key: str, value: Any, ttl: int):
-        """Set value in Redis with TTL"""
-        if self.redis_enabled:
-            self.redis_client.setex(key, ttl, pickle.dumps(value))
+        logger.debug(f"Cached query: {query[:50]}... ({len(results)} results)")
 
     async def invalidate_file(self, file_path: str):
         """
@@ -356,11 +565,36 @@ class QueryCache:
         Args:
             file_path: Path to the file that changed
         """
+        self.invalidate_file_local(file_path)
+
+    def invalidate_file_local(self, file_path: str) -> int:
+        """
+        Synchronously invalidate queries that accessed a file
+
+        Resolves affected keys from this process's reverse index and, when
+        Redis is enabled, the shared ``qcache:files:*`` index populated by
+        every worker. Safe to call from non-event-loop threads (e.g. the
+        invalidation bus listener).
+
+        Args:
+            file_path: Path to the file that changed
+
+        Returns:
+            Number of affected queries
+        """
         with self._map_lock:
             affected_queries = self._file_query_map.get(file_path, set()).copy()
 
+        if self.redis_enabled:
+            try:
+                shared_key = f"{self.FILE_INDEX_PREFIX}{file_path}"
+                shared = self.redis_client.smembers(shared_key) or set()
+                affected_queries.update(k.decode() if isinstance(k, bytes) else k for k in shared)
+            except Exception as e:
+                logger.warning(f"Failed to read shared file index: {e}")
+
         if not affected_queries:
-            return
+            return 0
 
         logger.info(
             f"Invalidating {len(affected_queries)} queries for file: {file_path}"
@@ -375,11 +609,23 @@ class QueryCache:
             # L2
             if self.redis_enabled:
                 try:
-                    self.redis_client.delete(f"qcache:{query_key}")
+                    self.redis_client.delete(
+                        f"qcache:{query_key}", f"{self.DEPS_PREFIX}{query_key}"
+                    )
                     self.stats.record_invalidation("l2")
                 except Exception as e:
                     logger.warning(f"Failed to invalidate L2: {e}")
 
+        # Drop only the keys we resolved: peers that see the broadcast later
+        # still need the rest of the shared set (it expires with its entries)
+        if self.redis_enabled:
+            try:
+                self.redis_client.srem(
+                    f"{self.FILE_INDEX_PREFIX}{file_path}", *affected_queries
+                )
+            except Exception as e:
+                logger.warning(f"Failed to update shared file index: {e}")
+
         # Update tracking
         with self._map_lock:
             for query_key in affected_queries:
@@ -390,6 +636,7 @@ class QueryCache:
                 del self._file_query_map[file_path]
 
         self.stats.record_invalidation("file", len(affected_queries))
+        return len(affected_queries)
 
     async def invalidate_batch(self, file_paths: List[str]):
         """
@@ -403,8 +650,10 @@ class QueryCache:
         tasks = [self.invalidate_file(fp) for fp in file_paths]
         await asyncio.gather(*tasks, return_exceptions=True)
 
-    def _track_file_access(self, query_key: str, file_paths: List[str]):
-        """Track which files were accessed by a query"""
+    def _track_file_access(
+        self, query_key: str, file_paths: List[str], ttl: int = 3600, share: bool = True
+    ):
+        """Track which files were accessed by a query (``share`` mirrors into Redis)"""
         with self._map_lock:
             # Query -> Files
             if query_key not in self._query_file_map:
@@ -417,6 +666,18 @@ class QueryCache:
                     self._file_query_map[file_path] = set()
                 self._file_query_map[file_path].add(query_key)
 
+        # Mirror into the shared index so other workers can resolve our L2 keys
+        if share and self.redis_enabled:
+            try:
+                pipe = self.redis_client.pipeline()
+                for file_path in file_paths:
+                    shared_key = f"{self.FILE_INDEX_PREFIX}{file_path}"
+                    pipe.sadd(shared_key, query_key)
+                    pipe.expire(shared_key, ttl)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"Failed to update shared file index: {e}")
+
     async def precompute_query(self, query: str, results: List[Any], ttl: int = 86400):
         """
         Store query in L3 pre-computed cache
@@ -431,8 +692,9 @@ class QueryCache:
 
         if self.redis_enabled:
             try:
-                self._set_redis(f"qcache:l3:{query_key}", results, ttl)
-                self.stats.record_set("l3", len(pickle.dumps(results)))
+                payload = pickle.dumps(results)
+                self.redis_client.setex(f"qcache:l3:{query_key}", ttl, payload)
+                self.stats.record_set("l3", len(payload))
                 logger.info(f"Pre-computed query: {query[:50]}...")
             except Exception as e:
                 logger.warning(f"Failed to precompute query: {e}")
@@ -446,15 +708,33 @@ class QueryCache:
                 "item_count": self.l1.item_count(),
                 "max_size_bytes": self.l1.max_size_bytes,
                 "ttl_seconds": self.l1.ttl_seconds,
+                "segments": self.l1.segment_count,
+                "evictions": self.l1.eviction_count(),
             },
             "l2": {"enabled": self.redis_enabled},
             "l3": {"precomputed_queries": len(self.l3_queries)},
+            "semantic": {
+                "enabled": self.semantic_cache is not None,
+                "item_count": self.semantic_cache.item_count() if self.semantic_cache else 0,
+                "similarity_threshold": (
+                    self.semantic_cache.similarity_threshold if self.semantic_cache else None
+                ),
+            },
             "tracking": {
                 "tracked_files": len(self._file_query_map),
                 "tracked_queries": len(self._query_file_map),
             },
         }
 
+    def clear_local(self):
+        """Clear this process's L1 layer and reverse index (L2 untouched)"""
+        self.l1.clear()
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
+        with self._map_lock:
+            self._file_query_map.clear()
+            self._query_file_map.clear()
+
     def clear_all(self):
         """Clear all cache layers"""
         self.l1.clear()
@@ -468,6 +748,8 @@ class QueryCache:
                 logger.warning(f"Failed to clear L2: {e}")
 
         self.l3_queries.clear()
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
         self._file_query_map.clear()
         self._query_file_map.clear()
 
@@ -485,5 +767,12 @@ def get_query_cache() -> QueryCache:
     if _query_cache is None:
         with _cache_lock:
             if _query_cache is None:
-                _query_cache = QueryCache()
+                try:
+                    from src.config.settings import settings
+
+                    enable_semantic = bool(getattr(settings, "semantic_query_cache_enabled", False))
+                    threshold = float(getattr(settings, "semantic_query_cache_threshold", 0.92))
+                except Exception:
+                    enable_semantic, threshold = False, 0.92
+                _query_cache = QueryCache(enable_semantic=enable_semantic, semantic_threshold=threshold)
     return _query_cache
@@ -0,0 +1,147 @@
+"""
+Semantic Query Cache Tier
+
+Maps query embeddings to exact cache keys so that near-duplicate queries
+("find auth middleware" vs "authentication middleware") reuse cached results.
+
+Features:
+- Per-scope index (project + filters) so matches never cross scopes
+- Normalized embeddings in a fixed-capacity NumPy ring buffer per scope
+- Single matrix-vector product per lookup (cosine similarity)
+- Configurable similarity threshold
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class _ScopeIndex:
+    """Ring buffer of normalized embeddings for one scope"""
+
+    __slots__ = ("vectors", "keys", "slots", "count", "next_slot")
+
+    def __init__(self, dim: int, capacity: int):
+        self.vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self.keys: List[Optional[str]] = [None] * capacity
+        self.slots: Dict[str, int] = {}
+        self.count = 0
+        self.next_slot = 0
+
+    def add(self, key: str, vector: np.ndarray):
+        slot = self.slots.get(key)
+        if slot is None:
+            capacity = len(self.keys)
+            slot = self.next_slot
+            self.next_slot = (self.next_slot + 1) % capacity
+            evicted = self.keys[slot]
+            if evicted is not None:
+                self.slots.pop(evicted, None)
+            else:
+                self.count += 1
+            self.keys[slot] = key
+            self.slots[key] = slot
+        self.vectors[slot] = vector
+
+    def remove(self, key: str):
+        slot = self.slots.pop(key, None)
+        if slot is not None:
+            self.keys[slot] = None
+            self.vectors[slot] = 0.0
+            self.count -= 1
+
+    def nearest(self, vector: np.ndarray) -> Tuple[Optional[str], float]:
+        if self.count == 0:
+            return None, 0.0
+        sims = self.vectors @ vector
+        idx = int(np.argmax(sims))
+        return self.keys[idx], float(sims[idx])
+
+
+class SemanticCache:
+    """
+    Embedding-keyed index over exact cache keys
+
+    Only stores (embedding -> cache key); results stay in the L1/L2 layers,
+    so invalidation of the underlying key automatically disables the match.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        max_entries_per_scope: int = 2048,
+        max_scopes: int = 256,
+    ):
+        """
+        Args:
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            max_entries_per_scope: Ring-buffer capacity per scope
+            max_scopes: Maximum number of scopes kept (LRU)
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_entries_per_scope = max_entries_per_scope
+        self.max_scopes = max_scopes
+        self._scopes: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def add(self, scope: str, cache_key: str, embedding: Sequence[float]):
+        """Register the embedding of a cached query"""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        with self._lock:
+            index = self._scopes.get(scope)
+            if index is None or index.vectors.shape[1] != vector.shape[0]:
+                index = _ScopeIndex(vector.shape[0], self.max_entries_per_scope)
+                self._scopes[scope] = index
+                while len(self._scopes) > self.max_scopes:
+                    self._scopes.popitem(last=False)
+            self._scopes.move_to_end(scope)
+            index.add(cache_key, vector)
+
+    def lookup(self, scope: str, embedding: Sequence[float]) -> Tuple[Optional[str], float]:
+        """
+        Find the closest cached query in scope
+
+        Returns:
+            (cache_key, similarity) when above threshold, else (None, best_similarity)
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return None, 0.0
+        with self._lock:
+            index = self._scopes.get(scope)
+            if index is None or index.vectors.shape[1] != vector.shape[0]:
+                return None, 0.0
+            key, similarity = index.nearest(vector)
+        if key is not None and similarity >= self.similarity_threshold:
+            return key, similarity
+        return None, similarity
+
+    def discard(self, scope: str, cache_key: str):
+        """Drop a stale mapping (e.g. underlying entry was invalidated)"""
+        with self._lock:
+            index = self._scopes.get(scope)
+            if index is not None:
+                index.remove(cache_key)
+
+    def clear(self):
+        with self._lock:
+            self._scopes.clear()
+
+    def item_count(self) -> int:
+        with self._lock:
+            return sum(index.count for index in self._scopes.values())
@@ -6,6 +6,7 @@ Tracks cache performance metrics and exposes them to Prometheus:
 - Cache sizes
 - Invalidation events
 - Latency metrics
+- Semantic-tier lookups and hits by similarity band
 """
 
 import logging
@@ -17,6 +18,19 @@ import threading
 
 logger = logging.getLogger(__name__)
 
+# Lower bounds of the similarity bands reported for the semantic tier
+SEMANTIC_BANDS = (0.99, 0.97, 0.95, 0.92, 0.85, 0.0)
+
+
+def _semantic_band(similarity: float) -> str:
+    """Label of the band a cosine similarity falls in (e.g. '0.95-0.97')"""
+    upper = 1.0
+    for lower in SEMANTIC_BANDS:
+        if similarity >= lower:
+            return f"{lower:.2f}-{upper:.2f}"
+        upper = lower
+    return f"{SEMANTIC_BANDS[-1]:.2f}-{upper:.2f}"
+
 
 @dataclass
 class CacheMetrics:
@@ -64,6 +78,11 @@ class CacheStats:
     prefetch_hits: int = 0
     file_invalidations: int = 0
 
+    # Semantic tier (band label -> count)
+    semantic_hits: int = 0
+    semantic_lookups_by_band: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    semantic_hits_by_band: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
     # Pattern analysis
     query_patterns: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
 
@@ -145,6 +164,30 @@ class CacheStats:
             elif layer == "l3":
                 self.l3_metrics.errors += 1
 
+    def record_semantic_lookup(self, similarity: float, hit: bool, latency_ms: float = 0.0):
+        """
+        Record a semantic-tier lookup
+
+        Misses are still counted in the overall miss via record_miss; hits
+        count as requests served from cache.
+        """
+        band = _semantic_band(similarity)
+        with self._lock:
+            self.semantic_lookups_by_band[band] += 1
+            if hit:
+                self.total_requests += 1
+                self.semantic_hits += 1
+                self.semantic_hits_by_band[band] += 1
+                self.l1_metrics.total_latency_ms += latency_ms
+
+    def get_semantic_band_hit_rates(self) -> Dict[str, float]:
+        """Hit rate percentage per similarity band"""
+        return {
+            band: round(self.semantic_hits_by_band.get(band, 0) / lookups * 100, 2)
+            for band, lookups in sorted(self.semantic_lookups_by_band.items(), reverse=True)
+            if lookups
+        }
+
     def record_prefetch(self, hit: bool = False):
         """Record prefetch operation"""
         with self._lock:
@@ -160,7 +203,10 @@ class CacheStats:
     def get_overall_hit_rate(self) -> float:
         """Calculate overall cache hit rate"""
         total_hits = (
-            self.l1_metrics.hits + self.l2_metrics.hits + self.l3_metrics.hits
+            self.l1_metrics.hits
+            + self.l2_metrics.hits
+            + self.l3_metrics.hits
+            + self.semantic_hits
         )
         return (
             (total_hits / self.total_requests * 100) if self.total_requests > 0 else 0.0
@@ -219,6 +265,12 @@ class CacheStats:
                 "errors": self.l3_metrics.errors,
                 "item_count": self.l3_metrics.item_count,
             },
+            "semantic": {
+                "hits": self.semantic_hits,
+                "lookups_by_band": dict(self.semantic_lookups_by_band),
+                "hits_by_band": dict(self.semantic_hits_by_band),
+                "hit_rate_by_band_percent": self.get_semantic_band_hit_rates(),
+            },
             "top_patterns": sorted(
                 self.query_patterns.items(), key=lambda x: x[1], reverse=True
             )[:10],
@@ -322,6 +374,16 @@ class CacheStats:
             f"cache_prefetch_effectiveness_percent {self.get_prefetch_effectiveness():.2f}"
         )
 
+        # Semantic tier
+        metrics.append("# HELP cache_semantic_lookups_total Semantic lookups by similarity band")
+        metrics.append("# TYPE cache_semantic_lookups_total counter")
+        for band, count in sorted(self.semantic_lookups_by_band.items()):
+            metrics.append(f'cache_semantic_lookups_total{{band="{band}"}} {count}')
+        metrics.append("# HELP cache_semantic_hits_total Semantic hits by similarity band")
+        metrics.append("# TYPE cache_semantic_hits_total counter")
+        for band, count in sorted(self.semantic_hits_by_band.items()):
+            metrics.append(f'cache_semantic_hits_total{{band="{band}"}} {count}')
+
         # Errors
         metrics.append("# HELP cache_errors_total Total cache errors")
         metrics.append("# TYPE cache_errors_total counter")
@@ -341,6 +403,9 @@ class CacheStats:
             self.prefetch_count = 0
             self.prefetch_hits = 0
             self.file_invalidations = 0
+            self.semantic_hits = 0
+            self.semantic_lookups_by_band.clear()
+            self.semantic_hits_by_band.clear()
             self.query_patterns.clear()
 
 
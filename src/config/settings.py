@@ -51,6 +51,12 @@ class Settings(BaseSettings):
     )
     qdrant_timeout: int = Field(default=30, ge=1, le=300)
     qdrant_max_retries: int = Field(default=3, ge=1, le=10)
+    project_similarity_subcentroids: int = Field(
+        default=0,
+        ge=0,
+        le=16,
+        description="k-means sub-centroids kept per project for project similarity (0 = single centroid)",
+    )
 
     # Ollama AI processing
     ollama_base_url: str = "http://localhost:11434"
@@ -72,10 +78,12 @@ class Settings(BaseSettings):
     # Correlation ID
     correlation_id_header: str = "X-Request-ID"
 
-    # Rate limiting (simple in-process)
+    # Rate limiting (GCRA, see src/mcp_server/rate_limit.py)
     rate_limit_enabled: bool = False
     rate_limit_requests_per_minute: int = 60
     rate_limit_key: str = "ip"  # options: ip, api_key
+    rate_limit_burst: Optional[int] = None  # back-to-back requests allowed; defaults to the per-minute limit
+    rate_limit_backend: str = "memory"  # options: memory, redis (shared by all workers)
 
     # Conversation state (in-memory)
     conversation_state_enabled: bool = True
@@ -125,11 +133,20 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
     log_format: str = "json"
+    log_async: bool = True  # format and write records on a background thread
+    log_info_sample_every: int = 1  # keep 1 in N INFO records from sampled loggers
+    log_sampled_loggers: str = "src.indexing"  # comma-separated logger prefixes
+    audit_max_bytes: int = 10 * 1024 * 1024  # rotate logs/audit.log at this size
+    audit_backup_count: int = 5
 
     # Performance settings
     max_search_results: int = 50
     cache_ttl_seconds: int = 1800
     indexing_batch_size: int = 100
+    # Workspace project indexing pipeline
+    workspace_index_workers: int = 0  # global read/embed/upsert budget (0 = CPU count, max 8)
+    workspace_index_embed_batch: int = 64  # texts per embedding call
+    workspace_index_queue_size: int = 256  # items buffered between pipeline stages
 
     # Embeddings provider (feature-flagged)
     embeddings_provider: str = Field(
@@ -334,6 +351,30 @@ class Settings(BaseSettings):
         default=False,
         description="Warm a small set of common texts on startup to reduce first-hit latency",
     )
+    semantic_query_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse cached results for near-duplicate queries (same project/filters) by embedding similarity",
+    )
+    semantic_query_cache_threshold: float = Field(
+        default=0.92,
+        ge=0.5,
+        le=1.0,
+        description="Minimum cosine similarity for a semantic query cache hit",
+    )
+    cache_invalidation_bus: str = Field(
+        default="none",
+        description="Cross-process cache invalidation bus for workers > 1: 'none', 'redis', or 'sqlite' (single host)",
+    )
+    cache_invalidation_bus_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file shared by workers when cache_invalidation_bus='sqlite' (defaults to the temp dir)",
+    )
+    cache_invalidation_poll_seconds: float = Field(
+        default=0.5,
+        ge=0.05,
+        le=10.0,
+        description="Polling interval for the SQLite invalidation bus",
+    )
 
 
     model_config = SettingsConfigDict(
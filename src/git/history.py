@@ -8,6 +8,8 @@ import logging
 import subprocess
 from typing import List, Dict, Any, Optional
 
+from src.git.reader import get_git_reader
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,23 +31,18 @@ def run_git_command(args: List[str], cwd: Optional[str] = None) -> str:
 
 def get_recent_commits(n: int = 10, cwd: Optional[str] = None) -> List[Dict[str, Any]]:
     """Get last n commits with basic info"""
-    fmt = "%H|%an|%ad|%s"
-    out = run_git_command(
-        ["log", f"-n{n}", f"--pretty=format:{fmt}", "--date=iso"], cwd
-    )
-    commits = []
-    for line in out.splitlines():
-        parts = line.split("|", 3)
-        if len(parts) == 4:
-            commits.append(
-                {
-                    "hash": parts[0],
-                    "author": parts[1],
-                    "date": parts[2],
-                    "subject": parts[3],
-                }
-            )
-    return commits
+    reader = get_git_reader(cwd or ".")
+    if reader is None:
+        return []
+    return [
+        {
+            "hash": commit.hash,
+            "author": commit.author_name,
+            "date": commit.author_date,
+            "subject": commit.subject,
+        }
+        for commit in reader.recent_commits(n)
+    ]
 
 
 def get_changed_files(ref: str = "HEAD", cwd: Optional[str] = None) -> List[str]:
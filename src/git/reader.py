@@ -0,0 +1,436 @@
+"""
+Long-lived Git Repository Reader
+
+Serves commit metadata, file contents at a revision and blame without forking
+``git`` per call:
+
+- One persistent ``git cat-file --batch`` process per repository answers
+  object reads (``<rev>:<path>``)
+- Commit history (with changed files) is loaded by a single ``git log`` and
+  kept in memory; when HEAD moves only the new commits are read
+- HEAD is resolved from ``.git/HEAD`` and the ref files, so checking for a
+  new HEAD costs two small file reads instead of a process
+- Blame is cached per (path, HEAD, file mtime)
+"""
+
+import atexit
+import logging
+import os
+import re
+import subprocess
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_FIELD = "\x1f"
+_RECORD = "\x1e"
+_LOG_FORMAT = _RECORD + _FIELD.join(["%H", "%P", "%an", "%ae", "%at", "%ct", "%ai", "%s"])
+
+
+@dataclass
+class CommitInfo:
+    """Metadata of one commit"""
+    hash: str
+    parents: Tuple[str, ...]
+    author_name: str
+    author_email: str
+    author_time: int
+    commit_time: int
+    author_date: str  # ISO-like, as printed by %ai
+    subject: str
+    files: List[str] = field(default_factory=list)
+
+
+def relative_time(timestamp: int, now: Optional[float] = None) -> str:
+    """Human readable age, in the style of git's %ar"""
+    delta = max(0, int((now if now is not None else time.time()) - timestamp))
+    for unit, seconds in (
+        ("year", 365 * 86400),
+        ("month", 30 * 86400),
+        ("week", 7 * 86400),
+        ("day", 86400),
+        ("hour", 3600),
+        ("minute", 60),
+    ):
+        if delta >= 2 * seconds or (unit in ("minute", "hour") and delta >= seconds):
+            count = delta // seconds
+            return f"{count} {unit}{'s' if count != 1 else ''} ago"
+    return f"{delta} second{'s' if delta != 1 else ''} ago"
+
+
+class GitRepoReader:
+    """
+    Cached, fork-light access to one git repository.
+
+    Thread-safe; blocking (call through ``asyncio.to_thread`` from async code).
+    """
+
+    # Commits kept in the in-memory history
+    HISTORY_LIMIT = 5000
+    # Blame is cut to this many bytes, so only the first lines are blamed
+    BLAME_MAX_BYTES = 5000
+    BLAME_MAX_LINES = 40
+    BLAME_CACHE_SIZE = 256
+    GIT_TIMEOUT = 30
+
+    def __init__(self, path: str):
+        """
+        Open a repository.
+
+        Args:
+            path: Any directory inside the work tree
+
+        Raises:
+            ValueError: If path is not inside a git work tree
+        """
+        self.path = os.path.abspath(path)
+        self.stats = {
+            "git_processes": 0,
+            "object_reads": 0,
+            "history_loads": 0,
+            "history_updates": 0,
+            "blame_hits": 0,
+            "blame_misses": 0,
+        }
+
+        out = self._git(
+            "rev-parse", "--show-toplevel", "--show-prefix", "--git-dir", "--git-common-dir"
+        )
+        if out is None:
+            raise ValueError(f"Not a git repository: {path}")
+        lines = out.split("\n")
+        self.toplevel = lines[0]
+        self.prefix = lines[1]
+        self.git_dir = os.path.join(self.path, lines[2])
+        self.common_dir = os.path.join(self.path, lines[3])
+
+        self._lock = threading.RLock()
+        self._cat_lock = threading.Lock()
+        self._cat_file: Optional[subprocess.Popen] = None
+        self._closed = False
+
+        self._history_head: Optional[str] = None
+        self._commits: List[CommitInfo] = []
+        self._by_path: Dict[str, List[int]] = defaultdict(list)
+        self._blame_cache: "OrderedDict[Tuple[str, str, int], str]" = OrderedDict()
+
+    # ==================== Processes ====================
+
+    def _git(self, *args: str) -> Optional[str]:
+        """Run a one-shot git command (None on failure)"""
+        self.stats["git_processes"] += 1
+        try:
+            result = subprocess.run(
+                ["git", "-c", "core.quotePath=false", *args],
+                cwd=self.path,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=self.GIT_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"git {' '.join(args)} failed: {e}")
+            return None
+        if result.returncode != 0:
+            logger.debug(f"git {' '.join(args)} exited {result.returncode}: {result.stderr.strip()}")
+            return None
+        return result.stdout.rstrip("\n")
+
+    def _start_cat_file(self) -> subprocess.Popen:
+        if self._cat_file is None or self._cat_file.poll() is not None:
+            self.stats["git_processes"] += 1
+            self._cat_file = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._cat_file
+
+    def read_object(self, spec: str) -> Optional[bytes]:
+        """
+        Read an object through the persistent cat-file process.
+
+        Args:
+            spec: Any object name git understands (``<rev>:<path>``, a SHA, ...)
+
+        Returns:
+            Raw object content, or None if it does not exist
+        """
+        if "\n" in spec:
+            return None
+        with self._cat_lock:
+            for attempt in range(2):
+                if self._closed:
+                    # Evicted/closed readers must not respawn a process nobody stops
+                    logger.debug(f"read_object on closed reader for {self.path}")
+                    return None
+                proc = self._start_cat_file()
+                try:
+                    proc.stdin.write(spec.encode("utf-8") + b"\n")
+                    proc.stdin.flush()
+                    header = proc.stdout.readline().decode("utf-8", errors="replace").split()
+                    if len(header) != 3:
+                        # "<spec> missing" / "<spec> ambiguous"
+                        return None
+                    size = int(header[2])
+                    data = proc.stdout.read(size + 1)[:size]
+                    self.stats["object_reads"] += 1
+                    return data
+                except (BrokenPipeError, OSError, ValueError) as e:
+                    logger.debug(f"cat-file process failed ({e}); restarting")
+                    self._stop_cat_file()
+        return None
+
+    def _stop_cat_file(self):
+        proc, self._cat_file = self._cat_file, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except Exception:
+            proc.kill()
+
+    def close(self):
+        """Stop the persistent processes; later object reads return None"""
+        with self._cat_lock:
+            self._closed = True
+            self._stop_cat_file()
+
+    # ==================== HEAD ====================
+
+    def _read_ref(self, ref: str) -> Optional[str]:
+        for base in (self.git_dir, self.common_dir):
+            try:
+                with open(os.path.join(base, ref), "r") as f:
+                    return f.read().strip() or None
+            except OSError:
+                continue
+        try:
+            with open(os.path.join(self.common_dir, "packed-refs"), "r") as f:
+                for line in f:
+                    if line.endswith(f" {ref}\n") or line.rstrip("\n").endswith(f" {ref}"):
+                        return line.split(" ", 1)[0]
+        except OSError:
+            pass
+        return None
+
+    def head(self) -> Optional[str]:
+        """Current HEAD commit SHA (None for an unborn branch)"""
+        try:
+            with open(os.path.join(self.git_dir, "HEAD"), "r") as f:
+                content = f.read().strip()
+        except OSError:
+            return None
+        for _ in range(5):  # follow symbolic refs
+            if not content.startswith("ref:"):
+                return content or None
+            content = self._read_ref(content[4:].strip())
+            if content is None:
+                return None
+        return None
+
+    # ==================== History ====================
+
+    def _load_log(self, *revs: str) -> Optional[List[CommitInfo]]:
+        out = self._git(
+            "log", f"--max-count={self.HISTORY_LIMIT}", f"--pretty=format:{_LOG_FORMAT}",
+            "--name-only", *revs, "--"
+        )
+        if out is None:
+            return None
+        commits = []
+        for record in out.split(_RECORD):
+            if not record.strip():
+                continue
+            header, _, files = record.partition("\n")
+            parts = header.split(_FIELD)
+            if len(parts) != 8:
+                continue
+            commits.append(CommitInfo(
+                hash=parts[0],
+                parents=tuple(parts[1].split()),
+                author_name=parts[2],
+                author_email=parts[3],
+                author_time=int(parts[4] or 0),
+                commit_time=int(parts[5] or 0),
+                author_date=parts[6],
+                subject=parts[7],
+                files=[line for line in files.split("\n") if line],
+            ))
+        return commits
+
+    def _ensure_history(self) -> List[CommitInfo]:
+        """History up to the current HEAD (re-read only when HEAD moves)"""
+        head = self.head()
+        with self._lock:
+            if head is None:
+                return []
+            if head == self._history_head:
+                return self._commits
+
+            new_commits = None
+            if self._history_head is not None:
+                # Fast-forward: only read commits the old history lacks
+                new_commits = self._load_log(head, f"^{self._history_head}")
+                if new_commits is not None and not any(
+                    self._history_head in c.parents for c in new_commits
+                ):
+                    new_commits = None  # HEAD was rewritten, not extended
+                if new_commits is not None:
+                    commits = (new_commits + self._commits)[: self.HISTORY_LIMIT]
+                    self.stats["history_updates"] += 1
+
+            if new_commits is None:
+                commits = self._load_log(head)
+                if commits is None:
+                    return self._commits
+                self.stats["history_loads"] += 1
+
+            by_path: Dict[str, List[int]] = defaultdict(list)
+            for i, commit in enumerate(commits):
+                for path in commit.files:
+                    by_path[path].append(i)
+            self._commits = commits
+            self._by_path = by_path
+            self._history_head = head
+            return commits
+
+    def _repo_path(self, file_path: str) -> str:
+        """Path relative to the repository root (as listed by git log)"""
+        if os.path.isabs(file_path):
+            return os.path.relpath(file_path, self.toplevel).replace(os.sep, "/")
+        return os.path.normpath(os.path.join(self.prefix, file_path)).replace(os.sep, "/")
+
+    def recent_commits(
+        self,
+        limit: int = 20,
+        since: Optional[float] = None
+    ) -> List[CommitInfo]:
+        """
+        Newest commits reachable from HEAD.
+
+        Args:
+            limit: Maximum commits
+            since: Only commits with a commit time at or after this Unix time
+        """
+        commits = self._ensure_history()
+        if since is None:
+            return commits[:limit]
+        return [c for c in commits if c.commit_time >= since][:limit]
+
+    def commits_for_path(self, file_path: str, limit: Optional[int] = None) -> List[CommitInfo]:
+        """Commits that changed a file (path relative to the reader's directory)"""
+        commits = self._ensure_history()
+        with self._lock:
+            indices = self._by_path.get(self._repo_path(file_path), [])
+            return [commits[i] for i in (indices[:limit] if limit else indices)]
+
+    def commits_by_author(self, author: str, limit: int) -> List[CommitInfo]:
+        """Commits whose "name <email>" matches author (regex, like git log --author)"""
+        try:
+            pattern = re.compile(author)
+            matches = lambda text: pattern.search(text) is not None  # noqa: E731
+        except re.error:
+            matches = lambda text: author in text  # noqa: E731
+        return [
+            c for c in self._ensure_history()
+            if matches(f"{c.author_name} <{c.author_email}>")
+        ][:limit]
+
+    def show(self, rev: str, file_path: str) -> Optional[str]:
+        """File content at a revision (path relative to the repository root)"""
+        data = self.read_object(f"{rev}:{file_path}")
+        return data.decode("utf-8", errors="replace") if data is not None else None
+
+    # ==================== Blame ====================
+
+    def blame(self, file_path: str) -> Optional[str]:
+        """
+        Line-porcelain blame of the first lines of a work-tree file.
+
+        Output is limited to BLAME_MAX_BYTES, so only the lines that can fit
+        are blamed. Cached per (path, HEAD, mtime).
+        """
+        full_path = os.path.join(self.path, file_path)
+        try:
+            mtime_ns = os.stat(full_path).st_mtime_ns
+            with open(full_path, "rb") as f:
+                line_count = f.read(self.BLAME_MAX_BYTES * 4).count(b"\n") or 1
+        except OSError:
+            return None
+
+        key = (self._repo_path(file_path), self.head() or "", mtime_ns)
+        with self._lock:
+            cached = self._blame_cache.get(key)
+            if cached is not None:
+                self._blame_cache.move_to_end(key)
+                self.stats["blame_hits"] += 1
+                return cached
+
+        self.stats["blame_misses"] += 1
+        lines = min(line_count, self.BLAME_MAX_LINES)
+        out = self._git("blame", "--line-porcelain", "-L", f"1,{lines}", "--", file_path)
+        if out is None:
+            return None
+        blame = out[: self.BLAME_MAX_BYTES]
+
+        with self._lock:
+            self._blame_cache[key] = blame
+            if len(self._blame_cache) > self.BLAME_CACHE_SIZE:
+                self._blame_cache.popitem(last=False)
+        return blame
+
+
+# Readers per directory (None = not a repository, rechecked after a while)
+_readers: "OrderedDict[str, Tuple[Optional[GitRepoReader], float]]" = OrderedDict()
+_readers_lock = threading.Lock()
+MAX_READERS = 16
+NOT_A_REPO_TTL = 30.0
+
+
+def get_git_reader(path: str) -> Optional[GitRepoReader]:
+    """
+    Shared reader for the repository containing path.
+
+    Returns:
+        GitRepoReader, or None if path is not inside a git work tree
+    """
+    key = os.path.abspath(path)
+    with _readers_lock:
+        entry = _readers.get(key)
+        if entry is not None:
+            reader, created = entry
+            if reader is not None or time.time() - created < NOT_A_REPO_TTL:
+                _readers.move_to_end(key)
+                return reader
+
+        try:
+            reader = GitRepoReader(key)
+        except ValueError:
+            reader = None
+        _readers[key] = (reader, time.time())
+        while len(_readers) > MAX_READERS:
+            _, (evicted, _) = _readers.popitem(last=False)
+            if evicted is not None:
+                evicted.close()
+        return reader
+
+
+def close_git_readers():
+    """Stop every shared reader's processes"""
+    with _readers_lock:
+        for reader, _ in _readers.values():
+            if reader is not None:
+                reader.close()
+        _readers.clear()
+
+
+atexit.register(close_git_readers)
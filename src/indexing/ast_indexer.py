@@ -13,6 +13,8 @@ from pathlib import Path
 from src.parsing.parser import get_parser
 from src.vector_db.ast_store import get_ast_vector_store
 from src.indexing.file_indexer import FileIndexer
+from src.indexing.identifier_index import get_identifier_index
+from src.utils.repo_walker import INDEX_EXCLUDE_DIRS, walk_files
 
 logger = logging.getLogger(__name__)
 
@@ -25,11 +27,15 @@ class ASTIndexer:
     in vector database collections.
     """
 
+    # Directories never indexed (pruned during directory walks)
+    EXCLUDE_DIRS = INDEX_EXCLUDE_DIRS
+
     def __init__(self):
         """Initialize AST indexer."""
         self.parser = get_parser()
         self.ast_store = get_ast_vector_store()
         self.file_indexer = FileIndexer()
+        self.identifier_index = get_identifier_index()
 
         self.stats = {
             "files_processed": 0,
@@ -76,6 +82,9 @@ class ASTIndexer:
                 self.stats["errors"] += 1
                 return False
 
+            # Keep the in-process identifier index current
+            self.identifier_index.update_from_parse_result(parse_result)
+
             # Store AST metadata in vector database
             logger.debug(f"Storing AST metadata for: {file_path}")
             storage_success = await self.ast_store.store_parse_result(parse_result)
@@ -138,14 +147,14 @@ class ASTIndexer:
         # Find all supported files
         files_to_index = []
 
-        if recursive:
-            for file_path in directory_path.rglob("*"):
-                if file_path.is_file() and await self._should_index_file(file_path):
-                    files_to_index.append(file_path)
-        else:
-            for file_path in directory_path.iterdir():
-                if file_path.is_file() and await self._should_index_file(file_path):
-                    files_to_index.append(file_path)
+        for file_path, _ in walk_files(
+            directory_path,
+            exclude_dirs=self.EXCLUDE_DIRS,
+            max_depth=None if recursive else 0,
+            with_stat=False,
+        ):
+            if await self._should_index_file(file_path):
+                files_to_index.append(file_path)
 
         logger.info(f"Found {len(files_to_index)} files to index")
 
@@ -173,6 +182,10 @@ class ASTIndexer:
 
         total_time = (asyncio.get_event_loop().time() - start_time) * 1000
 
+        if recursive:
+            # Every file under the directory has been parsed into the identifier index
+            self.identifier_index.add_root(directory_path)
+
         result = {
             "directory": str(directory_path),
             "files_found": len(files_to_index),
@@ -198,20 +211,8 @@ class ASTIndexer:
             return False
 
         # Skip common exclude patterns
-        exclude_patterns = [
-            "__pycache__",
-            ".git",
-            ".venv",
-            "node_modules",
-            ".pytest_cache",
-            ".mypy_cache",
-            "target",  # Rust
-            "build",
-            "dist",
-        ]
-
         file_str = str(file_path)
-        for pattern in exclude_patterns:
+        for pattern in self.EXCLUDE_DIRS:
             if pattern in file_str:
                 return False
 
@@ -8,6 +8,7 @@ import asyncio
 import logging
 import os
 import sys
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from pathlib import Path
 from datetime import datetime, timezone
@@ -120,6 +121,8 @@ class FileIndexer:
         ".cxx": "cpp",
     }
 
+    RECENT_CONTENT_MAX = 32
+
     def __init__(self):
         """Initialize file indexer"""
         logger.info("FileIndexer initialized")
@@ -130,6 +133,23 @@ class FileIndexer:
             "by_language": {},
         }
         self.indexed_files: set = set()  # Track unique files
+        # Content of recently indexed files, so post-index monitors need not re-read
+        self._recent_content: "OrderedDict[str, str]" = OrderedDict()
+
+    def _remember_content(self, file_path: str, content: str):
+        self._recent_content[file_path] = content
+        self._recent_content.move_to_end(file_path)
+        while len(self._recent_content) > self.RECENT_CONTENT_MAX:
+            self._recent_content.popitem(last=False)
+
+    def take_recent_content(self, file_path: str) -> Optional[str]:
+        """
+        Hand over the content read while indexing file_path (once).
+
+        Returns:
+            str: Content as indexed, or None if it is no longer held
+        """
+        return self._recent_content.pop(file_path, None)
 
     async def detect_file_type(self, file_path: str) -> Optional[str]:
         """
@@ -264,6 +284,7 @@ class FileIndexer:
                 # Read file content for embedding
                 with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
                     content = f.read()
+                self._remember_content(file_path, content)
 
                 # Generate embedding
                 embedding = await generate_code_embedding(
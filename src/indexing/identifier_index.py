@@ -0,0 +1,409 @@
+"""
+Identifier Index
+
+In-process identifier -> locations index built from the ``ParseResult``
+symbols the parsing pipeline already produces. Used by prompt context
+gathering to look up identifiers, imports and test files without spawning
+``rg``/``grep`` or walking the filesystem per request.
+
+Features:
+- Case-insensitive exact-name lookup of functions, methods and classes
+- Per-file import lists and basename lookup (dependency / test discovery)
+- Incremental updates per file (AST indexer, indexing queue / file watcher)
+- Workspace roots tracked so callers know whether a path is covered: roots
+  the indexer keeps current, and one-off snapshots (``build``) whose age is
+  exposed so callers can rebuild them
+- Per-file mtimes, so stale entries can be re-parsed before they are served
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.parsing.parser import detect_language, get_parser
+from src.utils.repo_walker import INDEX_EXCLUDE_DIRS, walk_files
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SymbolLocation:
+    """Where a symbol is defined"""
+
+    name: str
+    kind: str  # function, method, class, ...
+    file_path: str
+    line: int
+    signature: Optional[str] = None
+    parent: Optional[str] = None
+
+    @property
+    def snippet(self) -> str:
+        if self.signature:
+            return self.signature
+        qualified = f"{self.parent}.{self.name}" if self.parent else self.name
+        return f"{self.kind} {qualified}"
+
+
+class IdentifierIndex:
+    """
+    Identifier index over parsed files
+
+    All paths are stored absolute and normalized. Lookups are O(1) dictionary
+    hits; updates replace everything previously recorded for a file.
+    """
+
+    # Directories never indexed (same set as ASTIndexer)
+    EXCLUDE_DIRS = INDEX_EXCLUDE_DIRS
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # lowercase name -> file -> locations
+        self._by_name: Dict[str, Dict[str, List[SymbolLocation]]] = defaultdict(dict)
+        # file -> lowercase names defined in it
+        self._file_names: Dict[str, Set[str]] = {}
+        # file -> imported module names
+        self._imports: Dict[str, List[str]] = {}
+        # basename -> files
+        self._by_basename: Dict[str, Set[str]] = defaultdict(set)
+        # file -> mtime_ns when parsed
+        self._mtimes: Dict[str, int] = {}
+        # Roots kept current by the indexer / file watcher
+        self._roots: Set[str] = set()
+        # Roots indexed once by build() -> monotonic build time
+        self._snapshots: Dict[str, float] = {}
+        self._building: Set[str] = set()
+
+        self.stats = {
+            "files": 0,
+            "symbols": 0,
+            "lookups": 0,
+            "updates": 0,
+            "removals": 0,
+        }
+
+    @staticmethod
+    def _norm(path) -> str:
+        return os.path.normpath(os.path.abspath(str(path)))
+
+    @staticmethod
+    def _mtime(path: str) -> Optional[int]:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _under(path: str, roots: Iterable[str]) -> bool:
+        return any(path == root or path.startswith(root + os.sep) for root in roots)
+
+    # ==================== Maintenance ====================
+
+    @staticmethod
+    def _enclosing_class(classes, symbol) -> Optional[str]:
+        """Innermost class whose line span contains the symbol (not all parsers set parent_class)"""
+        best = None
+        for cls in classes:
+            if cls.line_start < symbol.line_start <= cls.line_end:
+                if best is None or cls.line_start > best.line_start:
+                    best = cls
+        return best.name if best is not None else None
+
+    def update_from_parse_result(self, parse_result) -> int:
+        """
+        Replace a file's entries with the symbols of a fresh ParseResult
+
+        Returns:
+            Number of symbols recorded for the file
+        """
+        file_path = self._norm(parse_result.file_path)
+        locations = [
+            SymbolLocation(
+                name=symbol.name,
+                kind=symbol.type,
+                file_path=file_path,
+                line=symbol.line_start,
+                signature=symbol.signature,
+                parent=symbol.parent_class or self._enclosing_class(parse_result.classes, symbol),
+            )
+            for symbol in parse_result.symbols
+        ]
+        locations.extend(
+            SymbolLocation(name=cls.name, kind="class", file_path=file_path, line=cls.line_start)
+            for cls in parse_result.classes
+        )
+        imports = [imp.module for imp in parse_result.imports if imp.module]
+        mtime = self._mtime(file_path)
+
+        with self._lock:
+            self._remove_locked(file_path)
+            if mtime is not None:
+                self._mtimes[file_path] = mtime
+            names = set()
+            for location in locations:
+                key = location.name.lower()
+                self._by_name[key].setdefault(file_path, []).append(location)
+                names.add(key)
+            self._file_names[file_path] = names
+            self._imports[file_path] = imports
+            self._by_basename[os.path.basename(file_path)].add(file_path)
+            self.stats["files"] = len(self._file_names)
+            self.stats["symbols"] += len(locations)
+            self.stats["updates"] += 1
+        return len(locations)
+
+    def _remove_locked(self, file_path: str) -> bool:
+        names = self._file_names.pop(file_path, None)
+        if names is None:
+            return False
+        for key in names:
+            files = self._by_name.get(key)
+            if files is None:
+                continue
+            removed = files.pop(file_path, None)
+            if removed:
+                self.stats["symbols"] -= len(removed)
+            if not files:
+                del self._by_name[key]
+        self._imports.pop(file_path, None)
+        self._mtimes.pop(file_path, None)
+        basename = os.path.basename(file_path)
+        same_name = self._by_basename.get(basename)
+        if same_name is not None:
+            same_name.discard(file_path)
+            if not same_name:
+                del self._by_basename[basename]
+        return True
+
+    def remove_file(self, file_path) -> bool:
+        """Forget everything recorded for a file"""
+        with self._lock:
+            removed = self._remove_locked(self._norm(file_path))
+            if removed:
+                self.stats["files"] = len(self._file_names)
+                self.stats["removals"] += 1
+            return removed
+
+    def refresh_file(self, file_path) -> bool:
+        """
+        Re-parse one file and update its entries (removes deleted files)
+
+        Only files under an indexed root are tracked; others are ignored.
+
+        Returns:
+            True if the index changed
+        """
+        path = Path(file_path)
+        if not self.covers(path):
+            return False
+        if not path.exists():
+            return self.remove_file(path)
+        if detect_language(path) is None:
+            return False
+        try:
+            parse_result = get_parser().parse(path)
+        except Exception as e:
+            logger.debug(f"Identifier index parse failed for {path}: {e}")
+            return False
+        if not parse_result.parse_success:
+            return False
+        self.update_from_parse_result(parse_result)
+        return True
+
+    def add_root(self, root):
+        """Mark a directory as covered (files under it are kept current)"""
+        with self._lock:
+            self._roots.add(self._norm(root))
+
+    def build(self, root, files: Optional[Iterable[Path]] = None) -> int:
+        """
+        Parse every supported file under root and record it as a snapshot
+
+        Files whose mtime is unchanged since they were last parsed are kept
+        as they are, and (for a full walk) indexed files that no longer
+        exist are dropped, so rebuilding a stale snapshot is cheap.
+
+        Blocking; run in a worker thread from async code.
+
+        Returns:
+            Number of files (re-)parsed
+        """
+        root_norm = self._norm(root)
+        with self._lock:
+            if root_norm in self._building:
+                return 0
+            self._building.add(root_norm)
+
+        parser = get_parser()
+        indexed = 0
+        full_walk = files is None
+        seen: Set[str] = set()
+        started = time.monotonic()
+        try:
+            if full_walk:
+                files = (
+                    path
+                    for path, _ in walk_files(
+                        root_norm, exclude_dirs=self.EXCLUDE_DIRS, with_stat=False
+                    )
+                    if detect_language(path) is not None
+                )
+            for path in files:
+                file_path = self._norm(path)
+                seen.add(file_path)
+                with self._lock:
+                    known = self._mtimes.get(file_path)
+                if known is not None and known == self._mtime(file_path):
+                    continue
+                try:
+                    parse_result = parser.parse(Path(path))
+                except Exception as e:
+                    logger.debug(f"Identifier index parse failed for {path}: {e}")
+                    continue
+                if parse_result.parse_success:
+                    self.update_from_parse_result(parse_result)
+                    indexed += 1
+
+            with self._lock:
+                if full_walk:
+                    for file_path in [f for f in self._file_names if self._under(f, (root_norm,))]:
+                        if file_path not in seen:
+                            self._remove_locked(file_path)
+                    self.stats["files"] = len(self._file_names)
+                self._snapshots[root_norm] = started
+            logger.info(f"Identifier index built for {root_norm}: {indexed} files parsed")
+        finally:
+            with self._lock:
+                self._building.discard(root_norm)
+        return indexed
+
+    def is_building(self, root) -> bool:
+        with self._lock:
+            return self._norm(root) in self._building
+
+    def clear(self):
+        with self._lock:
+            self._by_name.clear()
+            self._file_names.clear()
+            self._imports.clear()
+            self._by_basename.clear()
+            self._mtimes.clear()
+            self._roots.clear()
+            self._snapshots.clear()
+            self.stats["files"] = 0
+            self.stats["symbols"] = 0
+
+    # ==================== Queries ====================
+
+    def covers(self, path) -> bool:
+        """True if path lies under a root whose files are indexed (kept current or snapshot)"""
+        norm = self._norm(path)
+        with self._lock:
+            return self._under(norm, self._roots) or self._under(norm, self._snapshots)
+
+    def is_current(self, path, max_age: float) -> bool:
+        """
+        True if path lies under a root kept current by the indexer, or under
+        a snapshot built less than max_age seconds ago
+        """
+        norm = self._norm(path)
+        cutoff = time.monotonic() - max_age
+        with self._lock:
+            if self._under(norm, self._roots):
+                return True
+            return self._under(norm, [r for r, built in self._snapshots.items() if built >= cutoff])
+
+    def ensure_fresh(self, file_paths: Iterable) -> bool:
+        """
+        Re-parse (or drop) indexed files changed on disk since they were parsed
+
+        Blocking (one stat per file); run in a worker thread from async code.
+
+        Returns:
+            True if any entry changed
+        """
+        changed = False
+        for path in file_paths:
+            file_path = self._norm(path)
+            with self._lock:
+                if file_path not in self._file_names:
+                    continue
+                known = self._mtimes.get(file_path)
+            if known is None or known != self._mtime(file_path):
+                # Entries that cannot be re-parsed are dropped rather than served stale
+                changed = (self.refresh_file(file_path) or self.remove_file(file_path)) or changed
+        return changed
+
+    def lookup(self, identifier: str, root=None, limit: int = 20) -> List[SymbolLocation]:
+        """
+        Definitions of an identifier (case-insensitive exact name)
+
+        ``Class.method`` is matched on the method name and parent class.
+
+        Args:
+            identifier: Symbol name
+            root: Optional directory restricting results
+            limit: Maximum results
+
+        Returns:
+            Locations ordered by file path then line
+        """
+        parent = None
+        name = identifier.strip()
+        if "." in name:
+            parent, name = name.rsplit(".", 1)
+            parent = parent.rsplit(".", 1)[-1].lower()
+        prefix = self._norm(root) + os.sep if root is not None else None
+
+        with self._lock:
+            self.stats["lookups"] += 1
+            files = self._by_name.get(name.lower())
+            if not files:
+                return []
+            matches = [
+                location
+                for file_path in sorted(files)
+                if prefix is None or file_path.startswith(prefix)
+                for location in files[file_path]
+                if parent is None or (location.parent or "").lower() == parent
+            ]
+        matches.sort(key=lambda loc: (loc.file_path, loc.line))
+        return matches[:limit]
+
+    def get_imports(self, file_path) -> Optional[List[str]]:
+        """Imported module names for a file (None if the file is not indexed)"""
+        with self._lock:
+            imports = self._imports.get(self._norm(file_path))
+            return list(imports) if imports is not None else None
+
+    def has_file(self, file_path) -> bool:
+        with self._lock:
+            return self._norm(file_path) in self._file_names
+
+    def files_named(self, basename: str, root=None) -> List[str]:
+        """Indexed files with the given basename, optionally under root"""
+        prefix = self._norm(root) + os.sep if root is not None else None
+        with self._lock:
+            files = self._by_basename.get(basename, ())
+            return sorted(f for f in files if prefix is None or f.startswith(prefix))
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, "roots": len(self._roots), "names": len(self._by_name)}
+
+
+# Global identifier index instance
+_global_identifier_index: Optional[IdentifierIndex] = None
+
+
+def get_identifier_index() -> IdentifierIndex:
+    """Get the global identifier index instance."""
+    global _global_identifier_index
+    if _global_identifier_index is None:
+        _global_identifier_index = IdentifierIndex()
+    return _global_identifier_index
@@ -15,6 +15,7 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
 from src.config.settings import settings
+from src.utils.repo_walker import walk_files
 
 logger = logging.getLogger(__name__)
 
@@ -106,27 +107,15 @@ class InitialIndexer:
         logger.info(f"Scanning directory for existing files: {directory}")
         
         try:
-            # Walk directory tree
-            for root, dirs, files in os.walk(directory):
-                root_path = Path(root)
-                
-                # Filter out ignored directories (modify dirs in-place to prevent descent)
-                dirs[:] = [d for d in dirs if not self._should_ignore(root_path / d)]
-                
-                # Process files
-                for file in files:
-                    file_path = root_path / file
-                    
-                    # Skip ignored files
-                    if self._should_ignore(file_path):
-                        continue
-                    
-                    # Skip unsupported file types
-                    if not self._is_supported_file(file_path):
-                        continue
-                    
-                    # Add to list
-                    files_to_index.append(str(file_path))
+            # Walk directory tree (ignored directories are pruned before descent)
+            for file_path, _ in walk_files(
+                directory,
+                extensions=self.supported_extensions,
+                skip_dir=lambda entry: self._should_ignore(Path(entry.path)),
+                skip_file=lambda entry: self._should_ignore(Path(entry.path)),
+                with_stat=False,
+            ):
+                files_to_index.append(str(file_path))
             
             logger.info(f"Found {len(files_to_index)} files to index in {directory}")
             
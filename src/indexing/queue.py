@@ -288,12 +288,15 @@ class IndexingQueue:
                             from src.analysis.security_scanner import SecurityScanner
                             from src.analysis.performance_tracker import perf_tracker
 
+                            # Scan the content the indexer just read instead of re-reading the file
+                            content = file_indexer.take_recent_content(file_path)
+
                             async def _run_monitors():
                                 qa = CodeQualityAnalyzer()
                                 scanner = SecurityScanner()
                                 # Run lightweight analyses in a thread to avoid blocking event loop
                                 await asyncio.to_thread(qa.analyze_file, file_path)
-                                await asyncio.to_thread(scanner.scan_file, file_path)
+                                await asyncio.to_thread(scanner.scan_file, file_path, content)
                                 # Record simple perf metric
                                 duration_ms = (asyncio.get_event_loop().time() - _t0) * 1000.0
                                 perf_tracker.record(file_path, duration_ms)
@@ -350,6 +353,8 @@ class IndexingQueue:
                         pass
                     logger.warning(f"Failed to remove: {file_path}")
 
+            await self._refresh_identifier_index(file_path)
+
             item["processed_time"] = datetime.now(timezone.utc)
 
         except Exception as e:
@@ -363,6 +368,18 @@ class IndexingQueue:
             # Remove from queued files tracking after processing
             self.queued_files.pop(file_path, None)
 
+    async def _refresh_identifier_index(self, file_path: str):
+        """Re-parse a changed file into the identifier index (if its workspace is indexed)"""
+        try:
+            from src.indexing.identifier_index import get_identifier_index
+
+            identifier_index = get_identifier_index()
+            if identifier_index.covers(file_path):
+                await asyncio.to_thread(identifier_index.refresh_file, file_path)
+        except Exception as e:
+            # The identifier index is an optimization; never fail indexing over it
+            logger.debug(f"Identifier index refresh failed for {file_path}: {e}")
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get queue status
@@ -2,38 +2,189 @@
 Logging Manager (Enterprise-ready)
 
 Centralized logging configuration with optional JSON formatting.
+
+By default records are handed to a queue on the calling thread and a single
+writer thread (QueueListener) formats them and writes them in batches, so
+logging I/O stays off the hot path. High-volume INFO loggers can be sampled
+before a record is ever queued.
 """
 
-import logging
+import atexit
+import contextvars
 import json
+import logging
+import queue
 import sys
-import contextvars
 from datetime import datetime, timezone
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 # Correlation ID context var
 _correlation_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
     "correlation_id", default=None
 )
 
+# Active background writer (see configure_logging)
+_listener: Optional[QueueListener] = None
+
+
+def dumps(payload: Dict) -> str:
+    """Serialize a log payload, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str).decode("utf-8")
+    return json.dumps(payload, default=str)
+
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         payload = {
-            "ts": datetime.now(timezone.utc).isoformat(),
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "name": record.name,
             "message": record.getMessage(),
         }
-        cid = _correlation_id.get()
+        # Stamped on the calling thread when formatting happens on the writer thread
+        cid = getattr(record, "correlation_id", None) or _correlation_id.get()
         if cid:
             payload["correlation_id"] = cid
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(payload)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return dumps(payload)
+
+
+class InfoSampler(logging.Filter):
+    """
+    Keeps 1 in `every` INFO records from the given logger prefixes.
+
+    Records at any other level, and from other loggers, always pass. Counting
+    is per logger so one chatty module cannot starve another's samples.
+    """
+
+    def __init__(self, every: int = 1, loggers: Iterable[str] = ()):
+        super().__init__()
+        self.every = max(1, int(every))
+        self.prefixes = tuple(p for p in loggers if p)
+        self._counts: Dict[str, int] = {}
+        self.dropped = 0
+
+    def _sampled(self, name: str) -> bool:
+        if not self.prefixes:
+            return True
+        return any(name == p or name.startswith(p + ".") for p in self.prefixes)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.every == 1 or record.levelno != logging.INFO or not self._sampled(record.name):
+            return True
+        count = self._counts.get(record.name, 0)
+        self._counts[record.name] = count + 1
+        if count % self.every == 0:
+            return True
+        self.dropped += 1
+        return False
+
+
+class ContextQueueHandler(QueueHandler):
+    """
+    QueueHandler that captures per-thread context before enqueuing
+
+    The message is rendered and the traceback formatted here (arguments may
+    change after the call returns), and the correlation ID is copied onto the
+    record because context vars do not cross into the writer thread. The
+    JSON/text formatting itself is left to the writer.
+    """
 
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        if getattr(record, "correlation_id", None) is None:
+            record.correlation_id = _correlation_id.get()
+        return record
+
+
+class BatchStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that buffers formatted records and writes them in one call
+
+    The buffer is flushed when it reaches max_batch records or when flush() is
+    called; BatchingQueueListener flushes whenever the queue runs dry.
+    """
+
+    def __init__(self, stream=None, max_batch: int = 256):
+        super().__init__(stream)
+        self.max_batch = max_batch
+        self._buffer = []
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+            return
+        if len(self._buffer) >= self.max_batch:
+            self.flush()
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._buffer:
+                lines, self._buffer = self._buffer, []
+                self.stream.write(self.terminator.join(lines) + self.terminator)
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        except Exception:
+            pass
+        finally:
+            self.release()
+
+
+class BatchingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers each time the queue is drained"""
 
-def configure_logging(level: str = "INFO", fmt: str = "json", use_stderr: bool = False):
+    def dequeue(self, block: bool):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
+
+    def stop(self):
+        super().stop()
+        for handler in self.handlers:
+            handler.flush()
+
+
+def shutdown_logging():
+    """Stop the background writer, writing out anything still queued."""
+    global _listener
+    if _listener is not None:
+        listener, _listener = _listener, None
+        try:
+            listener.stop()
+        except Exception:
+            pass
+
+
+atexit.register(shutdown_logging)
+
+
+def configure_logging(
+    level: str = "INFO",
+    fmt: str = "json",
+    use_stderr: bool = False,
+    async_logging: Optional[bool] = None,
+    info_sample_every: Optional[int] = None,
+    sampled_loggers: Optional[Iterable[str]] = None,
+):
     """
     Configure logging for the application.
 
@@ -43,14 +194,33 @@ def configure_logging(level: str = "INFO", fmt: str = "json", use_stderr: bool =
         use_stderr: If True, log to stderr instead of stdout.
                    This is REQUIRED for MCP stdio servers to avoid
                    corrupting the JSON-RPC protocol on stdout.
+        async_logging: Format and write on a background thread
+                       (default: settings.log_async)
+        info_sample_every: Keep 1 in N INFO records from sampled_loggers
+                           (default: settings.log_info_sample_every)
+        sampled_loggers: Logger name prefixes subject to INFO sampling
+                         (default: settings.log_sampled_loggers)
     """
+    if async_logging is None or info_sample_every is None or sampled_loggers is None:
+        try:
+            from src.config.settings import settings
+        except Exception:
+            settings = None
+        if async_logging is None:
+            async_logging = bool(getattr(settings, "log_async", True))
+        if info_sample_every is None:
+            info_sample_every = int(getattr(settings, "log_info_sample_every", 1) or 1)
+        if sampled_loggers is None:
+            sampled_loggers = str(getattr(settings, "log_sampled_loggers", "") or "").split(",")
+
     lvl = getattr(logging, level.upper(), logging.INFO)
+    shutdown_logging()
     logging.root.handlers.clear()
     logging.root.setLevel(lvl)
 
     # Use stderr for MCP stdio servers to avoid corrupting protocol messages
     stream = sys.stderr if use_stderr else sys.stdout
-    handler = logging.StreamHandler(stream)
+    handler = BatchStreamHandler(stream) if async_logging else logging.StreamHandler(stream)
 
     if fmt.lower() == "json":
         handler.setFormatter(JsonFormatter())
@@ -58,7 +228,20 @@ def configure_logging(level: str = "INFO", fmt: str = "json", use_stderr: bool =
         handler.setFormatter(
             logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
         )
-    logging.root.addHandler(handler)
+
+    if async_logging:
+        global _listener
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        front: logging.Handler = ContextQueueHandler(log_queue)
+        _listener = BatchingQueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+    else:
+        front = handler
+
+    sampler = InfoSampler(info_sample_every, (p.strip() for p in sampled_loggers))
+    if sampler.every > 1:
+        front.addFilter(sampler)
+    logging.root.addHandler(front)
 
 
 # Correlation ID helpers
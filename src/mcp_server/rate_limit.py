@@ -0,0 +1,313 @@
+"""
+HTTP Rate Limiting
+
+GCRA (generic cell rate algorithm) limiter: each key stores a single
+"theoretical arrival time", so a check is O(1) regardless of the limit and
+idle keys simply expire once that time has passed.
+
+Backends:
+- MemoryRateLimitBackend: in-process (single worker, tests)
+- RedisRateLimitBackend: shared by every worker and host (atomic Lua script)
+
+RateLimitMiddleware applies the limiter as plain ASGI middleware, ahead of
+correlation IDs, auth and routing, so rejected requests cost one check.
+"""
+
+import heapq
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "ratelimit:"
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of one rate limit check"""
+
+    allowed: bool
+    retry_after: float = 0.0  # seconds until the next request would be allowed
+    remaining: int = 0  # further requests allowed right now
+
+
+class RateLimitBackend:
+    """Storage for per-key GCRA state"""
+
+    name = "base"
+
+    async def acquire(self, key: str, limit: int, window_seconds: float, burst: int) -> RateLimitDecision:
+        """
+        Count one request against key.
+
+        Args:
+            key: Rate limit key
+            limit: Requests allowed per window (steady rate)
+            window_seconds: Window length
+            burst: Requests allowed back-to-back from an idle key
+        """
+        raise NotImplementedError
+
+    def reset(self):
+        """Forget local state (no-op for shared stores)"""
+
+    async def close(self):
+        pass
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """
+    In-process GCRA state
+
+    Keys sit in a min-heap ordered by TAT (keys with different limits expire
+    in any order), so expired keys are popped from the top as requests come
+    in, and when max_keys is reached the key closest to expiry is evicted.
+    Heap entries superseded by a later update are skipped lazily, and the heap
+    is compacted when they outnumber live keys. One instance shared by several
+    middlewares behaves like a shared store, which is how tests stand in for
+    Redis.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self._clock = clock
+        self._tat: Dict[str, float] = {}
+        # (tat, key); entries whose tat no longer matches self._tat are stale
+        self._heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+    def _pop_live(self) -> Optional[str]:
+        """Remove and return the key with the earliest TAT"""
+        while self._heap:
+            tat, key = heapq.heappop(self._heap)
+            if self._tat.get(key) == tat:
+                del self._tat[key]
+                return key
+        return None
+
+    def _expire(self, now: float, key: str):
+        while self._heap and self._heap[0][0] <= now:
+            tat, expired = heapq.heappop(self._heap)
+            if self._tat.get(expired) == tat:
+                del self._tat[expired]
+        if key not in self._tat:
+            while len(self._tat) >= self.max_keys and self._pop_live() is not None:
+                pass
+
+    def _set(self, key: str, tat: float):
+        self._tat[key] = tat
+        heapq.heappush(self._heap, (tat, key))
+        if len(self._heap) > 2 * len(self._tat) + 1024:
+            self._heap = [(t, k) for k, t in self._tat.items()]
+            heapq.heapify(self._heap)
+
+    def acquire_sync(self, key: str, limit: int, window_seconds: float, burst: int) -> RateLimitDecision:
+        interval = window_seconds / max(limit, 1)
+        period = interval * max(burst, 1)
+        with self._lock:
+            now = self._clock()
+            self._expire(now, key)
+            new_tat = max(self._tat.get(key, now), now) + interval
+            allow_at = new_tat - period
+            if now < allow_at:
+                return RateLimitDecision(allowed=False, retry_after=allow_at - now)
+            self._set(key, new_tat)
+            return RateLimitDecision(allowed=True, remaining=int((now - allow_at) / interval))
+
+    async def acquire(self, key: str, limit: int, window_seconds: float, burst: int) -> RateLimitDecision:
+        return self.acquire_sync(key, limit, window_seconds, burst)
+
+    def reset(self):
+        with self._lock:
+            self._tat.clear()
+            self._heap.clear()
+
+
+# KEYS[1] = key; ARGV = emission interval (ms), burst period (ms)
+_GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then tat = now end
+local new_tat = tat + interval
+local allow_at = new_tat - period
+if now < allow_at then
+    return {0, math.ceil(allow_at - now), 0}
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now))
+return {1, 0, math.floor((now - allow_at) / interval)}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    GCRA state in Redis, shared by all workers
+
+    One atomic script call per request using the Redis server clock; keys
+    carry a TTL equal to their remaining TAT, so idle keys expire on their own.
+    Fails open if Redis is unreachable.
+    """
+
+    name = "redis"
+
+    def __init__(self, redis_client, prefix: str = REDIS_KEY_PREFIX):
+        """
+        Args:
+            redis_client: redis.asyncio client
+            prefix: Key namespace
+        """
+        self.redis_client = redis_client
+        self.prefix = prefix
+        self._script = redis_client.register_script(_GCRA_SCRIPT)
+
+    async def acquire(self, key: str, limit: int, window_seconds: float, burst: int) -> RateLimitDecision:
+        interval_ms = window_seconds * 1000.0 / max(limit, 1)
+        try:
+            allowed, retry_ms, remaining = await self._script(
+                keys=[self.prefix + key],
+                args=[interval_ms, interval_ms * max(burst, 1)],
+            )
+        except Exception as e:
+            logger.warning(f"Rate limit check failed, allowing request: {e}")
+            return RateLimitDecision(allowed=True)
+        return RateLimitDecision(
+            allowed=bool(allowed), retry_after=int(retry_ms) / 1000.0, remaining=int(remaining)
+        )
+
+    async def close(self):
+        try:
+            await self.redis_client.aclose()
+        except Exception:
+            pass
+
+
+def create_rate_limit_backend(backend: Optional[str] = None) -> RateLimitBackend:
+    """
+    Build the backend configured in settings
+
+    Args:
+        backend: Override for settings.rate_limit_backend ('memory', 'redis')
+
+    Returns:
+        RateLimitBackend (in-process when Redis is unavailable)
+    """
+    try:
+        from src.config.settings import settings
+    except Exception:
+        settings = None
+
+    kind = (backend or getattr(settings, "rate_limit_backend", "memory") or "memory").lower()
+    if kind == "redis":
+        try:
+            import redis.asyncio as redis_asyncio
+
+            client = redis_asyncio.from_url(getattr(settings, "redis_url", None), socket_connect_timeout=5)
+            return RedisRateLimitBackend(client)
+        except Exception as e:
+            logger.warning(f"Redis rate limit backend unavailable, using in-process state: {e}")
+    elif kind != "memory":
+        logger.warning(f"Unknown rate limit backend: {kind}; using in-process state")
+    return MemoryRateLimitBackend()
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware enforcing settings.rate_limit_* per client IP or API key
+
+    Limits are read from settings on every request so they can be changed at
+    runtime; the backend is created on the first limited request.
+    """
+
+    WINDOW_SECONDS = 60
+
+    def __init__(
+        self,
+        app,
+        enabled: Optional[Callable[[], bool]] = None,
+        backend: Optional[RateLimitBackend] = None,
+        settings=None,
+    ):
+        """
+        Args:
+            app: Wrapped ASGI application
+            enabled: Returns whether limiting applies (default: settings.rate_limit_enabled)
+            backend: Backend to use (default: create_rate_limit_backend())
+            settings: Settings object (default: src.config.settings.settings)
+        """
+        if settings is None:
+            from src.config.settings import settings
+        self.app = app
+        self.settings = settings
+        self.enabled = enabled or (lambda: bool(getattr(self.settings, "rate_limit_enabled", False)))
+        self.backend = backend
+
+        try:
+            from src.monitoring.metrics import metrics
+
+            self.c_limited = metrics.counter(
+                "http_rate_limited_total", "Requests rejected by the rate limiter", ("key_mode",)
+            )
+        except Exception:
+            self.c_limited = None
+
+    def _key(self, request: Request, key_mode: str) -> str:
+        if key_mode == "api_key":
+            return request.headers.get("x-api-key") or "anon"
+        return request.client.host if request.client else "local"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if not self.enabled():
+            # Drop local state so a later enable starts clean
+            if self.backend is not None:
+                self.backend.reset()
+            await self.app(scope, receive, send)
+            return
+
+        if self.backend is None:
+            self.backend = create_rate_limit_backend()
+
+        request = Request(scope)
+        key_mode = getattr(self.settings, "rate_limit_key", "ip")
+        limit = int(getattr(self.settings, "rate_limit_requests_per_minute", 60))
+        burst = int(getattr(self.settings, "rate_limit_burst", None) or limit)
+        decision = await self.backend.acquire(
+            f"{key_mode}:{self._key(request, key_mode)}", limit, self.WINDOW_SECONDS, burst
+        )
+
+        if not decision.allowed:
+            if self.c_limited is not None:
+                self.c_limited.labels(key_mode).inc()
+            retry_after = max(1, math.ceil(decision.retry_after))
+            response = JSONResponse(
+                status_code=429,
+                content={
+                    "error": "rate_limited",
+                    "retry_after_seconds": retry_after,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                },
+                headers={"Retry-After": str(retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
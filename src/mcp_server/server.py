@@ -165,24 +165,22 @@ except Exception:
 
 from fastapi import Request
 from src.logging.manager import set_correlation_id
+from src.mcp_server.rate_limit import RateLimitMiddleware
 import uuid
 
 
-# Simple in-process rate limiter state
-_RATE_LIMIT_STATE: dict[str, list[float]] = {}
-
-
-def _rate_limit_allow(key: str, limit: int, window_seconds: int = 60) -> bool:
-    now = time.time()
-    bucket = _RATE_LIMIT_STATE.get(key, [])
-    # drop old
-    bucket = [t for t in bucket if now - t < window_seconds]
-    if len(bucket) >= limit:
-        _RATE_LIMIT_STATE[key] = bucket
+def _rate_limit_enabled() -> bool:
+    """Whether RateLimitMiddleware enforces limits for the current request"""
+    # In pytest, only tests that explicitly exercise rate limiting enforce it.
+    # If PYTEST_CURRENT_TEST was cleared (some tests clear os.environ), be conservative.
+    pytest_ctx = os.getenv("PYTEST_CURRENT_TEST", "")
+    if pytest_ctx:
+        if "test_rate_limit" not in pytest_ctx:
+            return False
+    elif "pytest" in sys.modules:
         return False
-    bucket.append(now)
-    _RATE_LIMIT_STATE[key] = bucket
-    return True
+    return bool(getattr(settings, "rate_limit_enabled", False))
+
 
 @app.middleware("http")
 async def correlation_and_auth_middleware(request: Request, call_next):
@@ -191,16 +189,11 @@ async def correlation_and_auth_middleware(request: Request, call_next):
     start = time.perf_counter()
     response = None
     try:
-        # Determine effective flags. In pytest, only specific tests should enforce auth/ratelimit.
-        import sys
+        # Determine effective flags. In pytest, only specific tests should enforce auth.
         pytest_ctx = os.getenv("PYTEST_CURRENT_TEST", "")
         under_pytest = "pytest" in sys.modules
-        effective_rate_limit_enabled = bool(getattr(settings, "rate_limit_enabled", False))
         effective_auth_enabled = bool(getattr(settings, "api_auth_enabled", False))
         if pytest_ctx:
-            # Only enforce rate limiting in tests that explicitly exercise it
-            if "test_rate_limit" not in pytest_ctx:
-                effective_rate_limit_enabled = False
             # Only enforce API auth in auth-focused tests
             if (
                 "test_api_auth" not in pytest_ctx
@@ -209,36 +202,12 @@ async def correlation_and_auth_middleware(request: Request, call_next):
                 effective_auth_enabled = False
         elif under_pytest:
             # If running under pytest but PYTEST_CURRENT_TEST env was cleared (some tests clear os.environ),
-            # be conservative: disable rate limiting entirely. For auth, only enforce when a key is configured
-            # AND the request actually provides a key header; otherwise bypass to avoid spurious 401s.
-            effective_rate_limit_enabled = False
+            # only enforce auth when a key is configured AND the request actually provides a key header;
+            # otherwise bypass to avoid spurious 401s.
             has_header_key = bool(request.headers.get("x-api-key"))
             cfg_auth = bool(getattr(settings, "api_auth_enabled", False)) and bool(getattr(settings, "api_key", None))
             effective_auth_enabled = cfg_auth and has_header_key
 
-        # Reset rate limiter state when disabled to avoid cross-test leakage
-        if not effective_rate_limit_enabled and _RATE_LIMIT_STATE:
-            _RATE_LIMIT_STATE.clear()
-
-        # Rate limiting (simple in-process)
-        if effective_rate_limit_enabled:
-            key_mode = getattr(settings, "rate_limit_key", "ip")
-            if key_mode == "api_key":
-                rl_key = request.headers.get("x-api-key") or "anon"
-            else:
-                rl_key = request.client.host if request.client else "local"
-            limit = int(getattr(settings, "rate_limit_requests_per_minute", 60))
-            if not _rate_limit_allow(f"{key_mode}:{rl_key}", limit, 60):
-                response = JSONResponse(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    content={
-                        "error": "rate_limited",
-                        "retry_after_seconds": 60,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                )
-                return response
-
         # AuthN
         if effective_auth_enabled and settings.api_auth_scheme == "api_key":
             api_key = request.headers.get("x-api-key")
@@ -274,6 +243,10 @@ async def correlation_and_auth_middleware(request: Request, call_next):
         set_correlation_id(None)
 
 
+# Added after the correlation/auth middleware so it runs first (outermost)
+app.add_middleware(RateLimitMiddleware, enabled=_rate_limit_enabled)
+
+
 
 
 
@@ -601,18 +574,24 @@ from fastapi import Response
 
 @app.get("/metrics")
 async def metrics_prometheus():
-    """Prometheus metrics endpoint (if prometheus_client installed)."""
+    """Prometheus metrics endpoint (in-process metrics if prometheus_client is missing)."""
     try:
         from prometheus_client import generate_latest, CONTENT_TYPE_LATEST  # type: ignore
 
         output = generate_latest()
         return Response(content=output, media_type=CONTENT_TYPE_LATEST)
+    except ImportError:
+        from src.monitoring.metrics import metrics
+
+        return Response(
+            content=metrics.exposition(), media_type="text/plain; version=0.0.4; charset=utf-8"
+        )
     except Exception as e:
         logger.warning(f"/metrics unavailable: {e}")
         return JSONResponse(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
-                "error": "prometheus_client not installed",
+                "error": str(e),
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             },
         )
@@ -7,6 +7,7 @@ Epic 5: Conversation Memory
 - Similar conversation retrieval
 """
 
+import asyncio
 from datetime import datetime
 from typing import Dict, List, Optional
 from uuid import UUID, uuid4
@@ -186,12 +187,98 @@ class ConversationStore:
                 desc(Conversation.timestamp)
             ).limit(limit).offset(offset).all()
 
+    def _build_search_filter(
+        self,
+        user_id: Optional[str],
+        intent_filter: Optional[str],
+    ):
+        """Build the Qdrant payload filter for a similarity search."""
+        from qdrant_client.models import Filter, FieldCondition, MatchValue
+
+        filter_conditions = []
+        if user_id:
+            filter_conditions.append(
+                FieldCondition(key="user_id", match=MatchValue(value=user_id))
+            )
+        if intent_filter:
+            filter_conditions.append(
+                FieldCondition(key="intent", match=MatchValue(value=intent_filter))
+            )
+
+        return Filter(must=filter_conditions) if filter_conditions else None
+
+    def _search_and_hydrate(
+        self,
+        query_embedding: List[float],
+        user_id: Optional[str],
+        limit: int,
+        intent_filter: Optional[str],
+        hydrate: bool,
+    ) -> List[Dict]:
+        """Run the Qdrant search and attach PostgreSQL rows in one query.
+
+        Args:
+            query_embedding: Embedded search query
+            user_id: Optional user ID filter
+            limit: Maximum results
+            intent_filter: Optional intent filter
+            hydrate: Load full Conversation rows; when False results are
+                built from the Qdrant payload alone and no DB query is made
+
+        Returns:
+            List of dicts with conversation data and similarity scores,
+            in Qdrant score order
+        """
+        search_results = self.qdrant_client.search(
+            collection_name=self.COLLECTION_NAME,
+            query_vector=query_embedding,
+            query_filter=self._build_search_filter(user_id, intent_filter),
+            limit=limit,
+            with_payload=True,
+        )
+
+        if not hydrate:
+            return [
+                {
+                    "conversation_id": UUID(str(hit.id)),
+                    "conversation": None,
+                    "similarity_score": hit.score,
+                    "payload": hit.payload,
+                }
+                for hit in search_results
+            ]
+
+        hit_ids = [UUID(str(hit.id)) for hit in search_results]
+        if not hit_ids:
+            return []
+
+        # Fetch full conversation data from PostgreSQL in a single round trip
+        with self.db_manager.get_session() as session:
+            rows = session.query(Conversation).filter(
+                Conversation.id.in_(hit_ids)
+            ).all()
+            by_id = {row.id: row for row in rows}
+
+        results = []
+        for conversation_id, hit in zip(hit_ids, search_results):
+            conversation = by_id.get(conversation_id)
+            if conversation:
+                results.append({
+                    "conversation_id": conversation_id,
+                    "conversation": conversation,
+                    "similarity_score": hit.score,
+                    "payload": hit.payload,
+                })
+
+        return results
+
     def get_similar_conversations(
         self,
         query: str,
         user_id: Optional[str] = None,
         limit: int = 5,
         intent_filter: Optional[str] = None,
+        hydrate: bool = True,
     ) -> List[Dict]:
         """Find similar conversations using semantic search.
 
@@ -200,60 +287,83 @@ class ConversationStore:
             user_id: Optional user ID to filter results
             limit: Maximum number of results
             intent_filter: Optional intent type to filter by
+            hydrate: Load full Conversation rows (False serves results from
+                the Qdrant payload with ``conversation`` set to None)
 
         Returns:
             List of dicts with conversation data and similarity scores
         """
         try:
-            # Generate embedding for query
             query_embedding = self._generate_embedding(query)
+            return self._search_and_hydrate(
+                query_embedding, user_id, limit, intent_filter, hydrate
+            )
+
+        except Exception as e:
+            print(f"Error searching conversations: {e}")
+            # Fallback to text search in PostgreSQL
+            return self._text_search_fallback(query, user_id, limit, intent_filter)
 
-            # Build Qdrant filter
-            from qdrant_client.models import Filter, FieldCondition, MatchValue
+    async def _generate_embedding_async(self, text: str) -> List[float]:
+        """Embed text via the shared EmbeddingService batch path.
 
-            filter_conditions = []
-            if user_id:
-                filter_conditions.append(
-                    FieldCondition(key="user_id", match=MatchValue(value=user_id))
-                )
-            if intent_filter:
-                filter_conditions.append(
-                    FieldCondition(key="intent", match=MatchValue(value=intent_filter))
-                )
+        Falls back to this store's own model (off the event loop) when the
+        shared service is unavailable or uses a different embedding model,
+        since vectors must match the ones indexed in the collection.
+        """
+        try:
+            from src.vector_db.embeddings import get_embedding_service
+
+            service = get_embedding_service()
+            if (
+                service.model_name == self.EMBEDDING_MODEL
+                and service.embedding_dim == self.VECTOR_SIZE
+            ):
+                embeddings = await service.generate_batch_embeddings([text])
+                if embeddings and embeddings[0] is not None:
+                    return embeddings[0]
+        except Exception as e:
+            print(f"Warning: Shared embedding service unavailable: {e}")
 
-            search_filter = Filter(must=filter_conditions) if filter_conditions else None
+        return await asyncio.to_thread(self._generate_embedding, text)
 
-            # Search in Qdrant
-            search_results = self.qdrant_client.search(
-                collection_name=self.COLLECTION_NAME,
-                query_vector=query_embedding,
-                query_filter=search_filter,
-                limit=limit,
-                with_payload=True,
-            )
+    async def aget_similar_conversations(
+        self,
+        query: str,
+        user_id: Optional[str] = None,
+        limit: int = 5,
+        intent_filter: Optional[str] = None,
+        hydrate: bool = True,
+    ) -> List[Dict]:
+        """Async variant of get_similar_conversations for request handlers.
 
-            # Fetch full conversation data from PostgreSQL
-            results = []
-            with self.db_manager.get_session() as session:
-                for hit in search_results:
-                    conversation_id = UUID(hit.id)
-                    conversation = session.query(Conversation).filter(
-                        Conversation.id == conversation_id
-                    ).first()
+        The query is embedded through the shared EmbeddingService and the
+        blocking Qdrant search and PostgreSQL hydration run in a worker
+        thread, so the event loop is never blocked.
 
-                    if conversation:
-                        results.append({
-                            "conversation": conversation,
-                            "similarity_score": hit.score,
-                            "payload": hit.payload,
-                        })
+        Args:
+            query: Search query
+            user_id: Optional user ID to filter results
+            limit: Maximum number of results
+            intent_filter: Optional intent type to filter by
+            hydrate: Load full Conversation rows (False serves results from
+                the Qdrant payload with ``conversation`` set to None)
 
-            return results
+        Returns:
+            List of dicts with conversation data and similarity scores
+        """
+        try:
+            query_embedding = await self._generate_embedding_async(query)
+            return await asyncio.to_thread(
+                self._search_and_hydrate,
+                query_embedding, user_id, limit, intent_filter, hydrate,
+            )
 
         except Exception as e:
             print(f"Error searching conversations: {e}")
-            # Fallback to text search in PostgreSQL
-            return self._text_search_fallback(query, user_id, limit, intent_filter)
+            return await asyncio.to_thread(
+                self._text_search_fallback, query, user_id, limit, intent_filter
+            )
 
     def _text_search_fallback(
         self,
@@ -290,6 +400,7 @@ class ConversationStore:
 
             return [
                 {
+                    "conversation_id": conv.id,
                     "conversation": conv,
                     "similarity_score": 0.5,  # Arbitrary score for text match
                     "payload": {"fallback": True},
@@ -17,6 +17,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     Integer,
+    LargeBinary,
     String,
     Text,
     Index,
@@ -197,6 +198,8 @@ class Solution(Base):
 
     # Problem description
     problem_description: Mapped[str] = mapped_column(Text, nullable=False)
+    # Normalized float32 embedding of problem_description (see SolutionStore)
+    problem_embedding: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
     problem_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
@@ -9,13 +9,13 @@ Epic 8: User Preference Learning
 
 import ast
 import re
-import subprocess
 from collections import defaultdict, Counter
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
 from sqlalchemy import func
 
+from src.git.reader import get_git_reader
 from src.memory.database import get_db_manager
 from src.memory.models import UserPreference
 
@@ -131,61 +131,33 @@ class PreferenceStore:
             List of commit dictionaries
         """
         try:
-            # Try matching by email first
-            cmd = [
-                'git', 'log',
-                f'--author={user_id}',
-                f'-n', str(max_commits),
-                '--pretty=format:%H|%an|%ae|%s',
-                '--name-only'
-            ]
-
-            result = subprocess.run(
-                cmd,
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode != 0:
+            reader = get_git_reader(repo_path)
+            if reader is None:
                 return []
 
-            # Parse output
-            commits = []
-            current_commit = None
-
-            for line in result.stdout.split('\n'):
-                line = line.strip()
-                if not line:
-                    if current_commit:
-                        commits.append(current_commit)
-                        current_commit = None
-                    continue
-
-                if '|' in line:
-                    # Commit header
-                    parts = line.split('|')
-                    current_commit = {
-                        'hash': parts[0],
-                        'author_name': parts[1],
-                        'author_email': parts[2],
-                        'subject': parts[3] if len(parts) > 3 else '',
-                        'files': []
-                    }
-                elif current_commit:
-                    # File name
-                    current_commit['files'].append(line)
-
-            if current_commit:
-                commits.append(current_commit)
-
-            return commits
+            # --author semantics: regex over "name <email>"
+            return [
+                {
+                    'hash': commit.hash,
+                    'author_name': commit.author_name,
+                    'author_email': commit.author_email,
+                    'subject': commit.subject,
+                    'files': list(commit.files)
+                }
+                for commit in reader.commits_by_author(user_id, max_commits)
+            ]
 
         except Exception as e:
             print(f"Error getting commits: {e}")
             return []
 
+    def _show_file(self, repo_path: str, rev: str, file_path: str) -> Optional[str]:
+        """File content at a revision, read through the repository's cat-file process."""
+        reader = get_git_reader(repo_path)
+        if reader is None:
+            return None
+        return reader.show(rev, file_path)
+
     def _analyze_code_style(self, repo_path: str, commits: List[Dict]) -> Dict:
         """Analyze code style preferences from commits.
 
@@ -208,17 +180,9 @@ class PreferenceStore:
 
                 try:
                     # Get file content at this commit
-                    cmd = ['git', 'show', f"{commit['hash']}:{file_path}"]
-                    result = subprocess.run(
-                        cmd,
-                        cwd=repo_path,
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-
-                    if result.returncode == 0:
-                        content = result.stdout
+                    content = self._show_file(repo_path, commit['hash'], file_path)
+
+                    if content is not None:
                         indentation_styles.append(self._detect_indentation(content))
                         naming_conventions['functions'].extend(
                             self._extract_function_names(content)
@@ -345,18 +309,11 @@ class PreferenceStore:
                     continue
 
                 try:
-                    cmd = ['git', 'show', f"{commit['hash']}:{file_path}"]
-                    result = subprocess.run(
-                        cmd,
-                        cwd=repo_path,
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-
-                    if result.returncode == 0:
+                    content = self._show_file(repo_path, commit['hash'], file_path)
+
+                    if content is not None:
                         # Extract imports
-                        for line in result.stdout.split('\n'):
+                        for line in content.split('\n'):
                             if line.strip().startswith('import ') or line.strip().startswith('from '):
                                 # Extract library name
                                 match = re.match(r'(?:from|import)\s+([a-zA-Z0-9_]+)', line)
@@ -419,17 +376,9 @@ class PreferenceStore:
             for file_path in commit['files']:
                 try:
                     if file_path.endswith('.py'):
-                        cmd = ['git', 'show', f"{commit['hash']}:{file_path}"]
-                        result = subprocess.run(
-                            cmd,
-                            cwd=repo_path,
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
+                        content = self._show_file(repo_path, commit['hash'], file_path)
 
-                        if result.returncode == 0:
-                            content = result.stdout
+                        if content is not None:
                             doc_indicators["docstring"] += content.count('"""') + content.count("'''")
                             doc_indicators["comments"] += content.count('#')
 
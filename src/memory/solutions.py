@@ -5,31 +5,264 @@ Epic 7: Solution Memory
 - Cluster similar problems for reuse
 - Track success metrics
 - Retrieve similar solutions by semantic search
+
+Problem embeddings are computed once when a solution is stored, persisted in
+``solutions.problem_embedding`` and kept in an in-memory per-project matrix,
+so a similarity lookup is one matrix-vector product.
+
+Clustering is incremental: a new solution joins the nearest cluster (or seeds
+a new one with its unclustered neighbors) and only the affected rows are
+written. Full DBSCAN reclustering runs via recluster_solutions(), optionally
+on a background schedule.
 """
 
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from sentence_transformers import SentenceTransformer
-from sklearn.cluster import DBSCAN
-from sqlalchemy import desc
+from sqlalchemy import desc, func
 import numpy as np
 
 from src.memory.database import get_db_manager
 from src.memory.models import Solution
 
 
+class _ProblemIndex:
+    """Normalized problem embeddings for one project (row i <-> ids[i])."""
+
+    def __init__(self):
+        self.ids: List[UUID] = []
+        self.positions: Dict[UUID, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        # Newest created_at among loaded rows; with the row count this detects
+        # rows replaced by other processes
+        self.latest_created: Optional[datetime] = None
+
+        # Incremental clustering state
+        self.cluster_of: Dict[UUID, str] = {}
+        self.members: Dict[str, List[UUID]] = {}
+        self.centroid_sums: Dict[str, np.ndarray] = {}
+        self.next_label = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, solution_id: UUID, vector: np.ndarray):
+        if solution_id in self.positions:
+            self._matrix[self.positions[solution_id]] = vector
+            return
+        if self._matrix is None:
+            self._matrix = np.zeros((16, vector.shape[0]), dtype=np.float32)
+        elif len(self.ids) == self._matrix.shape[0]:
+            # Grow by doubling so appends stay amortized O(1)
+            grown = np.zeros((self._matrix.shape[0] * 2, self._matrix.shape[1]), dtype=np.float32)
+            grown[: len(self.ids)] = self._matrix
+            self._matrix = grown
+        self.positions[solution_id] = len(self.ids)
+        self._matrix[len(self.ids)] = vector
+        self.ids.append(solution_id)
+
+    def vectors(self) -> np.ndarray:
+        if self._matrix is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self._matrix[: len(self.ids)]
+
+    def vector(self, solution_id: UUID) -> Optional[np.ndarray]:
+        pos = self.positions.get(solution_id)
+        return None if pos is None else self._matrix[pos]
+
+    def search(self, query: np.ndarray, limit: int) -> List[Tuple[UUID, float]]:
+        if not self.ids or self._matrix.shape[1] != query.shape[0]:
+            return []
+        scores = self.vectors() @ query
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.ids[i], float(scores[i])) for i in top]
+
+    def neighbors(
+        self, query: np.ndarray, min_similarity: float, exclude: UUID
+    ) -> List[Tuple[UUID, float]]:
+        """All points with cosine similarity >= min_similarity, best first."""
+        scores = self.vectors() @ query
+        hits = np.flatnonzero(scores >= min_similarity)
+        hits = hits[np.argsort(-scores[hits])]
+        return [(self.ids[i], float(scores[i])) for i in hits if self.ids[i] != exclude]
+
+    def rank_members(self, cluster_id: str, query: np.ndarray, exclude: UUID) -> List[UUID]:
+        """Members of a cluster ordered by similarity to query."""
+        members = [m for m in self.members.get(cluster_id, []) if m != exclude]
+        if not members:
+            return []
+        scores = self._matrix[[self.positions[m] for m in members]] @ query
+        return [members[i] for i in np.argsort(-scores)]
+
+    def assign(self, solution_id: UUID, cluster_id: str):
+        previous = self.cluster_of.get(solution_id)
+        if previous == cluster_id:
+            return
+        vector = self.vector(solution_id)
+        if previous is not None:
+            self.members[previous].remove(solution_id)
+            self.centroid_sums[previous] -= vector
+        self.cluster_of[solution_id] = cluster_id
+        self.members.setdefault(cluster_id, []).append(solution_id)
+        if cluster_id in self.centroid_sums:
+            self.centroid_sums[cluster_id] += vector
+        else:
+            self.centroid_sums[cluster_id] = vector.astype(np.float64).copy()
+        # Keep labels of newly created clusters unique
+        suffix = cluster_id.rsplit("_", 1)[-1]
+        if suffix.isdigit():
+            self.next_label = max(self.next_label, int(suffix) + 1)
+
+    def nearest_cluster(self, query: np.ndarray) -> Tuple[Optional[str], float]:
+        """Cluster whose (normalized) centroid is most similar to query."""
+        cluster_ids = [c for c, members in self.members.items() if members]
+        if not cluster_ids:
+            return None, 0.0
+        centroids = np.stack([self.centroid_sums[c] for c in cluster_ids])
+        norms = np.linalg.norm(centroids, axis=1)
+        norms[norms == 0] = 1.0
+        scores = (centroids @ query) / norms
+        best = int(np.argmax(scores))
+        return cluster_ids[best], float(scores[best])
+
+
 class SolutionStore:
     """Store and retrieve problem-solution pairs with clustering."""
 
     EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 
-    def __init__(self):
-        """Initialize solution store."""
+    # DBSCAN parameters (cosine distance); incremental assignment uses the same eps
+    CLUSTER_EPS = 0.3
+    CLUSTER_MIN_SAMPLES = 2
+
+    # Maximum number of ids kept in similar_problems per solution
+    MAX_SIMILAR_PROBLEMS = 20
+
+    def __init__(self, recluster_interval_seconds: Optional[float] = None):
+        """Initialize solution store.
+
+        Args:
+            recluster_interval_seconds: If set, run a full recluster of all
+                projects in a background thread at this interval
+        """
         self.db_manager = get_db_manager()
         self.embedding_model = SentenceTransformer(self.EMBEDDING_MODEL)
 
+        # project_id -> embedding index, loaded lazily from the database
+        self._indexes: Dict[Optional[str], _ProblemIndex] = {}
+        self._index_lock = threading.RLock()
+
+        self._recluster_stop = threading.Event()
+        self._recluster_thread: Optional[threading.Thread] = None
+        if recluster_interval_seconds:
+            self.start_background_reclustering(recluster_interval_seconds)
+
+    # ===== Embeddings =====
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts into L2-normalized float32 rows."""
+        embeddings = np.asarray(self.embedding_model.encode(texts), dtype=np.float32)
+        if embeddings.ndim == 1:
+            embeddings = embeddings.reshape(1, -1)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return embeddings / norms
+
+    @staticmethod
+    def _project_filter(project_id: Optional[str]):
+        if project_id is None:
+            return Solution.project_id.is_(None)
+        return Solution.project_id == project_id
+
+    def _load_project_index(self, session, project_id: Optional[str]) -> _ProblemIndex:
+        """Build a project's index from stored embeddings, backfilling missing ones."""
+        rows = session.query(
+            Solution.id,
+            Solution.problem_description,
+            Solution.problem_embedding,
+            Solution.cluster_id,
+            Solution.created_at,
+        ).filter(self._project_filter(project_id)).all()
+
+        index = _ProblemIndex()
+        index.latest_created = max((row[4] for row in rows), default=None)
+        missing = [(sid, desc_) for sid, desc_, blob, _, _ in rows if blob is None]
+        backfilled = {}
+        if missing:
+            vectors = self._encode([desc_ for _, desc_ in missing])
+            for (sid, _), vector in zip(missing, vectors):
+                backfilled[sid] = vector
+                session.query(Solution).filter(Solution.id == sid).update(
+                    {"problem_embedding": vector.tobytes()}, synchronize_session=False
+                )
+            session.commit()
+
+        for sid, _, blob, cluster_id, _ in rows:
+            vector = backfilled.get(sid)
+            if vector is None:
+                vector = np.frombuffer(blob, dtype=np.float32)
+            index.add(sid, vector)
+            if cluster_id:
+                index.assign(sid, cluster_id)
+        return index
+
+    def _sync_indexes(self, session, project_id: Optional[str] = None, all_projects: bool = False):
+        """Make in-memory indexes match the database.
+
+        A single grouped query of row count and newest created_at detects rows
+        added, removed or replaced by other processes; only projects whose
+        signature changed are reloaded.
+
+        Args:
+            session: Database session
+            project_id: Project to sync (ignored when all_projects is True)
+            all_projects: Sync every project
+        """
+        q = session.query(
+            Solution.project_id, func.count(Solution.id), func.max(Solution.created_at)
+        )
+        if not all_projects:
+            q = q.filter(self._project_filter(project_id))
+        signatures = {proj: (count, latest) for proj, count, latest in q.group_by(Solution.project_id).all()}
+
+        with self._index_lock:
+            if all_projects:
+                for stale in [p for p in self._indexes if p not in signatures]:
+                    del self._indexes[stale]
+            elif project_id not in signatures:
+                self._indexes.pop(project_id, None)
+
+            for proj, (count, latest) in signatures.items():
+                index = self._indexes.get(proj)
+                if index is None or len(index) != count or index.latest_created != latest:
+                    self._indexes[proj] = self._load_project_index(session, proj)
+
+    def _embeddings_for(self, session, solutions: List[Solution]) -> np.ndarray:
+        """Stored embeddings for solutions, in order.
+
+        Indexes should already be synced; a project whose index lacks one of
+        the solutions (changed between sync and query) is reloaded once.
+        """
+        with self._index_lock:
+            vectors = []
+            reloaded = set()
+            for s in solutions:
+                index = self._indexes.get(s.project_id)
+                vector = index.vector(s.id) if index is not None else None
+                if vector is None and s.project_id not in reloaded:
+                    reloaded.add(s.project_id)
+                    index = self._indexes[s.project_id] = self._load_project_index(session, s.project_id)
+                    vector = index.vector(s.id)
+                if vector is None:
+                    vector = self._encode([s.problem_description])[0]
+                vectors.append(vector)
+            return np.stack(vectors)
+
     def store_solution(
         self,
         problem_description: str,
@@ -60,10 +293,13 @@ class SolutionStore:
         Returns:
             UUID of the created solution
         """
+        embedding = self._encode([problem_description])[0]
+
         with self.db_manager.get_session() as session:
             solution = Solution(
                 id=uuid4(),
                 problem_description=problem_description,
+                problem_embedding=embedding.tobytes(),
                 problem_type=problem_type,
                 error_message=error_message,
                 solution_code=solution_code,
@@ -79,6 +315,17 @@ class SolutionStore:
             session.add(solution)
             session.commit()
 
+            with self._index_lock:
+                index = self._indexes.get(project_id)
+                if index is not None:
+                    index.add(solution.id, embedding)
+                    # Read back as stored so it compares equal in _sync_indexes
+                    created = session.query(Solution.created_at).filter(
+                        Solution.id == solution.id
+                    ).scalar()
+                    if index.latest_created is None or (created and created > index.latest_created):
+                        index.latest_created = created
+
             # Trigger clustering update
             self._update_clustering(session, solution)
 
@@ -145,38 +392,35 @@ class SolutionStore:
             List of dicts with solution data and similarity scores
         """
         # Generate embedding for the problem
-        problem_embedding = self.embedding_model.encode(problem)
+        problem_embedding = self._encode([problem])[0]
 
-        # Get all solutions (potentially filtered)
         with self.db_manager.get_session() as session:
-            q = session.query(Solution)
-            if project_id:
-                q = q.filter(Solution.project_id == project_id)
+            self._sync_indexes(session, project_id, all_projects=not project_id)
 
-            solutions = q.all()
+            # Score against stored embeddings (no re-encoding of history)
+            with self._index_lock:
+                if project_id:
+                    indexes = [self._indexes[project_id]] if project_id in self._indexes else []
+                else:
+                    indexes = list(self._indexes.values())
+                hits = [hit for index in indexes for hit in index.search(problem_embedding, limit)]
 
-            if not solutions:
+            if not hits:
                 return []
 
-            # Compute similarity scores
-            similarities = []
-            for solution in solutions:
-                # Generate embedding for stored problem
-                stored_embedding = self.embedding_model.encode(solution.problem_description)
+            hits.sort(key=lambda x: x[1], reverse=True)
+            hits = hits[:limit]
 
-                # Compute cosine similarity
-                similarity = np.dot(problem_embedding, stored_embedding) / (
-                    np.linalg.norm(problem_embedding) * np.linalg.norm(stored_embedding)
-                )
-
-                similarities.append({
-                    "solution": solution,
-                    "similarity_score": float(similarity),
-                })
+            solutions = session.query(Solution).filter(
+                Solution.id.in_([sid for sid, _ in hits])
+            ).all()
+            by_id = {s.id: s for s in solutions}
 
-            # Sort by similarity and return top results
-            similarities.sort(key=lambda x: x["similarity_score"], reverse=True)
-            return similarities[:limit]
+            return [
+                {"solution": by_id[sid], "similarity_score": score}
+                for sid, score in hits
+                if sid in by_id
+            ]
 
     def update_solution_metrics(
         self,
@@ -226,44 +470,77 @@ class SolutionStore:
             return True
 
     def _update_clustering(self, session, new_solution: Solution):
-        """Update solution clustering when a new solution is added.
+        """Incrementally cluster a newly added solution.
 
-        Uses DBSCAN to cluster similar problems together.
+        The solution joins the nearest cluster whose centroid is within
+        CLUSTER_EPS (cosine distance), else the cluster of its most similar
+        clustered neighbor, else it seeds a new cluster with its unclustered
+        neighbors, else it stays unclustered (noise). Only the new row, newly
+        seeded members and a bounded number of existing members are written.
 
         Args:
             session: Database session
             new_solution: Newly added solution
         """
-        # Get all solutions from the same project
         project_id = new_solution.project_id
-        solutions = session.query(Solution).filter(
-            Solution.project_id == project_id
-        ).all()
-
-        if len(solutions) < 3:
-            # Need at least 3 solutions to cluster
-            return
-
-        # Generate embeddings for all problems
-        descriptions = [s.problem_description for s in solutions]
-        embeddings = self.embedding_model.encode(descriptions)
-
-        # Perform DBSCAN clustering
-        clustering = DBSCAN(eps=0.3, min_samples=2, metric='cosine')
-        cluster_labels = clustering.fit_predict(embeddings)
-
-        # Update cluster IDs for each solution
-        for solution, cluster_label in zip(solutions, cluster_labels):
-            if cluster_label != -1:  # -1 means noise/outlier
-                solution.cluster_id = f"{project_id}_cluster_{cluster_label}"
-
-                # Find similar problems in the same cluster
-                similar_ids = [
-                    str(s.id) for s, label in zip(solutions, cluster_labels)
-                    if label == cluster_label and s.id != solution.id
+        self._sync_indexes(session, project_id)
+        min_similarity = 1.0 - self.CLUSTER_EPS
+
+        with self._index_lock:
+            index = self._indexes.get(project_id)
+            if index is None or len(index) < 3:
+                # Need at least 3 solutions to cluster
+                return
+            vector = index.vector(new_solution.id)
+            if vector is None:
+                return
+
+            neighbors = index.neighbors(vector, min_similarity, exclude=new_solution.id)
+            cluster_id, centroid_similarity = index.nearest_cluster(vector)
+            seeded: List[UUID] = []
+
+            if cluster_id is None or centroid_similarity < min_similarity:
+                clustered = [sid for sid, _ in neighbors if sid in index.cluster_of]
+                if clustered:
+                    cluster_id = index.cluster_of[clustered[0]]
+                elif len(neighbors) + 1 >= self.CLUSTER_MIN_SAMPLES:
+                    cluster_id = f"{project_id or 'global'}_cluster_{index.next_label}"
+                    seeded = [sid for sid, _ in neighbors[: self.MAX_SIMILAR_PROBLEMS]]
+                else:
+                    # Noise: leave unclustered until the next full recluster
+                    return
+
+            index.assign(new_solution.id, cluster_id)
+            for sid in seeded:
+                index.assign(sid, cluster_id)
+
+            nearest = index.rank_members(cluster_id, vector, exclude=new_solution.id)
+            nearest = nearest[: self.MAX_SIMILAR_PROBLEMS]
+            similar_lists = {
+                sid: index.rank_members(cluster_id, index.vector(sid), exclude=sid)[
+                    : self.MAX_SIMILAR_PROBLEMS
                 ]
+                for sid in seeded
+            }
 
-                solution.similar_problems = {"similar_solution_ids": similar_ids}
+        new_solution.cluster_id = cluster_id
+        new_solution.similar_problems = {"similar_solution_ids": [str(sid) for sid in nearest]}
+
+        # Existing members only need the new id if they still have room
+        affected = set(seeded) | set(nearest)
+        if affected:
+            for solution in session.query(Solution).filter(Solution.id.in_(list(affected))):
+                if solution.id in similar_lists:
+                    solution.cluster_id = cluster_id
+                    solution.similar_problems = {
+                        "similar_solution_ids": [str(sid) for sid in similar_lists[solution.id]]
+                    }
+                    continue
+                current = list((solution.similar_problems or {}).get("similar_solution_ids", []))
+                if str(new_solution.id) not in current and len(current) < self.MAX_SIMILAR_PROBLEMS:
+                    solution.similar_problems = {
+                        "similar_solution_ids": current + [str(new_solution.id)]
+                    }
 
         session.commit()
 
@@ -286,27 +563,33 @@ class SolutionStore:
             if len(solutions) < 3:
                 return {"clusters": 0, "solutions": len(solutions)}
 
-            # Generate embeddings
-            descriptions = [s.problem_description for s in solutions]
-            embeddings = self.embedding_model.encode(descriptions)
+            # Reuse stored embeddings
+            self._sync_indexes(session, project_id, all_projects=not project_id)
+            embeddings = self._embeddings_for(session, solutions)
 
-            # Perform clustering
-            clustering = DBSCAN(eps=0.3, min_samples=2, metric='cosine')
+            # Perform clustering (sklearn is only needed here)
+            from sklearn.cluster import DBSCAN
+
+            clustering = DBSCAN(
+                eps=self.CLUSTER_EPS, min_samples=self.CLUSTER_MIN_SAMPLES, metric='cosine'
+            )
             cluster_labels = clustering.fit_predict(embeddings)
 
             # Count clusters
             unique_clusters = set(label for label in cluster_labels if label != -1)
 
             # Update all solutions
-            for solution, cluster_label in zip(solutions, cluster_labels):
+            for i, (solution, cluster_label) in enumerate(zip(solutions, cluster_labels)):
                 if cluster_label != -1:
                     proj_id = solution.project_id or "global"
                     solution.cluster_id = f"{proj_id}_cluster_{cluster_label}"
 
-                    # Find similar problems
+                    # Find the most similar problems in the same cluster
+                    same = np.flatnonzero(cluster_labels == cluster_label)
+                    same = same[same != i]
+                    ranked = same[np.argsort(-(embeddings[same] @ embeddings[i]))]
                     similar_ids = [
-                        str(s.id) for s, label in zip(solutions, cluster_labels)
-                        if label == cluster_label and s.id != solution.id
+                        str(solutions[j].id) for j in ranked[: self.MAX_SIMILAR_PROBLEMS]
                     ]
 
                     solution.similar_problems = {"similar_solution_ids": similar_ids}
@@ -316,12 +599,54 @@ class SolutionStore:
 
             session.commit()
 
+            # Cluster state is rebuilt from the new assignments on next use
+            with self._index_lock:
+                if project_id:
+                    self._indexes.pop(project_id, None)
+                else:
+                    self._indexes.clear()
+
             return {
                 "clusters": len(unique_clusters),
                 "solutions": len(solutions),
                 "outliers": sum(1 for label in cluster_labels if label == -1),
             }
 
+    def start_background_reclustering(self, interval_seconds: float):
+        """Periodically run a full recluster of all projects in a daemon thread.
+
+        Args:
+            interval_seconds: Seconds between reclustering runs
+        """
+        if self._recluster_thread is not None and self._recluster_thread.is_alive():
+            return
+
+        def recluster_loop():
+            while not self._recluster_stop.wait(interval_seconds):
+                try:
+                    with self.db_manager.get_session() as session:
+                        project_ids = [
+                            row[0] for row in session.query(Solution.project_id).distinct()
+                        ]
+                    for proj_id in project_ids:
+                        if proj_id:
+                            self.recluster_solutions(proj_id)
+                except Exception as e:
+                    print(f"Warning: Background reclustering failed: {e}")
+
+        self._recluster_stop.clear()
+        self._recluster_thread = threading.Thread(
+            target=recluster_loop, name="solution-recluster", daemon=True
+        )
+        self._recluster_thread.start()
+
+    def stop_background_reclustering(self):
+        """Stop the background reclustering thread."""
+        self._recluster_stop.set()
+        if self._recluster_thread is not None:
+            self._recluster_thread.join(timeout=5)
+            self._recluster_thread = None
+
     def get_solution_statistics(self, project_id: Optional[str] = None) -> Dict:
         """Get solution statistics.
 
@@ -401,4 +726,8 @@ class SolutionStore:
             ).delete()
 
             session.commit()
+
+            # Indexes are rebuilt from the database on next use
+            with self._index_lock:
+                self._indexes.clear()
             return deleted_count
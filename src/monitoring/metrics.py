@@ -3,13 +3,21 @@ Lightweight Metrics (Enterprise-grade foundation)
 
 Provides simple counters and timers with optional Prometheus integration.
 Falls back to in-process storage if prometheus_client is unavailable.
+
+The in-process backend uses constant memory per label set: histograms keep
+fixed bucket counts plus a DDSketch for percentiles, children are created
+once per label set and cached, and updates take one of a small pool of
+striped locks. Metrics.exposition() renders everything in the Prometheus
+text format.
 """
 
 from __future__ import annotations
 
+import math
 import time
 import threading
-from typing import Dict, Tuple, Callable
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple, Callable
 
 try:  # Optional dependency
     from prometheus_client import Counter as PCounter, Histogram as PHistogram  # type: ignore
@@ -17,28 +25,189 @@ except Exception:  # pragma: no cover
     PCounter = None  # type: ignore
     PHistogram = None  # type: ignore
 
+_LOCK_STRIPES = 16
+
+
+class DDSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees
+
+    Values are counted in logarithmic bins of ratio gamma = (1+a)/(1-a), so
+    any quantile is returned within relative accuracy `a` of the true value.
+    Memory is bounded by max_bins; if exceeded the lowest bins are collapsed,
+    which keeps upper percentiles (the ones worth alerting on) accurate.
+    """
+
+    MIN_VALUE = 1e-9  # magnitudes below this are counted as zero
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self._pos: Dict[int, int] = {}
+        self._neg: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1):
+        if value > self.MIN_VALUE:
+            bins = self._pos
+            key = self._index(value)
+        elif value < -self.MIN_VALUE:
+            bins = self._neg
+            key = self._index(-value)
+        else:
+            bins = None
+            self.zero_count += count
+        if bins is not None:
+            bins[key] = bins.get(key, 0) + count
+            if len(bins) > self.max_bins:
+                self._collapse(bins)
+        self.count += count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def _collapse(self, bins: Dict[int, int]):
+        keys = sorted(bins)
+        excess = keys[: len(keys) - self.max_bins + 1]
+        target = keys[len(excess)]
+        for key in excess:
+            bins[target] += bins.pop(key)
+
+    def merge(self, other: "DDSketch"):
+        """Add another sketch's counts (must share relative_accuracy)."""
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for mine, theirs in ((self._pos, other._pos), (self._neg, other._neg)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+            if len(mine) > self.max_bins:
+                self._collapse(mine)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> "DDSketch":
+        sketch = DDSketch(self.relative_accuracy, self.max_bins)
+        sketch.merge(self)
+        return sketch
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile (0 <= q <= 1), or None if empty."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._neg, reverse=True):
+            seen += self._neg[key]
+            if seen > rank:
+                return max(-self._value(key), self.min)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._pos):
+            seen += self._pos[key]
+            if seen > rank:
+                return min(self._value(key), self.max)
+        return self.max
+
+
+class _InProcCounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self, lock: threading.Lock):
+        self._lock = lock
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+
+class _InProcHistogramChild:
+    __slots__ = ("_lock", "_upper_bounds", "bucket_counts", "sum", "count", "sketch")
+
+    def __init__(self, lock: threading.Lock, upper_bounds: Tuple[float, ...]):
+        self._lock = lock
+        self._upper_bounds = upper_bounds
+        self.bucket_counts = [0] * (len(upper_bounds) + 1)  # last bucket is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.sketch = DDSketch()
+
+    def observe(self, value: float):
+        index = bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.sum += value
+            self.count += 1
+            self.sketch.add(value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            return self.sketch.quantile(q)
+
+
+class _InProcMetric:
+    """Label handling shared by the in-process metric types"""
 
-class _InProcCounter:
     def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
         self.name = name
         self.doc = documentation
-        self.labelnames = labelnames
+        self.labelnames = tuple(labelnames)
         self._lock = threading.Lock()
-        self._values: Dict[Tuple[str, ...], float] = {}
+        self._stripes = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def _new_child(self, lock: threading.Lock):
+        raise NotImplementedError
+
+    def labels(self, *labelvalues: str, **labelkwargs: str):
+        if labelkwargs:
+            labelvalues = tuple(labelkwargs[name] for name in self.labelnames)
+        key = tuple(str(v) for v in labelvalues)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child(self._stripes[hash(key) % _LOCK_STRIPES])
+                    self._children[key] = child
+        return child
+
+    def children(self) -> List[Tuple[Tuple[str, ...], object]]:
+        with self._lock:
+            return list(self._children.items())
+
+
+class _InProcCounter(_InProcMetric):
+    type_name = "counter"
 
-    def labels(self, *labelvalues: str):
-        key = tuple(labelvalues)
-        counter = self
+    def _new_child(self, lock: threading.Lock):
+        return _InProcCounterChild(lock)
 
-        class _Child:
-            def inc(self, amount: float = 1.0):
-                with counter._lock:
-                    counter._values[key] = counter._values.get(key, 0.0) + amount
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
 
-        return _Child()
+    def value(self, *labelvalues: str) -> float:
+        return self.labels(*labelvalues).value
 
 
-class _InProcHistogram:
+class _InProcHistogram(_InProcMetric):
+    type_name = "histogram"
+
     def __init__(
         self,
         name: str,
@@ -46,23 +215,43 @@ class _InProcHistogram:
         labelnames: Tuple[str, ...] = (),
         buckets: Tuple[float, ...] = (0.1, 0.5, 1, 2, 5, 10),
     ):
-        self.name = name
-        self.doc = documentation
-        self.labelnames = labelnames
-        self.buckets = buckets
-        self._lock = threading.Lock()
-        self._observations: Dict[Tuple[str, ...], list] = {}
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(b for b in buckets if b != math.inf))
+
+    def _new_child(self, lock: threading.Lock):
+        return _InProcHistogramChild(lock, self.buckets)
 
-    def labels(self, *labelvalues: str):
-        key = tuple(labelvalues)
-        hist = self
+    def observe(self, value: float):
+        self.labels().observe(value)
 
-        class _Child:
-            def observe(self, value: float):
-                with hist._lock:
-                    hist._observations.setdefault(key, []).append(value)
+    def quantile(self, q: float, *labelvalues: str) -> Optional[float]:
+        """
+        Approximate percentile for one label set, or across all label sets
+        when called without label values on a labelled histogram.
+        """
+        if labelvalues or not self.labelnames:
+            return self.labels(*labelvalues).quantile(q)
+        merged = DDSketch()
+        for _, child in self.children():
+            with child._lock:
+                merged.merge(child.sketch)
+        return merged.quantile(q)
 
-        return _Child()
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [
+        '%s="%s"' % (n, v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for n, v in zip(names, values)
+    ]
+    if extra:
+        parts.append(extra)
+    return "{%s}" % ",".join(parts) if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
 
 
 class Metrics:
@@ -92,6 +281,31 @@ class Metrics:
                 self._hists[name] = _InProcHistogram(name, doc, labelnames, buckets)
         return self._hists[name]
 
+    def exposition(self) -> str:
+        """Render in-process metrics in the Prometheus text format."""
+        lines: List[str] = []
+        for metric in list(self._counters.values()) + list(self._hists.values()):
+            if not isinstance(metric, _InProcMetric):
+                continue
+            lines.append(f"# HELP {metric.name} {metric.doc}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for key, child in metric.children():
+                if isinstance(child, _InProcCounterChild):
+                    lines.append(f"{metric.name}{_format_labels(metric.labelnames, key)} {_format_value(child.value)}")
+                    continue
+                with child._lock:
+                    counts = list(child.bucket_counts)
+                    total, count = child.sum, child.count
+                cumulative = 0
+                for bound, bucket_count in zip(metric.buckets + (math.inf,), counts):
+                    cumulative += bucket_count
+                    le = 'le="%s"' % _format_value(bound)
+                    lines.append(f"{metric.name}_bucket{_format_labels(metric.labelnames, key, le)} {cumulative}")
+                labels = _format_labels(metric.labelnames, key)
+                lines.append(f"{metric.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{metric.name}_count{labels} {count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
     def timed(
         self, name: str, doc: str = "", labelnames: Tuple[str, ...] = ()
     ):  # decorator
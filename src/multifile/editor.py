@@ -9,8 +9,9 @@ import asyncio
 import hashlib
 import logging
 import os
-import subprocess
+import shutil
 import tempfile
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -19,6 +20,8 @@ from typing import Dict, List, Optional, Set, Tuple
 
 import structlog
 
+from src.parsing.parser import get_parser
+
 logger = structlog.get_logger(__name__)
 
 
@@ -114,6 +117,12 @@ class MultiFileEditor:
     - Cross-repository coordination
     """
 
+    # Batch tool timeout: base seconds plus seconds per staged file
+    VALIDATION_TIMEOUT = 10
+    VALIDATION_TIMEOUT_PER_FILE = 1
+    VALIDATION_CACHE_SIZE = 4096
+    MAX_VALIDATION_MESSAGES = 10
+
     def __init__(
         self,
         workspace_root: str = ".",
@@ -121,6 +130,7 @@ class MultiFileEditor:
         enable_type_check: bool = True,
         enable_lint: bool = True,
         backup_dir: Optional[str] = None,
+        use_mypy_daemon: bool = False,
     ):
         """
         Initialize MultiFileEditor.
@@ -131,12 +141,14 @@ class MultiFileEditor:
             enable_type_check: Enable type checking
             enable_lint: Enable linting
             backup_dir: Directory for backups (temp dir if None)
+            use_mypy_daemon: Type check through a warm dmypy daemon (stop it with close())
         """
         self.workspace_root = Path(workspace_root).resolve()
         self.enable_syntax_check = enable_syntax_check
         self.enable_type_check = enable_type_check
         self.enable_lint = enable_lint
         self.backup_dir = Path(backup_dir) if backup_dir else Path(tempfile.mkdtemp())
+        self.use_mypy_daemon = use_mypy_daemon
 
         self.logger = logger.bind(
             component="multi_file_editor",
@@ -146,6 +158,10 @@ class MultiFileEditor:
         # Track applied changesets for rollback
         self.applied_changesets: List[ChangeSet] = []
 
+        # (tool, content sha256) -> (valid, messages)
+        self._validation_cache: "OrderedDict[Tuple[str, str], Tuple[bool, List[str]]]" = OrderedDict()
+        self._missing_tools: Set[str] = set()
+
     async def edit_files(self, change_plan: ChangeSet) -> Tuple[bool, ChangeSet]:
         """
         Execute multi-file edit with atomic guarantees.
@@ -304,87 +320,96 @@ class MultiFileEditor:
         """
         Validate all changes (syntax, types, linting).
 
+        Syntax is checked in-process per file; type checking and linting run
+        one batched tool invocation for all changed Python files.
+
         Returns:
             True if all validations pass
         """
-        validation_tasks = []
-
-        for change in change_plan.changes:
-            if change.content and change.change_type in (ChangeType.CREATE, ChangeType.MODIFY):
-                validation_tasks.append(self._validate_single_file(change))
-
-        # Run all validations in parallel
-        if validation_tasks:
-            results = await asyncio.gather(*validation_tasks, return_exceptions=True)
-
-            # Check if any validation failed
-            for result in results:
-                if isinstance(result, Exception):
-                    self.logger.error("Validation error", error=str(result))
-                    return False
-                if not result:
-                    return False
-
-        return True
-
-    async def _validate_single_file(self, change: FileChange) -> bool:
-        """
-        Validate a single file change.
+        to_validate = [
+            change for change in change_plan.changes
+            if change.content and change.change_type in (ChangeType.CREATE, ChangeType.MODIFY)
+        ]
+        if not to_validate:
+            return True
 
-        Returns:
-            True if all enabled validations pass
-        """
-        file_ext = Path(change.file_path).suffix
+        all_valid = True
 
         # Syntax check
-        if self.enable_syntax_check:
+        checked = []
+        for change in to_validate:
+            if not self.enable_syntax_check:
+                change.syntax_valid = ValidationStatus.SKIPPED
+                checked.append(change)
+                continue
             try:
-                syntax_valid = await self._check_syntax(change.file_path, change.content, file_ext)
-                change.syntax_valid = ValidationStatus.PASSED if syntax_valid else ValidationStatus.FAILED
-                if not syntax_valid:
-                    change.validation_errors.append("Syntax check failed")
-                    return False
+                syntax_valid = await self._check_syntax(
+                    change.file_path, change.content, Path(change.file_path).suffix
+                )
             except Exception as e:
                 change.syntax_valid = ValidationStatus.FAILED
                 change.validation_errors.append(f"Syntax check error: {str(e)}")
-                return False
-        else:
-            change.syntax_valid = ValidationStatus.SKIPPED
+                all_valid = False
+                continue
+            change.syntax_valid = ValidationStatus.PASSED if syntax_valid else ValidationStatus.FAILED
+            if syntax_valid:
+                checked.append(change)
+            else:
+                change.validation_errors.append("Syntax check failed")
+                all_valid = False
+
+        python_changes = [c for c in checked if Path(c.file_path).suffix == '.py']
+        type_targets = python_changes if self.enable_type_check else []
+        lint_targets = python_changes if self.enable_lint else []
+        type_ids = {id(c) for c in type_targets}
+        lint_ids = {id(c) for c in lint_targets}
+
+        # Type check and lint all Python files in one run per tool
+        type_results, lint_results = await asyncio.gather(
+            self._run_batch_check("mypy", type_targets),
+            self._run_batch_check("flake8", lint_targets),
+            return_exceptions=True,
+        )
 
-        # Type check
-        if self.enable_type_check and file_ext == '.py':
-            try:
-                type_valid = await self._check_types(change.file_path, change.content)
+        for change in checked:
+            # Type check
+            if id(change) not in type_ids:
+                change.type_check_valid = ValidationStatus.SKIPPED
+            elif isinstance(type_results, Exception):
+                change.type_check_valid = ValidationStatus.FAILED
+                change.validation_errors.append(f"Type check error: {str(type_results)}")
+                all_valid = False
+                continue
+            else:
+                type_valid, messages = type_results[change.file_path]
                 change.type_check_valid = ValidationStatus.PASSED if type_valid else ValidationStatus.FAILED
                 if not type_valid:
                     change.validation_errors.append("Type check failed")
-                    return False
-            except Exception as e:
-                change.type_check_valid = ValidationStatus.FAILED
-                change.validation_errors.append(f"Type check error: {str(e)}")
-                return False
-        else:
-            change.type_check_valid = ValidationStatus.SKIPPED
-
-        # Linting
-        if self.enable_lint:
-            try:
-                lint_valid = await self._check_lint(change.file_path, change.content, file_ext)
+                    change.validation_errors.extend(messages)
+                    all_valid = False
+                    continue
+
+            # Linting (files without a configured linter pass)
+            if not self.enable_lint:
+                change.lint_valid = ValidationStatus.SKIPPED
+            elif id(change) not in lint_ids:
+                change.lint_valid = ValidationStatus.PASSED
+            elif isinstance(lint_results, Exception):
+                change.lint_valid = ValidationStatus.FAILED
+                change.validation_errors.append(f"Lint check error: {str(lint_results)}")
+            else:
+                lint_valid, messages = lint_results[change.file_path]
                 change.lint_valid = ValidationStatus.PASSED if lint_valid else ValidationStatus.FAILED
                 if not lint_valid:
                     change.validation_errors.append("Lint check failed")
+                    change.validation_errors.extend(messages)
                     # Don't fail on lint errors, just warn
                     self.logger.warning(
                         "Lint check failed",
                         file=change.file_path
                     )
-            except Exception as e:
-                change.lint_valid = ValidationStatus.FAILED
-                change.validation_errors.append(f"Lint check error: {str(e)}")
-        else:
-            change.lint_valid = ValidationStatus.SKIPPED
 
-        return True
+        return all_valid
 
     async def _check_syntax(self, file_path: str, content: str, file_ext: str) -> bool:
         """Check syntax validity"""
@@ -401,80 +426,173 @@ class MultiFileEditor:
                 )
                 return False
 
-        # For other languages, use tree-sitter or similar
-        # For now, just return True
+        # Other languages: in-process tree-sitter parse (no AST conversion)
+        errors = get_parser().check_syntax(Path(file_path), content)
+        if errors is None:
+            # No parser for this language
+            return True
+        if errors:
+            self.logger.error(
+                "Syntax error",
+                file=file_path,
+                errors=errors
+            )
+            return False
         return True
 
     async def _check_types(self, file_path: str, content: str) -> bool:
         """Check type hints (Python only)"""
+        change = FileChange(file_path=file_path, change_type=ChangeType.MODIFY, content=content)
+        results = await self._run_batch_check("mypy", [change])
+        return results[file_path][0]
+
+    async def _check_lint(self, file_path: str, content: str, file_ext: str) -> bool:
+        """Run linter checks"""
+        if file_ext != '.py':
+            return True
+        change = FileChange(file_path=file_path, change_type=ChangeType.MODIFY, content=content)
+        results = await self._run_batch_check("flake8", [change])
+        return results[file_path][0]
+
+    def _tool_command(self, tool: str) -> List[str]:
+        """Command line for a batch validation tool (file paths are appended)"""
+        if tool == "mypy":
+            flags = [
+                '--ignore-missing-imports',
+                '--no-error-summary',
+                '--hide-error-context',
+                '--no-color-output',
+            ]
+            if self.use_mypy_daemon:
+                status_file = self.backup_dir / ".dmypy.json"
+                return ['dmypy', '--status-file', str(status_file), 'run', '--', *flags]
+            # Persistent cache: stdlib and typeshed are analyzed once, not per run
+            return ['mypy', *flags, '--cache-dir', str(self.backup_dir / ".mypy_cache")]
+        if tool == "flake8":
+            return ['flake8', '--max-line-length=100']
+        raise ValueError(f"Unknown validation tool: {tool}")
+
+    async def _run_batch_check(
+        self,
+        tool: str,
+        changes: List[FileChange]
+    ) -> Dict[str, Tuple[bool, List[str]]]:
+        """
+        Run one validation tool over many files in a single process.
+
+        Results are cached by content hash. Files are staged under their
+        content hash so same-named files from different directories don't
+        collide as modules. A missing tool, a timeout or a tool crash pass
+        the files, as the per-file checks always did.
+
+        Returns:
+            Dict mapping file_path to (valid, messages)
+        """
+        results: Dict[str, Tuple[bool, List[str]]] = {}
+        pending: Dict[str, List[FileChange]] = {}
+
+        for change in changes:
+            digest = hashlib.sha256(change.content.encode('utf-8')).hexdigest()
+            cached = self._validation_cache.get((tool, digest))
+            if cached is not None:
+                self._validation_cache.move_to_end((tool, digest))
+                results[change.file_path] = cached
+            else:
+                pending.setdefault(digest, []).append(change)
+
+        if not pending:
+            return results
+        if tool in self._missing_tools:
+            for group in pending.values():
+                for change in group:
+                    results[change.file_path] = (True, [])
+            return results
+
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        stage_dir = Path(tempfile.mkdtemp(prefix="validate_", dir=self.backup_dir))
+        staged: Dict[str, str] = {}  # staged file name -> digest
         try:
-            # Write to temp file and run mypy
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(content)
-                temp_path = f.name
+            for digest, group in pending.items():
+                name = f"m_{digest[:16]}.py"
+                (stage_dir / name).write_text(group[0].content)
+                staged[name] = digest
+
+            cmd = self._tool_command(tool) + [str(stage_dir / name) for name in staged]
+            timeout = self.VALIDATION_TIMEOUT + self.VALIDATION_TIMEOUT_PER_FILE * len(staged)
+            output = await self._run_tool(tool, cmd, timeout)
+
+            messages: Dict[str, List[str]] = {digest: [] for digest in pending}
+            if output is not None:
+                for line in output.splitlines():
+                    if tool == "mypy" and ": error:" not in line:
+                        continue
+                    name = os.path.basename(line.split(":", 1)[0])
+                    digest = staged.get(name)
+                    if digest is not None:
+                        messages[digest].append(line.split(":", 1)[1] if ":" in line else line)
+
+            for digest, group in pending.items():
+                outcome = (not messages[digest], messages[digest][:self.MAX_VALIDATION_MESSAGES])
+                if output is not None:
+                    self._validation_cache[(tool, digest)] = outcome
+                    if len(self._validation_cache) > self.VALIDATION_CACHE_SIZE:
+                        self._validation_cache.popitem(last=False)
+                for change in group:
+                    results[change.file_path] = (
+                        outcome[0],
+                        [f"{change.file_path}:{message}" for message in outcome[1]],
+                    )
+        finally:
+            shutil.rmtree(stage_dir, ignore_errors=True)
 
-            try:
-                result = subprocess.run(
-                    ['mypy', '--ignore-missing-imports', temp_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                return result.returncode == 0
-            finally:
-                Path(temp_path).unlink()
+        return results
 
+    async def _run_tool(self, tool: str, cmd: List[str], timeout: float) -> Optional[str]:
+        """
+        Run a validation tool and return its stdout.
+
+        Returns:
+            Tool output, or None if the result can't be trusted (missing tool,
+            timeout, crash)
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
         except FileNotFoundError:
-            # mypy not installed, skip type checking
-            self.logger.debug("mypy not found, skipping type check")
-            return True
-        except subprocess.TimeoutExpired:
-            self.logger.warning("Type check timed out", file=file_path)
-            return True
-        except Exception as e:
+            # Tool not installed, skip this check from now on
+            self.logger.debug(f"{cmd[0]} not found, skipping {tool} check")
+            self._missing_tools.add(tool)
+            return None
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            self.logger.warning(f"{tool} check timed out", timeout=timeout)
+            return None
+
+        # mypy/flake8 exit 1 when they report problems; anything else is a crash
+        if proc.returncode not in (0, 1):
             self.logger.warning(
-                "Type check error",
-                file=file_path,
-                error=str(e)
+                f"{tool} check error",
+                returncode=proc.returncode,
+                error=stderr.decode('utf-8', errors='replace')[:500]
             )
-            return True
-
-    async def _check_lint(self, file_path: str, content: str, file_ext: str) -> bool:
-        """Run linter checks"""
-        if file_ext == '.py':
-            try:
-                # Write to temp file and run flake8
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                    f.write(content)
-                    temp_path = f.name
-
-                try:
-                    result = subprocess.run(
-                        ['flake8', '--max-line-length=100', temp_path],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    return result.returncode == 0
-                finally:
-                    Path(temp_path).unlink()
-
-            except FileNotFoundError:
-                # flake8 not installed, skip linting
-                self.logger.debug("flake8 not found, skipping lint check")
-                return True
-            except subprocess.TimeoutExpired:
-                self.logger.warning("Lint check timed out", file=file_path)
-                return True
-            except Exception as e:
-                self.logger.warning(
-                    "Lint check error",
-                    file=file_path,
-                    error=str(e)
+            return None
+        return stdout.decode('utf-8', errors='replace')
+
+    async def close(self):
+        """Stop the mypy daemon if one was started"""
+        if self.use_mypy_daemon and "mypy" not in self._missing_tools:
+            status_file = self.backup_dir / ".dmypy.json"
+            if status_file.exists():
+                await self._run_tool(
+                    "mypy", ['dmypy', '--status-file', str(status_file), 'stop'], self.VALIDATION_TIMEOUT
                 )
-                return True
-
-        return True
 
     async def _apply_changes(self, change_plan: ChangeSet):
         """Apply all changes atomically"""
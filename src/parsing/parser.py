@@ -230,6 +230,48 @@ class CodeParser:
                 parse_time_ms=(time.time() - start_time) * 1000,
             )
 
+    def check_syntax(self, file_path: Path, content: str, max_errors: int = 10) -> Optional[List[str]]:
+        """
+        Find syntax errors without building the full AST or extracting symbols.
+
+        Args:
+            file_path: Path used for language detection
+            content: Source code to check
+            max_errors: Stop after this many errors
+
+        Returns:
+            List of error messages (empty if the source is valid), or None if
+            the language is unsupported or its parser is unavailable
+        """
+        language = detect_language(file_path)
+        if not language:
+            return None
+
+        parser = _get_tree_sitter_parser(language)
+        if not parser:
+            return None
+
+        source_bytes = content.encode("utf-8")
+        tree = parser.parse(source_bytes)
+        if not tree.root_node.has_error:
+            return []
+
+        errors: List[str] = []
+        stack = [tree.root_node]
+        while stack and len(errors) < max_errors:
+            node = stack.pop()
+            line = node.start_point[0] + 1
+            if node.is_missing:
+                errors.append(f"line {line}: missing '{node.type}'")
+            elif node.type == "ERROR":
+                text = source_bytes[node.start_byte : node.end_byte].decode("utf-8", errors="replace")
+                snippet = text.strip().splitlines()[0][:40] if text.strip() else ""
+                errors.append(f"line {line}: unexpected '{snippet}'")
+            elif node.has_error:
+                # Only descend into subtrees that contain an error
+                stack.extend(reversed(node.children))
+        return errors or [f"line {tree.root_node.start_point[0] + 1}: syntax error"]
+
     def _extract_symbols(
         self, ast_root: ASTNode, language: Language
     ) -> tuple[
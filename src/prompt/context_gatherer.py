@@ -24,12 +24,16 @@ import asyncio
 import hashlib
 import os
 import subprocess
+import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
+from src.git.reader import get_git_reader, relative_time
+from src.monitoring.metrics import metrics
+
 
 @dataclass
 class UserContext:
@@ -74,6 +78,13 @@ class RawContext:
     """All gathered context before ranking/selection"""
     chunks: List[ContextChunk] = field(default_factory=list)
     total_items: int = 0
+    # Sources that timed out or failed; their context is missing
+    incomplete_sources: List[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        """True when every requested source finished in time"""
+        return not self.incomplete_sources
 
     def merge(self, chunk: ContextChunk):
         """Merge a context chunk"""
@@ -161,8 +172,58 @@ class CodeContextGatherer:
     - Reverse dependencies (who imports this file)
     - Test files
     - Similar code patterns
+
+    Lookups are served from the in-process identifier index while it is current
+    for the workspace: kept up to date by the indexer, or a background snapshot
+    younger than index_max_age. Otherwise the snapshot is (re)built in the
+    background and the filesystem / ripgrep fallbacks are used. Files behind
+    served results are re-parsed first if they changed on disk.
     """
 
+    def __init__(
+        self,
+        identifier_index=None,
+        auto_build_index: bool = True,
+        index_max_age: float = 60.0,
+    ):
+        """
+        Initialize code context gatherer
+
+        Args:
+            identifier_index: IdentifierIndex to query (defaults to the global one)
+            auto_build_index: Build the index for unindexed workspaces in the background
+            index_max_age: Seconds a background snapshot is served before it is rebuilt
+        """
+        self._identifier_index = identifier_index
+        self.auto_build_index = auto_build_index
+        self.index_max_age = index_max_age
+        self._build_tasks: Dict[str, asyncio.Task] = {}
+
+    @property
+    def identifier_index(self):
+        if self._identifier_index is None:
+            from src.indexing.identifier_index import get_identifier_index
+            self._identifier_index = get_identifier_index()
+        return self._identifier_index
+
+    def _index_for(self, workspace_path: str):
+        """Identifier index if it is current for the workspace, else None (kicking off a build)"""
+        try:
+            index = self.identifier_index
+        except Exception:
+            return None
+
+        if index.is_current(workspace_path, self.index_max_age):
+            return index
+
+        if self.auto_build_index and not index.is_building(workspace_path):
+            task = self._build_tasks.get(workspace_path)
+            if task is None or task.done():
+                self._build_tasks[workspace_path] = asyncio.create_task(
+                    asyncio.to_thread(index.build, workspace_path)
+                )
+        return None
+
     async def gather(self, entities: List, user_context: UserContext) -> ContextChunk:
         """
         Gather code context
@@ -254,10 +315,16 @@ class CodeContextGatherer:
 
     async def _get_dependencies(self, workspace_path: str, file_path: str) -> List[tuple]:
         """Get file dependencies by parsing imports"""
+        index = self._index_for(workspace_path)
+        full_path = os.path.join(workspace_path, file_path)
+        if index is not None:
+            await asyncio.to_thread(index.ensure_fresh, [full_path])
+            if index.has_file(full_path):
+                return await self._get_indexed_dependencies(index, workspace_path, full_path)
+
         dependencies = []
 
         try:
-            full_path = os.path.join(workspace_path, file_path)
             with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
 
@@ -282,8 +349,34 @@ class CodeContextGatherer:
 
         return dependencies[:5]  # Limit to top 5 dependencies
 
+    async def _get_indexed_dependencies(self, index, workspace_path: str, full_path: str) -> List[tuple]:
+        """Resolve imports recorded in the identifier index to workspace files"""
+        dependencies = []
+        seen = set()
+
+        for module in index.get_imports(full_path) or []:
+            base = module.lstrip('.').replace('.', '/')
+            if not base:
+                continue
+            for dep_path in (base + '.py', base + '/__init__.py'):
+                if dep_path in seen or not index.has_file(os.path.join(workspace_path, dep_path)):
+                    continue
+                seen.add(dep_path)
+                dep_content = await self._read_file(workspace_path, dep_path)
+                if dep_content:
+                    dependencies.append((dep_path, dep_content))
+                break
+            if len(dependencies) >= 5:  # Limit to top 5 dependencies
+                break
+
+        return dependencies
+
     async def _find_test_files(self, workspace_path: str, file_path: str) -> List[tuple]:
         """Find test files for a given file"""
+        index = self._index_for(workspace_path)
+        if index is not None:
+            return await self._find_indexed_test_files(index, workspace_path, file_path)
+
         test_files = []
 
         try:
@@ -309,8 +402,43 @@ class CodeContextGatherer:
 
         return test_files
 
+    async def _find_indexed_test_files(self, index, workspace_path: str, file_path: str) -> List[tuple]:
+        """Find test files by basename anywhere in the indexed workspace"""
+        name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
+        source_dir = os.path.dirname(os.path.join(workspace_path, file_path))
+
+        candidates = []
+        for basename in (f'test_{name_without_ext}.py', f'{name_without_ext}_test.py'):
+            candidates.extend(index.files_named(basename, root=workspace_path))
+        # Tests next to the source file first
+        candidates.sort(key=lambda path: (not path.startswith(source_dir + os.sep), path))
+
+        test_files = []
+        for test_full_path in candidates[:4]:
+            test_path = os.path.relpath(test_full_path, workspace_path)
+            test_content = await self._read_file(workspace_path, test_path)
+            if test_content:
+                test_files.append((test_path, test_content))
+
+        return test_files
+
     async def _search_identifier(self, workspace_path: str, identifier: str) -> List[dict]:
-        """Search for identifier in codebase using grep"""
+        """Search for identifier definitions (identifier index, falling back to grep)"""
+        index = self._index_for(workspace_path)
+        if index is not None:
+            locations = index.lookup(identifier, root=workspace_path, limit=20)
+            # Files edited since they were parsed are re-parsed, then looked up again
+            if await asyncio.to_thread(index.ensure_fresh, {loc.file_path for loc in locations}):
+                locations = index.lookup(identifier, root=workspace_path, limit=20)
+            return [
+                {
+                    'file': os.path.relpath(location.file_path, workspace_path),
+                    'line': location.line,
+                    'snippet': location.snippet,
+                }
+                for location in locations
+            ]
+
         results = []
 
         try:
@@ -487,36 +615,20 @@ class HistoricalContextGatherer:
         commits = []
 
         try:
-            since = datetime.now() - timedelta(hours=hours)
-            since_str = since.strftime('%Y-%m-%d %H:%M:%S')
-
-            cmd = [
-                'git', '-C', workspace_path, 'log',
-                f'--since={since_str}',
-                '--pretty=format:%H|%an|%ae|%s|%ar',
-                '--max-count=20'
-            ]
-
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await proc.communicate()
-
-            if proc.returncode == 0:
-                output = stdout.decode('utf-8', errors='ignore')
-                for line in output.split('\n'):
-                    if line.strip():
-                        parts = line.split('|')
-                        if len(parts) >= 4:
-                            commits.append({
-                                'hash': parts[0],
-                                'author': parts[1],
-                                'email': parts[2],
-                                'message': parts[3],
-                                'time_ago': parts[4] if len(parts) > 4 else ''
-                            })
+            reader = await asyncio.to_thread(get_git_reader, workspace_path)
+            if reader is None:
+                return commits
+
+            since = (datetime.now() - timedelta(hours=hours)).timestamp()
+            now = time.time()
+            for commit in await asyncio.to_thread(reader.recent_commits, 20, since):
+                commits.append({
+                    'hash': commit.hash,
+                    'author': commit.author_name,
+                    'email': commit.author_email,
+                    'message': commit.subject,
+                    'time_ago': relative_time(commit.author_time, now)
+                })
 
         except Exception:
             pass
@@ -524,19 +636,11 @@ class HistoricalContextGatherer:
         return commits
 
     async def _get_git_blame(self, workspace_path: str, file_path: str) -> Optional[str]:
-        """Get git blame for a file"""
+        """Get git blame for a file (first 5KB, cached per HEAD)"""
         try:
-            cmd = ['git', '-C', workspace_path, 'blame', '--line-porcelain', file_path]
-
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await proc.communicate()
-
-            if proc.returncode == 0:
-                return stdout.decode('utf-8', errors='ignore')[:5000]  # Limit to 5KB
+            reader = await asyncio.to_thread(get_git_reader, workspace_path)
+            if reader is not None:
+                return await asyncio.to_thread(reader.blame, file_path)
 
         except Exception:
             pass
@@ -614,46 +718,33 @@ class TeamContextGatherer:
     async def _find_experts(self, workspace_path: str, file_path: str) -> Optional[List[dict]]:
         """Find expert developers for a file (by commit frequency)"""
         try:
-            cmd = [
-                'git', '-C', workspace_path, 'log',
-                '--pretty=format:%an|%ae',
-                '--', file_path
+            reader = await asyncio.to_thread(get_git_reader, workspace_path)
+            if reader is None:
+                return None
+
+            author_counts = defaultdict(int)
+            author_emails = {}
+
+            for commit in await asyncio.to_thread(reader.commits_for_path, file_path):
+                author_counts[commit.author_name] += 1
+                author_emails[commit.author_name] = commit.author_email
+
+            # Get top 3 contributors
+            top_authors = sorted(
+                author_counts.items(),
+                key=lambda x: x[1],
+                reverse=True
+            )[:3]
+
+            return [
+                {
+                    'name': name,
+                    'email': author_emails[name],
+                    'commits': count
+                }
+                for name, count in top_authors
             ]
 
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await proc.communicate()
-
-            if proc.returncode == 0:
-                output = stdout.decode('utf-8', errors='ignore')
-                author_counts = defaultdict(int)
-                author_emails = {}
-
-                for line in output.split('\n'):
-                    if '|' in line:
-                        name, email = line.split('|', 1)
-                        author_counts[name] += 1
-                        author_emails[name] = email
-
-                # Get top 3 contributors
-                top_authors = sorted(
-                    author_counts.items(),
-                    key=lambda x: x[1],
-                    reverse=True
-                )[:3]
-
-                return [
-                    {
-                        'name': name,
-                        'email': author_emails[name],
-                        'commits': count
-                    }
-                    for name, count in top_authors
-                ]
-
         except Exception:
             pass
 
@@ -740,14 +831,32 @@ class ContextGatherer:
     4. Historical context
     5. Team context
     6. External context (optional)
+
+    Each source runs under its own deadline (``source_timeouts``) bounded by
+    an overall budget (``gather_timeout``). Sources that finish in time are
+    kept even when others are cancelled.
     """
 
+    # Overall gathering budget in seconds
+    DEFAULT_BUDGET = 2.0
+
+    # Per-source deadlines in seconds (local reads are fast, git/team are not)
+    DEFAULT_SOURCE_TIMEOUTS = {
+        'current': 1.0,
+        'code': 1.5,
+        'architecture': 1.0,
+        'history': 1.5,
+        'team': 1.5,
+        'external': 2.0,
+    }
+
     def __init__(self, config: Optional[dict] = None):
         """
         Initialize context gatherer
 
         Args:
-            config: Optional configuration dict
+            config: Optional configuration dict (cache_ttl, external_enabled,
+                gather_timeout, source_timeouts)
         """
         self.config = config or {}
 
@@ -762,6 +871,14 @@ class ContextGatherer:
         # Initialize cache
         self.cache = ContextCache(ttl=self.config.get('cache_ttl', 300))
 
+        # Per-source latency, labelled by outcome, for tuning deadlines
+        self.h_source = metrics.histogram(
+            "context_gather_source_seconds",
+            "Context gathering latency per source",
+            ("source", "status"),
+            buckets=(0.05, 0.1, 0.25, 0.5, 1, 1.5, 2, 5),
+        )
+
     async def gather(self, prompt_intent, user_context: UserContext) -> RawContext:
         """
         Gather context from all relevant sources in parallel
@@ -818,34 +935,56 @@ class ContextGatherer:
                     self.external_gatherer.gather(prompt_intent.entities, user_context)
                 ))
 
-        # Gather all in parallel with timeout
-        try:
-            # Create task list
-            gather_tasks = [task for _, task in tasks]
-
-            # Run with 2 second timeout
-            results = await asyncio.wait_for(
-                asyncio.gather(*gather_tasks, return_exceptions=True),
-                timeout=2.0
-            )
-        except asyncio.TimeoutError:
-            # Timeout - return partial results
-            results = [None] * len(tasks)
+        # Gather all in parallel; each source gets its own deadline within
+        # the overall budget and stragglers are cancelled individually
+        budget = self.config.get('gather_timeout', self.DEFAULT_BUDGET)
+        results = await asyncio.gather(*[
+            self._run_source(name, coro, min(self._source_timeout(name), budget))
+            for name, coro in tasks
+        ])
 
-        # Merge results
+        # Merge results from sources that completed
         raw_context = RawContext()
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                # Log warning but continue
+        for name, status, result in results:
+            if status != 'ok':
+                raw_context.incomplete_sources.append(name)
                 continue
             if result:
                 raw_context.merge(result)
 
-        # Cache result
-        await self.cache.set(cache_key, raw_context)
+        # Only cache complete contexts so a slow source is retried next time
+        if raw_context.complete:
+            await self.cache.set(cache_key, raw_context)
 
         return raw_context
 
+    def _source_timeout(self, name: str) -> float:
+        """Deadline in seconds for one source (config overrides defaults)"""
+        overrides = self.config.get('source_timeouts', {})
+        return overrides.get(name, self.DEFAULT_SOURCE_TIMEOUTS.get(name, self.DEFAULT_BUDGET))
+
+    async def _run_source(self, name: str, coro, timeout: float) -> tuple:
+        """
+        Run one gatherer under its deadline and record its latency
+
+        Returns:
+            (source, status, chunk) where status is 'ok', 'timeout' or 'error'
+        """
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(coro, timeout=timeout)
+            status = 'ok'
+        except asyncio.TimeoutError:
+            result, status = None, 'timeout'
+        except Exception:
+            result, status = None, 'error'
+
+        try:
+            self.h_source.labels(name, status).observe(time.perf_counter() - start)
+        except Exception:
+            pass
+        return name, status, result
+
     def _make_cache_key(self, prompt_intent, user_context: UserContext) -> str:
         """Generate cache key"""
         key_parts = [
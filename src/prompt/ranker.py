@@ -16,17 +16,23 @@ Ranks context chunks by relevance using 10-factor scoring formula.
 10. user_preference: User referenced? (LOW - weight 0.5)
 """
 
+import hashlib
 import math
 import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 
 # Lazy load embedding model
 _embedding_model = None
 
+# Characters of item content used for semantic similarity
+MAX_EMBED_CHARS = 1000
+
 
 def get_embedding_model():
     """Lazy load sentence transformer model"""
@@ -41,6 +47,58 @@ def get_embedding_model():
     return _embedding_model
 
 
+class EmbeddingCache:
+    """
+    Bounded LRU of context-item embeddings keyed by content hash
+
+    Shared across ranker instances so items gathered again for a follow-up
+    prompt (same file, same commit) are not re-encoded.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str) -> str:
+        return hashlib.sha1(text.encode("utf-8", errors="replace")).hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def put(self, key: str, vector: np.ndarray):
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_embedding_cache = EmbeddingCache()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Shared embedding cache for context ranking"""
+    return _embedding_cache
+
+
 @dataclass
 class ScoredChunk:
     """Context chunk with relevance score"""
@@ -78,20 +136,30 @@ class ContextRanker:
         'user_preference': 0.5,           # User referenced?
     }
 
-    def __init__(self, weights: Optional[Dict[str, float]] = None):
+    def __init__(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+    ):
         """
         Initialize context ranker
 
         Args:
             weights: Optional custom weights for scoring factors
+            embedding_cache: Cache for item embeddings (defaults to the shared one)
         """
         self.weights = weights or self.DEFAULT_WEIGHTS
         self.embedding_model = get_embedding_model()
+        self.embedding_cache = embedding_cache or get_embedding_cache()
 
     async def rank(self, raw_context, prompt_intent, user_context) -> RankedContext:
         """
         Rank all context chunks by relevance
 
+        Item embeddings are produced in a single batched encode call (cached
+        items are skipped) and the weighted sum over all factors is computed
+        as one matrix-vector product.
+
         Args:
             raw_context: RawContext with all gathered chunks
             prompt_intent: Analyzed prompt intent
@@ -100,84 +168,93 @@ class ContextRanker:
         Returns:
             RankedContext with chunks sorted by score
         """
-        # Compute embedding for prompt once
-        prompt_embedding = None
-        if self.embedding_model:
-            try:
-                prompt_embedding = self.embedding_model.encode(
-                    prompt_intent.original_prompt
-                )
-            except Exception:
-                pass
-
-        scored_chunks = []
-
-        # Score each context item
-        for chunk in raw_context.chunks:
-            for item in chunk.items:
-                # Compute all 10 factors
-                factors = {
-                    'relevance_score': self._semantic_similarity(
-                        prompt_embedding,
-                        item
-                    ),
-                    'recency_score': self._recency_score(item),
-                    'proximity_score': self._proximity_score(item, user_context),
-                    'dependency_score': self._dependency_score(item, user_context),
-                    'usage_frequency': self._usage_frequency(item),
-                    'error_correlation': self._error_correlation(item, prompt_intent),
-                    'team_signal': self._team_signal(item, user_context),
-                    'historical_success': self._historical_success(item),
-                    'architectural_importance': self._architectural_importance(item),
-                    'user_preference': self._user_preference(item, prompt_intent),
-                }
-
-                # Compute weighted score
-                total_score = sum(
-                    factors[name] * weight
-                    for name, weight in self.weights.items()
-                )
-
-                # Add base priority from gatherer
-                total_score += item.priority
-
-                scored_chunks.append(ScoredChunk(
-                    chunk=item,
-                    score=total_score,
-                    factors=factors
-                ))
-
-        # Sort by score (descending)
-        scored_chunks.sort(key=lambda x: x.score, reverse=True)
+        items = [item for chunk in raw_context.chunks for item in chunk.items]
+        if not items:
+            return RankedContext(chunks=[])
+
+        relevance = self._batch_semantic_similarity(prompt_intent.original_prompt, items)
+
+        # Prompt-level signals shared by every item
+        has_errors = self._prompt_has_errors(prompt_intent)
+        prompt_lower = prompt_intent.original_prompt.lower()
+
+        factor_names = list(self.weights)
+        factor_rows = []
+        for item, relevance_score in zip(items, relevance):
+            # Compute all 10 factors
+            factors = {
+                'relevance_score': relevance_score,
+                'recency_score': self._recency_score(item),
+                'proximity_score': self._proximity_score(item, user_context),
+                'dependency_score': self._dependency_score(item, user_context),
+                'usage_frequency': self._usage_frequency(item),
+                'error_correlation': self._error_correlation(item, prompt_intent, has_errors),
+                'team_signal': self._team_signal(item, user_context),
+                'historical_success': self._historical_success(item),
+                'architectural_importance': self._architectural_importance(item),
+                'user_preference': self._user_preference(item, prompt_intent, prompt_lower),
+            }
+            factor_rows.append(factors)
+
+        # Weighted score for all items at once, plus base priority from gatherer
+        factor_matrix = np.array(
+            [[factors[name] for name in factor_names] for factors in factor_rows],
+            dtype=np.float64,
+        )
+        weight_vector = np.array([self.weights[name] for name in factor_names], dtype=np.float64)
+        priorities = np.array([item.priority for item in items], dtype=np.float64)
+        totals = factor_matrix @ weight_vector + priorities
+
+        # Sort by score (descending, stable for ties)
+        order = np.argsort(-totals, kind="stable")
+        scored_chunks = [
+            ScoredChunk(chunk=items[i], score=float(totals[i]), factors=factor_rows[i])
+            for i in order
+        ]
 
         return RankedContext(chunks=scored_chunks)
 
-    def _semantic_similarity(self, prompt_embedding, item) -> float:
+    def _batch_semantic_similarity(self, prompt: str, items: Sequence) -> List[float]:
         """
-        Compute cosine similarity between prompt and context
+        Cosine similarity between the prompt and every item
 
-        Returns: 0.0 - 1.0
+        The prompt and all uncached item texts are encoded in one batch.
+
+        Returns: list of 0.0 - 1.0 scores, one per item
         """
-        if prompt_embedding is None or self.embedding_model is None:
-            # Fallback: simple keyword matching
-            return self._keyword_similarity(item)
+        if self.embedding_model is None:
+            return [self._keyword_similarity(item) for item in items]
 
-        try:
-            # Get content text
-            content = str(item.content)[:1000]  # Limit to first 1000 chars
+        texts = [str(item.content)[:MAX_EMBED_CHARS] for item in items]
+        keys = [self.embedding_cache.key(text) for text in texts]
+        vectors: List[Optional[np.ndarray]] = [self.embedding_cache.get(key) for key in keys]
 
-            # Compute embedding
-            item_embedding = self.embedding_model.encode(content)
+        # Unique uncached texts, in first-seen order
+        pending: Dict[str, str] = {}
+        for key, text, vector in zip(keys, texts, vectors):
+            if vector is None and key not in pending:
+                pending[key] = text
 
-            # Cosine similarity
-            similarity = np.dot(prompt_embedding, item_embedding) / (
-                np.linalg.norm(prompt_embedding) * np.linalg.norm(item_embedding)
+        try:
+            encoded = np.asarray(
+                self.embedding_model.encode([prompt] + list(pending.values())),
+                dtype=np.float32,
             )
+        except Exception:
+            return [self._keyword_similarity(item) for item in items]
 
-            return max(0.0, min(1.0, float(similarity)))
+        prompt_embedding = encoded[0]
+        fresh = dict(zip(pending, encoded[1:]))
+        for key, vector in fresh.items():
+            self.embedding_cache.put(key, vector)
+        vectors = [vector if vector is not None else fresh[key] for key, vector in zip(keys, vectors)]
 
-        except Exception:
-            return self._keyword_similarity(item)
+        matrix = np.stack(vectors)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(prompt_embedding)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            similarity = (matrix @ prompt_embedding) / norms
+        similarity = np.clip(np.nan_to_num(similarity, nan=0.0), 0.0, 1.0)
+        return similarity.astype(np.float64).tolist()
 
     def _keyword_similarity(self, item) -> float:
         """Fallback keyword-based similarity"""
@@ -269,25 +346,30 @@ class ContextRanker:
         else:
             return 0.5
 
-    def _error_correlation(self, item, prompt_intent) -> float:
-        """
-        Score based on correlation with error messages
-
-        Returns: 0.0 - 1.0
-        """
-        # Check if prompt contains errors
+    def _prompt_has_errors(self, prompt_intent) -> bool:
+        """Whether the prompt mentions any error entities"""
         try:
             from src.prompt.analyzer import EntityType
-            has_errors = any(
+            return any(
                 e.type == EntityType.ERROR
                 for e in prompt_intent.entities
             )
         except ImportError:
-            has_errors = any(
+            return any(
                 e.type == "ERROR"
                 for e in prompt_intent.entities
             )
 
+    def _error_correlation(self, item, prompt_intent, has_errors: Optional[bool] = None) -> float:
+        """
+        Score based on correlation with error messages
+
+        Returns: 0.0 - 1.0
+        """
+        # Check if prompt contains errors
+        if has_errors is None:
+            has_errors = self._prompt_has_errors(prompt_intent)
+
         if not has_errors:
             return 0.5
 
@@ -346,7 +428,7 @@ class ContextRanker:
         else:
             return 0.5
 
-    def _user_preference(self, item, prompt_intent) -> float:
+    def _user_preference(self, item, prompt_intent, prompt_lower: Optional[str] = None) -> float:
         """
         Score based on user explicitly referencing this
 
@@ -354,7 +436,9 @@ class ContextRanker:
         """
         # Check if item path/name is mentioned in prompt
         item_name = item.metadata.get('path', '')
-        if item_name and item_name.lower() in prompt_intent.original_prompt.lower():
+        if prompt_lower is None:
+            prompt_lower = prompt_intent.original_prompt.lower()
+        if item_name and item_name.lower() in prompt_lower:
             return 1.0
         else:
             return 0.5
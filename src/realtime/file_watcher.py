@@ -5,6 +5,12 @@ Enhanced file system monitoring with sub-second latency, intelligent debouncing,
 and advanced filtering for real-time code intelligence.
 
 Builds on Story 1.3 file monitoring foundation with performance optimizations.
+
+Events from the watchdog observer thread are coalesced per file by a single
+debouncer loop driven by a timer wheel, and delivered in time-windowed batches.
+Content hashing is lazy (``FileChangeEvent.get_content_hash``), and event
+storms such as branch switches collapse into one ``rescan`` event per watched
+root.
 """
 
 from __future__ import annotations
@@ -12,11 +18,13 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
+import os
+import threading
 import time
 from collections import defaultdict, deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
@@ -26,27 +34,55 @@ from src.parsing.parser import detect_language, Language
 logger = logging.getLogger(__name__)
 
 
+def _hash_file(file_path: str) -> Optional[str]:
+    """SHA-256 of a file's content, None if unreadable."""
+    try:
+        with open(file_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except Exception as e:
+        logger.debug(f"Could not hash file {file_path}: {e}")
+        return None
+
+
 @dataclass
 class FileChangeEvent:
     """Enhanced file change event with metadata."""
 
-    event_type: str  # created, modified, deleted, moved
+    event_type: str  # created, modified, deleted, moved, rescan (file_path is a directory)
     file_path: str
     timestamp: float
     language: Optional[Language] = None
     content_hash: Optional[str] = None
     file_size: Optional[int] = None
     is_debounced: bool = False
+    mtime_ns: Optional[int] = None
+    event_count: int = 1  # raw events coalesced into this one
+
+    def get_content_hash(self) -> Optional[str]:
+        """Content hash, computed on first request."""
+        if self.content_hash is None and self.event_type not in ("deleted", "rescan"):
+            self.content_hash = _hash_file(self.file_path)
+        return self.content_hash
 
 
 @dataclass
 class DebounceState:
-    """State tracking for file change debouncing."""
+    """Pending (not yet delivered) changes for one file."""
 
+    event_type: str = "modified"
+    first_event_time: float = 0.0
     last_event_time: float = 0.0
     event_count: int = 0
-    pending_events: deque = field(default_factory=deque)
-    debounce_task: Optional[asyncio.Task] = None
+
+
+def _merge_event_types(previous: str, current: str) -> str:
+    """Net effect of two consecutive events on the same path."""
+    if previous == "created":
+        # Created then deleted inside one window: nothing to report
+        return "cancelled" if current == "deleted" else "created"
+    if previous == "deleted" and current == "created":
+        return "modified"
+    return current
 
 
 class RealTimeFileHandler(FileSystemEventHandler):
@@ -55,26 +91,57 @@ class RealTimeFileHandler(FileSystemEventHandler):
 
     Features:
     - Sub-second change detection
-    - Intelligent debouncing for rapid file changes
+    - One debouncer loop (timer wheel) instead of a task per event
+    - Per-file coalescing, delivered as time-windowed batches
+    - Lazy content hashing (one stat per delivered event)
+    - Storm detection: mass changes collapse into one rescan per watched root
     - Language-aware filtering
-    - Content hash tracking for duplicate detection
     - Performance monitoring
+
+    Callbacks:
+        on_batch_callback(List[FileChangeEvent]) receives each batch; when only
+        on_change_callback is set it is awaited once per event of the batch.
     """
 
-    def __init__(self, on_change_callback: Optional[Callable] = None):
+    def __init__(
+        self,
+        on_change_callback: Optional[Callable] = None,
+        on_batch_callback: Optional[Callable] = None,
+        watched_roots: Optional[Sequence[str]] = None,
+    ):
         super().__init__()
         self.on_change_callback = on_change_callback
-        self.debounce_states: Dict[str, DebounceState] = defaultdict(DebounceState)
+        self.on_batch_callback = on_batch_callback
+        # Rescans never reach above the root a changed file is watched under
+        self.watched_roots = [os.path.normpath(str(r)) for r in watched_roots or ()]
+        self.debounce_states: Dict[str, DebounceState] = {}
         self.debounce_delay = 0.5  # 500ms debounce
-        self.max_events_per_second = 10
+        self.max_debounce_delay = 5.0  # Files changing continuously flush at least this often
+        self.max_events_per_second = 10  # Hotter files wait for max_debounce_delay
+        self.storm_threshold = 500  # Pending files, or new files within storm_window, that make a storm
+        self.storm_window = 2.0  # Sliding window (seconds) for the new-file rate
+        self.tick = 0.05  # Timer wheel resolution (seconds)
         self.content_hashes: Dict[str, str] = {}
 
+        # Timer wheel: tick number -> paths due at that tick
+        self._wheel: Dict[int, set] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._debounce_task: Optional[asyncio.Task] = None
+        # First-event times of recently seen files (storm rate window)
+        self._recent_files: deque = deque()
+        # While a storm is active: (started, last event) - delivery waits for it to quiet down
+        self._storm: Optional[Tuple[float, float]] = None
+
         # Performance tracking
         self.stats = {
             "events_processed": 0,
             "events_debounced": 0,
             "events_filtered": 0,
             "avg_processing_time": 0.0,
+            "batches_delivered": 0,
+            "storms_collapsed": 0,
         }
 
         logger.info("RealTimeFileHandler initialized with intelligent debouncing")
@@ -94,61 +161,231 @@ class RealTimeFileHandler(FileSystemEventHandler):
 
     def _get_content_hash(self, file_path: str) -> Optional[str]:
         """Get content hash for duplicate detection."""
-        try:
-            with open(file_path, "rb") as f:
-                content = f.read()
-                return hashlib.sha256(content).hexdigest()
-        except Exception as e:
-            logger.debug(f"Could not hash file {file_path}: {e}")
-            return None
+        return _hash_file(file_path)
+
+    def _create_change_event(
+        self, event_type: str, file_path: str, with_hash: bool = True
+    ) -> FileChangeEvent:
+        """
+        Create enhanced file change event with metadata.
 
-    def _create_change_event(self, event_type: str, file_path: str) -> FileChangeEvent:
-        """Create enhanced file change event with metadata."""
+        Uses a single stat() call; with_hash=False leaves hashing to consumers
+        via FileChangeEvent.get_content_hash().
+        """
         path = Path(file_path)
-        language = detect_language(path) if path.exists() else None
-        content_hash = self._get_content_hash(file_path) if path.exists() else None
-        file_size = path.stat().st_size if path.exists() else None
+        try:
+            st = path.stat()
+        except OSError:
+            st = None
 
-        return FileChangeEvent(
+        event = FileChangeEvent(
             event_type=event_type,
             file_path=file_path,
             timestamp=time.time(),
-            language=language,
-            content_hash=content_hash,
-            file_size=file_size,
+            language=detect_language(path) if st is not None else None,
+            file_size=st.st_size if st is not None else None,
+            mtime_ns=st.st_mtime_ns if st is not None else None,
         )
+        if with_hash and st is not None:
+            event.content_hash = self._get_content_hash(file_path)
+        return event
 
-    async def _debounced_callback(self, file_path: str, event_type: str):
-        """Execute debounced callback after delay."""
-        state = self.debounce_states[file_path]
-
-        # Wait for debounce delay
-        await asyncio.sleep(self.debounce_delay)
+    # ==================== Debouncer ====================
 
-        # Check if more events came in during delay
-        if time.time() - state.last_event_time < self.debounce_delay:
-            # More events came in, extend debounce
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start the debouncer loop (call from the event loop thread)."""
+        if self._debounce_task and not self._debounce_task.done():
+            return
+        self._loop = loop or asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._debounce_task = self._loop.create_task(self._debounce_loop())
+
+    async def stop(self, flush: bool = False):
+        """Stop the debouncer loop, optionally delivering pending changes first."""
+        if flush:
+            await self.flush()
+        if self._debounce_task and not self._debounce_task.done():
+            self._debounce_task.cancel()
+            try:
+                await self._debounce_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._debounce_task = None
+
+    def _wake(self):
+        """Nudge the debouncer loop; safe from any thread."""
+        loop = self._loop
+        if loop is None or self._wakeup is None or loop.is_closed():
             return
-
-        # Process the final event
         try:
-            change_event = self._create_change_event(event_type, file_path)
-            change_event.is_debounced = True
-
-            if self.on_change_callback:
-                await self.on_change_callback(change_event)
+            if threading.get_ident() == getattr(loop, "_thread_id", None):
+                self._wakeup.set()
+            else:
+                loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            pass
+
+    def _due_tick(self, state: DebounceState) -> int:
+        if state.event_count > self.max_events_per_second:
+            due = state.first_event_time + self.max_debounce_delay
+        else:
+            due = min(
+                state.last_event_time + self.debounce_delay,
+                state.first_event_time + self.max_debounce_delay,
+            )
+        return int(due / self.tick) + 1
+
+    def _storm_due_tick(self) -> int:
+        started, last = self._storm
+        due = min(last + self.debounce_delay, started + self.max_debounce_delay)
+        return int(due / self.tick) + 1
+
+    def _next_tick(self) -> Optional[int]:
+        """Tick the debouncer should wake at next (caller holds the lock)."""
+        if self._storm is not None:
+            return self._storm_due_tick()
+        return min(self._wheel) if self._wheel else None
+
+    def _take_due(self, now: float) -> Tuple[List[tuple], bool]:
+        """
+        Pop every file whose debounce deadline has passed (caller holds the lock).
+
+        Returns:
+            (ready (path, state) pairs, whether they are a collapsed storm)
+        """
+        now_tick = int(now / self.tick)
+        if self._storm is not None:
+            if self._storm_due_tick() > now_tick:
+                return [], True
+            return self._take_all(), True
+        ready = []
+        for tick in [t for t in self._wheel if t <= now_tick]:
+            for file_path in self._wheel.pop(tick):
+                state = self.debounce_states.get(file_path)
+                # Entries superseded by a later reschedule are skipped lazily
+                if state is None or self._due_tick(state) > now_tick:
+                    continue
+                del self.debounce_states[file_path]
+                ready.append((file_path, state))
+        return ready, False
+
+    def _take_all(self) -> List[tuple]:
+        """Pop every pending file and end any storm (caller holds the lock)."""
+        ready = list(self.debounce_states.items())
+        self.debounce_states.clear()
+        self._wheel.clear()
+        self._recent_files.clear()
+        self._storm = None
+        return ready
+
+    async def _debounce_loop(self):
+        """Single loop that turns due timer-wheel slots into batches."""
+        while True:
+            with self._lock:
+                next_tick = self._next_tick()
+
+            if next_tick is None:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            delay = next_tick * self.tick - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            with self._lock:
+                ready, storm = self._take_due(time.time())
+            if ready:
+                try:
+                    await self._deliver(ready, storm)
+                except Exception as e:
+                    logger.error(f"Error delivering file change batch: {e}")
+
+    async def flush(self):
+        """Deliver every pending change immediately."""
+        with self._lock:
+            storm = self._storm is not None
+            ready = self._take_all()
+        if ready:
+            await self._deliver(ready, storm)
+
+    def _watched_root(self, file_path: str) -> Optional[str]:
+        """Innermost watched root containing file_path, if any."""
+        best = None
+        for root in self.watched_roots:
+            if file_path == root or file_path.startswith(root.rstrip(os.sep) + os.sep):
+                if best is None or len(root) > len(best):
+                    best = root
+        return best
+
+    def _build_rescans(self, ready: List[tuple]) -> List[FileChangeEvent]:
+        """One rescan per watched root, covering the changed files under it."""
+        groups: Dict[str, List[tuple]] = defaultdict(list)
+        for file_path, state in ready:
+            # Files outside every watched root only rescan their own directory
+            groups[self._watched_root(file_path) or os.path.dirname(file_path)].append((file_path, state))
+
+        rescans = []
+        for root, items in groups.items():
+            paths = [path for path, _ in items]
+            directory = os.path.commonpath(paths) if len(paths) > 1 else os.path.dirname(paths[0])
+            if directory != root and not directory.startswith(root.rstrip(os.sep) + os.sep):
+                directory = root
+            rescans.append(
+                FileChangeEvent(
+                    event_type="rescan",
+                    file_path=directory,
+                    timestamp=time.time(),
+                    is_debounced=True,
+                    event_count=sum(state.event_count for _, state in items),
+                )
+            )
+        self.stats["storms_collapsed"] += 1
+        logger.info(
+            f"File event storm ({len(ready)} files) collapsed into rescan of "
+            f"{', '.join(e.file_path for e in rescans)}"
+        )
+        return rescans
+
+    def _build_batch(self, ready: List[tuple], storm: bool = False) -> List[FileChangeEvent]:
+        """Turn coalesced states into events, collapsing storms into rescans."""
+        ready = [(path, state) for path, state in ready if state.event_type != "cancelled"]
+        if storm and ready:
+            return self._build_rescans(ready)
+
+        batch = []
+        for file_path, state in ready:
+            event = self._create_change_event(state.event_type, file_path, with_hash=False)
+            event.is_debounced = True
+            event.event_count = state.event_count
+            batch.append(event)
+        return batch
+
+    async def _deliver(self, ready: List[tuple], storm: bool = False):
+        batch = self._build_batch(ready, storm)
+        if not batch:
+            return
 
-            self.stats["events_processed"] += 1
-            logger.debug(f"Processed debounced event: {event_type} - {file_path}")
+        if self.on_batch_callback:
+            await self.on_batch_callback(batch)
+        elif self.on_change_callback:
+            for change_event in batch:
+                try:
+                    await self.on_change_callback(change_event)
+                except Exception as e:
+                    logger.error(f"Error in change callback for {change_event.file_path}: {e}")
 
-        except Exception as e:
-            logger.error(f"Error in debounced callback for {file_path}: {e}")
-        finally:
-            # Clean up debounce state
-            state.debounce_task = None
+        self.stats["events_processed"] += len(batch)
+        self.stats["batches_delivered"] += 1
+        logger.debug(f"Delivered batch of {len(batch)} file change events")
 
     def _handle_file_event(self, event_type: str, file_path: str):
-        """Handle file system event with debouncing."""
+        """Record a file system event; runs on the observer thread."""
         start_time = time.time()
 
         # Check if file should be processed
@@ -156,25 +393,44 @@ class RealTimeFileHandler(FileSystemEventHandler):
             self.stats["events_filtered"] += 1
             return
 
-        # Update debounce state
-        state = self.debounce_states[file_path]
-        state.last_event_time = time.time()
-        state.event_count += 1
-
-        # Check for rapid events (potential file system storm)
-        if state.event_count > self.max_events_per_second:
-            logger.warning(f"Rapid events detected for {file_path}, extending debounce")
-            self.stats["events_debounced"] += 1
-            return
-
-        # Cancel existing debounce task
-        if state.debounce_task and not state.debounce_task.done():
-            state.debounce_task.cancel()
-
-        # Start new debounce task
-        state.debounce_task = asyncio.create_task(
-            self._debounced_callback(file_path, event_type)
-        )
+        if self._debounce_task is None:
+            # Handler used without start(): bind to the running loop if there is one
+            try:
+                self.start()
+            except RuntimeError:
+                pass
+
+        with self._lock:
+            state = self.debounce_states.get(file_path)
+            if state is None:
+                state = DebounceState(event_type=event_type, first_event_time=start_time)
+                self.debounce_states[file_path] = state
+                self._recent_files.append(start_time)
+            else:
+                state.event_type = _merge_event_types(state.event_type, event_type)
+                self.stats["events_debounced"] += 1
+            state.last_event_time = start_time
+            state.event_count += 1
+
+            # Storms are judged on everything pending and on the rate of new
+            # files, not on what happens to come due in one tick
+            while self._recent_files and self._recent_files[0] < start_time - self.storm_window:
+                self._recent_files.popleft()
+            earliest = self._next_tick()
+            if self._storm is not None:
+                self._storm = (self._storm[0], start_time)
+            elif (
+                len(self.debounce_states) >= self.storm_threshold
+                or len(self._recent_files) >= self.storm_threshold
+            ):
+                self._storm = (start_time, start_time)
+
+            tick = self._due_tick(state)
+            self._wheel[tick].add(file_path)
+            wake_tick = self._next_tick()
+
+        if earliest is None or wake_tick < earliest:
+            self._wake()
 
         # Update performance stats
         processing_time = time.time() - start_time
@@ -210,10 +466,8 @@ class RealTimeFileHandler(FileSystemEventHandler):
         return {
             **self.stats,
             "active_debounce_states": len(self.debounce_states),
-            "pending_tasks": sum(
-                1
-                for state in self.debounce_states.values()
-                if state.debounce_task and not state.debounce_task.done()
+            "pending_tasks": int(
+                self._debounce_task is not None and not self._debounce_task.done()
             ),
         }
 
@@ -234,9 +488,11 @@ class RealTimeFileWatcher:
         self,
         paths: Optional[List[str]] = None,
         on_change_callback: Optional[Callable] = None,
+        on_batch_callback: Optional[Callable] = None,
     ):
         self.paths = paths or settings.indexed_paths
         self.on_change_callback = on_change_callback
+        self.on_batch_callback = on_batch_callback
         self.observer: Optional[Observer] = None
         self.handler: Optional[RealTimeFileHandler] = None
         self.is_running = False
@@ -257,8 +513,11 @@ class RealTimeFileWatcher:
             # Create observer and handler
             self.observer = Observer()
             self.handler = RealTimeFileHandler(
-                on_change_callback=self.on_change_callback
+                on_change_callback=self.on_change_callback,
+                on_batch_callback=self.on_batch_callback,
+                watched_roots=[str(Path(p).resolve()) for p in self.paths],
             )
+            self.handler.start()
 
             # Schedule monitoring for each path
             monitored_paths = 0
@@ -300,11 +559,9 @@ class RealTimeFileWatcher:
                 self.observer.stop()
                 self.observer.join(timeout=5)
 
-            # Cancel pending debounce tasks
+            # Stop the debouncer loop
             if self.handler:
-                for state in self.handler.debounce_states.values():
-                    if state.debounce_task and not state.debounce_task.done():
-                        state.debounce_task.cancel()
+                await self.handler.stop()
 
             self.is_running = False
             logger.info("RealTimeFileWatcher stopped")
@@ -333,10 +590,15 @@ class RealTimeFileWatcher:
 real_time_watcher = RealTimeFileWatcher()
 
 
-async def start_real_time_watcher(on_change_callback: Optional[Callable] = None):
+async def start_real_time_watcher(
+    on_change_callback: Optional[Callable] = None,
+    on_batch_callback: Optional[Callable] = None,
+):
     """Start the enhanced real-time file watcher."""
     if on_change_callback:
         real_time_watcher.on_change_callback = on_change_callback
+    if on_batch_callback:
+        real_time_watcher.on_batch_callback = on_batch_callback
     await real_time_watcher.start()
 
 
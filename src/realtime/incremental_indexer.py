@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple, Callable
 
 from src.parsing.parser import get_parser, detect_language
 from src.parsing.models import ParseResult, ImportInfo
+from src.utils.repo_walker import DEFAULT_EXCLUDE_DIRS, walk_files
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +88,37 @@ class IncrementalIndexer:
             return
         await self._queue.put((change_type, str(Path(file_path).resolve())))
 
+    async def enqueue_events(self, events) -> None:
+        """Accepts a RealTimeFileWatcher batch (List[FileChangeEvent]).
+
+        ``rescan`` events (collapsed event storms such as branch switches) are
+        expanded into per-file changes; unchanged files are then skipped by the
+        usual mtime/hash check.
+        """
+        for event in events:
+            if getattr(event, "event_type", None) == "rescan":
+                items = await asyncio.to_thread(self._expand_rescan, event.file_path)
+                for item in items:
+                    await self._queue.put(item)
+            else:
+                await self.enqueue_event(event)
+
+    def _expand_rescan(self, directory: str) -> List[Tuple[str, str]]:
+        """Per-file changes for a directory: every supported file plus vanished tracked files."""
+        root = str(Path(directory).resolve())
+        items: List[Tuple[str, str]] = []
+        present: Set[str] = set()
+        for path, _ in walk_files(root, exclude_dirs=DEFAULT_EXCLUDE_DIRS, with_stat=False):
+            file_path = str(path)
+            if self._is_supported(file_path):
+                present.add(file_path)
+                items.append(("modified", file_path))
+        prefix = root.rstrip("/") + "/"
+        for file_path in list(self._states):
+            if file_path.startswith(prefix) and file_path not in present:
+                items.append(("deleted", file_path))
+        return items
+
     async def _processor_loop(self):
         """Batch events and process incrementally."""
         while not self._stopped:
@@ -340,10 +372,11 @@ _incremental_indexer: Optional[IncrementalIndexer] = None
 
 def attach_watcher(watcher: Any, indexer: Optional[IncrementalIndexer] = None):
     """Attach incremental indexer to a RealTimeFileWatcher instance.
-    The watcher should expose `on_change_callback` attribute.
+    The watcher should expose `on_change_callback` / `on_batch_callback` attributes.
     """
     idx = indexer or get_incremental_indexer()
     watcher.on_change_callback = idx.enqueue_event
+    watcher.on_batch_callback = idx.enqueue_events
     return idx
 
 
@@ -15,6 +15,7 @@ import hashlib
 
 from src.research.query_patterns import TreeSitterQueryEngine, QueryPattern
 from src.parsing.parser import detect_language
+from src.utils.repo_walker import DEFAULT_EXCLUDE_DIRS, walk_files
 
 logger = logging.getLogger(__name__)
 
@@ -59,20 +60,15 @@ class PatternSearchService:
         exclude: Optional[List[str]],
         max_files: int,
     ) -> List[Path]:
-        import fnmatch
-
         files: List[Path] = []
-        for p in root.rglob("*"):
-            if not p.is_file():
-                continue
-            lang = detect_language(p)
-            if not lang:
-                continue
-            # include/exclude filters
-            rel = str(p.relative_to(root))
-            if include and not any(fnmatch.fnmatch(rel, pat) for pat in include):
-                continue
-            if exclude and any(fnmatch.fnmatch(rel, pat) for pat in exclude):
+        for p, _ in walk_files(
+            root,
+            exclude_dirs=DEFAULT_EXCLUDE_DIRS,
+            include_globs=include,
+            exclude_globs=exclude,
+            with_stat=False,
+        ):
+            if not detect_language(p):
                 continue
             files.append(p)
             if len(files) >= max_files:
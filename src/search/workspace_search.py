@@ -361,7 +361,7 @@ class WorkspaceSearch:
         related_projects = [project_id]  # Always include target project
 
         if self.relationship_graph:
-            related = await self.relationship_graph.get_related_projects(
+            related = self.relationship_graph.get_related_projects(
                 project_id, threshold=similarity_threshold
             )
             related_project_ids = [proj_id for proj_id, score in related]
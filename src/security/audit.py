@@ -2,18 +2,214 @@
 Auditing & Compliance Logging (Story 4-2)
 
 Writes audit events as JSON lines to logs/audit.log
+
+The log is append-only: the file is held open and each event is written and
+flushed as one line. Once it reaches settings.audit_max_bytes it is rotated
+to audit.log.1 (older files shift up to audit_backup_count); a writer whose
+file was rotated away by another process reopens the new one, as
+logging.handlers.WatchedFileHandler does. read_events is
+served from an in-memory tail of recent events while the file has not been
+touched by another writer, and otherwise reads backwards from the end of the
+file, so its cost depends on `limit` rather than the size of the log.
 """
 
 import json
 import os
+import threading
+from collections import deque
 from datetime import datetime, timezone
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 LOG_DIR = os.path.join(os.getcwd(), "logs")
 LOG_FILE = os.path.join(LOG_DIR, "audit.log")
 
 os.makedirs(LOG_DIR, exist_ok=True)
 
+_READ_BLOCK = 64 * 1024
+
+
+def _tail_lines(path: str, count: int) -> List[bytes]:
+    """Return up to the last `count` non-empty lines of a file, oldest first."""
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return []
+    with f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= count:
+            step = min(_READ_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = [line for line in data.split(b"\n") if line.strip()]
+    if pos > 0:
+        lines = lines[1:]  # first line may be partial
+    return lines[-count:] if count > 0 else []
+
+
+class AuditLog:
+    """Rotated append-only audit store with an in-memory tail index"""
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+        tail_size: int = 1000,
+    ):
+        """
+        Args:
+            path: Active log file
+            max_bytes: Rotate before a write would exceed this size (0 disables)
+            backup_count: Rotated files kept (path.1 ... path.N)
+            tail_size: Recent events kept in memory for read_events
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.tail_size = tail_size
+        self._lock = threading.Lock()
+        self._file = None
+        self._tail: deque = deque(maxlen=tail_size)
+        # Inode and size of the active file the tail reflects (None: not loaded / stale)
+        self._tail_ino: Optional[int] = None
+        self._tail_end: Optional[int] = None
+        # Whether the tail holds every event in the store
+        self._tail_complete = False
+
+    def _open(self):
+        if self._file is not None:
+            # Another process may have rotated (or removed) the file we hold
+            try:
+                st = os.stat(self.path)
+                current = (st.st_dev, st.st_ino)
+            except FileNotFoundError:
+                current = None
+            held = os.fstat(self._file.fileno())
+            if current != (held.st_dev, held.st_ino):
+                self._file.close()
+                self._file = None
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "ab")
+        return self._file
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        if self.backup_count <= 0 or os.path.exists(f"{self.path}.{self.backup_count}"):
+            # Oldest events are about to be dropped
+            self._tail_complete = False
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                src = f"{self.path}.{i}"
+                if os.path.exists(src):
+                    os.replace(src, f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def append(self, entry: Dict[str, Any]):
+        """Write one event and flush it to the OS."""
+        line = (json.dumps(entry) + "\n").encode("utf-8")
+        with self._lock:
+            f = self._open()
+            # Real size: other processes may append to the same file
+            st = os.fstat(f.fileno())
+            ino, size = st.st_ino, st.st_size
+            if self.max_bytes and size and size + len(line) > self.max_bytes:
+                tail_current = (self._tail_ino, self._tail_end) == (ino, size)
+                self._rotate()
+                f = self._open()
+                ino, size = os.fstat(f.fileno()).st_ino, 0
+                if tail_current:
+                    self._tail_ino, self._tail_end = ino, 0
+            f.write(line)
+            f.flush()
+            if (self._tail_ino, self._tail_end) == (ino, size):
+                if len(self._tail) == self.tail_size:
+                    self._tail_complete = False
+                self._tail.append(entry)
+                self._tail_end = size + len(line)
+            else:
+                # Another process appended or rotated since we last looked
+                self._tail_end = None
+
+    def _load_tail(self, count: int):
+        """
+        Read the last `count` events across the active and rotated files.
+
+        Returns:
+            (events oldest first, whether the whole store was read)
+        """
+        files = [self.path] + [f"{self.path}.{i}" for i in range(1, self.backup_count + 1)]
+        events: List[Dict[str, Any]] = []
+        for path in files:
+            needed = count - len(events)
+            if needed <= 0:
+                break
+            chunk = []
+            for raw in _tail_lines(path, needed):
+                try:
+                    chunk.append(json.loads(raw))
+                except ValueError:
+                    continue
+            events = chunk + events
+        return events, len(events) < count
+
+    def tail(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Return the last `limit` events, oldest first."""
+        if limit <= 0:
+            return []
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+                ino, size = st.st_ino, st.st_size
+            except OSError:
+                ino, size = None, 0
+            if (self._tail_ino, self._tail_end) == (ino, size) and (
+                limit <= len(self._tail) or self._tail_complete
+            ):
+                return list(self._tail)[-limit:]
+
+            count = max(limit, self.tail_size)
+            events, complete = self._load_tail(count)
+            self._tail.clear()
+            self._tail.extend(events[-self.tail_size:])
+            self._tail_ino, self._tail_end = ino, size
+            self._tail_complete = complete and len(events) <= self.tail_size
+            return events[-limit:]
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_logs: Dict[str, AuditLog] = {}
+_logs_lock = threading.Lock()
+
+
+def get_audit_log() -> AuditLog:
+    """Return the store for the current LOG_FILE."""
+    with _logs_lock:
+        log = _logs.get(LOG_FILE)
+        if log is None:
+            try:
+                from src.config.settings import settings
+            except Exception:
+                settings = None
+            log = AuditLog(
+                LOG_FILE,
+                max_bytes=int(getattr(settings, "audit_max_bytes", 10 * 1024 * 1024)),
+                backup_count=int(getattr(settings, "audit_backup_count", 5)),
+            )
+            _logs[LOG_FILE] = log
+        return log
+
 
 def record_event(event_type: str, actor: str, details: Dict[str, Any]):
     entry = {
@@ -22,15 +218,8 @@ def record_event(event_type: str, actor: str, details: Dict[str, Any]):
         "actor": actor,
         "details": details,
     }
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+    get_audit_log().append(entry)
 
 
 def read_events(limit: int = 100):
-    if not os.path.exists(LOG_FILE):
-        return []
-    lines = []
-    with open(LOG_FILE, "r", encoding="utf-8") as f:
-        for line in f:
-            lines.append(json.loads(line))
-    return lines[-limit:]
+    return get_audit_log().tail(limit)
@@ -0,0 +1,252 @@
+"""
+Pattern Scanning Engine
+
+Shared engine behind VulnerabilityScanner and SecurityScanner.
+
+All rules are compiled into one regular expression (a lookahead alternation,
+so every rule starting at any position is found in a single pass over the
+file). Files are scanned through mmap, findings are cached by content hash
+(with a stat index so unchanged files are not even read), and large file sets
+are spread over a process pool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Below this many files a pool costs more than it saves
+PARALLEL_MIN_FILES = 200
+
+
+@dataclass(frozen=True)
+class ScanRule:
+    """A literal pattern to look for"""
+    rule: str
+    pattern: str
+    severity: str = "medium"
+    message: str = ""
+
+
+@dataclass(frozen=True)
+class ScanMatch:
+    """First occurrence of a rule on a line"""
+    line: int  # 1-based
+    col: int  # 1-based, in characters
+    rule: ScanRule
+
+
+# (line, col, rule index) - compact form stored in caches and sent between processes
+_RawMatch = Tuple[int, int, int]
+
+
+def _content_digest(data) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class PatternScanEngine:
+    """Scans content for a fixed set of literal rules"""
+
+    def __init__(self, rules: Sequence[ScanRule], ignore_case: bool = False, cache_size: int = 50_000):
+        """
+        Args:
+            rules: Rules to match (report order follows this sequence)
+            ignore_case: Match patterns case-insensitively
+            cache_size: Content digests (and file stats) remembered
+        """
+        self.rules = tuple(rules)
+        self.ignore_case = ignore_case
+        self.cache_size = cache_size
+
+        flags = re.IGNORECASE if ignore_case else 0
+        alternation = "|".join(f"({re.escape(r.pattern)})" for r in self.rules)
+        self._regex = re.compile(f"(?=(?:{alternation}))".encode("utf-8"), flags)
+
+        self._lock = threading.Lock()
+        self._results: "OrderedDict[str, Tuple[_RawMatch, ...]]" = OrderedDict()
+        # path -> (mtime_ns, size, digest)
+        self._stat_index: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+        self.stats = {"scanned": 0, "cache_hits": 0, "unchanged_files": 0}
+
+    # ---- matching --------------------------------------------------------------
+
+    def _match(self, data) -> Tuple[_RawMatch, ...]:
+        """Find the first occurrence of each rule per line in bytes or an mmap."""
+        if not self.rules:
+            return ()
+        found: Dict[Tuple[int, int], int] = {}
+        line = 1
+        counted_to = 0
+        for m in self._regex.finditer(data):
+            pos = m.start()
+            line += data[counted_to:pos].count(b"\n")
+            counted_to = pos
+            rule_index = m.lastindex - 1
+            key = (line, rule_index)
+            if key in found:
+                continue
+            line_start = data.rfind(b"\n", 0, pos) + 1
+            found[key] = len(data[line_start:pos].decode("utf-8", errors="ignore")) + 1
+        self.stats["scanned"] += 1
+        return tuple((ln, col, idx) for (ln, idx), col in sorted(found.items()))
+
+    def _to_matches(self, raw: Iterable[_RawMatch]) -> List[ScanMatch]:
+        return [ScanMatch(line, col, self.rules[idx]) for line, col, idx in raw]
+
+    # ---- caching -----------------------------------------------------------------
+
+    def _cached(self, digest: str) -> Optional[Tuple[_RawMatch, ...]]:
+        with self._lock:
+            raw = self._results.get(digest)
+            if raw is not None:
+                self._results.move_to_end(digest)
+                self.stats["cache_hits"] += 1
+            return raw
+
+    def _remember(
+        self,
+        digest: str,
+        raw: Tuple[_RawMatch, ...],
+        path: Optional[str] = None,
+        fingerprint: Optional[Tuple[int, int]] = None,
+    ):
+        with self._lock:
+            self._results[digest] = raw
+            self._results.move_to_end(digest)
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+            if path is not None and fingerprint is not None:
+                self._stat_index[path] = (fingerprint[0], fingerprint[1], digest)
+                self._stat_index.move_to_end(path)
+                while len(self._stat_index) > self.cache_size:
+                    self._stat_index.popitem(last=False)
+
+    def _unchanged(self, path: str, fingerprint: Tuple[int, int]):
+        """Return (digest, raw matches) if the file has not changed since its last scan."""
+        with self._lock:
+            entry = self._stat_index.get(path)
+        if entry and entry[:2] == fingerprint:
+            raw = self._cached(entry[2])
+            if raw is not None:
+                self.stats["unchanged_files"] += 1
+                return entry[2], raw
+        return None
+
+    # ---- public API --------------------------------------------------------------
+
+    def scan_content(self, content: Union[str, bytes]) -> List[ScanMatch]:
+        """Scan content that is already in memory."""
+        data = content.encode("utf-8", errors="ignore") if isinstance(content, str) else content
+        digest = _content_digest(data)
+        raw = self._cached(digest)
+        if raw is None:
+            raw = self._match(data)
+            self._remember(digest, raw)
+        return self._to_matches(raw)
+
+    def _scan_path_raw(self, path: str) -> Tuple[str, Tuple[_RawMatch, ...]]:
+        """Return (content digest, raw matches) for a file."""
+        stat = os.stat(path)
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        known = self._unchanged(path, fingerprint)
+        if known is not None:
+            return known
+        with open(path, "rb") as f:
+            if stat.st_size == 0:
+                digest, raw = _content_digest(b""), ()
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    digest = _content_digest(data)
+                    raw = self._cached(digest)
+                    if raw is None:
+                        raw = self._match(data)
+        self._remember(digest, raw, path, fingerprint)
+        return digest, raw
+
+    def scan_path(self, path: str) -> List[ScanMatch]:
+        """Scan a file on disk (raises OSError if it cannot be read)."""
+        return self._to_matches(self._scan_path_raw(path)[1])
+
+    def scan_paths(self, paths: Sequence[str], max_workers: Optional[int] = None) -> Dict[str, List[ScanMatch]]:
+        """
+        Scan many files, in a process pool when there are enough of them.
+
+        Unreadable files are left out of the result.
+        """
+        raw_results: Dict[str, Tuple[_RawMatch, ...]] = {}
+        pending: List[str] = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            known = self._unchanged(path, (stat.st_mtime_ns, stat.st_size))
+            if known is not None:
+                raw_results[path] = known[1]
+            else:
+                pending.append(path)
+
+        if len(pending) >= PARALLEL_MIN_FILES and (max_workers is None or max_workers > 1):
+            workers = max_workers or min(8, os.cpu_count() or 1)
+            chunks = [pending[i::workers * 4] for i in range(workers * 4)]
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(_scan_files_worker, self.rules, self.ignore_case, chunk)
+                        for chunk in chunks
+                        if chunk
+                    ]
+                    for future in futures:
+                        for path, fingerprint, digest, raw in future.result():
+                            self._remember(digest, raw, path, fingerprint)
+                            raw_results[path] = raw
+                pending = [p for p in pending if p not in raw_results]
+            except Exception as e:
+                logger.warning(f"Parallel scan failed, scanning in-process: {e}")
+
+        for path in pending:
+            try:
+                raw_results[path] = self._scan_path_raw(path)[1]
+            except (OSError, ValueError):
+                continue
+
+        return {path: self._to_matches(raw_results[path]) for path in paths if path in raw_results}
+
+
+_engines: Dict[Tuple[Tuple[ScanRule, ...], bool], PatternScanEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_scan_engine(rules: Sequence[ScanRule], ignore_case: bool = False) -> PatternScanEngine:
+    """Return the shared engine (and cache) for a rule set."""
+    key = (tuple(rules), ignore_case)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = PatternScanEngine(key[0], ignore_case)
+            _engines[key] = engine
+        return engine
+
+
+def _scan_files_worker(rules: Tuple[ScanRule, ...], ignore_case: bool, paths: List[str]):
+    """Process pool entry point: scan files, returning (path, fingerprint, digest, matches)."""
+    engine = get_scan_engine(rules, ignore_case)
+    results = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            digest, raw = engine._scan_path_raw(path)
+        except (OSError, ValueError):
+            continue
+        results.append((path, (stat.st_mtime_ns, stat.st_size), digest, raw))
+    return results
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, asdict
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from src.security.scan_engine import PatternScanEngine, ScanRule, get_scan_engine
 
 
 @dataclass
@@ -24,34 +26,37 @@ RISKY_PATTERNS = [
     ("subprocess.Popen(", "medium", "PY004", "Check shell=True usage and input sanitization"),
 ]
 
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", ".pytest_cache"}
+
 
 class VulnerabilityScanner:
     """Very lightweight pattern-based scanner.
 
     Works without external tools; optional deep scanners can be added behind flags.
+    All patterns are matched in one pass per file by the shared scan engine.
     """
 
-    def __init__(self, root: str = "."):
+    def __init__(self, root: str = ".", max_workers: Optional[int] = None):
         self.root = root
+        self.max_workers = max_workers
+
+    @staticmethod
+    def engine() -> PatternScanEngine:
+        rules = [ScanRule(rule, pat, sev, msg) for pat, sev, rule, msg in RISKY_PATTERNS]
+        return get_scan_engine(rules)
+
+    def _python_files(self) -> List[str]:
+        paths: List[str] = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            # Skip typical large or irrelevant dirs without descending into them
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            paths.extend(os.path.join(dirpath, f) for f in filenames if f.endswith(".py"))
+        return paths
 
     def scan(self) -> List[Finding]:
         findings: List[Finding] = []
-        for dirpath, _, filenames in os.walk(self.root):
-            # Skip typical large or irrelevant dirs
-            if any(p in dirpath for p in (".git", "node_modules", "__pycache__", ".venv", ".pytest_cache")):
-                continue
-            for fname in filenames:
-                if not fname.endswith(".py"):
-                    continue
-                path = os.path.join(dirpath, fname)
-                try:
-                    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                        for idx, line in enumerate(f, start=1):
-                            for pat, sev, rule, msg in RISKY_PATTERNS:
-                                if pat in line:
-                                    findings.append(Finding(path, idx, sev, rule, msg))
-                except Exception:
-                    # Ignore unreadable files
-                    continue
+        results = self.engine().scan_paths(self._python_files(), max_workers=self.max_workers)
+        for path, matches in results.items():
+            for m in matches:
+                findings.append(Finding(path, m.line, m.rule.severity, m.rule.rule, m.rule.message))
         return findings
-
@@ -0,0 +1,309 @@
+"""
+Repository walker
+
+Single ``os.scandir``-based traversal shared by every component that enumerates
+source files (initial indexer, workspace projects, AST indexer, pattern search,
+project auto-discovery).
+
+Features:
+- Excluded directories are pruned before descending (node_modules, .git, ...)
+- Honors nested ``.gitignore`` / ``.contextignore`` files via compiled matchers
+- Optional thread-pool fan-out for high-latency (network) filesystems
+- Lazily yields ``(path, stat)`` for files, or directory listings for callers
+  that need to make their own pruning decisions
+"""
+
+import fnmatch
+import logging
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IGNORE_FILES: Tuple[str, ...] = (".gitignore", ".contextignore")
+
+# VCS metadata, dependency and cache directories that never hold indexable source
+DEFAULT_EXCLUDE_DIRS: Tuple[str, ...] = (
+    ".git",
+    ".hg",
+    ".svn",
+    "node_modules",
+    "__pycache__",
+    ".venv",
+    ".mypy_cache",
+    ".pytest_cache",
+)
+
+# Source indexers also skip build output directories
+INDEX_EXCLUDE_DIRS: Tuple[str, ...] = (
+    "__pycache__",
+    ".git",
+    ".venv",
+    "node_modules",
+    ".pytest_cache",
+    ".mypy_cache",
+    "target",  # Rust
+    "build",
+    "dist",
+)
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore glob (supports ``**``, ``*``, ``?``, ``[...]``) to regex"""
+    i, n = 0, len(pattern)
+    out = []
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern[i : i + 3] == "**/":
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern[i : i + 2] == "**":
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = pattern.find("]", i + 1)
+            if j == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : j]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = j
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class IgnoreMatcher:
+    """
+    Compiled rules from one ignore file (gitignore syntax)
+
+    Paths are matched relative to the directory holding the ignore file.
+    """
+
+    __slots__ = ("base", "rules")
+
+    def __init__(self, base: str, lines: Iterable[str]):
+        self.base = base
+        # (compiled regex, negated, directory-only)
+        self.rules: List[Tuple[re.Pattern, bool, bool]] = []
+        for raw in lines:
+            line = raw.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.strip("/") if dir_only else line
+            if not line:
+                continue
+            anchored = "/" in line.lstrip("/") or line.startswith("/")
+            body = _glob_to_regex(line.lstrip("/"))
+            regex = f"^{body}$" if anchored else f"^(?:.*/)?{body}$"
+            self.rules.append((re.compile(regex), negated, dir_only))
+
+    @classmethod
+    def from_file(cls, path: str) -> Optional["IgnoreMatcher"]:
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                matcher = cls(os.path.dirname(path), f)
+        except OSError:
+            return None
+        return matcher if matcher.rules else None
+
+    def match(self, path: str, is_dir: bool) -> Optional[bool]:
+        """True if ignored, False if re-included, None if no rule applies"""
+        rel = os.path.relpath(path, self.base).replace(os.sep, "/")
+        result = None
+        for regex, negated, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel):
+                result = not negated
+        return result
+
+
+def _is_ignored(matchers: Sequence[IgnoreMatcher], path: str, is_dir: bool) -> bool:
+    ignored = False
+    for matcher in matchers:
+        verdict = matcher.match(path, is_dir)
+        if verdict is not None:
+            ignored = verdict
+    return ignored
+
+
+DirListing = Tuple[Path, List[os.DirEntry], List[os.DirEntry]]
+
+
+def walk_dirs(
+    root,
+    *,
+    exclude_dirs: Iterable[str] = (),
+    skip_dir: Optional[Callable[[os.DirEntry], bool]] = None,
+    ignore_files: Sequence[str] = DEFAULT_IGNORE_FILES,
+    max_depth: Optional[int] = None,
+    follow_symlinks: bool = False,
+    max_workers: int = 1,
+) -> Iterator[DirListing]:
+    """
+    Walk directories top-down, yielding ``(dir_path, subdirs, files)``
+
+    ``subdirs`` may be mutated by the caller (as with ``os.walk``) to prune
+    descent. Directories named in ``exclude_dirs``, rejected by ``skip_dir``
+    or matched by an ignore file never appear and are never opened.
+
+    Args:
+        root: Directory to walk
+        exclude_dirs: Directory names pruned at any depth
+        skip_dir: Extra predicate on directory entries (True = prune)
+        ignore_files: Ignore-file names honored in every directory
+        max_depth: Maximum depth below root to descend (None = unlimited)
+        follow_symlinks: Whether to follow directory symlinks
+        max_workers: >1 scans directories concurrently in a thread pool
+            (results are then yielded breadth-first)
+    """
+    excluded = frozenset(exclude_dirs)
+    root_path = Path(root)
+
+    def scan(path: Path, matchers: Tuple[IgnoreMatcher, ...]):
+        subdirs: List[os.DirEntry] = []
+        files: List[os.DirEntry] = []
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.debug(f"Cannot scan {path}: {e}")
+            return subdirs, files, matchers
+
+        if ignore_files:
+            names = {e.name for e in entries}
+            loaded = [
+                IgnoreMatcher.from_file(os.path.join(path, name))
+                for name in ignore_files
+                if name in names
+            ]
+            loaded = [m for m in loaded if m is not None]
+            if loaded:
+                matchers = matchers + tuple(loaded)
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    if entry.name in excluded or (skip_dir is not None and skip_dir(entry)):
+                        continue
+                    if matchers and _is_ignored(matchers, entry.path, True):
+                        continue
+                    subdirs.append(entry)
+                elif entry.is_file():
+                    if matchers and _is_ignored(matchers, entry.path, False):
+                        continue
+                    files.append(entry)
+            except OSError:
+                continue
+        return subdirs, files, matchers
+
+    def children(subdirs, depth, matchers):
+        if max_depth is not None and depth >= max_depth:
+            return []
+        return [(Path(d.path), depth + 1, matchers) for d in subdirs]
+
+    if max_workers <= 1:
+        stack = [(root_path, 0, ())]
+        while stack:
+            path, depth, matchers = stack.pop()
+            subdirs, files, matchers = scan(path, matchers)
+            yield path, subdirs, files
+            stack.extend(reversed(children(subdirs, depth, matchers)))
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="repo-walker") as pool:
+        pending = deque([(root_path, 0, pool.submit(scan, root_path, ()))])
+        while pending:
+            path, depth, future = pending.popleft()
+            subdirs, files, matchers = future.result()
+            yield path, subdirs, files
+            for child, child_depth, child_matchers in children(subdirs, depth, matchers):
+                pending.append((child, child_depth, pool.submit(scan, child, child_matchers)))
+
+
+def walk_files(
+    root,
+    *,
+    extensions: Optional[Iterable[str]] = None,
+    exclude_dirs: Iterable[str] = (),
+    skip_dir: Optional[Callable[[os.DirEntry], bool]] = None,
+    skip_file: Optional[Callable[[os.DirEntry], bool]] = None,
+    include_globs: Optional[Sequence[str]] = None,
+    exclude_globs: Optional[Sequence[str]] = None,
+    ignore_files: Sequence[str] = DEFAULT_IGNORE_FILES,
+    max_depth: Optional[int] = None,
+    max_files: Optional[int] = None,
+    follow_symlinks: bool = False,
+    max_workers: int = 1,
+    with_stat: bool = True,
+) -> Iterator[Tuple[Path, Optional[os.stat_result]]]:
+    """
+    Lazily yield ``(path, stat)`` for files under root
+
+    Args:
+        root: Directory to walk
+        extensions: Allowed suffixes (case-insensitive, e.g. {".py"}); None = all
+        exclude_dirs: Directory names pruned at any depth
+        skip_dir: Extra predicate on directory entries (True = prune)
+        skip_file: Extra predicate on file entries (True = skip)
+        include_globs: fnmatch globs on the root-relative path; file must match one
+        exclude_globs: fnmatch globs on the root-relative path; matching files skipped
+        ignore_files: Ignore-file names honored in every directory
+        max_depth: Maximum directory depth below root
+        max_files: Stop after yielding this many files
+        follow_symlinks: Whether to follow directory symlinks
+        max_workers: Thread-pool size for directory scanning
+        with_stat: Whether to stat each yielded file (stat is None otherwise)
+    """
+    allowed = {e.lower() for e in extensions} if extensions is not None else None
+    root_str = str(root)
+    yielded = 0
+
+    for _, _, files in walk_dirs(
+        root,
+        exclude_dirs=exclude_dirs,
+        skip_dir=skip_dir,
+        ignore_files=ignore_files,
+        max_depth=max_depth,
+        follow_symlinks=follow_symlinks,
+        max_workers=max_workers,
+    ):
+        for entry in files:
+            if allowed is not None and os.path.splitext(entry.name)[1].lower() not in allowed:
+                continue
+            if skip_file is not None and skip_file(entry):
+                continue
+            if include_globs or exclude_globs:
+                rel = os.path.relpath(entry.path, root_str)
+                if include_globs and not any(fnmatch.fnmatch(rel, pat) for pat in include_globs):
+                    continue
+                if exclude_globs and any(fnmatch.fnmatch(rel, pat) for pat in exclude_globs):
+                    continue
+            stat = None
+            if with_stat:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+            yield Path(entry.path), stat
+            yielded += 1
+            if max_files is not None and yielded >= max_files:
+                return
@@ -9,6 +9,7 @@ Architecture:
 - Project metadata stored with each vector
 - Cross-collection search with result merging
 - Collection lifecycle management
+- Incremental project centroids for project-to-project similarity
 - Migration support from v1 single-collection
 """
 
@@ -26,6 +27,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 from qdrant_client.http import models
 from qdrant_client.http.exceptions import UnexpectedResponse
 from src.vector_db.qdrant_client import get_qdrant_client
+from src.vector_db.project_centroids import ProjectCentroidIndex
 from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -89,6 +91,9 @@ class MultiRootVectorStore:
         self.vector_size = vector_size or settings.qdrant_vector_size
         self.collections: Dict[str, str] = {}  # project_id -> collection_name
         self.project_metadata: Dict[str, ProjectMetadata] = {}  # project_id -> metadata
+        self.centroids = ProjectCentroidIndex(
+            sub_centroids=getattr(settings, "project_similarity_subcentroids", 0)
+        )
 
         self.stats = {
             "projects_registered": 0,
@@ -207,6 +212,12 @@ class MultiRootVectorStore:
                         project_name=project_name,
                         project_type=project_type
                     )
+                    if not self.centroids.point_count(project_id):
+                        # Existing vectors (e.g. from before a restart) seed the centroids
+                        try:
+                            self.centroids.load_collection(project_id, client, collection_name)
+                        except Exception as e:
+                            logger.warning(f"Could not seed centroids for project {project_id}: {e}")
                     return True
 
                 # Dimension mismatch
@@ -231,6 +242,7 @@ class MultiRootVectorStore:
 
                 # Delete old collection
                 client.delete_collection(collection_name)
+                self.centroids.remove_project(project_id)
                 logger.info(f"Deleted collection '{collection_name}' with {point_count} vectors")
 
             # Create collection with project metadata schema
@@ -339,6 +351,7 @@ class MultiRootVectorStore:
             del self.collections[project_id]
             if project_id in self.project_metadata:
                 del self.project_metadata[project_id]
+            self.centroids.remove_project(project_id)
 
             logger.info(f"✅ Collection {collection_name} deleted successfully")
             return True
@@ -435,6 +448,11 @@ class MultiRootVectorStore:
                 points=points
             )
 
+            self.centroids.add_points(
+                project_id,
+                ((p.id, p.payload["file_path"], p.vector) for p in points),
+            )
+
             self.stats["vectors_stored"] += len(points)
             logger.info(
                 f"Upserted {len(points)} vectors for project {project_id} "
@@ -688,6 +706,8 @@ class MultiRootVectorStore:
                     )
                 )
 
+            self.centroids.remove_files(project_id, file_paths)
+
             self.stats["vectors_deleted"] += len(file_paths)
             logger.info(
                 f"Deleted vectors for {len(file_paths)} files from project {project_id}"
@@ -987,6 +1007,7 @@ class MultiRootVectorStore:
             "cross_project_searches": self.stats["cross_project_searches"],
             "errors": self.stats["errors"],
             "vector_size": self.vector_size,
+            "centroids": self.centroids.get_stats(),
         }
 
     def get_project_info(self, project_id: str) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,393 @@
+"""
+Project Centroid Index
+
+Incrementally maintained project-level embeddings used to score semantic
+similarity between projects in a workspace.
+
+Features:
+- Running sum/count per project, updated as points are upserted or deleted;
+  per-file contributions are kept as float32 sums, not per-point vectors
+- Seeding from an existing Qdrant collection after a restart
+- Optional online k-means sub-centroids per project (captures projects that
+  share one sub-domain without being similar overall)
+- All-pairs similarity from a single matrix product, cached until any
+  project's vectors change
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(vector: Sequence[float]) -> Optional[np.ndarray]:
+    arr = np.asarray(vector, dtype=np.float64).reshape(-1)
+    norm = float(np.linalg.norm(arr))
+    if norm == 0.0 or not np.isfinite(norm):
+        return None
+    return arr / norm
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return matrix / norms
+
+
+class _FileVectors:
+    """One file's contribution: float32 vector sum and point count per sub-centroid slot"""
+
+    __slots__ = ("sums", "counts")
+
+    def __init__(self):
+        self.sums: Dict[int, np.ndarray] = {}
+        self.counts: Dict[int, int] = {}
+
+    def add(self, slot: int, vector: np.ndarray):
+        if slot in self.sums:
+            self.sums[slot] += vector
+            self.counts[slot] += 1
+        else:
+            self.sums[slot] = vector.astype(np.float32)
+            self.counts[slot] = 1
+
+
+@dataclass
+class _ProjectVectors:
+    """Running aggregates for one project"""
+
+    dim: int
+    k: int
+    total: np.ndarray = None
+    count: int = 0
+    files: Dict[str, _FileVectors] = field(default_factory=dict)
+    cluster_sums: np.ndarray = None
+    cluster_counts: np.ndarray = None
+
+    def __post_init__(self):
+        self.total = np.zeros(self.dim, dtype=np.float64)
+        self.cluster_sums = np.zeros((self.k, self.dim), dtype=np.float64)
+        self.cluster_counts = np.zeros(self.k, dtype=np.int64)
+
+    def _assign(self, vector: np.ndarray) -> int:
+        if self.k == 0:
+            return -1
+        empty = np.flatnonzero(self.cluster_counts == 0)
+        if len(empty):
+            # Seed empty slots with incoming points before clustering
+            return int(empty[0])
+        means = _normalize_rows(self.cluster_sums)
+        return int(np.argmax(means @ vector))
+
+    def add(self, file_path: str, vector: np.ndarray):
+        # Aggregates receive exactly what the file keeps, so removal cancels out
+        vector = vector.astype(np.float32)
+        slot = self._assign(vector)
+        entry = self.files.get(file_path)
+        if entry is None:
+            entry = self.files[file_path] = _FileVectors()
+        entry.add(slot, vector)
+        self.total += vector
+        self.count += 1
+        if slot >= 0:
+            self.cluster_sums[slot] += vector
+            self.cluster_counts[slot] += 1
+
+    def remove_file(self, file_path: str) -> int:
+        entry = self.files.pop(file_path, None)
+        if entry is None:
+            return 0
+        removed = 0
+        for slot, vector_sum in entry.sums.items():
+            n = entry.counts[slot]
+            removed += n
+            self.total -= vector_sum
+            if slot >= 0:
+                self.cluster_sums[slot] -= vector_sum
+                self.cluster_counts[slot] -= n
+                if self.cluster_counts[slot] == 0:
+                    self.cluster_sums[slot] = 0.0
+        self.count -= removed
+        if self.count == 0:
+            # Drop accumulated float error once the project is empty
+            self.total[:] = 0.0
+        return removed
+
+    def centroid(self) -> np.ndarray:
+        return self.total / max(self.count, 1)
+
+    def sub_centroids(self) -> np.ndarray:
+        active = self.cluster_counts > 0
+        return self.cluster_sums[active] / self.cluster_counts[active, None]
+
+
+class ProjectCentroidIndex:
+    """
+    Per-project centroid embeddings with cached all-pairs similarity
+
+    With ``sub_centroids == 0`` project similarity is the cosine of the two
+    centroids. With ``sub_centroids > 0`` each project also keeps up to that
+    many online k-means centroids and similarity is the symmetric average of
+    best-match cosines between the two sets.
+    """
+
+    def __init__(self, sub_centroids: int = 0):
+        """
+        Args:
+            sub_centroids: Number of k-means sub-centroids per project (0 = off)
+        """
+        self.sub_centroids = max(0, int(sub_centroids))
+        self._projects: Dict[str, _ProjectVectors] = {}
+        self._lock = threading.Lock()
+        self._version = 0
+        self._matrix_version = -1
+        self._matrix_ids: List[str] = []
+        self._matrix_pos: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self.stats = {
+            "points_added": 0,
+            "points_removed": 0,
+            "matrix_rebuilds": 0,
+        }
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every change (for dependent caches)"""
+        return self._version
+
+    # ==================== Maintenance ====================
+
+    def _apply(
+        self,
+        project_id: str,
+        project: Optional[_ProjectVectors],
+        points: Iterable[Tuple[Any, str, Sequence[float]]],
+        replace_files: bool = True,
+    ) -> Tuple[Optional[_ProjectVectors], int]:
+        """Add points to project, first dropping each file's previous contribution"""
+        applied = 0
+        replaced: Set[str] = set()
+        for _, file_path, vector in points:
+            normalized = _normalize(vector)
+            if normalized is None:
+                continue
+            if project is None or project.dim != normalized.shape[0]:
+                if project is not None:
+                    logger.warning(
+                        f"Centroid dimension changed for project {project_id} "
+                        f"({project.dim} -> {normalized.shape[0]}); resetting"
+                    )
+                project = _ProjectVectors(dim=normalized.shape[0], k=self.sub_centroids)
+                replaced.clear()
+            if replace_files and file_path not in replaced:
+                project.remove_file(file_path)
+                replaced.add(file_path)
+            project.add(file_path, normalized)
+            applied += 1
+        return project, applied
+
+    def add_points(
+        self,
+        project_id: str,
+        points: Iterable[Tuple[Any, str, Sequence[float]]],
+    ) -> int:
+        """
+        Add or replace points for a project
+
+        Args:
+            project_id: Project identifier
+            points: (point_id, file_path, vector) tuples; a file's points
+                replace everything previously added for that file, so all
+                points of a file must be passed in the same call
+
+        Returns:
+            Number of points applied
+        """
+        with self._lock:
+            project, applied = self._apply(project_id, self._projects.get(project_id), points)
+            if applied:
+                self._projects[project_id] = project
+                self._version += 1
+                self.stats["points_added"] += applied
+        return applied
+
+    def load_collection(self, project_id: str, client, collection_name: str, page_size: int = 256) -> int:
+        """
+        Rebuild a project's aggregates from the vectors stored in its collection
+
+        Used to seed the index for collections that already exist when the
+        process starts. Pages are streamed, so only the aggregates are held.
+
+        Args:
+            project_id: Project identifier
+            client: Qdrant client
+            collection_name: The project's collection
+            page_size: Points fetched per scroll call
+
+        Returns:
+            Number of points loaded
+        """
+        project: Optional[_ProjectVectors] = None
+        loaded = 0
+        offset = None
+        while True:
+            points, offset = client.scroll(
+                collection_name=collection_name,
+                limit=page_size,
+                offset=offset,
+                with_payload=["file_path"],
+                with_vectors=True,
+            )
+            page = []
+            for point in points:
+                vector = point.vector
+                if isinstance(vector, dict):
+                    vector = next(iter(vector.values()), None)
+                if vector is not None:
+                    file_path = (point.payload or {}).get("file_path") or str(point.id)
+                    page.append((point.id, file_path, vector))
+            # A file's chunks can be spread over pages, so nothing is replaced here
+            project, applied = self._apply(project_id, project, page, replace_files=False)
+            loaded += applied
+            if offset is None:
+                break
+
+        with self._lock:
+            if project is None:
+                self._projects.pop(project_id, None)
+            else:
+                self._projects[project_id] = project
+            self._version += 1
+            self.stats["points_added"] += loaded
+        return loaded
+
+    def remove_files(self, project_id: str, file_paths: Iterable[str]) -> int:
+        """Remove every point belonging to the given files"""
+        removed = 0
+        with self._lock:
+            project = self._projects.get(project_id)
+            if project is None:
+                return 0
+            for file_path in file_paths:
+                removed += project.remove_file(file_path)
+            if removed:
+                self._version += 1
+                self.stats["points_removed"] += removed
+        return removed
+
+    def remove_project(self, project_id: str) -> bool:
+        """Forget a project entirely"""
+        with self._lock:
+            if self._projects.pop(project_id, None) is None:
+                return False
+            self._version += 1
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._projects.clear()
+            self._version += 1
+
+    # ==================== Queries ====================
+
+    def get_centroid(self, project_id: str) -> Optional[List[float]]:
+        with self._lock:
+            project = self._projects.get(project_id)
+            if project is None or project.count == 0:
+                return None
+            return project.centroid().tolist()
+
+    def point_count(self, project_id: str) -> int:
+        with self._lock:
+            project = self._projects.get(project_id)
+            return project.count if project is not None else 0
+
+    def _rebuild_matrix(self):
+        """Recompute all-pairs similarity (caller holds the lock)"""
+        ids = [pid for pid, p in self._projects.items() if p.count > 0]
+        dims = {self._projects[pid].dim for pid in ids}
+        if len(dims) > 1:
+            # Mixed embedding models: compare only projects of the dominant dimension
+            dominant = max(dims, key=lambda d: sum(self._projects[p].dim == d for p in ids))
+            ids = [pid for pid in ids if self._projects[pid].dim == dominant]
+
+        if not ids:
+            matrix = np.zeros((0, 0), dtype=np.float64)
+        elif self.sub_centroids == 0:
+            centroids = _normalize_rows(np.stack([self._projects[pid].centroid() for pid in ids]))
+            matrix = centroids @ centroids.T
+        else:
+            blocks = [self._projects[pid].sub_centroids() for pid in ids]
+            sizes = np.array([len(b) for b in blocks])
+            starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+            subs = _normalize_rows(np.concatenate(blocks))
+            pairwise = subs @ subs.T
+            # Best match of every sub-centroid within each project's block ...
+            best = np.maximum.reduceat(pairwise, starts, axis=1)
+            # ... averaged over the source project's sub-centroids
+            directed = np.add.reduceat(best, starts, axis=0) / sizes[:, None]
+            matrix = (directed + directed.T) / 2.0
+
+        matrix = np.clip(matrix, 0.0, 1.0)
+        np.fill_diagonal(matrix, 1.0)
+
+        self._matrix = matrix
+        self._matrix_ids = ids
+        self._matrix_pos = {pid: i for i, pid in enumerate(ids)}
+        self._matrix_version = self._version
+        self.stats["matrix_rebuilds"] += 1
+
+    def _ensure_matrix(self):
+        if self._matrix is None or self._matrix_version != self._version:
+            self._rebuild_matrix()
+
+    def similarity_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """
+        All-pairs project similarity
+
+        Returns:
+            (project_ids, matrix) where matrix[i, j] is in [0, 1]
+        """
+        with self._lock:
+            self._ensure_matrix()
+            return list(self._matrix_ids), self._matrix.copy()
+
+    def similarity(self, project_a: str, project_b: str) -> float:
+        """Similarity between two projects (0.0 when either has no vectors)"""
+        with self._lock:
+            self._ensure_matrix()
+            i = self._matrix_pos.get(project_a)
+            j = self._matrix_pos.get(project_b)
+            if i is None or j is None:
+                return 0.0
+            return float(self._matrix[i, j])
+
+    def related(self, project_id: str, threshold: float = 0.7) -> List[Tuple[str, float]]:
+        """Projects whose similarity to project_id is at least threshold, best first"""
+        with self._lock:
+            self._ensure_matrix()
+            i = self._matrix_pos.get(project_id)
+            if i is None:
+                return []
+            row = self._matrix[i]
+            ids = self._matrix_ids
+        related = [
+            (ids[j], float(row[j]))
+            for j in np.flatnonzero(row >= threshold)
+            if j != i
+        ]
+        related.sort(key=lambda x: x[1], reverse=True)
+        return related
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "projects": len(self._projects),
+                "points": sum(p.count for p in self._projects.values()),
+                "sub_centroids": self.sub_centroids,
+                **self.stats,
+            }
@@ -10,6 +10,8 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
+from src.utils.repo_walker import walk_dirs
+
 from .models import DiscoveredProject, ProjectType
 
 
@@ -147,6 +149,9 @@ class ProjectScanner:
         """
         Walk directory tree and find project roots.
 
+        Ignored directories are pruned before they are opened and marker
+        detection reuses the directory listing instead of probing each marker.
+
         Args:
             root: Current directory to scan
             depth: Current depth level
@@ -159,38 +164,24 @@ class ProjectScanner:
 
         results = []
 
-        try:
+        for directory, subdirs, files in walk_dirs(
+            root,
+            exclude_dirs=self.ignore_patterns,
+            max_depth=self.max_depth - depth,
+        ):
             # Check if current directory is a project root
-            markers = self._find_markers(root)
+            names = {entry.name for entry in files}
+            markers = [marker for marker in self.MARKERS if marker in names]
             if markers:
-                results.append((root, markers))
+                results.append((directory, markers))
                 # Don't scan subdirectories of detected projects
                 # (prevents nested project confusion)
-                return results
+                subdirs[:] = []
+                continue
 
             # Scan subdirectories
             self.stats["directories_scanned"] += 1
-
-            entries = list(root.iterdir())
-            self.stats["files_examined"] += len(entries)
-
-            for entry in entries:
-                # Skip ignored patterns
-                if entry.name in self.ignore_patterns:
-                    continue
-
-                # Only recurse into directories
-                if entry.is_dir():
-                    try:
-                        sub_results = self._walk_tree(entry, depth + 1)
-                        results.extend(sub_results)
-                    except (PermissionError, OSError):
-                        # Skip directories we can't access
-                        continue
-
-        except (PermissionError, OSError):
-            # Skip directories we can't access
-            pass
+            self.stats["files_examined"] += len(subdirs) + len(files)
 
         return results
 
@@ -7,6 +7,7 @@ validation, I/O operations, and path resolution.
 
 import json
 import re
+from collections import deque
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
@@ -448,22 +449,20 @@ class WorkspaceConfig(BaseModel):
         if not transitive:
             return project.dependencies
 
-        # Get transitive dependencies using BFS
+        # Get transitive dependencies using BFS over an id -> dependencies map
+        graph = {p.id: p.dependencies for p in self.projects}
         dependencies = set()
-        queue = list(project.dependencies)
+        queue = deque(project.dependencies)
         visited = {project_id}
 
         while queue:
-            dep_id = queue.pop(0)
+            dep_id = queue.popleft()
             if dep_id in visited:
                 continue
 
             visited.add(dep_id)
             dependencies.add(dep_id)
-
-            dep_project = self.get_project(dep_id)
-            if dep_project:
-                queue.extend(dep_project.dependencies)
+            queue.extend(graph.get(dep_id, ()))
 
         return list(dependencies)
 
@@ -0,0 +1,308 @@
+"""
+Project Indexing Pipeline
+
+Staged producer/consumer indexing of one workspace project:
+
+    walk -> read -> parse/chunk -> batch-embed -> batch-upsert
+
+Stages are connected by bounded queues, so a slow stage applies backpressure
+instead of buffering the whole project in memory. File reads, embedding calls
+and upserts all draw from one worker budget shared by every project indexed on
+the same event loop, so indexing several projects in parallel does not
+multiply the load. Vectors go to the project's own MultiRootVectorStore
+collection, and progress is written to the project's ProjectStats as files
+move through the stages.
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import weakref
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Queue sentinel marking the end of a stage's output
+_DONE = object()
+
+# Paths pulled from the (blocking) walker per thread hop
+_WALK_CHUNK = 256
+
+_budgets: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def default_worker_count() -> int:
+    """Worker budget from settings.workspace_index_workers (0 = CPU count, max 8)."""
+    try:
+        from src.config.settings import settings
+    except Exception:
+        settings = None
+    configured = int(getattr(settings, "workspace_index_workers", 0) or 0)
+    return configured if configured > 0 else min(8, os.cpu_count() or 1)
+
+
+def get_worker_budget() -> asyncio.Semaphore:
+    """Return the worker budget shared by all pipelines on the running loop."""
+    loop = asyncio.get_running_loop()
+    budget = _budgets.get(loop)
+    if budget is None:
+        budget = asyncio.Semaphore(default_worker_count())
+        _budgets[loop] = budget
+    return budget
+
+
+def _read_file(path: Path):
+    stat = path.stat()
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return stat, f.read()
+
+
+@dataclass
+class _FileItem:
+    """One file moving through the pipeline"""
+    path: Path
+    language: str
+    size: int
+    content: str
+    chunks: List[str] = field(default_factory=list)
+
+
+class ProjectIndexPipeline:
+    """Indexes a set of files into one project's vector collection"""
+
+    def __init__(
+        self,
+        project_id: str,
+        files: Iterable[Path],
+        vector_store,
+        stats,
+        project_metadata: Optional[Dict[str, Any]] = None,
+        embed_texts: Optional[Callable[[List[str]], Awaitable[List[Optional[List[float]]]]]] = None,
+        chunk_text: Optional[Callable[[str], List[str]]] = None,
+        language_for: Optional[Callable[[Path], Optional[str]]] = None,
+        budget: Optional[asyncio.Semaphore] = None,
+        workers: Optional[int] = None,
+        embed_batch_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ):
+        """
+        Initialize pipeline
+
+        Args:
+            project_id: Project whose collection receives the vectors
+            files: Paths to index (may be a lazy walker; consumed in a thread)
+            vector_store: MultiRootVectorStore with the project collection
+            stats: ProjectStats updated with progress
+            project_metadata: Project name/type added to every payload
+            embed_texts: Batch embedding coroutine (default: embedding service)
+            chunk_text: Splits a file's text into embeddable chunks (default: embedding service)
+            language_for: Maps a path to its language, None to skip (default: FileIndexer extensions)
+            budget: Shared worker semaphore (default: get_worker_budget())
+            workers: Concurrent readers (default: settings.workspace_index_workers)
+            embed_batch_size: Texts per embedding call (default: settings.workspace_index_embed_batch)
+            queue_size: Bound on each inter-stage queue (default: settings.workspace_index_queue_size)
+        """
+        try:
+            from src.config.settings import settings
+        except Exception:
+            settings = None
+
+        self.project_id = project_id
+        self.files = files
+        self.vector_store = vector_store
+        self.stats = stats
+        self.project_metadata = project_metadata
+        self.budget = budget
+        self.workers = max(1, workers or default_worker_count())
+        self.embed_batch_size = max(
+            1, embed_batch_size or int(getattr(settings, "workspace_index_embed_batch", 64))
+        )
+        self.queue_size = max(1, queue_size or int(getattr(settings, "workspace_index_queue_size", 256)))
+
+        if embed_texts is None or chunk_text is None:
+            from src.vector_db.embeddings import get_embedding_service
+
+            service = get_embedding_service()
+            embed_texts = embed_texts or service.generate_batch_embeddings
+            chunk_text = chunk_text or service.chunk_text
+        self.embed_texts = embed_texts
+        self.chunk_text = chunk_text
+
+        if language_for is None:
+            from src.indexing.file_indexer import FileIndexer
+
+            extensions = FileIndexer.LANGUAGE_EXTENSIONS
+            language_for = lambda path: extensions.get(path.suffix.lower())  # noqa: E731
+        self.language_for = language_for
+
+    async def run(self):
+        """
+        Run every stage to completion.
+
+        Returns:
+            The ProjectStats passed in, with final counts
+        """
+        if self.budget is None:
+            self.budget = get_worker_budget()
+
+        paths_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        read_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        chunk_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        vector_q: asyncio.Queue = asyncio.Queue(maxsize=max(1, self.queue_size // self.embed_batch_size))
+        readers_left = [self.workers]
+
+        tasks = [
+            asyncio.create_task(self._walk(paths_q)),
+            *(asyncio.create_task(self._read(paths_q, read_q, readers_left)) for _ in range(self.workers)),
+            asyncio.create_task(self._chunk(read_q, chunk_q)),
+            asyncio.create_task(self._embed(chunk_q, vector_q)),
+            asyncio.create_task(self._upsert(vector_q)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        return self.stats
+
+    # ---- stages ------------------------------------------------------------------
+
+    async def _walk(self, out: asyncio.Queue):
+        iterator = iter(self.files)
+
+        def next_chunk() -> List[Path]:
+            return [Path(p) for p in itertools.islice(iterator, _WALK_CHUNK)]
+
+        while True:
+            chunk = await asyncio.to_thread(next_chunk)
+            if not chunk:
+                break
+            self.stats.total_files += len(chunk)
+            for path in chunk:
+                await out.put(path)
+        for _ in range(self.workers):
+            await out.put(_DONE)
+
+    async def _read(self, inq: asyncio.Queue, out: asyncio.Queue, readers_left: List[int]):
+        while True:
+            path = await inq.get()
+            if path is _DONE:
+                break
+            language = self.language_for(path)
+            if not language:
+                self.stats.files_skipped += 1
+                continue
+            try:
+                async with self.budget:
+                    stat, content = await asyncio.to_thread(_read_file, path)
+            except OSError as e:
+                logger.warning(f"Cannot read {path} in project {self.project_id}: {e}")
+                self.stats.errors += 1
+                continue
+            self.stats.files_read += 1
+            if not content.strip():
+                self.stats.files_skipped += 1
+                continue
+            await out.put(_FileItem(path, language, stat.st_size, content))
+
+        readers_left[0] -= 1
+        if readers_left[0] == 0:
+            await out.put(_DONE)
+
+    async def _chunk(self, inq: asyncio.Queue, out: asyncio.Queue):
+        while True:
+            item = await inq.get()
+            if item is _DONE:
+                await out.put(_DONE)
+                return
+            # Same context header as EmbeddingService.generate_code_embedding
+            text = f"Language: {item.language} | File: {item.path.name}\n\n{item.content}"
+            try:
+                item.chunks = self.chunk_text(text)
+            except Exception as e:
+                logger.warning(f"Cannot chunk {item.path} in project {self.project_id}: {e}")
+                self.stats.errors += 1
+                continue
+            item.content = ""  # only the chunks are needed from here on
+            await out.put(item)
+
+    async def _embed(self, inq: asyncio.Queue, out: asyncio.Queue):
+        batch: List[_FileItem] = []
+        pending_texts = 0
+        while True:
+            item = await inq.get()
+            done = item is _DONE
+            if not done:
+                batch.append(item)
+                pending_texts += len(item.chunks)
+            # Flush on a full batch, or as soon as upstream has nothing more ready
+            if batch and (done or pending_texts >= self.embed_batch_size or inq.empty()):
+                vectors = await self._embed_batch(batch)
+                if vectors:
+                    await out.put(vectors)
+                batch, pending_texts = [], 0
+            if done:
+                await out.put(_DONE)
+                return
+
+    async def _embed_batch(self, batch: List[_FileItem]) -> List[Dict[str, Any]]:
+        texts = [chunk for item in batch for chunk in item.chunks]
+        try:
+            async with self.budget:
+                embeddings = await self.embed_texts(texts)
+        except Exception as e:
+            logger.error(f"Embedding batch failed in project {self.project_id}: {e}")
+            self.stats.errors += len(batch)
+            return []
+
+        indexed_time = datetime.now(timezone.utc).isoformat()
+        vectors = []
+        offset = 0
+        for item in batch:
+            valid = [e for e in embeddings[offset : offset + len(item.chunks)] if e is not None]
+            offset += len(item.chunks)
+            if not valid:
+                logger.warning(f"No embedding generated for {item.path}")
+                self.stats.errors += 1
+                continue
+            # Multi-chunk files are represented by the mean of their chunk embeddings
+            vector = valid[0] if len(valid) == 1 else [sum(col) / len(valid) for col in zip(*valid)]
+            file_path = str(item.path.absolute())
+            vectors.append(
+                {
+                    "id": file_path,
+                    "vector": list(vector),
+                    "payload": {
+                        "file_path": file_path,
+                        "file_name": item.path.name,
+                        "file_type": item.language,
+                        "size": item.size,
+                        "indexed_time": indexed_time,
+                    },
+                }
+            )
+        self.stats.files_embedded += len(vectors)
+        return vectors
+
+    async def _upsert(self, inq: asyncio.Queue):
+        while True:
+            vectors = await inq.get()
+            if vectors is _DONE:
+                return
+            try:
+                async with self.budget:
+                    ok = await self.vector_store.add_vectors(self.project_id, vectors, self.project_metadata)
+            except Exception as e:
+                logger.error(f"Upsert failed in project {self.project_id}: {e}")
+                ok = False
+            if ok:
+                self.stats.files_indexed += len(vectors)
+            else:
+                self.stats.errors += len(vectors)
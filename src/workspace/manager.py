@@ -15,11 +15,12 @@ from datetime import datetime
 
 from src.workspace.config import WorkspaceConfig, ProjectConfig
 from src.workspace.multi_root_store import MultiRootVectorStore
+from src.workspace.index_pipeline import ProjectIndexPipeline
 from src.workspace.relationship_graph import ProjectRelationshipGraph, RelationshipType
 from src.indexing.file_monitor import FileMonitor
-from src.indexing.file_indexer import FileIndexer
 from src.vector_db.ast_store import ASTVectorStore
 from src.config.settings import settings
+from src.utils.repo_walker import walk_files
 
 logger = logging.getLogger(__name__)
 
@@ -42,14 +43,28 @@ class ProjectStats:
     errors: int = 0
     last_indexed: Optional[datetime] = None
     indexing_duration_seconds: Optional[float] = None
+    # Pipeline progress of the current (or last) indexing run
+    files_read: int = 0
+    files_embedded: int = 0
+    files_skipped: int = 0
+    indexing_in_progress: bool = False
+
+    def reset_progress(self) -> None:
+        """Zero the per-run counters before a new indexing run"""
+        self.files_indexed = 0
+        self.total_files = 0
+        self.errors = 0
+        self.files_read = 0
+        self.files_embedded = 0
+        self.files_skipped = 0
 
 
 class Project:
     """
     Represents a single project within a workspace
 
-    Each project has its own vector store, AST store, file monitor,
-    and indexer instances (no global singletons).
+    Each project has its own vector collection, AST store and file monitor
+    instances (no global singletons).
     """
 
     def __init__(
@@ -80,7 +95,6 @@ class Project:
         self.vector_store: Optional[MultiRootVectorStore] = None
         self.ast_store: Optional[ASTVectorStore] = None
         self.file_monitor: Optional[FileMonitor] = None
-        self.indexer: Optional[FileIndexer] = None
 
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
@@ -124,9 +138,6 @@ class Project:
                     on_change_callback=self._on_file_change,
                 )
 
-                # Initialize per-project indexer
-                self.indexer = FileIndexer()
-
                 logger.info(f"Project {self.id} initialized successfully")
                 self.status = ProjectStatus.READY
                 return True
@@ -160,71 +171,51 @@ class Project:
             self.status = ProjectStatus.INDEXING
 
             start_time = asyncio.get_event_loop().time()
+            self.stats.reset_progress()
+            self.stats.indexing_in_progress = True
 
             try:
+                if self.vector_store is None:
+                    raise RuntimeError(f"Project {self.id} is not initialized")
+
                 # Get all supported files
                 supported_extensions = {
                     ".py", ".js", ".jsx", ".ts", ".tsx",
                     ".java", ".cpp", ".hpp", ".h", ".cc", ".cxx"
                 }
 
-                files_to_index = []
                 exclude_patterns = set(self.config.indexing.exclude)
 
-                for file_path in self.path.rglob("*"):
-                    # Skip if not a file
-                    if not file_path.is_file():
-                        continue
-
-                    # Skip if extension not supported
-                    if file_path.suffix not in supported_extensions:
-                        continue
-
-                    # Skip if matches exclude patterns
-                    should_exclude = False
-                    for pattern in exclude_patterns:
-                        if pattern in file_path.parts:
-                            should_exclude = True
-                            break
-
-                    if should_exclude:
-                        continue
-
-                    files_to_index.append(file_path)
-
-                self.stats.total_files = len(files_to_index)
-                logger.info(f"Found {len(files_to_index)} files to index in project {self.id}")
-
-                # Index files
-                indexed_count = 0
-                error_count = 0
-
-                for file_path in files_to_index:
-                    try:
-                        # Index file
-                        metadata = await self.indexer.index_file(str(file_path))
-
-                        if metadata:
-                            indexed_count += 1
-
-                            # Note: Vector embedding is already handled by FileIndexer.index_file()
-                            # which calls vector_store.upsert_vector()
-                            # We just need to track project-specific stats
+                # Excluded directories are pruned before descending; the walk is
+                # consumed lazily by the pipeline's first stage
+                files_to_index = (
+                    file_path
+                    for file_path, _ in walk_files(
+                        self.path,
+                        extensions=supported_extensions,
+                        exclude_dirs=exclude_patterns,
+                        skip_file=lambda entry: entry.name in exclude_patterns,
+                        with_stat=False,
+                    )
+                )
 
-                    except Exception as e:
-                        logger.error(f"Error indexing file {file_path}: {e}")
-                        error_count += 1
+                pipeline = ProjectIndexPipeline(
+                    project_id=self.id,
+                    files=files_to_index,
+                    vector_store=self.vector_store,
+                    stats=self.stats,
+                    project_metadata={"name": self.name, "type": self.config.type},
+                )
+                await pipeline.run()
 
                 # Update stats
-                self.stats.files_indexed = indexed_count
-                self.stats.errors = error_count
                 self.stats.last_indexed = datetime.now()
                 self.stats.indexing_duration_seconds = asyncio.get_event_loop().time() - start_time
 
                 logger.info(
                     f"Indexed project {self.id}: "
-                    f"{indexed_count}/{len(files_to_index)} files "
-                    f"({error_count} errors) "
+                    f"{self.stats.files_indexed}/{self.stats.total_files} files "
+                    f"({self.stats.errors} errors) "
                     f"in {self.stats.indexing_duration_seconds:.2f}s"
                 )
 
@@ -237,6 +228,9 @@ class Project:
                 self.stats.errors += 1
                 return False
 
+            finally:
+                self.stats.indexing_in_progress = False
+
     async def search(
         self, query: str, limit: int = 10, score_threshold: float = 0.0
     ) -> List[Dict[str, Any]]:
@@ -329,15 +323,32 @@ class Project:
         """
         logger.debug(f"File change in project {self.id}: {event_type} - {file_path}")
 
+        path = Path(file_path).absolute()
+        if self.vector_store is None or set(self.config.indexing.exclude) & set(path.parts):
+            return
+
         try:
             if event_type in ("created", "modified"):
-                # Re-index the file
-                await self.indexer.index_file(file_path)
-                logger.info(f"Re-indexed file in project {self.id}: {file_path}")
+                # Same pipeline as a full index, so the vector and its centroid
+                # contribution land in this project's collection
+                stats = ProjectStats()
+                pipeline = ProjectIndexPipeline(
+                    project_id=self.id,
+                    files=[path],
+                    vector_store=self.vector_store,
+                    stats=stats,
+                    project_metadata={"name": self.name, "type": self.config.type},
+                )
+                await pipeline.run()
+                if stats.files_indexed:
+                    logger.info(f"Re-indexed file in project {self.id}: {file_path}")
+                elif stats.files_skipped:
+                    # Emptied or no longer indexable: drop what was stored for it
+                    await self.vector_store.delete_vectors(self.id, [str(path)])
 
             elif event_type == "deleted":
-                # Remove from index
-                await self.indexer.remove_file(file_path)
+                # Remove from the project collection (and its centroid)
+                await self.vector_store.delete_vectors(self.id, [str(path)])
                 logger.info(f"Removed file from project {self.id}: {file_path}")
 
         except Exception as e:
@@ -365,6 +376,10 @@ class Project:
                 "errors": self.stats.errors,
                 "last_indexed": self.stats.last_indexed.isoformat() if self.stats.last_indexed else None,
                 "duration_seconds": self.stats.indexing_duration_seconds,
+                "in_progress": self.stats.indexing_in_progress,
+                "files_read": self.stats.files_read,
+                "files_embedded": self.stats.files_embedded,
+                "files_skipped": self.stats.files_skipped,
             },
             "monitoring": {
                 "active": self.file_monitor.is_running if self.file_monitor else False,
@@ -393,7 +408,9 @@ class WorkspaceManager:
 
         # Shared workspace-level components
         self.multi_root_store = MultiRootVectorStore()
-        self.relationship_graph = ProjectRelationshipGraph()
+        self.relationship_graph = ProjectRelationshipGraph(
+            centroid_index=self.multi_root_store.centroids
+        )
 
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
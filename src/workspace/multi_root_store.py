@@ -4,11 +4,13 @@ Multi-Root Vector Store
 Per-project vector storage with isolated collections for workspace-wide search.
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Any, Optional
 from qdrant_client.http import models
 
 from src.vector_db.qdrant_client import get_qdrant_client
+from src.vector_db.project_centroids import ProjectCentroidIndex
 from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -25,6 +27,10 @@ class MultiRootVectorStore:
     def __init__(self):
         """Initialize multi-root vector store"""
         self.collections: Dict[str, str] = {}  # project_id -> collection_name
+        # Project-level embeddings for relationship-aware ranking
+        self.centroids = ProjectCentroidIndex(
+            sub_centroids=getattr(settings, "project_similarity_subcentroids", 0)
+        )
         self.stats = {
             "collections_created": 0,
             "vectors_stored": 0,
@@ -73,9 +79,11 @@ class MultiRootVectorStore:
                     )
                     # Delete and recreate
                     client.delete_collection(collection_name)
+                    self.centroids.remove_project(project_id)
                 else:
                     logger.debug(f"Collection {collection_name} already exists")
                     self.collections[project_id] = collection_name
+                    await asyncio.to_thread(self._seed_centroids, client, project_id, collection_name)
                     return True
 
             # Create collection with project metadata in payload schema
@@ -100,6 +108,16 @@ class MultiRootVectorStore:
             self.stats["errors"] += 1
             return False
 
+    def _seed_centroids(self, client, project_id: str, collection_name: str):
+        """Load centroids for a collection that already holds vectors (e.g. after a restart)"""
+        if self.centroids.point_count(project_id):
+            return
+        try:
+            loaded = self.centroids.load_collection(project_id, client, collection_name)
+            logger.debug(f"Seeded centroids for project '{project_id}' from {loaded} stored vectors")
+        except Exception as e:
+            logger.warning(f"Could not seed centroids for project {project_id}: {e}")
+
     async def add_vectors(
         self, project_id: str, vectors: List[Dict[str, Any]], project_metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
@@ -145,6 +163,7 @@ class MultiRootVectorStore:
                     "id": point_id,
                     "vector": vector_data["vector"],
                     "payload": payload,
+                    "file_path": payload.get("file_path", vector_data["id"]),
                 })
 
             # Batch upsert
@@ -154,6 +173,10 @@ class MultiRootVectorStore:
             ]
 
             client.upsert(collection_name=collection_name, points=points)
+            self.centroids.add_points(
+                project_id,
+                ((v["id"], v["file_path"], v["vector"]) for v in enhanced_vectors),
+            )
 
             self.stats["vectors_stored"] += len(vectors)
             logger.debug(f"Added {len(vectors)} vectors to project '{project_id}'")
@@ -291,6 +314,54 @@ class MultiRootVectorStore:
             self.stats["errors"] += 1
             return []
 
+    async def delete_vectors(self, project_id: str, file_paths: List[str]) -> bool:
+        """
+        Delete every vector of the given files from a project's collection
+
+        Args:
+            project_id: Project identifier
+            file_paths: Files whose vectors are removed
+
+        Returns:
+            bool: True if successful
+        """
+        if project_id not in self.collections:
+            logger.error(f"Project {project_id} collection not initialized")
+            return False
+
+        if not file_paths:
+            return True
+
+        collection_name = self.collections[project_id]
+        client = get_qdrant_client()
+
+        if not client:
+            logger.error("Qdrant client not available")
+            return False
+
+        try:
+            client.delete(
+                collection_name=collection_name,
+                points_selector=models.FilterSelector(
+                    filter=models.Filter(
+                        must=[
+                            models.FieldCondition(
+                                key="file_path",
+                                match=models.MatchAny(any=list(file_paths)),
+                            )
+                        ]
+                    )
+                ),
+            )
+            self.centroids.remove_files(project_id, file_paths)
+            logger.debug(f"Deleted vectors of {len(file_paths)} files from project '{project_id}'")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error deleting vectors from project {project_id}: {e}", exc_info=True)
+            self.stats["errors"] += 1
+            return False
+
     async def delete_project_collection(self, project_id: str) -> bool:
         """
         Delete a project's collection
@@ -315,6 +386,7 @@ class MultiRootVectorStore:
         try:
             client.delete_collection(collection_name)
             del self.collections[project_id]
+            self.centroids.remove_project(project_id)
             logger.info(f"Deleted collection for project '{project_id}': {collection_name}")
             return True
 
@@ -365,4 +437,5 @@ class MultiRootVectorStore:
             "vectors_stored": self.stats["vectors_stored"],
             "searches_performed": self.stats["searches_performed"],
             "errors": self.stats["errors"],
+            "centroids": self.centroids.get_stats(),
         }
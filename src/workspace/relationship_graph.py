@@ -8,6 +8,8 @@ semantic similarity, caching, serialization, and visualization.
 
 import json
 import logging
+from collections import deque
+from itertools import islice
 from typing import Dict, List, Tuple, Optional, Any, Set
 from enum import Enum
 from dataclasses import dataclass, asdict, field
@@ -188,8 +190,14 @@ class ProjectRelationshipGraph:
     or a simple fallback implementation.
     """
 
-    def __init__(self):
-        """Initialize relationship graph"""
+    def __init__(self, centroid_index=None):
+        """
+        Initialize relationship graph
+
+        Args:
+            centroid_index: Optional ProjectCentroidIndex providing
+                embedding-based project similarity
+        """
         if NETWORKX_AVAILABLE:
             self.graph = nx.DiGraph()
             logger.info("ProjectRelationshipGraph initialized with NetworkX")
@@ -198,7 +206,15 @@ class ProjectRelationshipGraph:
             logger.info("ProjectRelationshipGraph initialized with simple graph")
 
         self._semantic_similarity_cache: Dict[Tuple[str, str], float] = {}
-        self._dependency_cache: Dict[str, Set[str]] = {}
+        self._semantic_similarity_version = -1
+        self.centroid_index = centroid_index
+        # source -> {dependency: hop distance}, filled lazily by BFS
+        self._dependency_cache: Dict[str, Dict[str, int]] = {}
+        # Transitive closure as one bitset (int) per node; see _ensure_reachability
+        self._node_bits: Dict[str, int] = {}
+        self._reach: Dict[str, int] = {}
+        self._reach_valid = False
+        self._boost_cache: Dict[Tuple[str, float], Dict[str, float]] = {}
         self._cache_valid = True
         self.stats = {
             "relationships_added": 0,
@@ -338,7 +354,7 @@ class ProjectRelationshipGraph:
         # Add edge to graph
         self.graph.add_edge(from_id, to_id, **rel_metadata.to_dict())
         self.stats["relationships_added"] += 1
-        self._invalidate_cache()
+        self._invalidate_cache(added_edge=(from_id, to_id))
         logger.debug(f"Added relationship: {from_id} -> {to_id} ({rel_type.value})")
 
     def get_dependencies(self, project_id: str, depth: int = 1) -> List[str]:
@@ -355,23 +371,63 @@ class ProjectRelationshipGraph:
         if not self.graph.has_node(project_id):
             return []
 
-        dependencies = set()
+        distances = self._dependency_distances(project_id)
+        return [dep for dep, hops in distances.items() if hops <= max(depth, 1)]
 
-        # Direct dependencies (successors in the graph)
-        if NETWORKX_AVAILABLE:
-            direct_deps = list(self.graph.successors(project_id))
-        else:
-            direct_deps = self.graph.successors(project_id)
+    def _dependency_distances(self, project_id: str) -> Dict[str, int]:
+        """
+        Hop distance from project_id to everything it depends on (cached)
+
+        The project itself appears only if it lies on a cycle.
+        """
+        cached = self._dependency_cache.get(project_id)
+        if cached is not None:
+            return cached
+
+        distances: Dict[str, int] = {}
+        queue = deque((dep, 1) for dep in self.graph.successors(project_id))
+        while queue:
+            node, hops = queue.popleft()
+            if node in distances:
+                continue
+            distances[node] = hops
+            for dep in self.graph.successors(node):
+                if dep not in distances:
+                    queue.append((dep, hops + 1))
+
+        self._dependency_cache[project_id] = distances
+        return distances
+
+    def get_transitive_dependencies(self, project_id: str) -> List[str]:
+        """
+        Get every project reachable from project_id (unbounded depth)
 
-        dependencies.update(direct_deps)
+        Args:
+            project_id: Project identifier
 
-        # Transitive dependencies
-        if depth > 1:
-            for dep in direct_deps:
-                transitive = self.get_dependencies(dep, depth - 1)
-                dependencies.update(transitive)
+        Returns:
+            List of project IDs
+        """
+        if not self.graph.has_node(project_id):
+            return []
+        self._ensure_reachability()
+        reach = self._reach.get(project_id, 0)
+        return [node for node, bit in self._node_bits.items() if reach & bit]
 
-        return list(dependencies)
+    def is_reachable(self, from_id: str, to_id: str) -> bool:
+        """
+        Check whether from_id depends on to_id directly or transitively
+
+        Args:
+            from_id: Source project ID
+            to_id: Target project ID
+
+        Returns:
+            True if a dependency path exists
+        """
+        self._ensure_reachability()
+        bit = self._node_bits.get(to_id)
+        return bit is not None and bool(self._reach.get(from_id, 0) & bit)
 
     def get_dependents(self, project_id: str) -> List[str]:
         """
@@ -409,6 +465,12 @@ class ProjectRelationshipGraph:
 
         related = []
 
+        # Embedding-based similarity to other projects in the graph
+        if self.centroid_index is not None:
+            for other, similarity in self.centroid_index.related(project_id, threshold):
+                if self.graph.has_node(other):
+                    related.append((other, similarity))
+
         # Check semantic similarity edges
         if NETWORKX_AVAILABLE:
             for neighbor in self.graph.neighbors(project_id):
@@ -426,6 +488,13 @@ class ProjectRelationshipGraph:
                     if weight >= threshold:
                         related.append((neighbor, weight))
 
+        # Keep the best score per project (edge or embedding)
+        best: Dict[str, float] = {}
+        for other, similarity in related:
+            if similarity > best.get(other, -1.0):
+                best[other] = similarity
+        related = list(best.items())
+
         # Sort by similarity score (descending)
         related.sort(key=lambda x: x[1], reverse=True)
         return related
@@ -453,12 +522,9 @@ class ProjectRelationshipGraph:
         """
         Compute embedding-based similarity between projects
 
-        Note: Full implementation would require:
-        - Project-level embeddings (aggregate of file embeddings)
-        - Cosine similarity computation
-        - Caching for performance
-
-        This is a placeholder for future enhancement.
+        Uses project centroid embeddings maintained by the vector store
+        (see ProjectCentroidIndex). Returns 0.0 when no centroid index is
+        attached or either project has no vectors yet.
 
         Args:
             project_a: First project ID
@@ -467,18 +533,32 @@ class ProjectRelationshipGraph:
         Returns:
             Similarity score (0.0-1.0)
         """
+        self._sync_similarity_cache()
+
         # Check cache
         cache_key = tuple(sorted([project_a, project_b]))
-        if cache_key in self.semantic_similarity_cache:
-            return self.semantic_similarity_cache[cache_key]
+        if cache_key in self._semantic_similarity_cache:
+            return self._semantic_similarity_cache[cache_key]
 
-        # Placeholder: return 0.0 (no similarity)
-        similarity = 0.0
-        self.semantic_similarity_cache[cache_key] = similarity
+        if self.centroid_index is None:
+            similarity = 0.0
+        else:
+            similarity = self.centroid_index.similarity(project_a, project_b)
+        self._semantic_similarity_cache[cache_key] = similarity
 
-        logger.debug(f"Semantic similarity {project_a} <-> {project_b}: {similarity} (placeholder)")
+        logger.debug(f"Semantic similarity {project_a} <-> {project_b}: {similarity:.3f}")
         return similarity
 
+    def _sync_similarity_cache(self) -> None:
+        """Drop cached similarities when project embeddings have changed"""
+        if self.centroid_index is None:
+            return
+        version = self.centroid_index.version
+        if version != self._semantic_similarity_version:
+            self._semantic_similarity_cache.clear()
+            self._boost_cache.clear()
+            self._semantic_similarity_version = version
+
     def get_relationship_boost_factors(
         self, source_project: str, boost_factor: float = 1.5
     ) -> Dict[str, float]:
@@ -499,6 +579,12 @@ class ProjectRelationshipGraph:
         if not self.graph.has_node(source_project):
             return boosts
 
+        self._sync_similarity_cache()
+        cache_key = (source_project, boost_factor)
+        cached = self._boost_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         # Direct dependencies get full boost
         dependencies = self.get_dependencies(source_project, depth=1)
         for dep in dependencies:
@@ -522,7 +608,8 @@ class ProjectRelationshipGraph:
             if project not in boosts:
                 boosts[project] = 1.0 + (boost_factor - 1.0) * similarity
 
-        return boosts
+        self._boost_cache[cache_key] = boosts
+        return dict(boosts)
 
     def has_relationship(self, from_id: str, to_id: str) -> bool:
         """
@@ -547,9 +634,10 @@ class ProjectRelationshipGraph:
                 return True
 
         # Check semantic similarity cache
+        self._sync_similarity_cache()
         cache_key = tuple(sorted([from_id, to_id]))
-        if cache_key in self.semantic_similarity_cache:
-            return self.semantic_similarity_cache[cache_key] > 0.5
+        if cache_key in self._semantic_similarity_cache:
+            return self._semantic_similarity_cache[cache_key] > 0.5
 
         return False
 
@@ -938,10 +1026,75 @@ class ProjectRelationshipGraph:
 
     # ==================== Cache Management ====================
 
-    def _invalidate_cache(self) -> None:
-        """Invalidate all caches"""
+    def _invalidate_cache(self, added_edge: Optional[Tuple[str, str]] = None) -> None:
+        """
+        Invalidate all caches
+
+        Args:
+            added_edge: When the only change is a new edge, the reachability
+                index is updated in place instead of being rebuilt
+        """
         self._cache_valid = False
         self._dependency_cache.clear()
+        self._boost_cache.clear()
+
+        if added_edge is not None and self._reach_valid:
+            from_id, to_id = added_edge
+            from_bit = self._node_bits.get(from_id)
+            to_bit = self._node_bits.get(to_id)
+            if from_bit is not None and to_bit is not None:
+                # Everything that reaches from_id (and from_id itself) now reaches to_id's closure
+                gained = to_bit | self._reach[to_id]
+                for node, reach in self._reach.items():
+                    if node == from_id or reach & from_bit:
+                        self._reach[node] = reach | gained
+                return
+        self._reach_valid = False
+
+    def _ensure_reachability(self) -> None:
+        """Rebuild the transitive-closure bitsets if they were invalidated"""
+        if self._reach_valid:
+            return
+
+        nodes = list(self.graph.nodes)
+        self._node_bits = {node: 1 << i for i, node in enumerate(nodes)}
+        successors = {node: list(self.graph.successors(node)) for node in nodes}
+
+        # Iterative DFS post-order: successors are finalized before their
+        # predecessors, so an acyclic graph converges in a single pass
+        order: List[str] = []
+        visited: Set[str] = set()
+        for root in nodes:
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(successors[root]))]
+            while stack:
+                node, children = stack[-1]
+                for child in children:
+                    if child not in visited:
+                        visited.add(child)
+                        stack.append((child, iter(successors[child])))
+                        break
+                else:
+                    stack.pop()
+                    order.append(node)
+
+        reach = {node: 0 for node in nodes}
+        changed = True
+        while changed:
+            # Extra passes are only needed for cycles
+            changed = False
+            for node in order:
+                value = reach[node]
+                for child in successors[node]:
+                    value |= self._node_bits[child] | reach[child]
+                if value != reach[node]:
+                    reach[node] = value
+                    changed = True
+
+        self._reach = reach
+        self._reach_valid = True
 
     def refresh_cache(self) -> None:
         """Refresh all caches"""
@@ -1012,15 +1165,20 @@ class ProjectRelationshipGraph:
         if not has_from or not has_to:
             return []
 
+        self._ensure_reachability()
+        if from_id != to_id and not self.is_reachable(from_id, to_id):
+            return []
+
         if NETWORKX_AVAILABLE:
             try:
                 paths = nx.all_simple_paths(self.graph, from_id, to_id)
-                return list(paths)[:max_paths]
+                return list(islice(paths, max_paths))
             except nx.NetworkXNoPath:
                 return []
         else:
-            # DFS to find all simple paths
+            # DFS to find all simple paths, skipping branches that cannot reach the target
             all_paths = []
+            target_bit = self._node_bits[to_id]
 
             def dfs(current, target, path, visited):
                 if current == target:
@@ -1031,7 +1189,9 @@ class ProjectRelationshipGraph:
                     return
 
                 for neighbor in self.graph.successors(current):
-                    if neighbor not in visited:
+                    if neighbor not in visited and (
+                        neighbor == target or self._reach[neighbor] & target_bit
+                    ):
                         visited.add(neighbor)
                         path.append(neighbor)
                         dfs(neighbor, target, path, visited)
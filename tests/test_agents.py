@@ -31,6 +31,7 @@ from src.agents.testing_agent import TestingAgent
 from src.agents.review_agent import ReviewAgent
 from src.agents.pr_agent import PRAgent
 from src.agents.orchestrator import AgentOrchestrator
+from src.agents.scheduler import TaskScheduler
 
 
 @pytest.fixture
@@ -458,6 +459,99 @@ class TestOrchestrator:
         assert result.plan is not None or result.error is not None
 
 
+class TestTaskScheduler:
+    """Test dependency-driven task scheduling"""
+
+    def test_critical_path_lengths(self):
+        """Critical path includes the task's own effort and its longest dependent chain"""
+        plan = ExecutionPlan(request="Test", tasks=[
+            Task(id="a", description="A", type="add", files=[], estimated_effort=1),
+            Task(id="b", description="B", type="add", files=[], dependencies=["a"], estimated_effort=5),
+            Task(id="c", description="C", type="add", files=[], dependencies=["a"], estimated_effort=1),
+            Task(id="d", description="D", type="add", files=[], dependencies=["c"], estimated_effort=1),
+        ])
+
+        assert plan.critical_path_lengths() == {"a": 6, "b": 5, "c": 2, "d": 1}
+        assert plan.get_dependents()["a"] == ["b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_tasks_start_when_own_dependencies_complete(self):
+        """A dependent starts without waiting for a slow sibling of its dependency"""
+        plan = ExecutionPlan(request="Test", tasks=[
+            Task(id="slow", description="Slow", type="add", files=[]),
+            Task(id="fast", description="Fast", type="add", files=[]),
+            Task(id="next", description="Next", type="add", files=[], dependencies=["fast"]),
+        ])
+        delays = {"slow": 0.2, "fast": 0.01, "next": 0.01}
+        events = []
+
+        async def run_task(task):
+            events.append(("start", task.id))
+            await asyncio.sleep(delays[task.id])
+            events.append(("end", task.id))
+            return task.id.upper()
+
+        async def followup(task, result):
+            events.append(("followup", task.id))
+            return result.lower()
+
+        outcome = await TaskScheduler(max_concurrency=4).run(plan, run_task, followup)
+
+        assert events.index(("start", "next")) < events.index(("end", "slow"))
+        assert events.index(("followup", "fast")) < events.index(("end", "slow"))
+        assert outcome.results == {"slow": "SLOW", "fast": "FAST", "next": "NEXT"}
+        assert outcome.followup_results == {"slow": "slow", "fast": "fast", "next": "next"}
+        assert all(task.status == TaskStatus.COMPLETED for task in plan.tasks)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_and_critical_path_priority(self):
+        """At most max_concurrency jobs run; the longest chain starts first"""
+        plan = ExecutionPlan(request="Test", tasks=[
+            Task(id=f"leaf-{i}", description="Leaf", type="add", files=[]) for i in range(4)
+        ] + [
+            Task(id="root", description="Root", type="add", files=[], estimated_effort=3),
+            Task(id="after-root", description="After", type="add", files=[], dependencies=["root"]),
+        ])
+        started = []
+        active = 0
+        peak = 0
+
+        async def run_task(task):
+            nonlocal active, peak
+            started.append(task.id)
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return task.id
+
+        outcome = await TaskScheduler(max_concurrency=2).run(plan, run_task)
+
+        assert peak == 2
+        assert started[0] == "root"
+        assert outcome.success
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_dependents(self):
+        """Dependents of a failed task are never started"""
+        plan = ExecutionPlan(request="Test", tasks=[
+            Task(id="bad", description="Bad", type="add", files=[]),
+            Task(id="child", description="Child", type="add", files=[], dependencies=["bad"]),
+        ])
+
+        async def run_task(task):
+            if task.id == "bad":
+                raise RuntimeError("boom")
+            return task.id
+
+        outcome = await TaskScheduler().run(plan, run_task)
+
+        assert outcome.failed == ["bad"]
+        assert outcome.skipped == ["child"]
+        assert plan.tasks[0].error == "boom"
+        assert plan.tasks[1].status == TaskStatus.SKIPPED
+
+
 class TestIntegration:
     """Integration tests for full agent workflow"""
 
@@ -0,0 +1,117 @@
+"""
+Unit tests for incremental anomaly detection and metric-indexed alert rules
+"""
+
+import random
+
+import pytest
+
+from src.analytics.alerting import (
+    AlertManager,
+    AlertRule,
+    AlertSeverity,
+    AnomalyDetector,
+    ComparisonOperator,
+    RollingStats,
+)
+
+
+def _naive_detector(values, window_size, std_threshold):
+    window, flags = [], []
+    for value in values:
+        if len(window) < window_size:
+            window.append(value)
+            flags.append(False)
+            continue
+        mean = sum(window) / len(window)
+        std = (sum((x - mean) ** 2 for x in window) / len(window)) ** 0.5
+        flags.append(abs(value - mean) > std_threshold * std)
+        window.append(value)
+        window.pop(0)
+    return flags
+
+
+def test_rolling_stats_match_full_recomputation():
+    rng = random.Random(3)
+    stats = RollingStats(50)
+    stats.RECOMPUTE_EVERY = 10**9  # exercise the incremental path only
+    values = [rng.gauss(100, 15) for _ in range(2000)]
+    for i, value in enumerate(values):
+        stats.push(value)
+        window = values[max(0, i - 49): i + 1]
+        mean = sum(window) / len(window)
+        assert stats.mean == pytest.approx(mean)
+        assert stats.variance == pytest.approx(
+            sum((x - mean) ** 2 for x in window) / len(window), rel=1e-6, abs=1e-9
+        )
+
+
+def test_window_detector_matches_previous_behaviour():
+    rng = random.Random(11)
+    values = [rng.gauss(10, 1) for _ in range(500)]
+    values[100] = 40.0
+    values[300] = -25.0
+
+    detector = AnomalyDetector(window_size=20, std_threshold=3.0)
+    flags = [detector.add_datapoint("latency", v) for v in values]
+
+    assert flags == _naive_detector(values, 20, 3.0)
+    assert flags[100] and flags[300]
+    assert len(detector.data_windows["latency"]) == 20
+
+
+def test_ewma_detector_follows_drift():
+    detector = AnomalyDetector(window_size=10, std_threshold=4.0, method="ewma")
+    flags = [detector.add_datapoint("qps", 100 + i * 0.5 + (i % 3)) for i in range(300)]
+    assert not any(flags)
+    assert detector.add_datapoint("qps", 1000.0)
+
+
+def test_seasonal_baselines_are_separate():
+    detector = AnomalyDetector(window_size=5, std_threshold=3.0, season_period=86400, season_buckets=24)
+    day = 86400
+    for d in range(6):
+        detector.add_datapoint("load", 10.0 + (d % 2) * 0.5, timestamp=d * day + 3 * 3600)   # 03:00, quiet
+        detector.add_datapoint("load", 90.0 + (d % 2) * 0.5, timestamp=d * day + 15 * 3600)  # 15:00, busy
+
+    assert detector.get_baseline("load", timestamp=3 * 3600)["mean"] == pytest.approx(10.3)
+
+    # Normal for 15:00, anomalous for 03:00
+    assert not detector.add_datapoint("load", 90.2, timestamp=7 * day + 15 * 3600)
+    assert detector.add_datapoint("load", 90.2, timestamp=7 * day + 3 * 3600)
+
+
+@pytest.mark.asyncio
+async def test_alert_manager_evaluates_only_matching_rules():
+    manager = AlertManager()
+    for i in range(50):
+        manager.add_rule(AlertRule(
+            name=f"rule_{i}",
+            metric=f"metric_{i}",
+            threshold=1.0,
+            operator=ComparisonOperator.GREATER_THAN,
+            severity=AlertSeverity.WARNING,
+        ))
+    manager.add_rule(AlertRule(
+        name="rule_0_low",
+        metric="metric_0",
+        threshold=0.0,
+        operator=ComparisonOperator.LESS_THAN,
+        severity=AlertSeverity.INFO,
+    ))
+
+    await manager.evaluate({"metric_0": 5.0, "unrelated": 99.0})
+    assert [a.rule_name for a in manager.get_active_alerts()] == ["rule_0"]
+
+    # Re-adding a rule under a new metric moves it in the index
+    manager.add_rule(AlertRule(
+        name="rule_0",
+        metric="metric_x",
+        threshold=1.0,
+        operator=ComparisonOperator.GREATER_THAN,
+        severity=AlertSeverity.WARNING,
+    ))
+    assert set(manager.rules_by_metric["metric_0"]) == {"rule_0_low"}
+
+    manager.remove_rule("rule_0_low")
+    assert "metric_0" not in manager.rules_by_metric
@@ -2,6 +2,9 @@
 Unit tests for Audit Logging (Story 4-2)
 """
 
+import json
+import os
+
 from src.security.audit import record_event, read_events
 
 
@@ -16,3 +19,58 @@ def test_audit_record_and_read(tmp_path, monkeypatch):
     events = read_events()
     assert len(events) == 2
     assert events[0]["type"] == "test"
+
+
+def test_audit_log_rotates_and_reads_across_files(tmp_path):
+    from src.security.audit import AuditLog
+
+    log = AuditLog(str(tmp_path / "audit.log"), max_bytes=200, backup_count=3, tail_size=4)
+    for i in range(12):
+        log.append({"type": "t", "i": i})
+    log.close()
+
+    assert (tmp_path / "audit.log.1").exists()
+    assert os.path.getsize(tmp_path / "audit.log") <= 200
+
+    # Served from the in-memory tail, then from disk beyond it
+    assert [e["i"] for e in log.tail(3)] == [9, 10, 11]
+    fresh = AuditLog(str(tmp_path / "audit.log"), max_bytes=200, backup_count=3, tail_size=4)
+    assert [e["i"] for e in fresh.tail(8)] == list(range(4, 12))
+
+
+def test_audit_log_sees_appends_from_other_writers(tmp_path):
+    from src.security.audit import AuditLog
+
+    path = str(tmp_path / "audit.log")
+    log = AuditLog(path)
+    log.append({"i": 0})
+    assert [e["i"] for e in log.tail()] == [0]
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"i": 1}) + "\n")
+    log.append({"i": 2})
+
+    assert [e["i"] for e in log.tail()] == [0, 1, 2]
+    log.close()
+
+
+def test_audit_log_follows_rotation_by_another_writer(tmp_path):
+    from src.security.audit import AuditLog
+
+    path = str(tmp_path / "audit.log")
+    rotating = AuditLog(path, max_bytes=20, backup_count=2)
+    other = AuditLog(path, max_bytes=0)
+    other.append({"i": 0})
+    rotating.append({"i": 1})
+    rotating.append({"i": 2})  # rotates audit.log -> audit.log.1
+    assert os.path.exists(path + ".1")
+
+    other.append({"i": 3})
+    rotating.close()
+    other.close()
+
+    # The second writer reopened the new active file instead of the rotated one
+    with open(path + ".1", encoding="utf-8") as f:
+        assert [json.loads(line)["i"] for line in f] == [0, 1]
+    assert [e["i"] for e in AuditLog(path).tail()] == [0, 1, 2, 3]
+    assert [e["i"] for e in other.tail()] == [0, 1, 2, 3]
@@ -0,0 +1,74 @@
+"""
+Unit tests for the sharded L1 LRUCache in src.caching.query_cache
+"""
+
+import threading
+
+from src.caching.query_cache import LRUCache, estimate_size
+
+
+def test_eviction_decrements_size():
+    cache = LRUCache(max_size_bytes=1000, ttl_seconds=60, segments=1)
+    for i in range(20):
+        cache.set(f"k{i}", i, size=100)
+
+    # Budget holds exactly 10 entries; older ones evicted one at a time
+    assert cache.item_count() == 10
+    assert cache.size_bytes() == 1000
+    assert cache.eviction_count() == 10
+    assert cache.get("k19") == 19
+    assert cache.get("k0") is None
+
+
+def test_overwrite_does_not_double_count():
+    cache = LRUCache(max_size_bytes=1000, ttl_seconds=60, segments=1)
+    cache.set("a", "x", size=300)
+    cache.set("a", "y", size=200)
+    assert cache.size_bytes() == 200
+    assert cache.get("a") == "y"
+    assert cache.eviction_count() == 0
+
+
+def test_on_evict_callback_receives_size():
+    evicted = []
+    cache = LRUCache(
+        max_size_bytes=200, ttl_seconds=60, segments=1, on_evict=lambda k, s: evicted.append((k, s))
+    )
+    cache.set("a", 1, size=150)
+    cache.set("b", 2, size=150)
+    assert evicted == [("a", 150)]
+
+
+def test_delete_and_clear_reset_accounting():
+    cache = LRUCache(max_size_bytes=10_000, ttl_seconds=60, segments=4)
+    for i in range(8):
+        cache.set(f"k{i}", i, size=10)
+    assert cache.delete("k0") is True
+    assert cache.delete("k0") is False
+    assert cache.size_bytes() == 70
+    cache.clear()
+    assert cache.size_bytes() == 0
+    assert cache.item_count() == 0
+
+
+def test_estimate_size_scales_with_content():
+    small = [{"file": "a.py", "score": 0.5}]
+    large = small * 1000
+    assert estimate_size(large) > estimate_size(small) * 100
+
+
+def test_concurrent_writers_keep_size_consistent():
+    cache = LRUCache(max_size_bytes=5_000, ttl_seconds=60, segments=8)
+
+    def worker(offset):
+        for i in range(500):
+            cache.set(f"{offset}-{i}", i, size=50)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert cache.size_bytes() == cache.item_count() * 50
+    assert cache.size_bytes() <= 5_000
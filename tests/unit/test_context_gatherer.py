@@ -0,0 +1,78 @@
+"""
+Unit tests for deadline-aware context gathering
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from src.prompt.context_gatherer import ContextChunk, ContextGatherer, UserContext
+
+
+class FakeGatherer:
+    def __init__(self, source, delay=0.0, fail=False):
+        self.source = source
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = False
+
+    async def gather(self, *args):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise RuntimeError("boom")
+        chunk = ContextChunk(source=self.source)
+        chunk.add("file", f"{self.source} content", priority=1.0)
+        return chunk
+
+
+def _gatherer(**config):
+    gatherer = ContextGatherer(config=config)
+    gatherer.current_gatherer = FakeGatherer("current")
+    gatherer.code_gatherer = FakeGatherer("code", delay=0.01)
+    gatherer.history_gatherer = FakeGatherer("history", delay=5.0)
+    gatherer.team_gatherer = FakeGatherer("team", fail=True)
+    return gatherer
+
+
+PROMPT = SimpleNamespace(original_prompt="fix it", entities=[], context_types=["code", "history", "team"])
+USER = UserContext(workspace_path="/ws")
+
+
+async def test_completed_sources_survive_a_straggler():
+    gatherer = _gatherer(gather_timeout=0.2, source_timeouts={"history": 0.05})
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    raw = await gatherer.gather(PROMPT, USER)
+
+    assert loop.time() - start < 1.0
+    assert sorted(chunk.source for chunk in raw.chunks) == ["code", "current"]
+    assert sorted(raw.incomplete_sources) == ["history", "team"]
+    assert not raw.complete
+    assert gatherer.history_gatherer.cancelled
+
+
+async def test_incomplete_context_is_not_cached():
+    gatherer = _gatherer(gather_timeout=0.05)
+
+    await gatherer.gather(PROMPT, USER)
+    await gatherer.gather(PROMPT, USER)
+
+    assert gatherer.current_gatherer.calls == 2
+
+
+async def test_complete_context_is_cached():
+    gatherer = _gatherer()
+    prompt = SimpleNamespace(original_prompt="explain", entities=[], context_types=["code"])
+
+    first = await gatherer.gather(prompt, USER)
+    second = await gatherer.gather(prompt, USER)
+
+    assert first.complete
+    assert second is first
+    assert gatherer.code_gatherer.calls == 1
@@ -0,0 +1,116 @@
+"""
+Unit tests for ConversationStore similarity search hydration
+"""
+
+import sys
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.memory.models import Base, Conversation
+from src.memory.conversation import ConversationStore
+
+
+class FakeQdrant:
+    """Returns preset hits in score order and records search calls"""
+
+    def __init__(self):
+        self.hits = []
+        self.searches = 0
+
+    def get_collections(self):
+        return SimpleNamespace(collections=[SimpleNamespace(name=ConversationStore.COLLECTION_NAME)])
+
+    def search(self, collection_name, query_vector, query_filter, limit, with_payload):
+        self.searches += 1
+        return self.hits[:limit]
+
+
+@pytest.fixture(autouse=True)
+def qdrant_models():
+    # The unit conftest mocks qdrant_client as a plain module, not a package
+    with patch.dict(sys.modules, {"qdrant_client.models": Mock()}):
+        yield
+
+
+@pytest.fixture
+def store():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+
+    @contextmanager
+    def get_session():
+        session = SessionLocal()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    statements = []
+    event.listen(
+        engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    qdrant = FakeQdrant()
+    with patch("src.memory.conversation.get_db_manager", return_value=Mock(get_session=get_session)), \
+            patch("src.memory.conversation.get_qdrant_client", return_value=qdrant), \
+            patch("src.memory.conversation.SentenceTransformer"):
+        conversation_store = ConversationStore()
+    conversation_store._generate_embedding = lambda text: [0.1] * ConversationStore.VECTOR_SIZE
+
+    ids = [uuid4() for _ in range(4)]
+    with get_session() as session:
+        for i, conversation_id in enumerate(ids):
+            session.add(Conversation(id=conversation_id, user_id="u1", prompt=f"prompt {i}"))
+
+    # Qdrant ranks in reverse insertion order; the last hit has no DB row
+    qdrant.hits = [
+        SimpleNamespace(id=str(cid), score=0.9 - 0.1 * i, payload={"prompt": f"prompt {3 - i}"})
+        for i, cid in enumerate(reversed(ids))
+    ] + [SimpleNamespace(id=str(uuid4()), score=0.1, payload={"prompt": "gone"})]
+    statements.clear()
+    return conversation_store, ids, statements
+
+
+def test_hydration_uses_single_query_and_keeps_score_order(store):
+    conversation_store, ids, statements = store
+
+    results = conversation_store.get_similar_conversations("prompt", limit=5)
+
+    assert [r["conversation"].id for r in results] == list(reversed(ids))
+    assert [r["conversation_id"] for r in results] == list(reversed(ids))
+    assert results[0]["similarity_score"] == pytest.approx(0.9)
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+
+
+def test_payload_only_results_skip_database(store):
+    conversation_store, ids, statements = store
+
+    results = conversation_store.get_similar_conversations("prompt", limit=2, hydrate=False)
+
+    assert [r["conversation_id"] for r in results] == [ids[3], ids[2]]
+    assert all(r["conversation"] is None for r in results)
+    assert results[0]["payload"] == {"prompt": "prompt 3"}
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_async_search_matches_sync_results(store):
+    conversation_store, ids, _ = store
+
+    with patch("src.vector_db.embeddings.get_embedding_service", side_effect=RuntimeError("down")):
+        results = await conversation_store.aget_similar_conversations("prompt", limit=3)
+
+    assert [r["conversation_id"] for r in results] == [ids[3], ids[2], ids[1]]
+    assert conversation_store.qdrant_client.searches == 1
@@ -362,3 +362,62 @@ class TestSimilarityDetector:
         assert data["source_symbol"] == "create_user"
         assert data["target_symbol"] == "createUser"
         assert data["evidence"]["name_similarity"] == 0.9
+
+    def _clone_corpus(self):
+        """Two clone pairs across languages plus unrelated filler symbols."""
+        def result(path, language, names):
+            symbols = [
+                SymbolInfo(
+                    name=name,
+                    type="function",
+                    line_start=1,
+                    line_end=5,
+                    parameters=[ParameterInfo(name="value", type_hint="str")],
+                    return_type="str",
+                )
+                for name in names
+            ]
+            return ParseResult(
+                file_path=Path(path), language=language, symbols=symbols, ast_root=None
+            )
+
+        filler = [f"helper{i}_{'x' * (i % 7)}" for i in range(40)]
+        return [
+            result("users.py", Language.PYTHON, ["create_user", "load_config"] + filler[:20]),
+            result("users.ts", Language.TYPESCRIPT, ["createUser", "loadConfig"] + filler[20:]),
+        ]
+
+    def test_lsh_candidates_match_exhaustive_search(self):
+        """LSH blocking keeps the obvious clones found by the all-pairs path."""
+        parse_results = self._clone_corpus()
+        exhaustive = SimilarityDetector().find_similarities(parse_results, 0.65)
+        blocked = SimilarityDetector(exhaustive_limit=0).find_similarities(parse_results, 0.65)
+
+        pairs = {(m.source_symbol, m.target_symbol) for m in blocked}
+        assert ("create_user", "createUser") in pairs
+        assert ("load_config", "loadConfig") in pairs
+        assert pairs <= {(m.source_symbol, m.target_symbol) for m in exhaustive}
+
+    def test_upper_bound_never_prunes_a_match(self):
+        """Vectorized bound is >= the exact score for every pair."""
+        signatures = self.detector._generate_signatures(self._clone_corpus())
+        features = self.detector._build_features(signatures)
+        left, right = next(self.detector._all_pair_blocks(len(signatures)))
+
+        for threshold in (0.5, 0.7, 0.9):
+            keep = self.detector._upper_bound_mask(features, left, right, threshold)
+            for i, j, kept in zip(left.tolist(), right.tolist(), keep.tolist()):
+                sig1, _, sym1 = signatures[i]
+                sig2, _, sym2 = signatures[j]
+                score, _, _ = self.detector._calculate_similarity(sig1, sig2, sym1, sym2)
+                if score >= threshold:
+                    assert kept
+
+    def test_iter_similarities_streams_matches(self):
+        """Streaming mode yields the same matches as find_similarities."""
+        parse_results = self._clone_corpus()
+        streamed = [m.to_dict() for m in self.detector.iter_similarities(parse_results, 0.65)]
+        assert streamed == [
+            m.to_dict() for m in SimilarityDetector().find_similarities(parse_results, 0.65)
+        ]
+        assert self.detector.stats["similarities_found"] == len(streamed)
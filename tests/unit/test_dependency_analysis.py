@@ -75,3 +75,22 @@ def test_impact_of_change_depends_on_transitive():
     analyzer = DependencyAnalyzer([pr_a, pr_b, pr_c])
     impacted = analyzer.impact_of_change("c.py")
     assert impacted == {"b.py", "a.py"}
+
+
+def test_symbol_index_resolution_and_incremental_updates():
+    from src.analysis.symbol_index import SymbolIndex
+
+    pr_mod = make_pr("src/pkg/mod.py", classes=[ClassInfo(name="Mod", line_start=1, line_end=2)])
+    pr_other = make_pr("lib/mybar.py")
+    index = SymbolIndex([pr_mod, pr_other])
+
+    assert index.resolve_module_path("pkg.mod") == "src/pkg/mod.py"
+    assert index.resolve_module_path("bar") == "lib/mybar.py"
+    assert index.files_defining_class("Mod") == ["src/pkg/mod.py"]
+    assert index.files_matching_module("pkg.unknown") == ["src/pkg/mod.py"]
+
+    # Re-parsed file without the class drops it from the index
+    index.sync([make_pr("src/pkg/mod.py"), pr_other])
+    assert index.files_defining_class("Mod") == []
+    index.sync([pr_other])
+    assert index.resolve_module_path("pkg.mod") is None
@@ -0,0 +1,106 @@
+"""
+Unit tests for the long-lived git repository reader
+"""
+
+import os
+import subprocess
+
+import pytest
+
+from src.git.reader import GitRepoReader, get_git_reader, relative_time
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _commit(repo, path, content, author="Alice <alice@example.com>", message=None):
+    full = os.path.join(repo, path)
+    os.makedirs(os.path.dirname(full), exist_ok=True)
+    with open(full, "w") as f:
+        f.write(content)
+    _git(repo, "add", path)
+    _git(repo, "commit", "-q", f"--author={author}", "-m", message or f"edit {path}")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = str(tmp_path / "repo")
+    os.makedirs(path)
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "config", "user.email", "ci@example.com")
+    _git(path, "config", "user.name", "CI")
+    _commit(path, "src/app.py", "print('v1')\n")
+    _commit(path, "src/app.py", "print('v2')\n", author="Bob <bob@example.com>")
+    _commit(path, "README.md", "# readme\n")
+    return path
+
+
+def test_history_served_from_memory_until_head_moves(repo):
+    reader = GitRepoReader(repo)
+    commits = reader.recent_commits(10)
+    assert [c.subject for c in commits] == ["edit README.md", "edit src/app.py", "edit src/app.py"]
+    assert commits[0].files == ["README.md"]
+
+    processes = reader.stats["git_processes"]
+    reader.recent_commits(10)
+    assert [c.author_name for c in reader.commits_for_path("src/app.py")] == ["Bob", "Alice"]
+    assert [c.subject for c in reader.commits_by_author("alice@", 5)] == ["edit README.md", "edit src/app.py"]
+    assert reader.stats["git_processes"] == processes
+
+    # New commit: only the new range is read
+    _commit(repo, "src/app.py", "print('v3')\n", author="Bob <bob@example.com>")
+    assert reader.head() == subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True
+    ).stdout.strip()
+    assert len(reader.commits_for_path("src/app.py")) == 3
+    assert reader.stats["history_updates"] == 1
+    assert reader.stats["history_loads"] == 1
+
+    # Rewritten history is reloaded
+    _git(repo, "reset", "-q", "--hard", "HEAD~2")
+    assert len(reader.recent_commits(10)) == 2
+    assert reader.stats["history_loads"] == 2
+
+
+def test_show_uses_one_cat_file_process(repo):
+    reader = GitRepoReader(repo)
+    processes = reader.stats["git_processes"]
+    assert reader.show("HEAD", "src/app.py") == "print('v2')\n"
+    assert reader.show("HEAD~2", "src/app.py") == "print('v1')\n"
+    assert reader.show("HEAD", "missing.py") is None
+    assert reader.show("HEAD", "README.md") == "# readme\n"
+    assert reader.stats["git_processes"] == processes + 1
+    reader.close()
+
+    # A closed (e.g. evicted) reader never respawns cat-file
+    assert reader.show("HEAD", "src/app.py") is None
+    assert reader._cat_file is None
+    assert reader.stats["git_processes"] == processes + 1
+
+
+def test_blame_cached_per_head_and_mtime(repo):
+    reader = GitRepoReader(repo)
+    blame = reader.blame("src/app.py")
+    assert "author Bob" in blame
+    assert reader.blame("src/app.py") == blame
+    assert reader.stats["blame_hits"] == 1
+
+    _commit(repo, "src/app.py", "print('v3')\nprint('more')\n")
+    assert "author Alice" in reader.blame("src/app.py")
+    assert reader.stats["blame_misses"] == 2
+    assert reader.blame("untracked.py") is None
+
+
+def test_subdirectory_paths_and_registry(repo, tmp_path):
+    reader = get_git_reader(os.path.join(repo, "src"))
+    assert reader is get_git_reader(os.path.join(repo, "src"))
+    assert len(reader.commits_for_path("app.py")) == 2
+    assert reader.blame("app.py") is not None
+    assert get_git_reader(str(tmp_path)) is None
+
+
+def test_relative_time():
+    assert relative_time(0, now=30) == "30 seconds ago"
+    assert relative_time(0, now=3 * 3600) == "3 hours ago"
+    assert relative_time(0, now=3 * 86400) == "3 days ago"
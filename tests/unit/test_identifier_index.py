@@ -0,0 +1,131 @@
+"""
+Unit tests for the in-process identifier index and its use in code context gathering
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.indexing.identifier_index import IdentifierIndex
+from src.prompt.context_gatherer import CodeContextGatherer
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text('"""Package"""\n')
+    (tmp_path / "pkg" / "auth.py").write_text(
+        "from pkg import tokens\n\n"
+        "class AuthService:\n"
+        "    def validate_token(self, token):\n"
+        "        return tokens.decode(token)\n"
+    )
+    (tmp_path / "pkg" / "tokens.py").write_text("def decode(token):\n    return token\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_auth.py").write_text("def test_validate_token():\n    pass\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "vendored.py").write_text("def decode(x):\n    pass\n")
+    return tmp_path
+
+
+def test_build_and_lookup(workspace):
+    index = IdentifierIndex()
+    # node_modules is pruned
+    assert index.build(workspace) == 4
+    assert index.covers(workspace / "pkg" / "auth.py")
+
+    [location] = index.lookup("authservice")
+    assert location.kind == "class"
+    assert location.file_path.endswith("auth.py")
+
+    [method] = index.lookup("AuthService.validate_token")
+    assert method.line == 4
+    assert [loc.file_path for loc in index.lookup("decode")] == [str(workspace / "pkg" / "tokens.py")]
+    assert index.get_imports(workspace / "pkg" / "auth.py") == ["pkg"]
+
+
+def test_refresh_replaces_and_removes_file_entries(workspace):
+    index = IdentifierIndex()
+    index.build(workspace)
+    tokens = workspace / "pkg" / "tokens.py"
+
+    tokens.write_text("def encode(token):\n    return token\n")
+    assert index.refresh_file(tokens)
+    assert index.lookup("decode") == []
+    assert len(index.lookup("encode")) == 1
+
+    tokens.unlink()
+    assert index.refresh_file(tokens)
+    assert index.lookup("encode") == []
+    assert not index.has_file(tokens)
+
+    # Files outside indexed roots are ignored
+    assert not index.refresh_file(workspace.parent / "elsewhere.py")
+
+
+async def test_code_gatherer_uses_index_without_subprocesses(workspace):
+    index = IdentifierIndex()
+    index.build(workspace)
+    gatherer = CodeContextGatherer(identifier_index=index)
+
+    with patch("asyncio.create_subprocess_exec", side_effect=AssertionError("spawned")):
+        results = await gatherer._search_identifier(str(workspace), "validate_token")
+        tests = await gatherer._find_test_files(str(workspace), "pkg/auth.py")
+        deps = await gatherer._get_dependencies(str(workspace), "pkg/auth.py")
+
+    assert [(r["file"], r["line"]) for r in results] == [("pkg/auth.py", 4)]
+    assert [path for path, _ in tests] == ["tests/test_auth.py"]
+    assert [path for path, _ in deps] == ["pkg/__init__.py"]
+
+
+async def test_unindexed_workspace_builds_in_background(workspace):
+    index = IdentifierIndex()
+    gatherer = CodeContextGatherer(identifier_index=index)
+
+    await gatherer._find_test_files(str(workspace), "pkg/auth.py")
+    await next(iter(gatherer._build_tasks.values()))
+
+    assert index.covers(workspace)
+
+
+def test_rebuild_reparses_only_changed_files_and_drops_deleted(workspace):
+    index = IdentifierIndex()
+    assert index.build(workspace) == 4
+    assert index.build(workspace) == 0
+
+    (workspace / "pkg" / "tokens.py").unlink()
+    (workspace / "pkg" / "extra.py").write_text("def decode(token):\n    return token\n")
+    assert index.build(workspace) == 1
+    assert [loc.file_path for loc in index.lookup("decode")] == [str(workspace / "pkg" / "extra.py")]
+
+
+async def test_edited_files_are_reparsed_before_results_are_served(workspace):
+    index = IdentifierIndex()
+    index.build(workspace)
+    gatherer = CodeContextGatherer(identifier_index=index)
+
+    auth = workspace / "pkg" / "auth.py"
+    auth.write_text("class AuthService:\n    pass\n")
+    os.utime(auth, ns=(auth.stat().st_atime_ns, auth.stat().st_mtime_ns + 1_000_000))
+
+    assert await gatherer._search_identifier(str(workspace), "validate_token") == []
+    assert await gatherer._get_dependencies(str(workspace), "pkg/auth.py") == []
+
+
+async def test_stale_snapshot_is_rebuilt_instead_of_served(workspace):
+    index = IdentifierIndex()
+    index.build(workspace)
+    gatherer = CodeContextGatherer(identifier_index=index, index_max_age=0.0)
+    (workspace / "pkg" / "session.py").write_text("def refresh_session():\n    pass\n")
+
+    with patch("asyncio.create_subprocess_exec", side_effect=FileNotFoundError):
+        assert await gatherer._search_identifier(str(workspace), "refresh_session") == []
+    await next(iter(gatherer._build_tasks.values()))
+    assert [loc.file_path for loc in index.lookup("refresh_session")] == [
+        str(workspace / "pkg" / "session.py")
+    ]
+
+    # Roots the indexer keeps current are always served
+    index.add_root(workspace)
+    assert gatherer._index_for(str(workspace)) is index
@@ -239,6 +239,28 @@ def test_attach_watcher_sets_callback(monkeypatch):
     idx = IncrementalIndexer()
     attach_watcher(w, idx)
     assert callable(w.on_change_callback)
+    assert callable(w.on_batch_callback)
+
+
+@pytest.mark.asyncio
+async def test_rescan_event_expands_to_changed_and_deleted_files(tmp_path: Path, monkeypatch):
+    from src.realtime.file_watcher import FileChangeEvent
+    from src.realtime.incremental_indexer import IncrementalIndexer
+
+    root = tmp_path.resolve()
+    kept = root / "kept.py"
+    kept.write_text("print(1)\n")
+    (root / "notes.txt").write_text("ignored\n")
+    gone = str(root / "gone.py")
+
+    idx = IncrementalIndexer()
+    idx._states[gone] = object()
+    await idx.enqueue_events([FileChangeEvent(event_type="rescan", file_path=str(root), timestamp=0.0)])
+
+    queued = []
+    while not idx._queue.empty():
+        queued.append(idx._queue.get_nowait())
+    assert sorted(queued) == [("deleted", gone), ("modified", str(kept))]
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,170 @@
+"""
+Unit tests for the staged workspace project indexing pipeline
+"""
+
+import asyncio
+import functools
+
+import pytest
+
+from src.workspace import manager as manager_module
+from src.workspace.config import ProjectConfig
+from src.workspace.index_pipeline import ProjectIndexPipeline
+from src.workspace.manager import Project, ProjectStats
+
+
+class FakeStore:
+    def __init__(self, fail_first: bool = False):
+        self.calls = []
+        self.fail_first = fail_first
+
+    async def add_vectors(self, project_id, vectors, project_metadata=None):
+        self.calls.append((project_id, vectors, project_metadata))
+        return not (self.fail_first and len(self.calls) == 1)
+
+    async def delete_vectors(self, project_id, file_paths):
+        self.calls.append((project_id, "delete", list(file_paths)))
+        return True
+
+
+class FakeEmbedder:
+    """Embeds every chunk except those of bad.py"""
+
+    def __init__(self):
+        self.batches = []
+
+    async def __call__(self, texts):
+        self.batches.append(list(texts))
+        await asyncio.sleep(0)
+        return [None if "bad.py" in t or "EMPTY" in t else [float(len(t)), 1.0] for t in texts]
+
+
+def chunk_lines(text):
+    return [line for line in text.split("\n") if line]
+
+
+def make_files(tmp_path, count):
+    paths = []
+    for i in range(count):
+        p = tmp_path / f"m{i}.py"
+        p.write_text(f"x = {i}\n")
+        paths.append(p)
+    return paths
+
+
+@pytest.mark.asyncio
+async def test_pipeline_batches_into_project_collection(tmp_path):
+    files = make_files(tmp_path, 20)
+    (tmp_path / "empty.py").write_text("   \n")
+    (tmp_path / "notes.txt").write_text("text")
+    (tmp_path / "bad.py").write_text("EMPTY\n")
+    files += [tmp_path / "empty.py", tmp_path / "notes.txt", tmp_path / "bad.py", tmp_path / "gone.py"]
+
+    stats = ProjectStats()
+    store = FakeStore()
+    embed = FakeEmbedder()
+    pipeline = ProjectIndexPipeline(
+        "proj",
+        iter(files),
+        store,
+        stats,
+        project_metadata={"name": "Proj", "type": "python"},
+        embed_texts=embed,
+        chunk_text=chunk_lines,
+        workers=3,
+        embed_batch_size=8,
+        queue_size=4,
+    )
+    await pipeline.run()
+
+    assert stats.total_files == 24
+    assert stats.files_indexed == 20
+    assert stats.files_skipped == 2  # empty file, unsupported extension
+    assert stats.errors == 2  # no embedding, unreadable
+    assert all(len(b) <= 8 + 1 for b in embed.batches)
+
+    stored = [v for _, vectors, _ in store.calls for v in vectors]
+    assert {c[0] for c in store.calls} == {"proj"}
+    assert store.calls[0][2] == {"name": "Proj", "type": "python"}
+    assert sorted(v["payload"]["file_name"] for v in stored) == sorted(f"m{i}.py" for i in range(20))
+    # Mean of the header and body chunk embeddings
+    first = next(v for v in stored if v["payload"]["file_name"] == "m0.py")
+    header = "Language: python | File: m0.py"
+    assert first["vector"] == [(len(header) + len("x = 0")) / 2, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_failed_upsert_counts_errors(tmp_path):
+    stats = ProjectStats()
+    pipeline = ProjectIndexPipeline(
+        "proj",
+        make_files(tmp_path, 3),
+        FakeStore(fail_first=True),
+        stats,
+        embed_texts=FakeEmbedder(),
+        chunk_text=chunk_lines,
+        workers=1,
+        embed_batch_size=100,
+    )
+    await pipeline.run()
+    assert stats.files_indexed + stats.errors == 3
+    assert stats.errors >= 1
+
+
+@pytest.mark.asyncio
+async def test_shared_budget_limits_concurrent_work(tmp_path):
+    budget = asyncio.Semaphore(2)
+    active = 0
+    peak = 0
+
+    async def slow_embed(texts):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return [[1.0] for _ in texts]
+
+    for i in range(3):
+        (tmp_path / f"p{i}").mkdir()
+    pipelines = [
+        ProjectIndexPipeline(
+            f"p{i}",
+            make_files(tmp_path / f"p{i}", 5),
+            FakeStore(),
+            ProjectStats(),
+            embed_texts=slow_embed,
+            chunk_text=chunk_lines,
+            budget=budget,
+            workers=4,
+            embed_batch_size=1,
+        )
+        for i in range(3)
+    ]
+    results = await asyncio.gather(*(p.run() for p in pipelines))
+    assert [s.files_indexed for s in results] == [5, 5, 5]
+    assert peak <= 2
+
+
+@pytest.mark.asyncio
+async def test_file_changes_update_the_project_collection(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        manager_module,
+        "ProjectIndexPipeline",
+        functools.partial(ProjectIndexPipeline, embed_texts=FakeEmbedder(), chunk_text=chunk_lines),
+    )
+    project = Project(ProjectConfig(id="proj", name="Proj", path=str(tmp_path)), workspace_manager=None)
+    project.vector_store = store = FakeStore()
+    source = tmp_path / "m.py"
+    source.write_text("x = 1\n")
+
+    await project._on_file_change("modified", str(source))
+    [(project_id, vectors, metadata)] = store.calls
+    assert project_id == "proj"
+    assert [v["id"] for v in vectors] == [str(source)]
+    assert metadata == {"name": "Proj", "type": "application"}
+
+    source.write_text("  \n")
+    await project._on_file_change("modified", str(source))
+    await project._on_file_change("deleted", str(source))
+    assert store.calls[1:] == [("proj", "delete", [str(source)])] * 2
@@ -0,0 +1,69 @@
+"""
+Unit tests for the in-process metrics backend (used without prometheus_client)
+"""
+
+import random
+
+import pytest
+
+from src.monitoring.metrics import DDSketch, Metrics, _InProcCounter, _InProcHistogram
+
+
+def test_histogram_memory_is_bounded_and_quantiles_accurate():
+    hist = _InProcHistogram("latency_seconds", "Latency", ("op",), buckets=(0.1, 1, 10))
+    rng = random.Random(7)
+    values = [rng.lognormvariate(0, 1) for _ in range(50_000)]
+    for v in values:
+        hist.labels("search").observe(v)
+
+    child = hist.labels("search")
+    assert child is hist.labels(op="search")  # cached, not rebuilt per call
+    assert child.count == len(values)
+    assert sum(child.bucket_counts) == len(values)
+    assert len(child.sketch._pos) + len(child.sketch._neg) < 1000
+
+    values.sort()
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert child.quantile(q) == pytest.approx(exact, rel=0.02)
+
+
+def test_sketch_merge_matches_single_sketch():
+    a, b, whole = DDSketch(), DDSketch(), DDSketch()
+    for i in range(1, 1001):
+        (a if i % 2 else b).add(i / 10)
+        whole.add(i / 10)
+    a.merge(b)
+    assert a.count == whole.count
+    assert a.quantile(0.95) == whole.quantile(0.95)
+    assert DDSketch().quantile(0.5) is None
+
+
+def test_quantile_across_label_sets():
+    hist = _InProcHistogram("h", "doc", ("op",))
+    for v in range(1, 101):
+        hist.labels("a" if v <= 50 else "b").observe(float(v))
+    assert hist.quantile(0.5, "a") == pytest.approx(25.5, rel=0.05)
+    assert hist.quantile(0.99) == pytest.approx(99, rel=0.02)
+
+
+def test_exposition_text_format():
+    m = Metrics()
+    counter = _InProcCounter("requests_total", "Requests", ("status",))
+    hist = _InProcHistogram("duration_seconds", "Duration", (), buckets=(0.5, 1))
+    m._counters[counter.name] = counter
+    m._hists[hist.name] = hist
+
+    counter.labels('o"k').inc()
+    counter.labels('o"k').inc(2)
+    for v in (0.2, 0.5, 3.0):
+        hist.observe(v)
+
+    text = m.exposition()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{status="o\\"k"} 3.0' in text
+    assert 'duration_seconds_bucket{le="0.5"} 2' in text
+    assert 'duration_seconds_bucket{le="1.0"} 2' in text
+    assert 'duration_seconds_bucket{le="+Inf"} 3' in text
+    assert "duration_seconds_count 3" in text
+    assert "duration_seconds_sum 3.7" in text
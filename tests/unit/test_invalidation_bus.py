@@ -0,0 +1,159 @@
+"""
+Unit tests for the cross-process cache invalidation bus
+"""
+
+import asyncio
+
+from src.caching.invalidation import CacheInvalidator, InvalidationEvent
+from src.caching.invalidation_bus import (
+    InvalidationBus,
+    LocalInvalidationBackend,
+    SQLiteInvalidationBackend,
+)
+from src.caching.query_cache import QueryCache
+from src.caching.stats import CacheStats
+
+
+class _SharedRedis:
+    """Minimal in-memory stand-in for the Redis commands QueryCache uses"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def mget(self, *keys):
+        return [self.data.get(k) for k in keys]
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value.encode() if isinstance(value, str) else value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(members)
+
+    def srem(self, key, *members):
+        self.data.get(key, set()).difference_update(members)
+
+    def expire(self, key, ttl):
+        pass
+
+    def pipeline(self):
+        return _Pipeline(self)
+
+
+class _Pipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self._calls.append((name, args))
+
+    def execute(self):
+        return [getattr(self._redis, name)(*args) for name, args in self._calls]
+
+
+def _worker(backend, redis=None):
+    cache = QueryCache(enable_redis=False, stats=CacheStats())
+    if redis is not None:
+        cache.redis_client = redis
+        cache.redis_enabled = True
+    invalidator = CacheInvalidator(query_cache=cache, stats=cache.stats, bus=InvalidationBus(backend))
+    return cache, invalidator
+
+
+def _event(path):
+    return InvalidationEvent(file_path=path, event_type="modified", timestamp=0.0)
+
+
+def test_file_invalidation_reaches_other_worker():
+    backend = LocalInvalidationBackend()
+    cache_a, inv_a = _worker(backend)
+    cache_b, _ = _worker(backend)
+
+    asyncio.run(cache_b.set("find auth", ["r"], accessed_files=["src/auth.py"]))
+    assert asyncio.run(cache_b.get("find auth")) == ["r"]
+
+    asyncio.run(inv_a._process_invalidation_batch([_event("src/auth.py")]))
+
+    assert asyncio.run(cache_b.get("find auth")) is None
+    assert inv_a.bus.published == 1
+
+
+def test_project_and_all_invalidation_resolve_remotely():
+    backend = LocalInvalidationBackend()
+    _, inv_a = _worker(backend)
+    cache_b, _ = _worker(backend)
+
+    asyncio.run(cache_b.set("q1", [1], accessed_files=["/proj/a.py"]))
+    asyncio.run(cache_b.set("q2", [2], accessed_files=["/other/b.py"]))
+
+    asyncio.run(inv_a.invalidate_project("/proj"))
+    assert asyncio.run(cache_b.get("q1")) is None
+    assert asyncio.run(cache_b.get("q2")) == [2]
+
+    asyncio.run(inv_a.invalidate_all())
+    assert asyncio.run(cache_b.get("q2")) is None
+
+
+def test_own_messages_are_ignored():
+    backend = LocalInvalidationBackend()
+    _, inv_a = _worker(backend)
+    inv_a._publish("files", ["x.py"])
+    assert inv_a.bus.received == 0
+
+
+def test_sqlite_backend_delivers_new_messages_only(tmp_path):
+    db = str(tmp_path / "bus.db")
+    publisher = InvalidationBus(SQLiteInvalidationBackend(db_path=db), origin="a")
+    publisher.publish("files", ["old.py"])
+
+    subscriber = SQLiteInvalidationBackend(db_path=db)
+    publisher.publish("files", ["new.py"])
+
+    messages = subscriber.poll()
+    assert [m.targets for m in messages] == [["new.py"]]
+    assert messages[0].origin == "a"
+    assert subscriber.poll() == []
+
+
+def test_l2_promoted_entry_is_invalidated_remotely():
+    backend = LocalInvalidationBackend()
+    redis = _SharedRedis()
+    _, inv_a = _worker(backend, redis)
+    cache_b, _ = _worker(backend, redis)
+    cache_c, _ = _worker(backend, redis)
+
+    # C stores the entry; B only ever sees it through L2 -> L1 promotion
+    asyncio.run(cache_c.set("find auth", ["r"], accessed_files=["/proj/auth.py"]))
+    asyncio.run(cache_c.set("find db", ["d"], accessed_files=["/proj/db.py"]))
+    assert asyncio.run(cache_b.get("find auth")) == ["r"]
+    assert cache_b._get_exact(cache_b.generate_cache_key("find db")) == ["d"]
+    assert "/proj/auth.py" in cache_b._file_query_map
+
+    asyncio.run(inv_a._process_invalidation_batch([_event("/proj/auth.py")]))
+    assert asyncio.run(cache_b.get("find auth")) is None
+
+    # Project invalidation resolves against B's own index of promoted entries
+    asyncio.run(inv_a.invalidate_project("/proj"))
+    assert asyncio.run(cache_b.get("find db")) is None
+
+
+
+def test_sqlite_backend_reuses_and_closes_connection(tmp_path):
+    backend = SQLiteInvalidationBackend(db_path=str(tmp_path / "bus.db"))
+    conn = backend._conn
+    InvalidationBus(backend, origin="a").publish("files", ["x.py"])
+    assert [m.targets for m in backend.poll()] == [["x.py"]]
+    assert backend._conn is conn
+
+    backend.close()
+    assert backend._conn is None
@@ -0,0 +1,61 @@
+"""
+Unit tests for the logging manager's background writer and sampling
+"""
+
+import io
+import json
+import logging
+
+import pytest
+
+from src.logging.manager import (
+    InfoSampler,
+    configure_logging,
+    set_correlation_id,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def restore_root_logging():
+    handlers = list(logging.root.handlers)
+    level = logging.root.level
+    yield
+    shutdown_logging()
+    logging.root.handlers[:] = handlers
+    logging.root.setLevel(level)
+
+
+def test_async_json_logging_keeps_context(monkeypatch, restore_root_logging):
+    stream = io.StringIO()
+    monkeypatch.setattr("sys.stdout", stream)
+    configure_logging("INFO", "json", async_logging=True, info_sample_every=1, sampled_loggers=())
+
+    set_correlation_id("req-1")
+    try:
+        logging.getLogger("test.async").info("hello %s", "world")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("test.async").exception("failed")
+    finally:
+        set_correlation_id(None)
+    shutdown_logging()
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [r["message"] for r in records] == ["hello world", "failed"]
+    assert all(r["correlation_id"] == "req-1" for r in records)
+    assert "ValueError: boom" in records[1]["exc_info"]
+
+
+def test_info_sampler_only_thins_matching_info_records():
+    sampler = InfoSampler(every=3, loggers=["src.indexing"])
+
+    def passes(name, level):
+        return sampler.filter(logging.LogRecord(name, level, __file__, 1, "m", None, None))
+
+    kept = [passes("src.indexing.project", logging.INFO) for _ in range(6)]
+    assert kept == [True, False, False, True, False, False]
+    assert sampler.dropped == 4
+    assert passes("src.indexing.project", logging.WARNING)
+    assert all(passes("src.search", logging.INFO) for _ in range(3))
@@ -0,0 +1,111 @@
+"""
+Unit tests for MultiFileEditor batched validation
+"""
+
+import os
+import stat
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.multifile.editor import ChangeSet, ChangeType, FileChange, MultiFileEditor, ValidationStatus
+from src.parsing.parser import get_parser
+
+FAKE_TOOL = textwrap.dedent(
+    """\
+    #!{python}
+    import sys
+    with open({log!r}, "a") as log:
+        log.write("{name} " + str(len([a for a in sys.argv[1:] if a.endswith(".py")])) + "\\n")
+    bad = False
+    for arg in sys.argv[1:]:
+        if arg.endswith(".py") and "{marker}" in open(arg).read():
+            print(arg + ":1: error: {name} complaint")
+            bad = True
+    sys.exit(1 if bad else 0)
+    """
+)
+
+
+@pytest.fixture
+def fake_tools(tmp_path, monkeypatch):
+    """Put fake mypy/flake8 executables on PATH that log each invocation"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "calls.log"
+    for name, marker in (("mypy", "BAD_TYPE"), ("flake8", "BAD_LINT")):
+        script = bin_dir / name
+        script.write_text(FAKE_TOOL.format(python=sys.executable, log=str(log), name=name, marker=marker))
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return log
+
+
+def _calls(log):
+    return log.read_text().splitlines() if log.exists() else []
+
+
+def _changes(contents):
+    return ChangeSet(
+        changes=[
+            FileChange(file_path=path, change_type=ChangeType.CREATE, content=content)
+            for path, content in contents.items()
+        ],
+        description="test",
+    )
+
+
+@pytest.mark.asyncio
+async def test_one_tool_run_per_batch_and_cached(tmp_path, fake_tools):
+    editor = MultiFileEditor(workspace_root=str(tmp_path / "ws"), backup_dir=str(tmp_path / "bk"))
+    contents = {f"pkg{i}/utils.py": f"x = {i}\n" for i in range(5)}
+    contents["pkg0/dup.py"] = "x = 0\n"  # same content as pkg0/utils.py
+
+    assert await editor._validate_changes(_changes(contents))
+    assert sorted(_calls(fake_tools)) == ["flake8 5", "mypy 5"]
+
+    # Unchanged contents are served from the cache
+    assert await editor._validate_changes(_changes(contents))
+    assert len(_calls(fake_tools)) == 2
+
+
+@pytest.mark.asyncio
+async def test_type_failure_is_attributed_to_its_file(tmp_path, fake_tools):
+    editor = MultiFileEditor(workspace_root=str(tmp_path / "ws"), backup_dir=str(tmp_path / "bk"))
+    change_set = _changes({
+        "good.py": "x = 1\n",
+        "bad.py": "y = 'BAD_TYPE'\n",
+        "lint.py": "z = 'BAD_LINT'\n",
+    })
+
+    assert not await editor._validate_changes(change_set)
+    good, bad, lint = change_set.changes
+    assert good.type_check_valid == ValidationStatus.PASSED
+    assert bad.type_check_valid == ValidationStatus.FAILED
+    assert bad.validation_errors[0] == "Type check failed"
+    assert "bad.py:1: error: mypy complaint" in bad.validation_errors[1]
+    # Lint problems are reported but don't fail validation
+    assert lint.type_check_valid == ValidationStatus.PASSED
+    assert lint.lint_valid == ValidationStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_missing_tools_pass(tmp_path, monkeypatch):
+    monkeypatch.setenv("PATH", str(tmp_path))
+    editor = MultiFileEditor(workspace_root=str(tmp_path / "ws"), backup_dir=str(tmp_path / "bk"))
+    assert await editor._check_types("a.py", "x: int = 'no'\n")
+    assert await editor._check_lint("a.py", "x=1", ".py")
+    assert editor._missing_tools == {"mypy", "flake8"}
+
+
+@pytest.mark.asyncio
+async def test_non_python_syntax_checked_with_tree_sitter(tmp_path):
+    if get_parser().check_syntax(Path("a.js"), "") is None:
+        pytest.skip("tree-sitter JavaScript grammar unavailable")
+    editor = MultiFileEditor(workspace_root=str(tmp_path), enable_type_check=False, enable_lint=False)
+
+    assert await editor._check_syntax("ok.js", "function f() { return 1 }", ".js")
+    assert not await editor._check_syntax("bad.js", "function f( { return 1 }", ".js")
+    assert await editor._check_syntax("notes.md", "# anything", ".md")
@@ -0,0 +1,38 @@
+"""
+Unit tests for PatternAnalyzer prediction indexes
+"""
+
+from src.caching.prefetcher import PatternAnalyzer
+
+
+def test_markov_and_trigram_predictions():
+    pa = PatternAnalyzer()
+    for _ in range(3):
+        pa.record_query("open config")
+        pa.record_query("find settings")
+        pa.record_query("edit settings")
+
+    pa.record_query("open config")
+    pa.record_query("find settings")
+    predictions = dict(pa.predict_next_queries("find settings"))
+
+    # Markov (0.6) plus trigram (open config, find settings) -> edit settings (0.2)
+    assert predictions["edit settings"] == 0.8
+    assert ((("open config", "find settings", "edit settings"), 3)) in pa.get_frequent_sequences()
+
+
+def test_context_similarity_uses_bounded_window():
+    pa = PatternAnalyzer(history_size=2)
+    ctx = {"current_project": "p"}
+    pa.record_query("auth middleware setup", ctx)
+    pa.record_query("database pool", ctx)
+    pa.record_query("cache layer", ctx)
+
+    # The auth query fell out of the project window and is no longer indexed
+    index = pa._context_patterns["p"]
+    assert "auth" not in index.postings
+    assert len(index) == 2
+
+    pa.record_query("auth middleware", ctx)
+    predicted = [q for q, _ in pa.predict_next_queries("auth handler", ctx)]
+    assert predicted == ["auth middleware"]
@@ -0,0 +1,166 @@
+"""
+Unit tests for project centroid embeddings and semantic project similarity
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.vector_db.project_centroids import ProjectCentroidIndex
+from src.workspace.relationship_graph import ProjectMetadata, ProjectRelationshipGraph
+
+
+def _vec(*values):
+    return list(values)
+
+
+def test_centroid_tracks_upserts_replacements_and_deletes():
+    index = ProjectCentroidIndex()
+    index.add_points("a", [("p1", "x.py", _vec(1, 0, 0)), ("p2", "y.py", _vec(0, 1, 0))])
+    assert index.point_count("a") == 2
+    assert np.allclose(index.get_centroid("a"), [0.5, 0.5, 0.0])
+
+    # Re-upserting the same point replaces its contribution
+    index.add_points("a", [("p2", "y.py", _vec(1, 0, 0))])
+    assert index.point_count("a") == 2
+    assert np.allclose(index.get_centroid("a"), [1.0, 0.0, 0.0])
+
+    assert index.remove_files("a", ["x.py", "y.py"]) == 2
+    assert index.point_count("a") == 0
+    assert index.get_centroid("a") is None
+
+
+def test_files_keep_float32_sums_not_point_vectors():
+    index = ProjectCentroidIndex(sub_centroids=2)
+    index.add_points("a", [
+        ("p1", "x.py", _vec(1, 0, 0)),
+        ("p2", "x.py", _vec(0, 1, 0)),
+        ("p3", "y.py", _vec(0, 0, 1)),
+    ])
+    project = index._projects["a"]
+    assert set(project.files) == {"x.py", "y.py"}
+    assert all(s.dtype == np.float32 for f in project.files.values() for s in f.sums.values())
+
+    # Re-adding a file replaces all of its points at once
+    index.add_points("a", [("p1", "x.py", _vec(0, 0, 1))])
+    assert index.point_count("a") == 2
+    assert np.allclose(index.get_centroid("a"), [0.0, 0.0, 1.0])
+    assert project.cluster_counts.sum() == 2
+
+    assert index.remove_files("a", ["x.py"]) == 1
+    assert np.allclose(index.get_centroid("a"), [0.0, 0.0, 1.0])
+
+
+def test_load_collection_seeds_from_stored_vectors():
+    pages = {
+        None: ([
+            SimpleNamespace(id="1", vector=[1.0, 0.0], payload={"file_path": "a.py"}),
+            SimpleNamespace(id="2", vector=[0.0, 1.0], payload={"file_path": "b.py"}),
+        ], "next"),
+        # Second chunk of a.py arrives on a later page
+        "next": ([SimpleNamespace(id="3", vector=[1.0, 0.0], payload={"file_path": "a.py"})], None),
+    }
+
+    class Client:
+        def scroll(self, collection_name, limit, offset, with_payload, with_vectors):
+            assert collection_name == "project_a_vectors" and with_vectors
+            return pages[offset]
+
+    index = ProjectCentroidIndex()
+    index.add_points("a", [("old", "gone.py", _vec(0, 1))])
+    assert index.load_collection("a", Client(), "project_a_vectors") == 3
+    assert index.point_count("a") == 3
+    assert np.allclose(index.get_centroid("a"), [2 / 3, 1 / 3])
+    assert index.remove_files("a", ["a.py"]) == 2
+    assert index.remove_files("a", ["gone.py"]) == 0
+
+
+def test_similarity_matrix_is_cached_until_change():
+    index = ProjectCentroidIndex()
+    index.add_points("a", [("p1", "a.py", _vec(1, 0))])
+    index.add_points("b", [("p1", "b.py", _vec(1, 0.1))])
+    index.add_points("c", [("p1", "c.py", _vec(0, 1))])
+
+    ids, matrix = index.similarity_matrix()
+    assert ids == ["a", "b", "c"]
+    assert matrix.shape == (3, 3)
+    assert index.similarity("a", "b") > 0.99
+    assert index.similarity("a", "c") == pytest.approx(0.0)
+    rebuilds = index.stats["matrix_rebuilds"]
+
+    index.similarity("b", "c")
+    assert index.stats["matrix_rebuilds"] == rebuilds
+
+    index.remove_project("c")
+    assert index.similarity("a", "c") == 0.0
+    assert index.stats["matrix_rebuilds"] == rebuilds + 1
+    assert index.related("a", threshold=0.9) == [("b", pytest.approx(index.similarity("a", "b")))]
+
+
+def test_sub_centroids_match_shared_subdomain():
+    # "mixed" covers two topics; "auth" only one of them
+    plain = ProjectCentroidIndex()
+    clustered = ProjectCentroidIndex(sub_centroids=2)
+    for index in (plain, clustered):
+        index.add_points("mixed", [
+            ("m1", "m1.py", _vec(1, 0, 0)),
+            ("m2", "m2.py", _vec(1, 0.05, 0)),
+            ("m3", "m3.py", _vec(0, 0, 1)),
+            ("m4", "m4.py", _vec(0, 0.05, 1)),
+        ])
+        index.add_points("auth", [("a1", "a1.py", _vec(1, 0.02, 0))])
+
+    assert clustered.similarity("mixed", "auth") > plain.similarity("mixed", "auth")
+    assert clustered.similarity("mixed", "auth") == pytest.approx(
+        clustered.similarity("auth", "mixed")
+    )
+
+
+@pytest.mark.asyncio
+async def test_relationship_graph_uses_centroids():
+    index = ProjectCentroidIndex()
+    graph = ProjectRelationshipGraph(centroid_index=index)
+    for pid in ("api", "client", "docs"):
+        graph.add_project(ProjectMetadata(id=pid, name=pid, path=f"/ws/{pid}", type="library"))
+
+    assert await graph.compute_semantic_similarity("api", "client") == 0.0
+
+    index.add_points("api", [("p", "api.py", _vec(1, 0.1))])
+    index.add_points("client", [("p", "client.py", _vec(1, 0.0))])
+    index.add_points("docs", [("p", "readme.md", _vec(0, 1))])
+
+    # Cached 0.0 is dropped once embeddings change
+    assert await graph.compute_semantic_similarity("api", "client") > 0.9
+    assert graph.has_relationship("api", "client")
+    assert [pid for pid, _ in graph.get_related_projects("api", threshold=0.7)] == ["client"]
+    assert "client" in graph.get_relationship_boost_factors("api")
+
+
+@pytest.mark.asyncio
+async def test_workspace_store_seeds_existing_collection_and_deletes_files(monkeypatch):
+    from src.workspace import multi_root_store as store_module
+
+    client = MagicMock()
+    client.get_collections.return_value = SimpleNamespace(
+        collections=[SimpleNamespace(name="project_api_vectors")]
+    )
+    client.get_collection.return_value.config.params.vectors.size = 2
+    client.scroll.return_value = (
+        [
+            SimpleNamespace(id="1", vector=[1.0, 0.0], payload={"file_path": "/ws/api/a.py"}),
+            SimpleNamespace(id="2", vector=[0.0, 1.0], payload={"file_path": "/ws/api/b.py"}),
+        ],
+        None,
+    )
+    monkeypatch.setattr(store_module, "get_qdrant_client", lambda: client)
+
+    store = store_module.MultiRootVectorStore()
+    assert await store.ensure_project_collection("api", vector_size=2)
+    assert store.centroids.point_count("api") == 2
+
+    assert await store.delete_vectors("api", ["/ws/api/b.py"])
+    client.delete.assert_called_once()
+    assert store.centroids.point_count("api") == 1
+    assert np.allclose(store.centroids.get_centroid("api"), [1.0, 0.0])
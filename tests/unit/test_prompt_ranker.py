@@ -0,0 +1,93 @@
+"""
+Unit tests for batched embedding in the prompt ContextRanker
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.prompt.context_gatherer import ContextChunk
+from src.prompt.ranker import ContextRanker, EmbeddingCache
+
+VOCAB = ["auth", "token", "database", "query", "cache", "error"]
+
+
+class CountingEncoder:
+    """Bag-of-words encoder that records every encode call"""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts):
+        self.calls.append(texts)
+        single = isinstance(texts, str)
+        batch = [texts] if single else texts
+        rows = np.array(
+            [[text.lower().count(word) for word in VOCAB] + [0.1] for text in batch],
+            dtype=np.float32,
+        )
+        return rows[0] if single else rows
+
+
+def _context(*contents):
+    chunk = ContextChunk(source="code")
+    for i, content in enumerate(contents):
+        chunk.add("file", content, priority=1.0, path=f"src/mod{i}.py")
+    return SimpleNamespace(chunks=[chunk])
+
+
+@pytest.fixture
+def ranker():
+    ranker = ContextRanker(embedding_cache=EmbeddingCache(max_entries=16))
+    ranker.embedding_model = CountingEncoder()
+    return ranker
+
+
+PROMPT = SimpleNamespace(original_prompt="fix the auth token check", entities=[])
+USER = SimpleNamespace(current_file=None)
+
+
+async def test_rank_encodes_items_in_one_batch(ranker):
+    raw = _context("auth token validation", "database query builder", "auth token validation", "cache layer")
+
+    ranked = await ranker.rank(raw, PROMPT, USER)
+
+    assert len(ranker.embedding_model.calls) == 1
+    # Prompt plus three unique item texts
+    assert len(ranker.embedding_model.calls[0]) == 4
+    assert ranked.chunks[0].chunk.content == "auth token validation"
+    assert ranked.chunks[0].score >= ranked.chunks[-1].score
+
+    # Batched scores match a direct cosine of the prompt and item embeddings
+    prompt_embedding = np.asarray(ranker.embedding_model.encode(PROMPT.original_prompt), dtype=np.float32)
+    for scored in ranked.chunks:
+        item_embedding = np.asarray(ranker.embedding_model.encode(scored.chunk.content), dtype=np.float32)
+        cosine = float(prompt_embedding @ item_embedding) / (
+            np.linalg.norm(prompt_embedding) * np.linalg.norm(item_embedding)
+        )
+        expected = max(0.0, min(1.0, cosine))
+        assert scored.factors["relevance_score"] == pytest.approx(expected, abs=1e-6)
+
+
+async def test_rank_reuses_cached_item_embeddings(ranker):
+    raw = _context("auth token validation", "database query builder")
+    await ranker.rank(raw, PROMPT, USER)
+
+    await ranker.rank(_context("database query builder", "error handler"), PROMPT, USER)
+
+    # Second batch only needs the prompt and the new item
+    assert ranker.embedding_model.calls[-1] == [PROMPT.original_prompt, "error handler"]
+    assert ranker.embedding_cache.hits >= 1
+
+
+async def test_rank_scores_match_weighted_sum(ranker):
+    ranker.embedding_model = None
+    raw = _context("a", "b")
+
+    ranked = await ranker.rank(raw, PROMPT, USER)
+
+    for scored in ranked.chunks:
+        expected = sum(scored.factors[n] * w for n, w in ranker.weights.items()) + 1.0
+        assert scored.score == pytest.approx(expected)
+        assert scored.factors["relevance_score"] == 0.5
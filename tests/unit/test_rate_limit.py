@@ -41,3 +41,111 @@ async def test_rate_limit_blocks_after_threshold(monkeypatch):
         data = r3.json()
         assert data["error"] == "rate_limited"
 
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_gcra_allows_burst_then_steady_rate():
+    from src.mcp_server.rate_limit import MemoryRateLimitBackend
+
+    clock = FakeClock()
+    backend = MemoryRateLimitBackend(clock=clock)
+
+    decisions = [backend.acquire_sync("k", 3, 60, 3) for _ in range(4)]
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+    assert [d.remaining for d in decisions[:3]] == [2, 1, 0]
+    assert decisions[3].retry_after == pytest.approx(20.0)
+
+    # One emission interval later exactly one more request fits
+    clock.now += 20
+    assert backend.acquire_sync("k", 3, 60, 3).allowed
+    assert not backend.acquire_sync("k", 3, 60, 3).allowed
+
+
+def test_idle_keys_expire_and_key_count_is_bounded():
+    from src.mcp_server.rate_limit import MemoryRateLimitBackend
+
+    clock = FakeClock()
+    backend = MemoryRateLimitBackend(max_keys=3, clock=clock)
+    for i in range(5):
+        backend.acquire_sync(f"k{i}", 60, 60, 60)
+    assert len(backend) == 3
+
+    clock.now += 2  # every key's TAT (now + 1s) has passed
+    backend.acquire_sync("fresh", 60, 60, 60)
+    assert len(backend) == 1
+
+
+def test_keys_with_different_limits_expire_by_tat():
+    from src.mcp_server.rate_limit import MemoryRateLimitBackend
+
+    clock = FakeClock()
+    backend = MemoryRateLimitBackend(max_keys=3, clock=clock)
+    backend.acquire_sync("slow", 1, 3600, 1)  # TAT an hour out
+    backend.acquire_sync("fast", 60, 60, 60)  # TAT one second out, updated last
+
+    clock.now += 2
+    backend.acquire_sync("other", 60, 60, 60)
+    assert len(backend) == 2
+
+    # At capacity the key closest to expiry goes, not the oldest update
+    backend.acquire_sync("third", 60, 60, 60)
+    clock.now += 0.5
+    backend.acquire_sync("fourth", 60, 60, 60)
+    assert len(backend) == 3
+    assert not backend.acquire_sync("slow", 1, 3600, 1).allowed
+
+
+@pytest.mark.asyncio
+async def test_middleware_with_shared_backend_limits_across_workers():
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+
+    from src.mcp_server.rate_limit import MemoryRateLimitBackend, RateLimitMiddleware
+
+    class Settings:
+        rate_limit_key = "api_key"
+        rate_limit_requests_per_minute = 2
+        rate_limit_burst = None
+
+    async def ok(_):
+        return PlainTextResponse("ok")
+
+    shared = MemoryRateLimitBackend()
+    workers = [
+        RateLimitMiddleware(Starlette(routes=[Route("/", ok)]), enabled=lambda: True, backend=shared, settings=Settings())
+        for _ in range(2)
+    ]
+
+    statuses = []
+    for worker in workers + workers:
+        async with httpx.AsyncClient(transport=ASGITransport(app=worker), base_url="http://test") as client:
+            r = await client.get("/", headers={"x-api-key": "team-a"})
+            statuses.append(r.status_code)
+    assert statuses == [200, 200, 429, 429]
+    assert int(r.headers["Retry-After"]) >= 1
+
+    # Other keys are unaffected
+    async with httpx.AsyncClient(transport=ASGITransport(app=workers[0]), base_url="http://test") as client:
+        assert (await client.get("/", headers={"x-api-key": "team-b"})).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_fails_open():
+    from src.mcp_server.rate_limit import RedisRateLimitBackend
+
+    class BrokenRedis:
+        def register_script(self, _):
+            async def script(keys, args):
+                raise ConnectionError("down")
+            return script
+
+    decision = await RedisRateLimitBackend(BrokenRedis()).acquire("k", 1, 60, 1)
+    assert decision.allowed
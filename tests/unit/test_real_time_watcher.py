@@ -2,6 +2,7 @@
 Tests for Real-time File Watcher (Story 2.2 AC1)
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import tempfile
@@ -177,3 +178,119 @@ class TestGlobalFunctions:
         status = get_watcher_status()
         assert status == {"running": True}
         mock_watcher.get_status.assert_called_once()
+
+
+class TestBatchedDebouncing:
+    """Test timer-wheel coalescing and batch delivery."""
+
+    def _handler(self, **overrides):
+        batches = []
+
+        async def on_batch(events):
+            batches.append(events)
+
+        handler = RealTimeFileHandler(on_batch_callback=on_batch)
+        handler.debounce_delay = 0.05
+        handler.tick = 0.01
+        for name, value in overrides.items():
+            setattr(handler, name, value)
+        handler._should_process_file = lambda path: True
+        handler.start()
+        return handler, batches
+
+    @pytest.mark.asyncio
+    async def test_events_coalesce_into_one_batch(self, tmp_path):
+        handler, batches = self._handler()
+        files = [tmp_path / f"f{i}.py" for i in range(3)]
+        for f in files:
+            f.write_text("x = 1\n")
+
+        # Observer thread delivers events off the event loop
+        def burst():
+            for _ in range(4):
+                for f in files:
+                    handler._handle_file_event("modified", str(f))
+
+        await asyncio.to_thread(burst)
+        await asyncio.sleep(0.3)
+        await handler.stop()
+
+        assert len(batches) == 1
+        events = sorted(batches[0], key=lambda e: e.file_path)
+        assert [e.file_path for e in events] == [str(f) for f in files]
+        assert all(e.event_count == 4 and e.is_debounced for e in events)
+        # Hashing is deferred until a consumer asks
+        assert events[0].content_hash is None
+        assert events[0].get_content_hash() is not None
+        assert events[0].file_size == 6
+
+    @pytest.mark.asyncio
+    async def test_create_then_delete_is_dropped(self, tmp_path):
+        handler, batches = self._handler()
+        handler._handle_file_event("created", str(tmp_path / "tmp.py"))
+        handler._handle_file_event("deleted", str(tmp_path / "tmp.py"))
+        handler._handle_file_event("deleted", str(tmp_path / "old.py"))
+
+        await asyncio.sleep(0.2)
+        await handler.stop()
+
+        assert [[(e.event_type, e.file_path) for e in b] for b in batches] == [
+            [("deleted", str(tmp_path / "old.py"))]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_storm_collapses_into_rescan(self, tmp_path):
+        handler, batches = self._handler(storm_threshold=5, watched_roots=[str(tmp_path)])
+        for i in range(10):
+            sub = tmp_path / f"pkg{i % 2}"
+            sub.mkdir(exist_ok=True)
+            handler._handle_file_event("modified", str(sub / f"m{i}.py"))
+
+        await asyncio.sleep(0.2)
+        await handler.stop()
+
+        [[event]] = batches
+        assert event.event_type == "rescan"
+        assert event.file_path == str(tmp_path)
+        assert event.event_count == 10
+        assert handler.get_stats()["storms_collapsed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_storm_spread_over_many_ticks_is_detected(self, tmp_path):
+        handler, batches = self._handler(storm_threshold=20, watched_roots=[str(tmp_path)])
+
+        # Never more than a few files pending at once, but a high new-file rate
+        def trickle():
+            for i in range(60):
+                handler._handle_file_event("modified", str(tmp_path / f"m{i}.py"))
+                time.sleep(0.005)
+
+        await asyncio.to_thread(trickle)
+        await asyncio.sleep(0.3)
+        await handler.stop()
+
+        events = [e for batch in batches for e in batch]
+        rescans = [e for e in events if e.event_type == "rescan"]
+        assert [e.file_path for e in rescans] == [str(tmp_path)]
+        assert len(events) - len(rescans) < 20
+        assert sum(e.event_count for e in events) == 60
+        assert handler.get_stats()["storms_collapsed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_storm_rescans_stay_inside_each_watched_root(self, tmp_path):
+        roots = [tmp_path / "a", tmp_path / "b"]
+        handler, batches = self._handler(storm_threshold=5, watched_roots=[str(r) for r in roots])
+        for i in range(10):
+            sub = roots[i % 2] / f"pkg{i % 4}"
+            sub.mkdir(parents=True, exist_ok=True)
+            handler._handle_file_event("modified", str(sub / f"m{i}.py"))
+
+        await asyncio.sleep(0.2)
+        await handler.stop()
+
+        [batch] = batches
+        assert sorted((e.event_type, e.file_path, e.event_count) for e in batch) == [
+            ("rescan", str(roots[0]), 5),
+            ("rescan", str(roots[1]), 5),
+        ]
+        assert handler.get_stats()["storms_collapsed"] == 1
@@ -0,0 +1,87 @@
+"""
+Unit tests for the project relationship graph reachability index and caches
+"""
+
+import random
+
+from src.workspace.relationship_graph import (
+    ProjectMetadata,
+    ProjectRelationshipGraph,
+    RelationshipType,
+)
+
+
+def _graph(*project_ids):
+    graph = ProjectRelationshipGraph()
+    for pid in project_ids:
+        graph.add_project(ProjectMetadata(id=pid, name=pid, path=f"/ws/{pid}"))
+    return graph
+
+
+def _brute_force_reach(graph, start):
+    seen, stack = set(), list(graph.graph.successors(start))
+    while stack:
+        node = stack.pop()
+        if node not in seen:
+            seen.add(node)
+            stack.extend(graph.graph.successors(node))
+    return seen
+
+
+def test_dependencies_by_depth():
+    graph = _graph("web", "api", "core", "utils")
+    graph.add_relationship("web", "api", RelationshipType.API_CLIENT)
+    graph.add_relationship("api", "core", RelationshipType.IMPORTS)
+    graph.add_relationship("core", "utils", RelationshipType.IMPORTS)
+
+    assert sorted(graph.get_dependencies("web")) == ["api"]
+    assert sorted(graph.get_dependencies("web", depth=2)) == ["api", "core"]
+    assert sorted(graph.get_transitive_dependencies("web")) == ["api", "core", "utils"]
+    assert graph.is_reachable("web", "utils")
+    assert not graph.is_reachable("utils", "web")
+
+
+def test_incremental_closure_matches_rebuild():
+    rng = random.Random(7)
+    ids = [f"p{i}" for i in range(12)]
+    graph = _graph(*ids)
+    graph.get_transitive_dependencies("p0")  # build the index once
+
+    for _ in range(30):
+        a, b = rng.sample(ids, 2)
+        graph.add_relationship(a, b, RelationshipType.DEPENDENCY)
+        assert graph._reach_valid  # updated in place, not rebuilt
+        for pid in ids:
+            assert set(graph.get_transitive_dependencies(pid)) == _brute_force_reach(graph, pid)
+
+    a, b = next(iter(graph.graph.edges))
+    graph.remove_relationship(a, b)
+    for pid in ids:
+        assert set(graph.get_transitive_dependencies(pid)) == _brute_force_reach(graph, pid)
+
+
+def test_cycle_and_path_queries():
+    graph = _graph("a", "b", "c", "d")
+    graph.add_relationship("a", "b", RelationshipType.IMPORTS)
+    graph.add_relationship("b", "c", RelationshipType.IMPORTS)
+    graph.add_relationship("c", "a", RelationshipType.IMPORTS)
+
+    assert sorted(graph.get_transitive_dependencies("a")) == ["a", "b", "c"]
+    assert graph.find_all_paths("a", "c") == [["a", "b", "c"]]
+    assert graph.find_all_paths("a", "d") == []
+
+
+def test_boost_factors_cached_until_graph_changes():
+    graph = _graph("web", "api", "core")
+    graph.add_relationship("web", "api", RelationshipType.API_CLIENT)
+
+    first = graph.get_relationship_boost_factors("web", 1.5)
+    assert first == {"api": 1.5}
+    first["bogus"] = 9.0
+    assert graph.get_relationship_boost_factors("web", 1.5) == {"api": 1.5}
+
+    graph.add_relationship("api", "core", RelationshipType.IMPORTS)
+    assert graph.get_relationship_boost_factors("web", 1.5) == {
+        "api": 1.5,
+        "core": 1.5 * 0.7,
+    }
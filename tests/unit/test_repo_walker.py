@@ -0,0 +1,67 @@
+"""
+Unit tests for the shared repository walker
+"""
+
+from src.utils.repo_walker import IgnoreMatcher, walk_dirs, walk_files
+
+
+def _touch(path, text=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _rel(root, paths):
+    return sorted(str(p.relative_to(root)).replace("\\", "/") for p in paths)
+
+
+def test_prunes_excluded_dirs_and_filters_extensions(tmp_path):
+    _touch(tmp_path / "src" / "a.py")
+    _touch(tmp_path / "src" / "b.txt")
+    _touch(tmp_path / "node_modules" / "pkg" / "index.py")
+
+    files = [p for p, _ in walk_files(tmp_path, extensions={".py"}, exclude_dirs={"node_modules"})]
+    assert _rel(tmp_path, files) == ["src/a.py"]
+
+
+def test_yields_stat_lazily(tmp_path):
+    _touch(tmp_path / "a.py", "print(1)\n")
+    [(path, stat)] = list(walk_files(tmp_path))
+    assert path.name == "a.py"
+    assert stat.st_size == 9
+    assert list(walk_files(tmp_path, with_stat=False))[0][1] is None
+
+
+def test_honors_nested_ignore_files(tmp_path):
+    _touch(tmp_path / ".gitignore", "build/\n*.log\n!keep.log\n")
+    _touch(tmp_path / "build" / "out.py")
+    _touch(tmp_path / "app.log")
+    _touch(tmp_path / "keep.log")
+    _touch(tmp_path / "pkg" / ".contextignore", "/generated.py\n")
+    _touch(tmp_path / "pkg" / "generated.py")
+    _touch(tmp_path / "pkg" / "sub" / "generated.py")
+
+    files = [p for p, _ in walk_files(tmp_path, exclude_globs=[".*", "*/.*"])]
+    assert _rel(tmp_path, files) == ["keep.log", "pkg/sub/generated.py"]
+
+
+def test_walk_dirs_allows_caller_pruning_and_threads(tmp_path):
+    _touch(tmp_path / "proj" / "setup.py")
+    _touch(tmp_path / "proj" / "nested" / "setup.py")
+    _touch(tmp_path / "other" / "x.py")
+
+    seen = []
+    for directory, subdirs, files in walk_dirs(tmp_path):
+        seen.append(directory)
+        if any(f.name == "setup.py" for f in files):
+            subdirs[:] = []
+    assert tmp_path / "proj" / "nested" not in seen
+
+    threaded = [p for p, _ in walk_files(tmp_path, max_workers=4)]
+    assert len(threaded) == 3
+
+
+def test_ignore_matcher_double_star():
+    matcher = IgnoreMatcher("/r", ["docs/**/*.md"])
+    assert matcher.match("/r/docs/a/b/c.md", False) is True
+    assert matcher.match("/r/docs/c.md", False) is True
+    assert matcher.match("/r/src/c.md", False) is None
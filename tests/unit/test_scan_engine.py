@@ -0,0 +1,71 @@
+"""
+Unit tests for the shared pattern scanning engine and the scanners built on it
+"""
+
+from src.analysis.security_scanner import SecurityScanner
+from src.security import scan_engine
+from src.security.scan_engine import PatternScanEngine, ScanRule
+from src.security.vulnerability_scanner import VulnerabilityScanner
+
+RULES = [
+    ScanRule("R1", "subprocess.Popen(", "medium"),
+    ScanRule("R2", "Popen(", "low"),
+    ScanRule("R3", "eval(", "high"),
+]
+
+
+def test_single_pass_finds_overlapping_rules_once_per_line():
+    engine = PatternScanEngine(RULES)
+    content = "x = eval(a) + eval(b)\n\nsubprocess.Popen(['ls'])  # é eval(\n"
+    found = [(m.line, m.col, m.rule.rule) for m in engine.scan_content(content)]
+    assert found == [(1, 5, "R3"), (3, 1, "R1"), (3, 12, "R2"), (3, 31, "R3")]
+
+
+def test_findings_cached_by_content_and_file_stat(tmp_path):
+    engine = PatternScanEngine(RULES)
+    a = tmp_path / "a.py"
+    a.write_text("eval(x)\n")
+    (tmp_path / "b.py").write_text("eval(x)\n")
+
+    assert [m.line for m in engine.scan_path(str(a))] == [1]
+    engine.scan_path(str(tmp_path / "b.py"))  # same content, different file
+    engine.scan_path(str(a))  # unchanged file
+    assert engine.stats["scanned"] == 1
+    assert engine.stats["unchanged_files"] == 1
+
+    a.write_text("ok\neval(y)\n")
+    assert [m.line for m in engine.scan_path(str(a))] == [2]
+    assert engine.stats["scanned"] == 2
+
+
+def test_scan_paths_parallel_matches_serial(tmp_path, monkeypatch):
+    monkeypatch.setattr(scan_engine, "PARALLEL_MIN_FILES", 4)
+    paths = []
+    for i in range(12):
+        p = tmp_path / f"m{i}.py"
+        p.write_text("pass\n" * i + ("eval(1)\n" if i % 3 == 0 else ""))
+        paths.append(str(p))
+
+    parallel = PatternScanEngine(RULES).scan_paths(paths, max_workers=2)
+    serial = PatternScanEngine(RULES).scan_paths(paths, max_workers=1)
+    assert parallel == serial
+    assert sorted(p for p, m in parallel.items() if m) == sorted(paths[i] for i in (0, 3, 6, 9))
+
+
+def test_vulnerability_scanner_prunes_skipped_dirs(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("import pickle\npickle.load(f)\nexec(code)\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.py").write_text("eval(x)\n")
+
+    findings = VulnerabilityScanner(root=str(tmp_path)).scan()
+    assert [(f.line, f.rule) for f in findings] == [(2, "PY003"), (3, "PY001")]
+
+
+def test_security_scanner_uses_supplied_content(tmp_path):
+    path = tmp_path / "s.py"
+    path.write_text("nothing here\n")
+    res = SecurityScanner().scan_file(str(path), content="x = 1\ny = EVAL(z)\n")
+    assert res["success"]
+    assert res["issues"] == [{"line": 2, "col": 5, "code": "S001", "message": "Use of eval()"}]
+    assert SecurityScanner().scan_file(str(tmp_path / "missing.py"))["error"] == "file_not_found"
@@ -0,0 +1,59 @@
+"""
+Unit tests for the semantic (near-duplicate) query cache tier
+"""
+
+import asyncio
+
+from src.caching.query_cache import QueryCache
+from src.caching.semantic_cache import SemanticCache
+from src.caching.stats import CacheStats
+
+
+def _cache(threshold=0.9):
+    return QueryCache(enable_redis=False, stats=CacheStats(), enable_semantic=True, semantic_threshold=threshold)
+
+
+def test_near_duplicate_query_hits():
+    qc = _cache()
+    asyncio.run(qc.set("find auth middleware", ["auth.py"], query_embedding=[1.0, 0.0, 0.1]))
+
+    result = asyncio.run(qc.get("authentication middleware", query_embedding=[1.0, 0.05, 0.1]))
+
+    assert result == ["auth.py"]
+    summary = qc.stats.get_summary()
+    assert summary["semantic"]["hits"] == 1
+    assert summary["semantic"]["hit_rate_by_band_percent"] == {"0.99-1.00": 100.0}
+
+
+def test_dissimilar_query_misses():
+    qc = _cache()
+    asyncio.run(qc.set("find auth middleware", ["auth.py"], query_embedding=[1.0, 0.0, 0.0]))
+    assert asyncio.run(qc.get("database pool", query_embedding=[0.0, 1.0, 0.0])) is None
+    assert qc.stats.semantic_hits == 0
+
+
+def test_scope_isolation_by_project_and_filters():
+    qc = _cache()
+    ctx_a = {"current_project": "a", "filters": {"lang": "py"}}
+    ctx_b = {"current_project": "b", "filters": {"lang": "py"}}
+    asyncio.run(qc.set("find auth", ["a.py"], context=ctx_a, query_embedding=[1.0, 0.0]))
+
+    assert asyncio.run(qc.get("auth lookup", context=ctx_b, query_embedding=[1.0, 0.0])) is None
+    assert asyncio.run(qc.get("auth lookup", context=ctx_a, query_embedding=[1.0, 0.0])) == ["a.py"]
+
+
+def test_invalidated_entry_is_not_served():
+    qc = _cache()
+    asyncio.run(qc.set("find auth", ["a.py"], accessed_files=["a.py"], query_embedding=[1.0, 0.0]))
+    asyncio.run(qc.invalidate_file("a.py"))
+    assert asyncio.run(qc.get("auth lookup", query_embedding=[1.0, 0.0])) is None
+    assert qc.semantic_cache.item_count() == 0
+
+
+def test_ring_buffer_capacity():
+    sc = SemanticCache(similarity_threshold=0.5, max_entries_per_scope=2)
+    sc.add("", "k1", [1.0, 0.0])
+    sc.add("", "k2", [0.0, 1.0])
+    sc.add("", "k3", [1.0, 1.0])
+    assert sc.item_count() == 2
+    assert sc.lookup("", [1.0, 0.0])[0] == "k3"
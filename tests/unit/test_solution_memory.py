@@ -0,0 +1,180 @@
+"""
+Unit tests for SolutionStore embedding persistence and similarity lookup
+"""
+
+import sys
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.memory.models import Base, Solution
+from src.memory.solutions import SolutionStore
+
+VOCAB = ["jwt", "token", "auth", "database", "timeout", "pool", "cache", "redis"]
+
+
+class BagOfWordsEncoder:
+    """Deterministic stand-in for SentenceTransformer that counts encoded texts"""
+
+    def __init__(self):
+        self.encoded = 0
+
+    def encode(self, texts):
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        self.encoded += len(batch)
+        rows = np.array(
+            [[float(word in text.lower()) for word in VOCAB] + [0.01] for text in batch],
+            dtype=np.float32,
+        )
+        return rows[0] if single else rows
+
+
+class TinyDBSCAN:
+    """Minimal cosine DBSCAN; sklearn cannot import next to the mocked torch module"""
+
+    def __init__(self, eps, min_samples, metric="cosine"):
+        self.eps = eps
+        self.min_samples = min_samples
+
+    def fit_predict(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        unit = X / np.linalg.norm(X, axis=1, keepdims=True)
+        neighbors = [np.flatnonzero(1 - unit @ row <= self.eps) for row in unit]
+        labels = np.full(len(X), -1)
+        cluster = 0
+        for i in range(len(X)):
+            if labels[i] != -1 or len(neighbors[i]) < self.min_samples:
+                continue
+            labels[i] = cluster
+            frontier = list(neighbors[i])
+            while frontier:
+                j = frontier.pop()
+                if labels[j] == -1:
+                    labels[j] = cluster
+                    if len(neighbors[j]) >= self.min_samples:
+                        frontier.extend(neighbors[j])
+            cluster += 1
+        return labels
+
+
+@pytest.fixture
+def store():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+
+    @contextmanager
+    def get_session():
+        session = SessionLocal()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    manager = Mock(get_session=get_session)
+    with patch("src.memory.solutions.get_db_manager", return_value=manager):
+        solution_store = SolutionStore()
+    solution_store.embedding_model = BagOfWordsEncoder()
+    solution_store.SessionLocal = SessionLocal
+    return solution_store
+
+
+def test_similar_solutions_use_stored_embeddings(store):
+    store.store_solution("JWT token auth fails", project_id="p1")
+    store.store_solution("Database pool timeout", project_id="p1")
+    store.store_solution("Redis cache eviction", project_id="p1")
+    store.store_solution("JWT token expired", project_id="p2")
+    encoded_after_store = store.embedding_model.encoded
+
+    results = store.get_similar_solutions("auth token problem", project_id="p1", limit=2)
+    assert [r["solution"].problem_description for r in results][0] == "JWT token auth fails"
+    assert len(results) == 2
+    assert results[0]["similarity_score"] >= results[1]["similarity_score"]
+
+    everywhere = store.get_similar_solutions("jwt token", limit=2)
+    assert {r["solution"].project_id for r in everywhere} == {"p1", "p2"}
+
+    # Only the two queries were encoded; stored problems were not re-embedded
+    assert store.embedding_model.encoded == encoded_after_store + 2
+
+
+def test_missing_embeddings_are_backfilled_once(store):
+    session = store.SessionLocal()
+    session.add(Solution(problem_description="Database timeout on startup", project_id="legacy"))
+    session.commit()
+    session.close()
+
+    results = store.get_similar_solutions("database timeout", project_id="legacy")
+    assert len(results) == 1
+
+    session = store.SessionLocal()
+    assert session.query(Solution).one().problem_embedding is not None
+    session.close()
+
+    encoded = store.embedding_model.encoded
+    store.get_similar_solutions("database timeout", project_id="legacy")
+    assert store.embedding_model.encoded == encoded + 1
+
+
+def test_incremental_clustering_updates_only_affected_rows(store):
+    auth_a = store.store_solution("JWT token auth fails", project_id="p1")
+    db_a = store.store_solution("Database pool timeout", project_id="p1")
+    auth_b = store.store_solution("JWT token auth expired", project_id="p1")
+
+    # Third insert seeds a cluster with its unclustered neighbor
+    session = store.SessionLocal()
+    rows = {s.id: s for s in session.query(Solution)}
+    assert rows[auth_a].cluster_id == rows[auth_b].cluster_id == "p1_cluster_0"
+    assert rows[db_a].cluster_id is None
+    session.close()
+
+    auth_c = store.store_solution("auth token refresh for JWT", project_id="p1")
+    db_b = store.store_solution("database pool timeout under load", project_id="p1")
+
+    session = store.SessionLocal()
+    rows = {s.id: s for s in session.query(Solution)}
+    assert rows[auth_c].cluster_id == "p1_cluster_0"
+    assert rows[db_a].cluster_id == rows[db_b].cluster_id == "p1_cluster_1"
+    assert str(auth_c) in rows[auth_a].similar_problems["similar_solution_ids"]
+    assert set(rows[auth_c].similar_problems["similar_solution_ids"]) == {str(auth_a), str(auth_b)}
+    session.close()
+
+    with patch.dict(sys.modules, {"sklearn": SimpleNamespace(), "sklearn.cluster": SimpleNamespace(DBSCAN=TinyDBSCAN)}):
+        stats = store.recluster_solutions("p1")
+    assert stats["clusters"] == 2
+
+
+def test_rows_replaced_by_another_process_reload_the_index(store):
+    old = store.store_solution("Redis cache eviction", project_id="p1")
+    store.store_solution("Database pool timeout", project_id="p1")
+    store.store_solution("Database pool exhausted", project_id="p1")
+    store.get_similar_solutions("cache", project_id="p1")  # index loaded
+
+    # Another writer deletes one row and inserts one: the count is unchanged
+    session = store.SessionLocal()
+    session.query(Solution).filter(Solution.id == old).delete()
+    other = Solution(
+        problem_description="JWT token auth fails",
+        problem_embedding=store._encode(["JWT token auth fails"])[0].tobytes(),
+        project_id="p1",
+    )
+    session.add(other)
+    session.commit()
+    other_id = other.id
+    session.close()
+
+    results = store.get_similar_solutions("jwt auth token", project_id="p1", limit=1)
+    assert results[0]["solution"].id == other_id
+
+    with patch.dict(sys.modules, {"sklearn": SimpleNamespace(), "sklearn.cluster": SimpleNamespace(DBSCAN=TinyDBSCAN)}):
+        assert store.recluster_solutions("p1")["solutions"] == 3